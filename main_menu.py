@@ -3,137 +3,261 @@ from datetime import datetime
 from PIL import Image
 import time
 from tkinter import messagebox
-from concurrent.futures import ThreadPoolExecutor
-from modulos.modulo_felicitaciones import AplicacionFelicitaciones
-from functools import lru_cache
-import queue
-from modulos.modulo_prestamos import AplicacionPrestamos as AplicacionPrestamos
-from modulos.modulo_conceptos import AplicacionConceptos
-from modulos.modulo_personal import PersonalManagementApp
-from modulos.modulo_sanciones import AplicacionSanciones
-from modulos.modulo_certificados_medicos import AplicacionCertificadosMedicos 
-from modulos.modulo_licencias import AplicacionLicencias
-from modulos.modulo_art import AplicacionART
 import os
 import sys
+import logging
 from pathlib import Path
-from utils.thread_manager import ThreadManager
+from utils.thread_manager import ThreadManager, DatabasePool, get_thread_manager
 from utils.interface_manager import EstiloApp
+from utils.load_telemetry import get_load_telemetry
+from utils.warm_start import HistorialUso, frames_logo_gif
+from utils.db_pool import get_pool
+from utils.schema_maintenance import get_mantenimiento
+from utils.log_config import configurar_logging
+import threading
 import tkinter as tk
 from tkinter import ttk
 import traceback
-from modulos.modulo_antecedentes import crear_modulo as crear_modulo_antecedentes
+
+# Los módulos del menú se importan recién al abrirlos o precargarlos
+from utils.module_registry import get_module_registry
+from utils.module_lifecycle import CicloVidaModulos, estimar_memoria
+from utils.import_profile import diagnostico_arranque, diagnostico_solicitado
 
 # Configuración de rutas
 BASE_DIR = Path(__file__).resolve().parent
 RESOURCES_DIR = BASE_DIR / 'resources'
 ICONS_DIR = RESOURCES_DIR / 'icons'
 
+logger = logging.getLogger("main_menu")
+
 # Forzar tema claro por defecto
 ctk.set_appearance_mode("light")
 
 class ModuleCache:
-    """Clase para manejar el caché de módulos con capacidad extendida"""
-    def __init__(self):
+    """
+    Caché de módulos con ciclo de vida (utils.module_lifecycle).
+
+    El módulo que se oculta se suspende: deja de animar el logo y libera sus
+    hilos, pero conserva los datos para volver a mostrarse rápido. Los
+    suspendidos se expulsan, del menos usado al más usado, cuando la memoria
+    que retienen entre todos supera el límite (MODULE_CACHE_MAX_MB).
+    """
+    DEFAULT_MAX_MB = 150
+
+    def __init__(self, max_cache_mb=None):
         self.modules = {}
         self.last_accessed = {}
-        self.max_cache_size = 10  # Aumentar tamaño máximo de caché
-      # Aumentar tamaño máximo de caché
+        self.footprints = {}  # bytes estimados de cada módulo suspendido
+        self.max_cache_bytes = int(
+            float(max_cache_mb or os.getenv('MODULE_CACHE_MAX_MB', self.DEFAULT_MAX_MB)) * 1024 * 1024
+        )
         self.preload_data = {}  # Nuevo: Almacenar datos precargados
+        self.lifecycle = CicloVidaModulos()
         self.cache_stats = {
             'hits': 0,
-            'misses': 0
+            'misses': 0,
+            'evictions': 0
         }
 
     def get(self, module_name):
-        """Obtener módulo del caché con estadísticas"""
+        """Obtener módulo del caché (reanudándolo) con estadísticas"""
         if module_name in self.modules:
             self.cache_stats['hits'] += 1
             self.last_accessed[module_name] = time.time()
-            # Reducir logging para mejorar rendimiento
-            return self.modules[module_name]
+            instance = self.modules[module_name]
+            self.lifecycle.reanudar(instance)
+            self.footprints.pop(module_name, None)
+            return instance
         self.cache_stats['misses'] += 1
         return None
 
     def set(self, module_name, instance, preload_data=None):
         """Guardar módulo en caché con datos precargados"""
-        # Limpiar caché si excede el tamaño máximo
-        if len(self.modules) >= self.max_cache_size:
-            oldest_module = min(self.last_accessed.items(), key=lambda x: x[1])[0]
-            self.clear(oldest_module)
+        previous = self.modules.get(module_name)
+        if previous is not None and previous is not instance:
+            # La instancia reemplazada no se va a volver a mostrar
+            self.lifecycle.liberar(previous)
         
         self.modules[module_name] = instance
         self.last_accessed[module_name] = time.time()
+        self.footprints.pop(module_name, None)
         if preload_data:
             self.preload_data[module_name] = preload_data
 
+    def suspend(self, instance):
+        """Suspender el módulo que se oculta y expulsar otros si no hay memoria"""
+        module_name = next((name for name, module in self.modules.items() if module is instance), None)
+        if module_name is None:
+            # No está en caché: nadie lo va a reanudar
+            self.lifecycle.liberar(instance)
+            return
+        
+        self.lifecycle.suspender(instance)
+        self.footprints[module_name] = estimar_memoria(instance)
+        logger.debug("💤 %s suspendido (%.1f MB)", module_name, self.footprints[module_name] / 1024 / 1024)
+        self._evict()
+
+    def memory_usage(self):
+        """Bytes estimados que retienen los módulos suspendidos"""
+        return sum(self.footprints.values())
+
+    def _evict(self):
+        while self.footprints and self.memory_usage() > self.max_cache_bytes:
+            oldest_module = min(self.footprints, key=lambda name: self.last_accessed.get(name, 0))
+            logger.debug("🧹 Liberando %s de la caché (%.1f MB)", oldest_module, self.footprints[oldest_module] / 1024 / 1024)
+            self.clear(oldest_module)
+            self.cache_stats['evictions'] += 1
+
     def clear(self, module_name=None):
-        """Limpiar caché con manejo de recursos"""
+        """Limpiar caché liberando los recursos de los módulos"""
         if module_name:
             if module_name in self.modules:
-                # Limpiar recursos específicos del módulo
-                module = self.modules[module_name]
-                if hasattr(module, 'cleanup'):
-                    module.cleanup()
-                self.modules.pop(module_name)
-                self.last_accessed.pop(module_name)
+                self.lifecycle.liberar(self.modules.pop(module_name))
+                self.last_accessed.pop(module_name, None)
+                self.footprints.pop(module_name, None)
                 self.preload_data.pop(module_name, None)
         else:
             # Limpiar todos los módulos
-            for name, module in self.modules.items():
-                if hasattr(module, 'cleanup'):
-                    module.cleanup()
+            for module in self.modules.values():
+                self.lifecycle.liberar(module)
             self.modules.clear()
             self.last_accessed.clear()
+            self.footprints.clear()
             self.preload_data.clear()
 
 class ModuleLoader:
-    """Gestor de carga de módulos con precarga y caché"""
-    def __init__(self, max_workers=4):
-        self.executor = ThreadPoolExecutor(max_workers=max_workers)
-        self.preload_queue = queue.Queue()
+    """
+    Motor de arranque en caliente de los módulos.
+
+    Adelanta en segundo plano todo lo que no necesita Tk: abre conexiones del
+    pool, decodifica los frames del logo y deja en el almacén de precargas
+    (utils.warm_start) los datos iniciales de los módulos que el operador
+    probablemente abra, según su historial de uso. Cada módulo toma esos
+    resultados al construirse; si no están (o vencieron) los calcula como siempre.
+    """
+    # Módulos a precargar al iniciar y después de abrir cada módulo
+    MAX_STARTUP_PRELOADS = 3
+    MAX_NEXT_PRELOADS = 2
+    POOL_WARM_CONNECTIONS = 2
+
+    def __init__(self):
+        # Tareas de baja prioridad del gestor compartido: nunca demoran lo que pide el usuario
+        self.tasks = get_thread_manager()
         self.cache = {}
         self.loading_status = {}
+        self.registry = get_module_registry()
+        self.history = HistorialUso()
+        self.preload_tasks = self._build_preload_tasks()
+        self._preloading = set()
+        self._lock = threading.Lock()
         self._initialize_preload()
 
+    def _build_preload_tasks(self):
+        """Trabajo sin Tk que se puede adelantar para cada módulo (empezando por importarlo)"""
+        logo_square = lambda: frames_logo_gif(cuadrado=300, margen=20)
+        logo_200 = lambda: frames_logo_gif(alto=200)
+        tasks = {
+            "Módulo Personal": [
+                logo_square,
+                lambda: self.registry.obtener("Módulo Personal", "PaginadorPersonal").precargar_primera_pagina()
+            ],
+            "Módulo Felicitaciones": [logo_square],
+            "Módulo Sanciones": [logo_200],
+            "Módulo Conceptos": [logo_200],
+            "Módulo Préstamos": [lambda: frames_logo_gif(alto=160)],
+            "Módulo Certificados Médicos": [],
+            "Módulo Licencias": [logo_200],
+            "Módulo ART": [logo_square],
+            "Antecedentes Laborales": [
+                lambda: self.registry.obtener("Antecedentes Laborales", "precargar_antecedentes")()
+            ],
+        }
+        for name, name_tasks in tasks.items():
+            name_tasks.insert(0, lambda name=name: self.registry.importar(name))
+        return tasks
+
     def _initialize_preload(self):
-        """Iniciar precarga de módulos pesados en segundo plano"""
-        def preload_modules():
-            from modulos.modulo_personal import PersonalManagementApp
-            from modulos.modulo_felicitaciones import AplicacionFelicitaciones
-            from modulos.modulo_sanciones import AplicacionSanciones
-            from modulos.modulo_conceptos import AplicacionConceptos
-            from modulos.modulo_prestamos import AplicacionPrestamos
-            from modulos.modulo_certificados_medicos import AplicacionCertificadosMedicos
-            from modulos.modulo_licencias import AplicacionLicencias
-            
-            modules = {
-                "Módulo Personal": PersonalManagementApp,
-                "Módulo Felicitaciones": AplicacionFelicitaciones,
-                "Módulo Sanciones": AplicacionSanciones,
-                "Módulo Conceptos": AplicacionConceptos,
-                "Módulo Préstamos": AplicacionPrestamos,
-                "Módulo Certificados Médicos": AplicacionCertificadosMedicos,
-                "Módulo Licencias": AplicacionLicencias
+        """Registrar los módulos y precargar en segundo plano los más usados"""
+        # La clase se resuelve (e importa) recién al instanciar el módulo
+        for name in self.registry.nombres:
+            self.cache[name] = {
+                'class': None,
+                'status': 'ready',
+                'timestamp': time.time()
             }
-            
-            for name, module_class in modules.items():
-                self.loading_status[name] = "preloading"
-                try:
-                    # Importar pero no instanciar
-                    self.cache[name] = {
-                        'class': module_class,
-                        'status': 'ready',
-                        'timestamp': time.time()
-                    }
-                    print(f"✓ Módulo {name} precargado")
-                except Exception as e:
-                    print(f"❌ Error precargando {name}: {e}")
-                    self.loading_status[name] = "error"
 
-        self.executor.submit(preload_modules)
+        def warm_pool():
+            idle = get_pool().warm_up(self.POOL_WARM_CONNECTIONS)
+            logger.debug("✓ Pool de conexiones precalentado (%s ociosas)", idle)
+
+        def migrar_personal():
+            # personal.foto_hash reconstruye la tabla: se crea acá una sola
+            # vez, nunca desde una búsqueda (que mientras tanto usa LENGTH(foto))
+            try:
+                get_mantenimiento().asegurar_esquema('personal')
+            except Exception as e:
+                logger.error("❌ No se pudo actualizar el esquema de personal: %s", e)
+
+        self.tasks.submit_task("precalentar_pool", warm_pool, priority=ThreadManager.PRIORITY_LOW)
+        self.tasks.submit_task("esquema_personal", migrar_personal, priority=ThreadManager.PRIORITY_LOW)
+        self.preload(self.history.prioridades(list(self.preload_tasks), self.MAX_STARTUP_PRELOADS))
+
+    def preload(self, module_names):
+        """Encolar la precarga de los módulos indicados (en orden de prioridad)"""
+        for name in module_names:
+            with self._lock:
+                if name in self._preloading or name not in self.preload_tasks:
+                    continue
+                self._preloading.add(name)
+            self.loading_status[name] = "preloading"
+            self.tasks.submit_task(
+                f"precarga_{name}", self._run_preload, None, name, priority=ThreadManager.PRIORITY_LOW
+            )
+
+    def _run_preload(self, name):
+        inicio = time.perf_counter()
+        try:
+            for task in self.preload_tasks[name]:
+                task()
+            self.loading_status[name] = "ready"
+            logger.debug("✓ Módulo %s precargado (%.2fs)", name, time.perf_counter() - inicio)
+        except Exception as e:
+            logger.error("❌ Error precargando %s: %s", name, e)
+            self.loading_status[name] = "error"
+        finally:
+            with self._lock:
+                self._preloading.discard(name)
+
+    def prepare(self, module_name):
+        """
+        Trabajo sin Tk previo a construir un módulo, para el hilo de trabajo:
+        importarlo y, si no se precargó ni se está precargando, adelantar sus
+        datos iniciales. Devuelve la clase del módulo; los widgets se crean
+        después en el hilo de Tk.
+        """
+        with self._lock:
+            run = (
+                module_name in self.preload_tasks
+                and module_name not in self._preloading
+                and self.loading_status.get(module_name) != "ready"
+            )
+            if run:
+                self._preloading.add(module_name)
+        if run:
+            self.loading_status[module_name] = "preloading"
+            self._run_preload(module_name)
+        return self.registry.obtener(module_name)
+
+    def register_use(self, module_name):
+        """Registrar la apertura de un módulo y precargar los que suelen seguirle"""
+        def _register():
+            self.history.registrar(module_name)
+            self.preload(self.history.siguientes(
+                module_name, list(self.preload_tasks), self.MAX_NEXT_PRELOADS
+            ))
+        self.tasks.submit_task("registrar_uso", _register, priority=ThreadManager.PRIORITY_LOW)
 
-    @lru_cache(maxsize=5)
     def get_module_instance(self, module_name, parent_frame):
         """Obtener instancia de módulo con caché"""
         try:
@@ -143,24 +267,25 @@ class ModuleLoader:
             module_info = self.cache[module_name]
             if module_info['status'] == 'ready':
                 try:
+                    module_class = module_info['class'] or self.registry.obtener(module_name)
                     # Caso especial para AplicacionPrestamos
                     if module_name == "Módulo Préstamos":
-                        instance = module_info['class'](parent_frame=parent_frame, root=self._get_root(parent_frame))
+                        instance = module_class(parent_frame=parent_frame, root=self._get_root(parent_frame))
                     else:
-                        instance = module_info['class'](parent_frame)
+                        instance = module_class(parent_frame)
                     return instance
                 except Exception as e:
                     raise RuntimeError(f"Error instanciando {module_name}: {e}")
             else:
                 raise RuntimeError(f"Módulo {module_name} no está listo")
         except (ValueError, RuntimeError) as e:
-            print(f"⚠️ Error al cargar el módulo {module_name}: {e}")
+            logger.error("⚠️ Error al cargar el módulo %s: %s", module_name, e)
             # Intentar recargar el módulo desde cero
             return self.reload_module(module_name, parent_frame)
 
     def reload_module(self, module_name, parent_frame):
         """Recargar módulo desde cero si no se puede restaurar desde la caché"""
-        print(f"🔄 Intentando recargar el módulo {module_name} desde cero...")
+        logger.debug("🔄 Intentando recargar el módulo %s desde cero...", module_name)
         try:
             # Aquí deberías implementar la lógica para recargar el módulo
             # Por ejemplo, podrías volver a importar el módulo y crear una nueva instancia
@@ -189,9 +314,8 @@ class ModuleLoader:
                 from modulos.modulo_art import AplicacionART
                 instance = AplicacionART(parent_frame=self.module_frame)
             elif module_name == "Antecedentes Laborales":
-                # Cambiar esto para usar la función crear_modulo_antecedentes
-                print("Creando instancia de Módulo Antecedentes")
-                instance = crear_modulo_antecedentes(self.module_frame)
+                logger.debug("Creando instancia de Módulo Antecedentes")
+                instance = self.registry.obtener(module_name)(parent_frame)
             else:
                 raise ValueError(f"Módulo {module_name} no implementado para recarga")
 
@@ -203,7 +327,7 @@ class ModuleLoader:
             }
             return instance
         except Exception as e:
-            print(f"❌ Error al recargar el módulo {module_name}: {e}")
+            logger.error("❌ Error al recargar el módulo %s: %s", module_name, e)
             raise RuntimeError(f"No se pudo recargar el módulo {module_name}")
 
     def _get_root(self, widget):
@@ -214,16 +338,30 @@ class ModuleLoader:
         return current
 
     def load_module_async(self, module_name, parent_frame, callback):
-        """Cargar módulo de forma asíncrona"""
-        def _load():
+        """
+        Cargar módulo de forma asíncrona; callback recibe la instancia (None
+        si falló) en el hilo de Tk. En segundo plano solo se importa y se
+        precargan datos (prepare); la instancia crea widgets, así que se
+        construye en el hilo de Tk con parent_frame.after().
+        """
+        def _build():
             try:
                 instance = self.get_module_instance(module_name, parent_frame)
-                return instance
             except Exception as e:
-                raise RuntimeError(f"Error cargando {module_name}: {e}")
+                logger.error("❌ Error cargando %s: %s", module_name, e)
+                instance = None
+            callback(instance)
+
+        def _prepare():
+            try:
+                self.prepare(module_name)
+            except Exception as e:
+                logger.error("❌ Error preparando %s: %s", module_name, e)
+            parent_frame.after(0, _build)
 
-        future = self.executor.submit(_load)
-        future.add_done_callback(lambda f: callback(f.result()))
+        return self.tasks.submit_task(
+            f"load_{module_name}", _prepare, priority=ThreadManager.PRIORITY_HIGH
+        )
 
 class MainMenu(ctk.CTk):
     def __init__(self):
@@ -247,8 +385,17 @@ class MainMenu(ctk.CTk):
         self.is_destroyed = False
         self.is_loading = False
         
+        # Tiempo mínimo de la pantalla de carga (0 = ocultarla apenas el módulo está listo)
+        self.loading_min_time = float(os.getenv('MODULE_LOADING_MIN_SECONDS', '0'))
+        self.loading_start_time = time.time()
+        
+        # Telemetría de carga de módulos
+        self.load_telemetry = get_load_telemetry()
+        self.load_measurement = None
+        
         # Inicializar managers
-        self.thread_manager = ThreadManager(max_workers=4)
+        # Gestor de tareas compartido: los callbacks se entregan en el hilo de esta ventana
+        self.thread_manager = get_thread_manager(self)
         self.module_cache = ModuleCache()
         
         # Definir colores por defecto
@@ -297,9 +444,6 @@ class MainMenu(ctk.CTk):
         self.current_module = None
         self.loading_progress = None
 
-        # Inicializar caché de módulos
-        self.module_cache = ModuleCache()
-        
         # Añadir variable para controlar el estado de carga
         self.is_loading = False
 
@@ -312,9 +456,6 @@ class MainMenu(ctk.CTk):
         # Inicializar el loader de módulos
         self.module_loader = ModuleLoader()
         
-        # Aumentar caché
-        self.module_cache.max_cache_size = 10
-        
         # Estado de carga
         self.loading_states = {}
 
@@ -472,7 +613,7 @@ class MainMenu(ctk.CTk):
             )
             logo_label.pack(pady=(20, 0))
         except Exception as e:
-            print(f"Error cargando logo: {e}")
+            logger.error("Error cargando logo: %s", e)
             pass
 
         # Título del módulo con efecto de sombra
@@ -534,129 +675,111 @@ class MainMenu(ctk.CTk):
             if self.is_loading and hasattr(self, 'loading_frame') and self.loading_frame.winfo_exists():
                 self.after(800, self._animate_loading_messages)  # Cambiar mensaje cada 800ms
 
+    def _remaining_loading_ms(self):
+        """Milisegundos que faltan para cumplir el tiempo mínimo de carga configurado"""
+        elapsed_time = time.time() - self.loading_start_time
+        return int(max(0, self.loading_min_time - elapsed_time) * 1000)
+
     def hide_loading_screen(self):
-        """Ocultar pantalla de carga con efecto de desvanecimiento"""
+        """Ocultar pantalla de carga (respetando el tiempo mínimo configurado)"""
+        remaining = self._remaining_loading_ms()
+        if remaining > 0:
+            self.after(remaining, self.hide_loading_screen)
+            return
+        
         try:
             # Detener y limpiar la barra de progreso
             if hasattr(self, 'loading_progress') and self.loading_progress is not None:
                 try:
                     self.loading_progress.stop()
                 except Exception as e:
-                    print(f"Error al detener barra de progreso: {e}")
+                    logger.error("Error al detener barra de progreso: %s", e)
             
-            # Crear efecto de desvanecimiento
             if hasattr(self, 'loading_frame') and self.loading_frame is not None:
                 try:
-                    self._fade_out_loading_screen()
-                except Exception as e:
-                    print(f"Error al iniciar desvanecimiento: {e}")
-                    # Si falla el desvanecimiento, intentar destruir directamente
-                    try:
+                    if self.loading_frame.winfo_exists():
                         self.loading_frame.destroy()
-                    except:
-                        pass
-                    self.loading_frame = None
-            
-            # Limpiar referencias explícitamente
-            if not hasattr(self, 'loading_frame') or self.loading_frame is None:
-                self.loading_progress = None
-                self.loading_message = None
-                
+                except Exception as e:
+                    logger.error("Error al destruir pantalla de carga: %s", e)
+                    
         except Exception as e:
-            print(f"Error al ocultar pantalla de carga: {e}")
-            # Asegurar que las referencias se limpien incluso si hay error
+            logger.error("Error al ocultar pantalla de carga: %s", e)
+        finally:
+            # Limpiar referencias explícitamente
             self.loading_progress = None
             self.loading_frame = None
             self.loading_message = None
-    
-    def _fade_out_loading_screen(self, alpha=1.0):
-        """Crear efecto de desvanecimiento para la pantalla de carga"""
-        # Verificación inicial de seguridad
-        if not hasattr(self, 'loading_frame') or self.loading_frame is None:
-            return
         
-        try:
-            # Verificar si el frame todavía existe de manera segura
-            frame_exists = False
-            try:
-                frame_exists = self.loading_frame.winfo_exists()
-            except:
-                frame_exists = False
-            
-            if alpha <= 0 or not frame_exists:
-                # Cuando termina la animación o si el frame ya no existe
-                try:
-                    if frame_exists:
-                        self.loading_frame.destroy()
-                except:
-                    pass
-                
-                # Limpiar todas las referencias
-                self.loading_frame = None
-                self.loading_progress = None
-                self.loading_message = None
-                return
-            
-            # Reducir la opacidad gradualmente
-            new_alpha = alpha - 0.1
-            
-            # Actualizar mensaje para indicar que está cerrando
-            if hasattr(self, 'loading_message') and self.loading_message is not None:
-                try:
-                    message_exists = False
-                    try:
-                        message_exists = self.loading_message.winfo_exists()
-                    except:
-                        message_exists = False
-                    
-                    if message_exists:
-                        self.loading_message.configure(text="Completado ✓")
-                except Exception as e:
-                    print(f"Error al actualizar mensaje: {e}")
-            
-            # Continuar la animación
-            self.after(50, lambda: self._fade_out_loading_screen(new_alpha))
-        except Exception as e:
-            print(f"Error en animación de desvanecimiento: {e}")
-            # En caso de error, destruir directamente
-            try:
-                if hasattr(self, 'loading_frame') and self.loading_frame is not None:
-                    try:
-                        if self.loading_frame.winfo_exists():
-                            self.loading_frame.destroy()
-                    except:
-                        pass
-            except:
-                pass
-            
-            # Limpiar todas las referencias
-            self.loading_frame = None
-            self.loading_progress = None
-            self.loading_message = None
+        self._mark_module_painted()
+
+    def _start_load_measurement(self, module_name, origin):
+        """Comenzar la medición de tiempos de carga de un módulo"""
+        self.loading_start_time = time.time()
+        measurement = self.load_telemetry.iniciar(module_name, origin)
+        self.load_measurement = measurement
+
+        # Primera consulta terminada del módulo: aviso de un solo uso del
+        # pool, así fuera de una carga devolver conexiones no cuesta nada
+        def first_data():
+            DatabasePool.avisar_al_devolver(None)
+            measurement.marcar('primeros_datos')
+
+        DatabasePool.avisar_al_devolver(first_data)
+        return measurement
+
+    def _mark_module_painted(self):
+        """Registrar construcción y primer pintado del módulo en la telemetría"""
+        measurement = self.load_measurement
+        if measurement is None or measurement.finalizada:
+            return
+        measurement.marcar('construccion')
+        # after_idle corre después de los redibujados pendientes
+        self.after_idle(lambda: measurement.marcar('primer_pintado'))
+        # Si el módulo no consulta la base, cerrar la medición igualmente
+        self.after(10000, measurement.finalizar)
 
     def load_module(self, module_name):
         """Cargar módulo con manejo mejorado de caché y logging"""
         if self.is_loading:
-            print(f"⚠️ Ya hay una carga en proceso para: {module_name}")
+            logger.warning("⚠️ Ya hay una carga en proceso para: %s", module_name)
             return
         
         self.is_loading = True
-        print(f"\n🔄 === INICIANDO CARGA DE MÓDULO: {module_name} ===")
+        logger.debug("🔄 === INICIANDO CARGA DE MÓDULO: %s ===", module_name)
+        self.module_loader.register_use(module_name)
+        
+        # Suspender el módulo que se oculta antes de destruir sus widgets
+        self._suspend_current_module()
         
         # Limpiar frame actual
         for widget in self.module_frame.winfo_children():
             widget.destroy()
-        print("✓ Frame limpiado")
+        logger.debug("✓ Frame limpiado")
         
         self.show_loading_screen(module_name)
         
-        # Tiempo mínimo de carga para efecto visual (3 segundos)
-        self.loading_start_time = time.time()
-        self.loading_min_time = 3.0  # segundos
+        # Verificar caché primero
+        cached_module = self.module_cache.get(module_name)
+        measurement = self._start_load_measurement(module_name, 'cache' if cached_module else 'nuevo')
         
-        def create_module():
+        def prepare_module():
+            # Hilo de trabajo: importar y precargar datos, sin tocar Tk
+            try:
+                module_class = self.module_loader.prepare(module_name)
+            except Exception as e:
+                logger.error("❌ Error al preparar módulo %s: %s", module_name, e)
+                if not self.is_destroyed:
+                    self.after(0, lambda e=e: self._abort_module_load(f"Error creando módulo: {str(e)}"))
+                else:
+                    self.is_loading = False
+                return
+            if not self.is_destroyed:
+                self.after(0, lambda: create_module(module_class))
+
+        def create_module(module_class):
+            # Hilo de Tk: construir los widgets del módulo
             try:
-                print(f"\n🏗️ Creando nueva instancia de {module_name}")
+                logger.debug("🏗️ Creando nueva instancia de %s", module_name)
                 
                 # Crear nueva instancia del módulo
                 if module_name == "Módulo Préstamos":
@@ -672,34 +795,34 @@ class MainMenu(ctk.CTk):
                     container_frame.grid_rowconfigure(0, weight=1)
                     container_frame.grid_columnconfigure(0, weight=1)
                     
-                    print("Configurando frame para préstamos...")
-                    module_instance = AplicacionPrestamos(parent_frame=container_frame, root=self)
-                    print("✓ Módulo de préstamos creado")
+                    logger.debug("Configurando frame para préstamos...")
+                    module_instance = module_class(parent_frame=container_frame, root=self)
+                    logger.debug("✓ Módulo de préstamos creado")
                     
                     # Forzar actualización de la geometría
                     container_frame.update_idletasks()
                     self.module_frame.update_idletasks()
                 
                 elif module_name == "Módulo Personal":
-                    print("Configurando frame para personal...")
-                    module_instance = PersonalManagementApp(parent_frame=self.module_frame)
-                    print("✓ Módulo de personal creado")
+                    logger.debug("Configurando frame para personal...")
+                    module_instance = module_class(parent_frame=self.module_frame)
+                    logger.debug("✓ Módulo de personal creado")
                     
                     # Forzar actualización de la geometría
                     self.module_frame.update_idletasks()
                 
                 elif module_name == "Módulo Felicitaciones":
-                    module_instance = AplicacionFelicitaciones(parent_frame=self.module_frame)
+                    module_instance = module_class(parent_frame=self.module_frame)
                 elif module_name == "Módulo Sanciones":
-                    module_instance = AplicacionSanciones(parent_frame=self.module_frame)
+                    module_instance = module_class(parent_frame=self.module_frame)
                 elif module_name == "Módulo Conceptos":
-                    print("Creando instancia de AplicacionConceptos")  # Debug
-                    module_instance = AplicacionConceptos(parent_frame=self.module_frame)
+                    logger.debug("Creando instancia de AplicacionConceptos")  # Debug
+                    module_instance = module_class(parent_frame=self.module_frame)
                 elif module_name == "Módulo Certificados Médicos":
-                    print("Creando instancia de AplicacionCertificadosMedicos")
-                    module_instance = AplicacionCertificadosMedicos(parent_frame=self.module_frame)
+                    logger.debug("Creando instancia de AplicacionCertificadosMedicos")
+                    module_instance = module_class(parent_frame=self.module_frame)
                 elif module_name == "Módulo Licencias":
-                    print("Configurando frame para licencias...")
+                    logger.debug("Configurando frame para licencias...")
                     
                     # Configurar el grid del module_frame
                     self.module_frame.grid_rowconfigure(0, weight=1)
@@ -713,14 +836,14 @@ class MainMenu(ctk.CTk):
                     container_frame.grid_rowconfigure(0, weight=1)
                     container_frame.grid_columnconfigure(0, weight=1)
                     
-                    module_instance = AplicacionLicencias(parent_frame=container_frame)
-                    print("✓ Módulo de licencias creado")
+                    module_instance = module_class(parent_frame=container_frame)
+                    logger.debug("✓ Módulo de licencias creado")
                     
                     # Forzar actualización de la geometría
                     container_frame.update_idletasks()
                     self.module_frame.update_idletasks()
                 elif module_name == "Módulo ART":
-                    print("Configurando frame para ART...")
+                    logger.debug("Configurando frame para ART...")
                     
                     # Configurar el grid del module_frame
                     self.module_frame.grid_rowconfigure(0, weight=1)
@@ -734,69 +857,74 @@ class MainMenu(ctk.CTk):
                     container_frame.grid_rowconfigure(0, weight=1)
                     container_frame.grid_columnconfigure(0, weight=1)
                     
-                    module_instance = AplicacionART(parent_frame=container_frame)
-                    print("✓ Módulo de ART creado")
+                    module_instance = module_class(parent_frame=container_frame)
+                    logger.debug("✓ Módulo de ART creado")
                     
                     # Forzar actualización de la geometría
                     container_frame.update_idletasks()
                     self.module_frame.update_idletasks()
                 elif module_name == "Antecedentes Laborales":
-                    print("Creando instancia de Módulo Antecedentes")
-                    module_instance = crear_modulo_antecedentes(self.module_frame)
+                    logger.debug("Creando instancia de Módulo Antecedentes")
+                    module_instance = module_class(self.module_frame)
                 else:
                     raise ValueError(f"Módulo no reconocido: {module_name}")
 
-                print(f"✓ Módulo {module_name} creado exitosamente")
+                logger.debug("✓ Módulo %s creado exitosamente", module_name)
+                measurement.marcar('construccion')
                 
                 if not self.is_destroyed:
-                    print("Finalizando carga del módulo...")
-                    # Calcular tiempo transcurrido y esperar si es necesario
-                    elapsed_time = time.time() - self.loading_start_time
-                    remaining_time = max(0, self.loading_min_time - elapsed_time)
-                    
-                    if remaining_time > 0:
-                        print(f"Esperando {remaining_time:.2f} segundos adicionales para efecto visual...")
-                        self.update_loading_status(f"✨ Finalizando... ({int(remaining_time)}s)")
-                        self.after(int(remaining_time * 1000), lambda: self._finish_module_load(module_instance, module_name))
-                    else:
-                        self.after(0, lambda: self._finish_module_load(module_instance, module_name))
+                    logger.debug("Finalizando carga del módulo...")
+                    self._finish_module_load(module_instance, module_name)
                     
             except Exception as e:
-                print(f"❌ Error al crear módulo {module_name}: {str(e)}")
-                if not self.is_destroyed:
-                    self.after(0, lambda: self.show_error(f"Error creando módulo: {str(e)}"))
-                    self.after(0, self.hide_loading_screen)
-                self.is_loading = False
+                logger.error("❌ Error al crear módulo %s: %s", module_name, e)
+                self._abort_module_load(f"Error creando módulo: {str(e)}")
 
-        # Verificar caché primero
-        cached_module = self.module_cache.get(module_name)
         if cached_module:
-            print(f"📦 Restaurando {module_name} desde caché")
+            logger.debug("📦 Restaurando %s desde caché", module_name)
             self.update_loading_status("📦 Restaurando desde caché...")
-            # Incluso para módulos en caché, esperar el tiempo mínimo
-            self.after(int(self.loading_min_time * 1000), lambda: self._restore_cached_module(cached_module, module_name))
+            self.after(0, lambda: self._restore_cached_module(cached_module, module_name))
             return
 
-        # Crear módulo en thread separado
-        print(f"🚀 Creando nuevo {module_name}")
+        # Importar y precargar en segundo plano; los widgets se crean en el hilo de Tk
+        logger.debug("🚀 Creando nuevo %s", module_name)
         self.update_loading_status("🚀 Iniciando módulo...")
-        self.thread_manager.submit_task(f"load_{module_name}", create_module)
+        self.thread_manager.submit_task(
+            f"load_{module_name}", prepare_module, priority=ThreadManager.PRIORITY_HIGH
+        )
+
+    def _abort_module_load(self, message):
+        """Mostrar el error de una carga fallida y liberar la pantalla de carga (hilo de Tk)"""
+        self.is_loading = False
+        if self.is_destroyed:
+            return
+        self.show_error(message)
+        self.hide_loading_screen()
+
+    def _suspend_current_module(self):
+        """Suspender el módulo en pantalla (animación, hilos) al cambiar de módulo"""
+        if self.current_module is not None:
+            try:
+                self.module_cache.suspend(self.current_module)
+            except Exception as e:
+                logger.error("⚠️ Error suspendiendo el módulo actual: %s", e)
+            self.current_module = None
 
     def _finish_module_load(self, module_instance, module_name):
         """Finalizar la carga del módulo con efectos visuales mejorados"""
-        print(f"\n✨ === FINALIZANDO CARGA: {module_name} ===")
+        logger.debug("✨ === FINALIZANDO CARGA: %s ===", module_name)
         try:
-            print("1. Guardando en caché...")
+            logger.debug("1. Guardando en caché...")
             self.module_cache.set(module_name, module_instance)
             
-            print("2. Actualizando módulo actual...")
+            logger.debug("2. Actualizando módulo actual...")
             self.current_module = module_instance
             
-            print("3. Verificando estado del frame...")
+            logger.debug("3. Verificando estado del frame...")
             if hasattr(module_instance, 'diagnostico_gui'):
                 module_instance.diagnostico_gui()
             
-            print("4. Preparando transición visual...")
+            logger.debug("4. Preparando transición visual...")
             # Mostrar mensaje de éxito en la pantalla de carga
             if hasattr(self, 'loading_message') and self._widget_exists(self.loading_message):
                 self.loading_message.configure(
@@ -811,25 +939,24 @@ class MainMenu(ctk.CTk):
                 self.loading_progress.configure(mode="determinate")
                 self.loading_progress.set(1.0)  # Progreso completo
             
-            # Esperar un momento para mostrar el mensaje de éxito
-            self.after(800, self.hide_loading_screen)
+            self.hide_loading_screen()
             
-            print(f"✓ Carga de {module_name} completada")
+            logger.debug("✓ Carga de %s completada", module_name)
             self.is_loading = False
             
         except Exception as e:
-            print(f"❌ Error finalizando carga: {str(e)}")
+            logger.error("❌ Error finalizando carga: %s", e)
             self.show_error(f"Error finalizando carga: {str(e)}")
             self.is_loading = False
             self.hide_loading_screen()
 
     def _restore_cached_module(self, cached_module, module_name):
         """Restaurar módulo desde caché con efectos visuales mejorados"""
-        print(f"\n📦 === RESTAURANDO DESDE CACHÉ: {module_name} ===")
+        logger.debug("📦 === RESTAURANDO DESDE CACHÉ: %s ===", module_name)
         try:
             # Verificar que el módulo en caché no sea None
             if cached_module is None:
-                print(f"❌ Error: El módulo en caché es None para {module_name}")
+                logger.error("❌ Error: El módulo en caché es None para %s", module_name)
                 raise Exception(f"Módulo en caché inválido (None) para {module_name}")
                 
             # Caso especial para el Módulo Personal
@@ -845,11 +972,11 @@ class MainMenu(ctk.CTk):
                 self._restore_antecedentes_module(cached_module)
                 return
             
-            print("1. Verificando estado del módulo...")
+            logger.debug("1. Verificando estado del módulo...")
             if not hasattr(cached_module, 'show_in_frame'):
                 raise Exception(f"Módulo en caché inválido: no tiene método 'show_in_frame' para {module_name}")
             
-            print("2. Preparando frame...")
+            logger.debug("2. Preparando frame...")
             # Limpiar eventos y bindings primero
             for widget in self.module_frame.winfo_children():
                 try:
@@ -859,17 +986,17 @@ class MainMenu(ctk.CTk):
                     # Destruir el widget
                     widget.destroy()
                 except Exception as e:
-                    print(f"Error limpiando widget: {e}")
+                    logger.error("Error limpiando widget: %s", e)
             
             self.module_frame.update_idletasks()
             
-            print("3. Restaurando módulo...")
+            logger.debug("3. Restaurando módulo...")
             cached_module.show_in_frame(self.module_frame)
             
-            print("4. Actualizando referencias...")
+            logger.debug("4. Actualizando referencias...")
             self.current_module = cached_module
             
-            print("5. Preparando transición visual...")
+            logger.debug("5. Preparando transición visual...")
             # Mostrar mensaje de éxito en la pantalla de carga
             if hasattr(self, 'loading_message') and self._widget_exists(self.loading_message):
                 self.loading_message.configure(
@@ -884,14 +1011,13 @@ class MainMenu(ctk.CTk):
                 self.loading_progress.configure(mode="determinate")
                 self.loading_progress.set(1.0)  # Progreso completo
             
-            # Esperar un momento para mostrar el mensaje de éxito
-            self.after(800, self.hide_loading_screen)
+            self.hide_loading_screen()
             
-            print("✓ Restauración completada")
+            logger.debug("✓ Restauración completada")
             self.is_loading = False
             
         except Exception as e:
-            print(f"❌ Error restaurando módulo: {str(e)}")
+            logger.error("❌ Error restaurando módulo: %s", e)
             traceback.print_exc()  # Imprimir el traceback completo para depuración
             self.show_error(f"Error en restauración: {str(e)}")
             self.module_cache.clear(module_name)
@@ -901,7 +1027,7 @@ class MainMenu(ctk.CTk):
     
     def _create_fallback_module(self, module_name):
         """Crear un nuevo módulo como fallback cuando falla la restauración desde caché"""
-        print(f"🔄 Creando nuevo módulo {module_name} como fallback...")
+        logger.debug("🔄 Creando nuevo módulo %s como fallback...", module_name)
         try:
             if module_name == "Módulo Personal":
                 self._create_personal_module()
@@ -922,15 +1048,15 @@ class MainMenu(ctk.CTk):
             elif module_name == "Antecedentes Laborales":
                 self._create_antecedentes_module()
             else:
-                print(f"⚠️ No hay método de fallback para {module_name}")
+                logger.warning("⚠️ No hay método de fallback para %s", module_name)
                 self.is_loading = False
         except Exception as e:
-            print(f"❌ Error en fallback para {module_name}: {str(e)}")
+            logger.error("❌ Error en fallback para %s: %s", module_name, e)
             self.is_loading = False
 
     def _restore_personal_module(self, cached_module, module_name="Módulo Personal"):
         """Restaurar módulo personal desde caché con manejo mejorado"""
-        print(f"\n📦 === RESTAURANDO MÓDULO PERSONAL ===")
+        logger.debug("📦 === RESTAURANDO MÓDULO PERSONAL ===")
         try:
             # Limpiar frame actual de forma segura
             for widget in self.module_frame.winfo_children():
@@ -966,21 +1092,21 @@ class MainMenu(ctk.CTk):
                     self.current_module = cached_module
                     self.is_loading = False
                     self.hide_loading_screen()
-                    print("✅ Módulo personal restaurado correctamente")
+                    logger.debug("✅ Módulo personal restaurado correctamente")
                     
                 except Exception as e:
-                    print(f"❌ Error en restauración final: {str(e)}")
+                    logger.error("❌ Error en restauración final: %s", e)
                     traceback.print_exc()
                     self.show_error(f"Error restaurando módulo: {str(e)}")
                     self.module_cache.clear(module_name)
                     self.is_loading = False
                     self._create_personal_module()  # Crear nuevo como fallback
             
-            # Usar after para dar tiempo a la actualización de la UI
-            self.after(300, finish_restore)
+            # Restaurar apenas se procesen los eventos pendientes de la UI
+            self.after_idle(finish_restore)
             
         except Exception as e:
-            print(f"❌ Error inicial al restaurar módulo personal: {str(e)}")
+            logger.error("❌ Error inicial al restaurar módulo personal: %s", e)
             traceback.print_exc()
             self.show_error(f"Error en restauración: {str(e)}")
             self.is_loading = False
@@ -1010,7 +1136,7 @@ class MainMenu(ctk.CTk):
             self.hide_loading_screen()
             
         except Exception as e:
-            print(f"❌ Error creando módulo personal: {str(e)}")
+            logger.error("❌ Error creando módulo personal: %s", e)
             traceback.print_exc()
             self.show_error(f"Error creando módulo: {str(e)}")
             self.is_loading = False
@@ -1040,8 +1166,7 @@ class MainMenu(ctk.CTk):
                 self.loading_progress.configure(mode="determinate")
                 self.loading_progress.set(1.0)  # Progreso completo
             
-            # Esperar un momento para mostrar el mensaje de éxito
-            self.after(800, self.hide_loading_screen)
+            self.hide_loading_screen()
             
             self.is_loading = False
             
@@ -1080,8 +1205,7 @@ class MainMenu(ctk.CTk):
                     self.loading_progress.configure(mode="determinate")
                     self.loading_progress.set(1.0)  # Progreso completo
                 
-                # Esperar un momento para mostrar el mensaje de éxito
-                self.after(800, self.hide_loading_screen)
+                self.hide_loading_screen()
                 
                 self.is_loading = False
                 
@@ -1089,8 +1213,8 @@ class MainMenu(ctk.CTk):
                 self.show_error(f"Error creando módulo: {str(e)}")
                 self.is_loading = False
         
-        # Usar after para dar tiempo a la UI de actualizarse
-        self.after(200, create_module)
+        # Crear apenas se procesen los eventos pendientes de la UI
+        self.after_idle(create_module)
 
     def _create_sanciones_module(self):
         """Crear nuevo módulo de sanciones"""
@@ -1125,8 +1249,7 @@ class MainMenu(ctk.CTk):
                     self.loading_progress.configure(mode="determinate")
                     self.loading_progress.set(1.0)  # Progreso completo
                 
-                # Esperar un momento para mostrar el mensaje de éxito
-                self.after(800, self.hide_loading_screen)
+                self.hide_loading_screen()
                 
                 self.is_loading = False
                 
@@ -1134,8 +1257,8 @@ class MainMenu(ctk.CTk):
                 self.show_error(f"Error creando módulo: {str(e)}")
                 self.is_loading = False
         
-        # Usar after para dar tiempo a la UI de actualizarse
-        self.after(200, create_module)
+        # Crear apenas se procesen los eventos pendientes de la UI
+        self.after_idle(create_module)
 
     def _create_conceptos_module(self):
         """Crear nuevo módulo de conceptos"""
@@ -1149,8 +1272,8 @@ class MainMenu(ctk.CTk):
         
         def create_module():
             try:
-                print("Creando módulo de conceptos...")
-                print(f"Frame padre: {self.module_frame}")
+                logger.debug("Creando módulo de conceptos...")
+                logger.debug("Frame padre: %s", self.module_frame)
                 
                 # Crear el módulo con el frame correcto
                 new_module = AplicacionConceptos(parent_frame=self.module_frame)
@@ -1159,7 +1282,7 @@ class MainMenu(ctk.CTk):
                 if new_module is None:
                     raise Exception("Error al crear el módulo de conceptos")
                 
-                print("Módulo creado exitosamente")
+                logger.debug("Módulo creado exitosamente")
                 
                 # Asignar y guardar en caché
                 self.current_module = new_module
@@ -1179,18 +1302,17 @@ class MainMenu(ctk.CTk):
                     self.loading_progress.configure(mode="determinate")
                     self.loading_progress.set(1.0)  # Progreso completo
                 
-                # Esperar un momento para mostrar el mensaje de éxito
-                self.after(800, self.hide_loading_screen)
+                self.hide_loading_screen()
                 
                 self.is_loading = False
                 
             except Exception as e:
-                print(f"Error detallado al crear módulo: {str(e)}")
+                logger.error("Error detallado al crear módulo: %s", e)
                 self.show_error(f"Error creando módulo: {str(e)}")
                 self.is_loading = False
         
-        # Usar after para dar tiempo a la UI de actualizarse
-        self.after(200, create_module)
+        # Crear apenas se procesen los eventos pendientes de la UI
+        self.after_idle(create_module)
 
     def _create_prestamos_module(self):
         """Crear nuevo módulo de préstamos"""
@@ -1236,8 +1358,7 @@ class MainMenu(ctk.CTk):
                     self.loading_progress.configure(mode="determinate")
                     self.loading_progress.set(1.0)  # Progreso completo
                 
-                # Esperar un momento para mostrar el mensaje de éxito
-                self.after(800, self.hide_loading_screen)
+                self.hide_loading_screen()
                 
                 self.is_loading = False
                 
@@ -1245,8 +1366,8 @@ class MainMenu(ctk.CTk):
                 self.show_error(f"Error creando módulo: {str(e)}")
                 self.is_loading = False
         
-        # Dar tiempo para que la UI se actualice
-        self.after(200, create_module)
+        # Crear apenas se procesen los eventos pendientes de la UI
+        self.after_idle(create_module)
 
     def _create_certificados_medicos_module(self):
         """Crear nuevo módulo de certificados médicos"""
@@ -1281,8 +1402,7 @@ class MainMenu(ctk.CTk):
                     self.loading_progress.configure(mode="determinate")
                     self.loading_progress.set(1.0)  # Progreso completo
                 
-                # Esperar un momento para mostrar el mensaje de éxito
-                self.after(800, self.hide_loading_screen)
+                self.hide_loading_screen()
                 
                 self.is_loading = False
                 
@@ -1290,8 +1410,8 @@ class MainMenu(ctk.CTk):
                 self.show_error(f"Error creando módulo: {str(e)}")
                 self.is_loading = False
         
-        # Usar after para dar tiempo a la UI de actualizarse
-        self.after(200, create_module)
+        # Crear apenas se procesen los eventos pendientes de la UI
+        self.after_idle(create_module)
 
     def _restore_art_module(self, cached_module):
         """Restaurar módulo de ART desde caché"""
@@ -1336,8 +1456,7 @@ class MainMenu(ctk.CTk):
                 self.loading_progress.configure(mode="determinate")
                 self.loading_progress.set(1.0)  # Progreso completo
             
-            # Esperar un momento para mostrar el mensaje de éxito
-            self.after(800, self.hide_loading_screen)
+            self.hide_loading_screen()
             
             self.is_loading = False
             
@@ -1387,8 +1506,8 @@ class MainMenu(ctk.CTk):
                     self.show_error(f"Error creando módulo: {str(e)}")
                     self.is_loading = False
             
-            # Dar tiempo para que la UI se actualice
-            self.after(200, create_module)
+            # Crear apenas se procesen los eventos pendientes de la UI
+            self.after_idle(create_module)
             
         except Exception as e:
             self.show_error(f"Error en creación: {str(e)}")
@@ -1401,8 +1520,8 @@ class MainMenu(ctk.CTk):
                 if self.loading_message.winfo_exists():
                     self.loading_message.configure(text=message)
             except Exception as e:
-                print(f"Error al actualizar mensaje de carga: {e}")
-        print(message)
+                logger.error("Error al actualizar mensaje de carga: %s", e)
+        logger.debug("%s", message)
 
     def show_error(self, message):
         """Mostrar mensaje de error de forma segura"""
@@ -1451,7 +1570,7 @@ class MainMenu(ctk.CTk):
         self.after(100, self.update_clock)
 
     def open_settings(self):
-        print("Abrir configuración")
+        logger.debug("Abrir configuración")
 
     def logout(self):
         """Cerrar sesión y limpiar caché"""
@@ -1462,9 +1581,9 @@ class MainMenu(ctk.CTk):
             if hasattr(self, 'current_module') and self.current_module:
                 if hasattr(self.current_module, 'db'):
                     self.current_module.db.close()
-            print("Cerrar sesión")
+            logger.debug("Cerrar sesión")
         except Exception as e:
-            print(f"Error al cerrar sesión: {e}")
+            logger.error("Error al cerrar sesión: %s", e)
 
     def _create_welcome_screen(self):
         """Crear pantalla de bienvenida en el frame principal"""
@@ -1513,7 +1632,7 @@ class MainMenu(ctk.CTk):
             self.welcome_logo.pack(expand=True)
 
         except Exception as e:
-            print(f"Error cargando logo de bienvenida: {e}")
+            logger.error("Error cargando logo de bienvenida: %s", e)
 
         # Mensajes de bienvenida
         ctk.CTkLabel(
@@ -1571,69 +1690,76 @@ class MainMenu(ctk.CTk):
     def abrir_modulo_antecedentes(self):
         """Método mejorado para abrir el módulo de antecedentes"""
         if self.is_loading:
-            print("⚠️ Ya hay una carga en proceso")
+            logger.warning("⚠️ Ya hay una carga en proceso")
             return
         
         self.is_loading = True
-        print("\n🔄 === INICIANDO CARGA DE MÓDULO: Antecedentes Laborales ===")
+        logger.debug("🔄 === INICIANDO CARGA DE MÓDULO: Antecedentes Laborales ===")
+        self.module_loader.register_use("Antecedentes Laborales")
+        
+        # Suspender el módulo que se oculta antes de destruir sus widgets
+        self._suspend_current_module()
         
         # Limpiar el contenido actual del frame principal
         for widget in self.module_frame.winfo_children():
             widget.destroy()
-        print("✓ Frame limpiado")
+        logger.debug("✓ Frame limpiado")
         
         self.show_loading_screen("Antecedentes Laborales")
         
-        # Tiempo mínimo de carga para efecto visual
-        self.loading_start_time = time.time()
-        self.loading_min_time = 3.0  # segundos
+        # Verificar caché primero
+        cached_module = self.module_cache.get("Antecedentes Laborales")
+        measurement = self._start_load_measurement("Antecedentes Laborales", 'cache' if cached_module else 'nuevo')
         
-        def create_antecedentes_module():
+        def prepare_antecedentes_module():
+            # Hilo de trabajo: importar y precargar datos, sin tocar Tk
             try:
-                print("\n🏗️ Creando nueva instancia de Módulo Antecedentes")
+                module_class = self.module_loader.prepare("Antecedentes Laborales")
+            except Exception as e:
+                logger.error("❌ Error al preparar módulo Antecedentes: %s", e)
+                if not self.is_destroyed:
+                    self.after(0, lambda e=e: self._abort_module_load(f"Error creando módulo: {str(e)}"))
+                else:
+                    self.is_loading = False
+                return
+            if not self.is_destroyed:
+                self.after(0, lambda: create_antecedentes_module(module_class))
+
+        def create_antecedentes_module(module_class):
+            # Hilo de Tk: construir los widgets del módulo
+            try:
+                logger.debug("🏗️ Creando nueva instancia de Módulo Antecedentes")
                 
                 # Crear y mostrar el módulo de antecedentes
-                module_instance = crear_modulo_antecedentes(self.module_frame)
+                module_instance = module_class(self.module_frame)
+                measurement.marcar('construccion')
                 
                 # Actualizar título
                 self.title("Sistema RRHH - Antecedentes Laborales")
                 
-                # Calcular tiempo transcurrido y esperar si es necesario
-                elapsed_time = time.time() - self.loading_start_time
-                remaining_time = max(0, self.loading_min_time - elapsed_time)
-                
-                if remaining_time > 0:
-                    print(f"Esperando {remaining_time:.2f} segundos adicionales para efecto visual...")
-                    self.update_loading_status(f"✨ Finalizando... ({int(remaining_time)}s)")
-                    self.after(int(remaining_time * 1000), lambda: self._finish_module_load(module_instance, "Antecedentes Laborales"))
-                else:
-                    self.after(0, lambda: self._finish_module_load(module_instance, "Antecedentes Laborales"))
+                self._finish_module_load(module_instance, "Antecedentes Laborales")
                 
             except Exception as e:
-                print(f"❌ Error al crear módulo Antecedentes: {str(e)}")
+                logger.error("❌ Error al crear módulo Antecedentes: %s", e)
                 traceback.print_exc()
-                if not self.is_destroyed:
-                    self.after(0, lambda: self.show_error(f"Error creando módulo: {str(e)}"))
-                    self.after(0, self.hide_loading_screen)
-                self.is_loading = False
+                self._abort_module_load(f"Error creando módulo: {str(e)}")
         
-        # Verificar caché primero
-        cached_module = self.module_cache.get("Antecedentes Laborales")
         if cached_module:
-            print(f"📦 Restaurando Antecedentes Laborales desde caché")
+            logger.debug("📦 Restaurando Antecedentes Laborales desde caché")
             self.update_loading_status("📦 Restaurando desde caché...")
-            # Incluso para módulos en caché, esperar el tiempo mínimo
-            self.after(int(self.loading_min_time * 1000), lambda: self._restore_antecedentes_module(cached_module))
+            self.after(0, lambda: self._restore_antecedentes_module(cached_module))
             return
         
-        # Crear módulo en thread separado
-        print(f"🚀 Creando nuevo Antecedentes Laborales")
+        # Importar y precargar en segundo plano; los widgets se crean en el hilo de Tk
+        logger.debug("🚀 Creando nuevo Antecedentes Laborales")
         self.update_loading_status("🚀 Iniciando módulo...")
-        self.thread_manager.submit_task("load_Antecedentes", create_antecedentes_module)
+        self.thread_manager.submit_task(
+            "load_Antecedentes", prepare_antecedentes_module, priority=ThreadManager.PRIORITY_HIGH
+        )
 
     def _restore_antecedentes_module(self, cached_module):
         """Restaurar módulo de antecedentes desde caché"""
-        print(f"\n📦 === RESTAURANDO MÓDULO ANTECEDENTES ===")
+        logger.debug("📦 === RESTAURANDO MÓDULO ANTECEDENTES ===")
         try:
             # Limpiar frame actual de forma segura
             for widget in self.module_frame.winfo_children():
@@ -1644,8 +1770,8 @@ class MainMenu(ctk.CTk):
             
             # En lugar de intentar restaurar, es más seguro crear uno nuevo
             # ya que el módulo puede tener referencias a widgets que ya no existen
-            print("Creando nueva instancia en lugar de restaurar")
-            new_module = crear_modulo_antecedentes(self.module_frame)
+            logger.debug("Creando nueva instancia en lugar de restaurar")
+            new_module = self.module_loader.registry.obtener("Antecedentes Laborales")(self.module_frame)
             
             # Actualizar título
             self.title("Sistema RRHH - Antecedentes Laborales")
@@ -1668,14 +1794,13 @@ class MainMenu(ctk.CTk):
                 self.loading_progress.configure(mode="determinate")
                 self.loading_progress.set(1.0)  # Progreso completo
             
-            # Esperar un momento para mostrar el mensaje de éxito
-            self.after(800, self.hide_loading_screen)
+            self.hide_loading_screen()
             
             self.is_loading = False
-            print("✅ Módulo antecedentes cargado correctamente")
+            logger.debug("✅ Módulo antecedentes cargado correctamente")
             
         except Exception as e:
-            print(f"❌ Error al cargar módulo: {str(e)}")
+            logger.error("❌ Error al cargar módulo: %s", e)
             traceback.print_exc()
             self.show_error(f"Error cargando módulo: {str(e)}")
             self.module_cache.clear("Antecedentes Laborales")
@@ -1684,5 +1809,9 @@ class MainMenu(ctk.CTk):
             self.after(200, self._create_antecedentes_module)
 
 if __name__ == "__main__":
+    configurar_logging()
+    if diagnostico_solicitado():
+        # Perfil de importación en frío (en procesos aparte) para seguir las regresiones de arranque
+        threading.Thread(target=diagnostico_arranque, name="perfil-importacion", daemon=True).start()
     app = MainMenu()
     app.mainloop()
\ No newline at end of file
@@ -1,18 +1,20 @@
 import os
 import io
 import threading
-import tempfile
 import webbrowser
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, date
 from queue import Queue
 from concurrent.futures import ThreadPoolExecutor
 from PIL import Image as PILImage, ImageTk, UnidentifiedImageError
 import mysql.connector
 from dotenv import load_dotenv
-from weasyprint import HTML
-from jinja2 import Environment, FileSystemLoader
+import re
 import glob
+import json
 import time
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 # CustomTkinter imports
 import customtkinter as ctk
@@ -131,112 +133,21 @@ except ImportError:
                 self.COLOR_ADVERTENCIA = "#f39c12"  # Naranja
                 self.COLOR_ADVERTENCIA_HOVER = "#d35400"
                 
-                print("⚠️ Usando EstiloApp de respaldo - No se pudo importar desde utils")
+                logger.warning("⚠️ Usando EstiloApp de respaldo - No se pudo importar desde utils")
 
 # Cargar variables de entorno
 load_dotenv()
 
 # ------------------ Configuración de la base de datos ------------------
-class DatabaseManager:
-    """Gestor de conexiones a base de datos con pool de hilos"""
-    def __init__(self):
-        self.config = {
-            'host': os.getenv('DB_HOST'),
-            'user': os.getenv('DB_USER'),
-            'password': os.getenv('DB_PASSWORD'),
-            'database': os.getenv('DB_DATABASE')
-        }
-        self.executor = ThreadPoolExecutor(max_workers=3)
-        self.connection_pool = []
-        self.queue = Queue()
-        self._initialize_pool()
-
-    def _initialize_pool(self, pool_size=3):
-        """Inicializar pool de conexiones"""
-        try:
-            for _ in range(pool_size):
-                connection = mysql.connector.connect(**self.config)
-                self.connection_pool.append(connection)
-        except Exception as e:
-            print(f"Error inicializando pool: {e}")
-
-    def get_connection(self):
-        """Obtener una conexión del pool"""
-        if not self.connection_pool:
-            connection = mysql.connector.connect(**self.config)
-            return connection
-        return self.connection_pool.pop()
-
-    def return_connection(self, connection):
-        """Devolver una conexión al pool"""
-        if connection and connection.is_connected():
-            self.connection_pool.append(connection)
-
-    def execute_query_async(self, query: str, params: tuple = None, callback=None):
-        """Ejecutar consulta de forma asíncrona usando ThreadPoolExecutor"""
-        print(f"\n📡 Ejecutando consulta: {query}")
-        print(f"🔧 Parámetros: {params}")
-
-        def _async_query():
-            connection = None
-            cursor = None
-            try:
-                print("🔌 Obteniendo conexión del pool...")
-                connection = self.get_connection()
-                print("✅ Conexión obtenida")
-
-                print("🔄 Creando cursor...")
-                cursor = connection.cursor()
-                print("✅ Cursor creado")
-
-                print("🚀 Ejecutando consulta en la base de datos...")
-                if params:
-                    cursor.execute(query, params)
-                else:
-                    cursor.execute(query)
-                print("✅ Consulta ejecutada")
+from utils.thread_manager import DatabasePool
+from utils.image_utils import decodificar_imagen, imagen_a_data_uri, limpiar_temporales_heredados
+from utils.virtual_tree import VirtualTreeview
+from utils.warm_start import get_warm_store
 
-                if query.strip().lower().startswith('select'):
-                    print("📥 Obteniendo resultados...")
-                    result = cursor.fetchall()
-                    print(f"✨ Resultados obtenidos: {len(result) if result else 0} registros")
-                else:
-                    print("💾 Haciendo commit de la transacción...")
-                    connection.commit()
-                    result = True
-                    print("✅ Commit realizado")
+logger = logging.getLogger(__name__)
 
-                if callback:
-                    print("🔄 Enviando resultado al callback...")
-                    callback(result)
-                    print("✅ Callback ejecutado")
-                else:
-                    print("⚠️ No se definió callback")
-
-            except Exception as e:
-                print(f"❌ Error en consulta: {str(e)}")
-                if callback:
-                    callback(None)
-            finally:
-                if cursor:
-                    cursor.close()
-                    print("🔌 Cursor cerrado")
-                if connection:
-                    self.return_connection(connection)
-                    print("🔌 Conexión devuelta al pool")
-
-        self.executor.submit(_async_query)
-
-    def close(self):
-        """Cerrar todas las conexiones en el pool"""
-        while self.connection_pool:
-            connection = self.connection_pool.pop()
-            if connection.is_connected():
-                connection.close()
-        self.executor.shutdown(wait=True)
-
-# Instanciar el administrador de base de datos
-db_manager = DatabaseManager()
+# Acceso al pool de conexiones compartido (no abre conexiones hasta el primer uso)
+db_manager = DatabasePool()
 
 # ------------------ Formateo de fechas ------------------
 def formatear_fecha(fecha):
@@ -296,33 +207,289 @@ def obtener_informes_generados():
                         "tamanio": tamanio
                     })
                 except Exception as e:
-                    print(f"Error al procesar archivo {archivo}: {str(e)}")
+                    logger.error("Error al procesar archivo %s: %s", archivo, e)
     
     # Ordenar por fecha de modificación (más reciente primero)
     informes.sort(key=lambda x: x["fecha_modificacion"], reverse=True)
     
     return informes
 
-# ------------------ Generación de informes ------------------
-def generar_primer_nivel(legajo):
-    """Genera un PDF con el informe de antecedentes del legajo especificado"""
+# ------------------ Obtención de datos del informe ------------------
+# Secciones independientes del informe. Cada una se consulta con su propia
+# conexión del pool, en paralelo, de modo que el tiempo total queda acotado
+# por la sección más lenta y no por la suma de todas.
+CONSULTAS_INFORME = {
+    'personal': """
+        SELECT p.legajo, p.apellido_nombre, p.fecha_nacimiento, 
+               p.fecha_alta, p.foto, p.edad,
+               p.estado_civil, p.cargas, p.estudios
+        FROM personal p
+        WHERE p.legajo = %s
+    """,
+    'felicitaciones': """
+        SELECT fecha, objetivo, motivo
+        FROM felicitaciones 
+        WHERE legajo = %s
+        ORDER BY fecha DESC
+    """,
+    # Una sola lectura de sanciones; se separan actuales e históricas en Python
+    'sanciones': """
+        SELECT fecha, cantidad_dias, motivo, solicita, tipo_sancion
+        FROM sanciones 
+        WHERE legajo = %s
+        ORDER BY fecha DESC
+    """,
+    'prestamos': """
+        SELECT p.fecha_inicio, p.monto_total, p.cuotas, p.motivo, 
+               CASE 
+                   WHEN COUNT(pa.id) = 0 THEN 'Sin pagos registrados'
+                   WHEN SUM(CASE WHEN pa.estado = 'Pendiente' THEN 1 ELSE 0 END) = 0 THEN 'Pagado'
+                   ELSE 'Pendiente'
+               END AS estado_pago
+        FROM prestamos p
+        LEFT JOIN pagos pa ON p.id_prestamos = pa.id_prestamos
+        WHERE p.legajo = %s
+        GROUP BY p.id_prestamos
+        ORDER BY p.fecha_inicio DESC
+    """,
+    'certificados_medicos': """
+        SELECT fecha_atencion_medica, fecha_recepcion_certificado, 
+               diagnostico_causa, cantidad_dias, medico_hospital_clinica, datos_adicionales
+        FROM certificados_medicos 
+        WHERE legajo = %s
+        ORDER BY fecha_atencion_medica DESC
+    """,
+    'accidentes': """
+        SELECT fecha_acc, fecha_alta, dx, ambito, objetivo, n_siniestro, descripcion
+        FROM accidentes 
+        WHERE legajo = %s
+        ORDER BY fecha_acc DESC
+    """,
+    'licencias_sin_goce': """
+        SELECT cantidad_dias, desde_fecha, hasta_fecha, solicita, motivo
+        FROM licencias_sin_goce 
+        WHERE legajo = %s
+        ORDER BY desde_fecha DESC
+    """,
+    'conceptos': """
+        SELECT fecha, concepto 
+        FROM conceptos 
+        WHERE legajo = %s 
+        AND fecha BETWEEN %s AND %s
+        ORDER BY fecha ASC
+    """
+}
+
+# Hilos para las consultas del informe; se limita para no acaparar el pool compartido
+informes_executor = ThreadPoolExecutor(max_workers=4)
+
+def _consultar_seccion(query, params):
+    """Ejecutar la consulta de una sección del informe con una conexión del pool"""
+    connection = db_manager.get_connection()
     try:
-        print(f"\n🔍 Generando informe para legajo: {legajo}")
-        
-        # Obtener conexión de la base de datos
-        connection = db_manager.get_connection()
         cursor = connection.cursor()
+        cursor.execute(query, params)
+        filas = cursor.fetchall()
+        cursor.close()
+        return filas
+    finally:
+        db_manager.return_connection(connection)
+
+def _restar_anios(fecha, anios):
+    """Restar años a una fecha (el 29/02 pasa al 28/02, igual que DATE_SUB de MySQL)"""
+    try:
+        return fecha.replace(year=fecha.year - anios)
+    except ValueError:
+        return fecha.replace(year=fecha.year - anios, day=28)
+
+def calcular_meses_conceptos(fecha_actual):
+    """
+    Devuelve los 6 meses anteriores al actual (sin incluirlo) en orden cronológico,
+    junto con el rango de fechas (inicio, fin) para la consulta de conceptos.
+    """
+    # Primer día del mes actual
+    primer_dia_mes_actual = fecha_actual.replace(day=1)
+    
+    # Último día del mes anterior (fecha_fin)
+    fecha_fin = primer_dia_mes_actual - timedelta(days=1)
+    
+    # Para asegurar exactamente 6 meses, calculamos mes por mes
+    meses = []
+    mes_actual = fecha_fin.replace(day=1)  # Primer día del mes anterior
+    
+    # Añadir los 6 meses anteriores (comenzando con el mes anterior al actual)
+    for i in range(6):
+        meses.insert(0, mes_actual)  # Insertar al inicio para orden cronológico
+        # Retroceder un mes
+        if mes_actual.month == 1:
+            mes_actual = datetime(mes_actual.year - 1, 12, 1)
+        else:
+            mes_actual = datetime(mes_actual.year, mes_actual.month - 1, 1)
+    
+    # El primer mes de nuestra lista es el inicio del rango
+    return meses, meses[0], fecha_fin
+
+def obtener_datos_informe(legajo, fecha_inicio_conceptos, fecha_fin_conceptos):
+    """
+    Obtener en paralelo todas las secciones del informe de un legajo.
+    
+    Returns:
+        dict: filas de cada sección de CONSULTAS_INFORME; 'personal' es la fila
+        del empleado (o None si no existe) y las sanciones vienen separadas en
+        'sanciones' (últimos 3 años) y 'sanciones_historicas'.
+    """
+    parametros = {nombre: (legajo,) for nombre in CONSULTAS_INFORME}
+    parametros['conceptos'] = (legajo, fecha_inicio_conceptos, fecha_fin_conceptos)
+    
+    futuros = {
+        nombre: informes_executor.submit(_consultar_seccion, query, parametros[nombre])
+        for nombre, query in CONSULTAS_INFORME.items()
+    }
+    datos = {nombre: futuro.result() for nombre, futuro in futuros.items()}
+    
+    datos['personal'] = datos['personal'][0] if datos['personal'] else None
+    
+    # Separar sanciones actuales (últimos 3 años) e históricas
+    limite = _restar_anios(date.today(), 3)
+    actuales, historicas = [], []
+    for sancion in datos['sanciones']:
+        fecha = sancion[0].date() if isinstance(sancion[0], datetime) else sancion[0]
+        (actuales if fecha and fecha >= limite else historicas).append(sancion)
+    datos['sanciones'] = actuales
+    datos['sanciones_historicas'] = historicas
+    
+    return datos
+
+# ------------------ Motor de renderizado de informes ------------------
+class MotorInformes:
+    """
+    Recursos de renderizado reutilizables entre informes.
+    
+    Compila la plantilla una sola vez, resuelve la ruta del logo y parsea las
+    hojas de estilo de la plantilla (el CSS embebido y las fuentes externas)
+    para que WeasyPrint no tenga que volver a descargarlas ni parsearlas en
+    cada informe.
+    """
+    PLANTILLA = "informe.html"
+    
+    def __init__(self):
+        # WeasyPrint y Jinja2 son pesados: se importan al crear el motor, no con el módulo
+        from jinja2 import Environment, FileSystemLoader
+        from weasyprint.text.fonts import FontConfiguration
+        
+        self.templates_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "templates")
+        self.env = Environment(loader=FileSystemLoader(self.templates_dir), auto_reload=False)
+        self.template = self.env.get_template(self.PLANTILLA)
+        self.base_url = self.templates_dir + os.sep
+        self.logo_url = self._resolver_logo()
+        self.font_config = FontConfiguration()
+        self.stylesheets = self._cargar_estilos()
+    
+    def _resolver_logo(self):
+        """Buscar el logo del informe (PNG en lugar de GIF) y devolverlo como URL"""
+        resources_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "resources"))
+        candidatos = [
+            os.path.join(resources_dir, "icons", "logo.png"),
+            os.path.join(resources_dir, "logo.png"),
+            os.path.join(resources_dir, "icons_gifs", "logo.png")
+        ]
+        logo_path = next((ruta for ruta in candidatos if os.path.exists(ruta)), candidatos[0])
+        
+        # Convertir a formato URL para WeasyPrint con manejo adecuado para transparencia
+        logo_url = f"file:///{logo_path.replace(os.sep, '/').lstrip('/')}"
+        logger.debug("✅ Ruta del logo para el informe: %s", logo_url)
+        return logo_url
+    
+    def _cargar_estilos(self):
+        """Parsear una sola vez las hojas de estilo declaradas en la plantilla"""
+        from weasyprint import CSS
+        
+        fuente, _, _ = self.env.loader.get_source(self.env, self.PLANTILLA)
+        stylesheets = []
+        
+        for href in re.findall(r'<link[^>]+href="([^"]+)"[^>]*rel="stylesheet"', fuente):
+            try:
+                stylesheets.append(CSS(url=href, font_config=self.font_config))
+            except Exception as e:
+                # Sin conexión se usa la fuente alternativa definida en el CSS
+                logger.warning("⚠️ No se pudo cargar la hoja de estilo %s: %s", href, e)
         
-        # Consulta principal - Datos personales
-        cursor.execute("""
-            SELECT p.legajo, p.apellido_nombre, p.fecha_nacimiento, 
-                   p.fecha_alta, p.foto, p.edad,
-                   p.estado_civil, p.cargas, p.estudios
-            FROM personal p
-            WHERE p.legajo = %s
-        """, (legajo,))
+        for bloque in re.findall(r'<style>(.*?)</style>', fuente, re.S):
+            stylesheets.append(CSS(string=bloque, base_url=self.base_url, font_config=self.font_config))
+        
+        return stylesheets
+    
+    def renderizar_html(self, **contexto):
+        """Renderizar la plantilla sin los estilos embebidos (se aplican ya parseados)"""
+        return self.template.render(logo_path=self.logo_url, estilos_precargados=True, **contexto)
+    
+    def maquetar(self, html_content):
+        """Maquetar el documento con WeasyPrint usando las hojas de estilo precargadas"""
+        from weasyprint import HTML
+        
+        return HTML(string=html_content, base_url=self.base_url).render(
+            stylesheets=self.stylesheets,
+            font_config=self.font_config
+        )
+
+_motor_informes = None
+_motor_informes_lock = threading.Lock()
+
+def obtener_motor_informes():
+    """Obtener (creando la primera vez) el motor de informes del proceso"""
+    global _motor_informes
+    with _motor_informes_lock:
+        if _motor_informes is None:
+            _motor_informes = MotorInformes()
+        return _motor_informes
+
+def precargar_antecedentes():
+    """Arranque en caliente: preparar el motor de informes y la lista de informes (sin Tk)"""
+    obtener_motor_informes()
+    get_warm_store().guardar(('antecedentes', 'informes'), obtener_informes_generados())
+
+# ------------------ Generación de informes ------------------
+class LegajoNoEncontradoError(LookupError):
+    """El legajo solicitado no existe en la tabla personal"""
+
+def generar_primer_nivel(legajo):
+    """Genera el informe de un legajo mostrando los errores al usuario (uso desde la interfaz)"""
+    try:
+        return generar_informe_pdf(legajo)
+    except LegajoNoEncontradoError as e:
+        messagebox.showerror("Error", str(e))
+        return False
+    except Exception as e:
+        messagebox.showerror("Error", f"Error al generar el PDF: {str(e)}")
+        return False
+
+def generar_informe_pdf(legajo, tiempos=None):
+    """
+    Genera un PDF con el informe de antecedentes del legajo especificado.
+    No muestra diálogos, por lo que puede usarse desde hilos o procesos de trabajo.
+    
+    Args:
+        legajo: legajo del empleado
+        tiempos: diccionario opcional donde se registran los segundos de cada
+            etapa (datos, foto, html, maquetado, pdf)
+    
+    Returns:
+        str: ruta del PDF generado
+    
+    Raises:
+        LegajoNoEncontradoError: si el legajo no existe
+    """
+    try:
+        logger.debug("🔍 Generando informe para legajo: %s", legajo)
         
-        personal = cursor.fetchone()
+        # Obtener todas las secciones del informe en paralelo
+        fecha_actual = datetime.now()
+        meses, fecha_inicio, fecha_fin = calcular_meses_conceptos(fecha_actual)
+        tiempos = {} if tiempos is None else tiempos
+        t_etapa = time.perf_counter()
+        datos = obtener_datos_informe(legajo, fecha_inicio, fecha_fin)
+        tiempos['datos'] = time.perf_counter() - t_etapa
+        personal = datos['personal']
         
         if personal:
             # Datos del personal encontrados
@@ -350,179 +517,55 @@ def generar_primer_nivel(legajo):
             pdf_path = os.path.join(directorio_informes, nombre_archivo)
             
             # Mostrar información básica
-            print(f"📄 Generando informe para: {nombre} {apellido}")
-            print(f"📂 Ruta del informe: {pdf_path}")
+            logger.debug("📄 Generando informe para: %s %s", nombre, apellido)
+            logger.debug("📂 Ruta del informe: %s", pdf_path)
             
-            # Preparar directorio temporal para la foto
-            temp_dir = tempfile.mkdtemp()
-            temp_foto = os.path.join(temp_dir, "temp_foto.jpg")
+            t_etapa = time.perf_counter()
             
-            # Guardar la foto en un archivo temporal si existe
+            # Incrustar la foto como data URI: se procesa en memoria, sin archivos temporales
             foto_path = None
             if foto_bytes:
                 try:
-                    image_stream = io.BytesIO(foto_bytes)
-                    img = PILImage.open(image_stream)
+                    img = decodificar_imagen(foto_bytes)
                     
                     # Aumentar el tamaño de la imagen si es muy pequeña
-                    if img.size[0] < 80:  # Si el ancho es menor a 800px
+                    if img.size[0] < 80:  # Si el ancho es menor a 80px
                         ratio = img.size[1] / img.size[0]
                         new_width = 80
                         new_height = int(new_width * ratio)
                         img = img.resize((new_width, new_height), PILImage.Resampling.LANCZOS)
 
-                    if img.mode == 'RGBA':
-                        img = img.convert('RGB')
-
-                    # Guardar con mayor calidad
-                    img.save(temp_foto, 'JPEG', quality=95, dpi=(300, 300))
-                    
-                    # Verificar que el archivo existe
-                    if os.path.exists(temp_foto):
-                        foto_path = f"file:///{temp_foto.replace(os.sep, '/').lstrip('/')}"
-                        print(f"✅ Foto guardada en alta calidad: {foto_path}")
-                    else:
-                        print("❌ Error: No se pudo guardar la foto temporal")
-                        foto_path = None
+                    # Codificar con mayor calidad
+                    foto_path = imagen_a_data_uri(img, 'JPEG', quality=95, dpi=(300, 300))
+                    logger.debug("✅ Foto incrustada en el informe (%s KB)", len(foto_path) // 1024)
 
                 except UnidentifiedImageError:
-                    print(f"❌ Error: No se pudo identificar el archivo de imagen para el legajo {legajo}")
+                    logger.error("❌ Error: No se pudo identificar el archivo de imagen para el legajo %s", legajo)
                 except Exception as e:
-                    print(f"❌ Error procesando imagen: {str(e)}")
+                    logger.error("❌ Error procesando imagen: %s", e)
                     foto_path = None
             
-            # Obtener fecha actual
-            fecha_actual = datetime.now()
+            tiempos['foto'] = time.perf_counter() - t_etapa
             
             # Convertir fecha de alta para mostrarse formateada
             fecha_alta_formateada = formatear_fecha(fecha_alta) if fecha_alta else "---"
             
-            # Obtener datos de felicitaciones
-            cursor.execute("""
-                SELECT fecha, objetivo, motivo
-                FROM felicitaciones 
-                WHERE legajo = %s
-                ORDER BY fecha DESC
-            """, (legajo,))
-            felicitaciones = cursor.fetchall()
-            
-            # Obtener datos de sanciones actuales
-            cursor.execute("""
-                SELECT fecha, cantidad_dias, motivo, solicita, tipo_sancion
-                FROM sanciones 
-                WHERE legajo = %s AND fecha >= DATE_SUB(CURDATE(), INTERVAL 3 YEAR)
-                ORDER BY fecha DESC
-            """, (legajo,))
-            sanciones = cursor.fetchall()
+            felicitaciones = datos['felicitaciones']
+            sanciones = datos['sanciones']
+            sanciones_historicas = datos['sanciones_historicas']
+            prestamos = datos['prestamos']
+            certificados_medicos = datos['certificados_medicos']
+            accidentes = datos['accidentes']
+            licencias_sin_goce = datos['licencias_sin_goce']
+            conceptos_raw = datos['conceptos']
             
             # Calcular días totales de suspensión
             total_dias_sanciones = sum([s[1] if s[1] and s[4] == 'Suspensión' else 0 for s in sanciones])
             
-            # Obtener datos de sanciones históricas (más de 3 años)
-            cursor.execute("""
-                SELECT fecha, cantidad_dias, motivo, solicita, tipo_sancion
-                FROM sanciones 
-                WHERE legajo = %s AND fecha < DATE_SUB(CURDATE(), INTERVAL 3 YEAR)
-                ORDER BY fecha DESC
-            """, (legajo,))
-            sanciones_historicas = cursor.fetchall()
-            
-            # Obtener datos de préstamos con su estado de pago
-            cursor.execute("""
-                SELECT p.fecha_inicio, p.monto_total, p.cuotas, p.motivo, 
-                       CASE 
-                           WHEN COUNT(pa.id) = 0 THEN 'Sin pagos registrados'
-                           WHEN SUM(CASE WHEN pa.estado = 'Pendiente' THEN 1 ELSE 0 END) = 0 THEN 'Pagado'
-                           ELSE 'Pendiente'
-                       END AS estado_pago
-                FROM prestamos p
-                LEFT JOIN pagos pa ON p.id_prestamos = pa.id_prestamos
-                WHERE p.legajo = %s
-                GROUP BY p.id_prestamos
-                ORDER BY p.fecha_inicio DESC
-            """, (legajo,))
-            prestamos = cursor.fetchall()
-
-            # Obtener datos de certificados médicos
-            cursor.execute("""
-                SELECT fecha_atencion_medica, fecha_recepcion_certificado, 
-                       diagnostico_causa, cantidad_dias, medico_hospital_clinica, datos_adicionales
-                FROM certificados_medicos 
-                WHERE legajo = %s
-                ORDER BY fecha_atencion_medica DESC
-            """, (legajo,))
-            certificados_medicos = cursor.fetchall()
-            
-            # Obtener datos de accidentes de trabajo (ART)
-            cursor.execute("""
-                SELECT 
-                    fecha_acc, 
-                    fecha_alta, 
-                    dx, 
-                    ambito, 
-                    objetivo, 
-                    n_siniestro, 
-                    descripcion
-                FROM accidentes 
-                WHERE legajo = %s
-                ORDER BY fecha_acc DESC
-            """, (legajo,))
-            accidentes = cursor.fetchall()
-            
-            # Obtener datos de licencias sin goce
-            cursor.execute("""
-                SELECT 
-                    cantidad_dias,
-                    desde_fecha,
-                    hasta_fecha,
-                    solicita,
-                    motivo
-                FROM licencias_sin_goce 
-                WHERE legajo = %s
-                ORDER BY desde_fecha DESC
-            """, (legajo,))
-            licencias_sin_goce = cursor.fetchall()
-            
-            # -----------------------Conceptos-----------------------
-            # Definir rango de fechas para conceptos (6 meses anteriores, sin incluir el mes actual)
-            fecha_actual = datetime.now()
-            
-            # Primer día del mes actual
-            primer_dia_mes_actual = fecha_actual.replace(day=1)
-            
-            # Último día del mes anterior (fecha_fin)
-            fecha_fin = primer_dia_mes_actual - timedelta(days=1)
-            
-            # Para asegurar exactamente 6 meses, calculamos mes por mes
-            meses = []
-            mes_actual = fecha_fin.replace(day=1)  # Primer día del mes anterior
-            
-            # Añadir los 6 meses anteriores (comenzando con el mes anterior al actual)
-            for i in range(6):
-                meses.insert(0, mes_actual)  # Insertar al inicio para orden cronológico
-                # Retroceder un mes
-                if mes_actual.month == 1:
-                    mes_actual = datetime(mes_actual.year - 1, 12, 1)
-                else:
-                    mes_actual = datetime(mes_actual.year, mes_actual.month - 1, 1)
-            
-            # El primer mes de nuestra lista es el inicio del rango
-            fecha_inicio = meses[0]
-            
-            print(f"DEBUG - Meses para conceptos: {[m.strftime('%B %Y') for m in meses]}")
-            print(f"DEBUG - Rango de fechas: {fecha_inicio} a {fecha_fin}")
-            
-            # Obtener conceptos
-            cursor.execute("""
-                SELECT fecha, concepto 
-                FROM conceptos 
-                WHERE legajo = %s 
-                AND fecha BETWEEN %s AND %s
-                ORDER BY fecha ASC
-            """, (legajo, fecha_inicio, fecha_fin))
-            
-            conceptos_raw = cursor.fetchall()
-            print(f"DEBUG - Conceptos encontrados: {len(conceptos_raw)}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Meses para conceptos: %s", [m.strftime('%B %Y') for m in meses])
+            logger.debug("Rango de fechas: %s a %s", fecha_inicio, fecha_fin)
+            logger.debug("Conceptos encontrados: %s", len(conceptos_raw))
             
             # Convertir conceptos a diccionario para fácil acceso
             conceptos_dict = {
@@ -543,36 +586,15 @@ def generar_primer_nivel(legajo):
                 encabezados_conceptos.append(nombre_mes)
                 calificaciones.append(conceptos_dict.get(mes_str, "N/A"))
             
-            print(f"DEBUG - Número de encabezados: {len(encabezados_conceptos)}")
-            print(f"DEBUG - Encabezados: {encabezados_conceptos}")
-            
-            # Preparar entorno Jinja2 para el template
-            templates_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "templates")
-            env = Environment(loader=FileSystemLoader(templates_dir))
-            template = env.get_template("informe.html")
-            
-            # Obtener la ruta del logo para el informe (usar PNG en lugar de GIF)
-            logo_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "resources", "icons", "logo.png"))
-            
-            # Verificar que el archivo existe
-            if not os.path.exists(logo_path):
-                # Intentar con rutas alternativas si no se encuentra
-                alternativas = [
-                    os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "resources", "logo.png")),
-                    os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "resources", "icons_gifs", "logo.png"))
-                ]
-                
-                for alt_path in alternativas:
-                    if os.path.exists(alt_path):
-                        logo_path = alt_path
-                        break
+            logger.debug("Número de encabezados: %s", len(encabezados_conceptos))
+            logger.debug("Encabezados: %s", encabezados_conceptos)
             
-            # Convertir a formato URL para WeasyPrint con manejo adecuado para transparencia
-            logo_path = f"file:///{logo_path.replace(os.sep, '/').lstrip('/')}"
-            print(f"✅ Ruta del logo para el informe: {logo_path}")
+            # Plantilla, logo y estilos ya preparados en el motor de informes
+            motor = obtener_motor_informes()
+            t_etapa = time.perf_counter()
             
             # Renderizar la plantilla con los datos
-            html_content = template.render(
+            html_content = motor.renderizar_html(
                 legajo=legajo,
                 nombre=nombre,
                 apellido=apellido,
@@ -586,7 +608,6 @@ def generar_primer_nivel(legajo):
                 cargas=cargas,
                 estudios=estudios,
                 foto_path=foto_path,
-                logo_path=logo_path,
                 felicitaciones=[{
                     'fecha': formatear_fecha(f[0]),
                     'objetivo': f[1],
@@ -642,27 +663,205 @@ def generar_primer_nivel(legajo):
                 } for f in licencias_sin_goce]
             )
 
-            # Generar PDF con WeasyPrint
-            HTML(string=html_content).write_pdf(pdf_path)
-            print(f"✅ PDF generado exitosamente en: {pdf_path}")
-
-            # Cerrar conexiones de BD
-            cursor.close()
-            db_manager.return_connection(connection)
+            tiempos['html'] = time.perf_counter() - t_etapa
+            
+            # Generar PDF con WeasyPrint: maquetado y escritura por separado para medir cada etapa
+            t_etapa = time.perf_counter()
+            documento = motor.maquetar(html_content)
+            tiempos['maquetado'] = time.perf_counter() - t_etapa
+            
+            t_etapa = time.perf_counter()
+            documento.write_pdf(pdf_path)
+            tiempos['pdf'] = time.perf_counter() - t_etapa
+            logger.debug("✅ PDF generado exitosamente en: %s", pdf_path)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("⏱️ Tiempos del informe: %s", " | ".join(
+                    f"{etapa} {segundos:.2f}s" for etapa, segundos in tiempos.items()
+                ))
 
             # Ya no abrimos el PDF aquí, solo retornamos la ruta para abrirlo después
             return pdf_path  # Retornar la ruta del PDF en lugar de True
 
         else:
-            messagebox.showerror("Error", f"No se encontró el legajo {legajo}")
-            cursor.close()
-            db_manager.return_connection(connection)
-            return False
+            raise LegajoNoEncontradoError(f"No se encontró el legajo {legajo}")
 
+    except LegajoNoEncontradoError:
+        raise
     except Exception as e:
-        messagebox.showerror("Error", f"Error al generar el PDF: {str(e)}")
-        print(f"❌ Error completo: {str(e)}")
-        return False
+        logger.error("❌ Error completo: %s", e)
+        raise
+
+# ------------------ Generación de informes por lote ------------------
+# Conexiones del pool por proceso de trabajo (cada proceso tiene su propio pool)
+CONEXIONES_POR_PROCESO = 2
+# Techo de procesos del lote, aunque sobren núcleos y conexiones
+MAX_PROCESOS_INFORMES = 4
+
+def _procesos_permitidos():
+    """
+    Procesos del lote que entran en el presupuesto de conexiones del puesto
+    (DB_CONEXIONES_TOTALES, por defecto 12): lo que queda después del pool
+    del proceso principal, a CONEXIONES_POR_PROCESO por proceso.
+    """
+    from utils.db_pool import get_pool
+    presupuesto = int(os.getenv('DB_CONEXIONES_TOTALES', '12'))
+    disponibles = presupuesto - get_pool().max_size
+    if disponibles < CONEXIONES_POR_PROCESO:
+        logger.warning("Presupuesto de conexiones (%s) sin lugar para el lote; se usa un solo proceso", presupuesto)
+    return max(1, min(MAX_PROCESOS_INFORMES, disponibles // CONEXIONES_POR_PROCESO))
+
+def parsear_legajos(texto):
+    """
+    Interpreta una lista de legajos del tipo "100-150, 200, 305".
+    
+    Returns:
+        list: legajos sin repetir, en el orden indicado
+    
+    Raises:
+        ValueError: si algún elemento no es un legajo o rango válido
+    """
+    legajos = []
+    for parte in texto.replace(";", ",").split(","):
+        parte = parte.strip()
+        if not parte:
+            continue
+        if "-" in parte:
+            desde, hasta = (int(x) for x in parte.split("-", 1))
+            if desde > hasta:
+                desde, hasta = hasta, desde
+            legajos.extend(range(desde, hasta + 1))
+        else:
+            legajos.append(int(parte))
+    return list(dict.fromkeys(legajos))
+
+def obtener_legajos_personal():
+    """Obtener todos los legajos de la tabla personal"""
+    connection = db_manager.get_connection()
+    try:
+        cursor = connection.cursor()
+        cursor.execute("SELECT legajo FROM personal ORDER BY legajo")
+        legajos = [fila[0] for fila in cursor.fetchall()]
+        cursor.close()
+        return legajos
+    finally:
+        db_manager.return_connection(connection)
+
+def _inicializar_proceso_informes(conexiones):
+    """Preparar un proceso de trabajo: pool propio y acotado para no saturar MySQL"""
+    from utils.db_pool import ConnectionPool
+    ConnectionPool.reset_instance(max_size=conexiones)
+
+def _generar_informe_proceso(legajo):
+    """Generar un informe dentro de un proceso de trabajo y devolver su resultado"""
+    inicio = time.perf_counter()
+    tiempos = {}
+    resultado = {'legajo': legajo, 'estado': 'generado', 'pdf': None, 'error': None, 'tiempos': tiempos}
+    try:
+        resultado['pdf'] = generar_informe_pdf(legajo, tiempos)
+    except LegajoNoEncontradoError as e:
+        resultado['estado'] = 'no_encontrado'
+        resultado['error'] = str(e)
+    except Exception as e:
+        resultado['estado'] = 'error'
+        resultado['error'] = str(e)
+    resultado['duracion'] = round(time.perf_counter() - inicio, 3)
+    resultado['tiempos'] = {etapa: round(segundos, 3) for etapa, segundos in tiempos.items()}
+    return resultado
+
+def _escribir_manifiesto(manifiesto):
+    """Guardar el resumen del lote como JSON junto a los informes"""
+    directorio_informes = os.path.join(os.path.dirname(os.path.dirname(__file__)), "Informes")
+    if not os.path.exists(directorio_informes):
+        os.makedirs(directorio_informes)
+    
+    nombre = f"Lote_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    ruta = os.path.join(directorio_informes, nombre)
+    with open(ruta, "w", encoding="utf-8") as archivo:
+        json.dump(manifiesto, archivo, ensure_ascii=False, indent=2, default=str)
+    return ruta
+
+def generar_informes_lote(legajos, max_procesos=None, reintentos=2, on_progreso=None):
+    """
+    Genera los informes de varios legajos en un pool de procesos.
+    
+    WeasyPrint consume CPU y retiene el GIL, por eso cada informe se genera en
+    un proceso aparte. Los informes fallidos se reintentan hasta `reintentos`
+    veces (los legajos inexistentes no se reintentan) y al final se escribe un
+    manifiesto JSON con el resultado de cada legajo.
+    
+    Args:
+        legajos: legajos a procesar
+        max_procesos: cantidad de procesos (por defecto, núcleos - 1); siempre
+            acotada por el presupuesto de conexiones (_procesos_permitidos)
+        reintentos: reintentos por informe fallido
+        on_progreso: callback(completados, total, legajo, estado) llamado desde
+            el hilo que coordina el lote
+    
+    Returns:
+        dict: manifiesto del lote (incluye 'ruta_manifiesto')
+    """
+    legajos = list(dict.fromkeys(int(legajo) for legajo in legajos))
+    total = len(legajos)
+    if not max_procesos:
+        max_procesos = (os.cpu_count() or 2) - 1
+    max_procesos = max(1, min(max_procesos, _procesos_permitidos(), total or 1))
+    
+    inicio = datetime.now()
+    t_inicio = time.perf_counter()
+    resultados = {}
+    completados = 0
+    pendientes = legajos
+    
+    # 'spawn' evita heredar conexiones abiertas y el estado de Tk del proceso principal
+    contexto = multiprocessing.get_context("spawn")
+    
+    for intento in range(1, reintentos + 2):
+        if not pendientes:
+            break
+        if intento > 1:
+            logger.debug("🔁 Reintentando %s informes (intento %s)", len(pendientes), intento)
+        
+        reintentar = []
+        # Un pool nuevo por ronda: un proceso caído no arrastra a los reintentos
+        with ProcessPoolExecutor(max_workers=min(max_procesos, len(pendientes)),
+                                 mp_context=contexto,
+                                 initializer=_inicializar_proceso_informes,
+                                 initargs=(CONEXIONES_POR_PROCESO,)) as executor:
+            futuros = {executor.submit(_generar_informe_proceso, legajo): legajo for legajo in pendientes}
+            for futuro in as_completed(futuros):
+                legajo = futuros[futuro]
+                try:
+                    resultado = futuro.result()
+                except Exception as e:
+                    resultado = {'legajo': legajo, 'estado': 'error', 'pdf': None,
+                                 'error': str(e), 'duracion': None}
+                resultado['intentos'] = intento
+                resultados[legajo] = resultado
+                
+                if resultado['estado'] == 'error' and intento <= reintentos:
+                    reintentar.append(legajo)
+                    continue
+                
+                completados += 1
+                if on_progreso:
+                    on_progreso(completados, total, legajo, resultado['estado'])
+        pendientes = reintentar
+    
+    informes = [resultados[legajo] for legajo in legajos if legajo in resultados]
+    manifiesto = {
+        'inicio': inicio.isoformat(timespec='seconds'),
+        'fin': datetime.now().isoformat(timespec='seconds'),
+        'duracion': round(time.perf_counter() - t_inicio, 2),
+        'procesos': max_procesos,
+        'total': total,
+        'generados': sum(1 for r in informes if r['estado'] == 'generado'),
+        'no_encontrados': sum(1 for r in informes if r['estado'] == 'no_encontrado'),
+        'fallidos': sum(1 for r in informes if r['estado'] == 'error'),
+        'informes': informes
+    }
+    manifiesto['ruta_manifiesto'] = _escribir_manifiesto(manifiesto)
+    logger.debug("✅ Lote finalizado: %s/%s informes en %ss", manifiesto['generados'], total, manifiesto['duracion'])
+    return manifiesto
 
 # ------------------ Interfaz gráfica con CustomTkinter ------------------
 import os
@@ -679,6 +878,9 @@ class ModuloAntecedentes(ctk.CTkFrame):
         # Crear componentes de la interfaz
         self.crear_widgets()
         
+        # Borrar en segundo plano las fotos temporales que dejaban versiones anteriores
+        threading.Thread(target=limpiar_temporales_heredados, daemon=True).start()
+        
     def crear_widgets(self):
         """Crear todos los widgets de la interfaz"""
         # Header frame con logo - Nuevo
@@ -723,10 +925,10 @@ class ModuloAntecedentes(ctk.CTkFrame):
                             # Cuando no hay más frames, se lanza TclError
                             break
                     
-                    print(f"✅ GIF cargado con {frame_count} frames")
+                    logger.debug("✅ GIF cargado con %s frames", frame_count)
                     return frames
                 except Exception as e:
-                    print(f"❌ Error cargando frames del GIF: {e}")
+                    logger.error("❌ Error cargando frames del GIF: %s", e)
                     return []
             
             # Cargar los frames
@@ -734,7 +936,7 @@ class ModuloAntecedentes(ctk.CTkFrame):
             
             # Función para actualizar la animación
             def update_animation():
-                if self.frames:
+                if self.frames and not getattr(self, '_suspendido', False):
                     # Actualizar al siguiente frame
                     self.frame_index = (self.frame_index + 1) % len(self.frames)
                     self.logo_label.configure(image=self.frames[self.frame_index])
@@ -745,10 +947,10 @@ class ModuloAntecedentes(ctk.CTkFrame):
             if self.frames:
                 self.after(100, update_animation)
             else:
-                print("⚠️ No se pudieron cargar frames para animar el GIF")
+                logger.warning("⚠️ No se pudieron cargar frames para animar el GIF")
             
         except Exception as e:
-            print(f"❌ Error al cargar el logo: {e}")
+            logger.error("❌ Error al cargar el logo: %s", e)
         
         # Título del módulo en el header
         self.header_title = ctk.CTkLabel(
@@ -851,7 +1053,20 @@ class ModuloAntecedentes(ctk.CTkFrame):
             corner_radius=8,
             command=self.abrir_carpeta_informes
         )
-        self.btn_abrir_carpeta.pack(side="left")
+        self.btn_abrir_carpeta.pack(side="left", padx=(0, 15))
+        
+        # Botón para generar informes de varios legajos
+        self.btn_generar_lote = ctk.CTkButton(
+            self.frame_botones,
+            text="Generar por Lote",
+            font=ctk.CTkFont(size=16, weight="bold"),
+            fg_color=self.estilos.COLOR_PRIMARIO,
+            hover_color=self.estilos.COLOR_SECUNDARIO,
+            height=45,
+            corner_radius=8,
+            command=self.generar_informes_lote
+        )
+        self.btn_generar_lote.pack(side="left")
         
         # Barra de progreso para mostrar el avance de la generación
         self.frame_progress = ctk.CTkFrame(self.frame_legajo_container, fg_color=self.estilos.COLOR_FONDO)
@@ -991,6 +1206,12 @@ class ModuloAntecedentes(ctk.CTkFrame):
         # Configurar scrollbar
         scrollbar.config(command=self.treeview.yview)
         
+        # Filas alternas; la ruta completa del PDF se usa como iid
+        self.tabla_informes = VirtualTreeview(
+            self.treeview,
+            tags=lambda i, valores: ('evenrow',) if i % 2 == 0 else ('oddrow',)
+        )
+        
         # Definir las columnas
         self.treeview.heading("legajo", text="Legajo")
         self.treeview.heading("apellido", text="Apellido")
@@ -1088,29 +1309,13 @@ class ModuloAntecedentes(ctk.CTkFrame):
     
     def actualizar_lista_informes(self):
         """Actualizar la lista de informes en el Treeview"""
-        # Limpiar Treeview
-        for item in self.treeview.get_children():
-            self.treeview.delete(item)
-        
-        # Cargar informes
-        informes = obtener_informes_generados()
+        # Cargar informes (la primera vez puede venir del arranque en caliente)
+        informes = get_warm_store().tomar(('antecedentes', 'informes'))
+        if informes is None:
+            informes = obtener_informes_generados()
         
-        # Poblar Treeview
-        for i, informe in enumerate(informes):
-            # Alternar colores de fila
-            tags = ('evenrow',) if i % 2 == 0 else ('oddrow',)
-            
-            self.treeview.insert(
-                "", "end", 
-                values=(
-                    informe["legajo"],
-                    informe["apellido"],
-                    informe["fecha_modificacion"].strftime("%d/%m/%Y %H:%M"),
-                    f"{informe['tamanio']:.1f}"
-                ),
-                tags=tags,
-                iid=informe["ruta"]  # Usar la ruta completa como iid para facilitar el acceso
-            )
+        # Poblar Treeview (solo se tocan los informes nuevos o modificados)
+        self._mostrar_informes(informes)
         
         # Configurar colores alternos para filas
         self.estilo.map('Treeview', background=[
@@ -1122,6 +1327,20 @@ class ModuloAntecedentes(ctk.CTkFrame):
         # Actualizar estado
         self.lbl_status.configure(text=f"Se encontraron {len(informes)} informes generados")
     
+    def _mostrar_informes(self, informes):
+        """Cargar los informes en la tabla virtualizada"""
+        filas = [
+            (
+                informe["legajo"],
+                informe["apellido"],
+                informe["fecha_modificacion"].strftime("%d/%m/%Y %H:%M"),
+                f"{informe['tamanio']:.1f}"
+            )
+            for informe in informes
+        ]
+        # Usar la ruta completa como iid para facilitar el acceso
+        self.tabla_informes.actualizar(filas, iids=[informe["ruta"] for informe in informes])
+    
     def abrir_informe_seleccionado(self, event=None):
         """Abrir el informe seleccionado en el Treeview"""
         seleccion = self.treeview.selection()
@@ -1213,8 +1432,8 @@ class ModuloAntecedentes(ctk.CTkFrame):
             
             # Si ya hay 2 o más informes, mostrar advertencia
             if len(archivos_hoy) >= 2:
-                print(f"DEBUG: Se encontraron {len(archivos_hoy)} informes para legajo {legajo} hoy")
-                print(f"DEBUG: Archivos: {archivos_hoy}")
+                logger.debug("Se encontraron %s informes para legajo %s hoy", len(archivos_hoy), legajo)
+                logger.debug("Archivos: %s", archivos_hoy)
                 
                 resultado = messagebox.askyesno(
                     "Límite de informes diarios",
@@ -1281,11 +1500,90 @@ class ModuloAntecedentes(ctk.CTkFrame):
         except Exception as e:
             messagebox.showerror("Error", f"Error al generar informe: {str(e)}")
             self.lbl_status.configure(text="Error al generar informe")
-            print(f"ERROR COMPLETO: {str(e)}")
+            logger.error("ERROR COMPLETO: %s", e)
             # Ocultar barra de progreso en caso de error
             if hasattr(self, 'frame_progress') and self.frame_progress.winfo_ismapped():
                 self.frame_progress.pack_forget()
         
+    def generar_informes_lote(self):
+        """Generar informes para una lista o rango de legajos, o para todo el personal"""
+        dialogo = ctk.CTkInputDialog(
+            title="Generación por lote",
+            text="Legajos a procesar (ej: 100-150, 200, 305)\no escriba TODOS para todo el personal:"
+        )
+        texto = (dialogo.get_input() or "").strip()
+        if not texto:
+            return
+        
+        todos = texto.lower() == "todos"
+        if not todos:
+            try:
+                legajos = parsear_legajos(texto)
+            except ValueError:
+                messagebox.showerror("Error", "Formato inválido. Use legajos o rangos separados por coma")
+                return
+            if not legajos:
+                return
+        
+        # Mostrar la barra de progreso
+        self.btn_generar_lote.configure(state="disabled")
+        self.frame_progress.pack(fill="x", pady=(15, 10))
+        self.progress_bar.set(0)
+        self.lbl_progress.configure(text="Preparando lote de informes...")
+        self.lbl_status.configure(text="Generando informes por lote...")
+        
+        def on_progreso(completados, total, legajo, estado):
+            self.after(0, lambda: self.actualizar_progreso_lote(completados, total, legajo, estado))
+        
+        def ejecutar_lote():
+            try:
+                lista = obtener_legajos_personal() if todos else legajos
+                manifiesto = generar_informes_lote(lista, on_progreso=on_progreso)
+                self.after(0, lambda: self.finalizar_lote(manifiesto))
+            except Exception as e:
+                error = str(e)
+                self.after(0, lambda: self.mostrar_error_generacion(error))
+                self.after(0, lambda: self.btn_generar_lote.configure(state="normal"))
+        
+        threading.Thread(target=ejecutar_lote, daemon=True).start()
+    
+    def actualizar_progreso_lote(self, completados, total, legajo, estado):
+        """Reflejar el avance del lote en la barra de progreso"""
+        textos_estado = {
+            'generado': "generado",
+            'no_encontrado': "no encontrado",
+            'error': "con error"
+        }
+        self.progress_bar.set(completados / total if total else 1.0)
+        self.lbl_progress.configure(
+            text=f"Lote: {completados}/{total} - legajo {legajo} {textos_estado.get(estado, estado)}"
+        )
+    
+    def finalizar_lote(self, manifiesto):
+        """Mostrar el resumen del lote y actualizar la lista de informes"""
+        self.btn_generar_lote.configure(state="normal")
+        self.progress_bar.set(1.0)
+        self.lbl_progress.configure(text="¡Lote finalizado!")
+        self.lbl_status.configure(
+            text=f"Lote: {manifiesto['generados']} de {manifiesto['total']} informes generados"
+        )
+        self.actualizar_lista_informes()
+        
+        resumen = (
+            f"Informes generados: {manifiesto['generados']}\n"
+            f"Legajos no encontrados: {manifiesto['no_encontrados']}\n"
+            f"Informes con error: {manifiesto['fallidos']}\n"
+            f"Duración: {manifiesto['duracion']} s\n\n"
+            f"Resumen guardado en:\n{manifiesto['ruta_manifiesto']}"
+        )
+        if manifiesto['fallidos']:
+            messagebox.showwarning("Lote finalizado con errores", resumen)
+        else:
+            messagebox.showinfo("Lote finalizado", resumen)
+        
+        # Ocultar la barra de progreso después de 3 segundos
+        self.after(3000, self.frame_progress.pack_forget)
+
     def actualizar_estado_generacion(self, resultado, legajo):
         """Actualizar el estado después de generar un informe"""
         if resultado:  # resultado ahora contiene la ruta del PDF
@@ -1349,10 +1647,6 @@ class ModuloAntecedentes(ctk.CTkFrame):
             self.actualizar_lista_informes()
             return
         
-        # Limpiar TreeView
-        for item in self.treeview.get_children():
-            self.treeview.delete(item)
-        
         # Cargar informes
         informes = obtener_informes_generados()
         
@@ -1365,21 +1659,7 @@ class ModuloAntecedentes(ctk.CTkFrame):
                 informes_filtrados.append(informe)
         
         # Poblar TreeView con resultados filtrados
-        for i, informe in enumerate(informes_filtrados):
-            # Alternar colores de fila
-            tags = ('evenrow',) if i % 2 == 0 else ('oddrow',)
-            
-            self.treeview.insert(
-                "", "end", 
-                values=(
-                    informe["legajo"],
-                    informe["apellido"],
-                    informe["fecha_modificacion"].strftime("%d/%m/%Y %H:%M"),
-                    f"{informe['tamanio']:.1f}"
-                ),
-                tags=tags,
-                iid=informe["ruta"]  # Usar la ruta completa como iid para facilitar el acceso
-            )
+        self._mostrar_informes(informes_filtrados)
         
         # Actualizar estado
         self.lbl_status.configure(text=f"Se encontraron {len(informes_filtrados)} informes que coinciden con '{texto_busqueda}' (por legajo o apellido)")
@@ -1396,9 +1676,9 @@ class ModuloAntecedentes(ctk.CTkFrame):
             try:
                 # Abrir el PDF con el visor predeterminado
                 webbrowser.open(self.ultimo_pdf_generado)
-                print(f"✅ PDF abierto: {self.ultimo_pdf_generado}")
+                logger.debug("✅ PDF abierto: %s", self.ultimo_pdf_generado)
             except Exception as e:
-                print(f"❌ Error al abrir el PDF: {str(e)}")
+                logger.error("❌ Error al abrir el PDF: %s", e)
                 messagebox.showerror("Error", f"No se pudo abrir el informe: {str(e)}")
 
 # Función principal para crear y mostrar el módulo
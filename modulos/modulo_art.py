@@ -25,7 +25,13 @@ if parent_dir not in sys.path:
     sys.path.insert(0, parent_dir)
 
 # Importaciones de utils
-from utils.thread_manager import ThreadManager, DatabasePool
+from utils.thread_manager import DatabasePool, get_thread_manager
+from utils.log_config import get_logger
+from utils.request_coalescer import CoalescedorConsultas
+from utils.employee_summary import ConsultaResumen, como_fecha, dias_entre
+from utils.photo_cache import solicitar_foto_empleado
+from utils.warm_start import frames_logo_gif
+from utils.virtual_tree import VirtualTreeview
 from utils.interface_manager import EstiloApp
 
 # Cargar variables de entorno
@@ -77,6 +83,16 @@ class DialogManager:
         self.active_dialogs = []
 
 class AplicacionART:
+    # Tamaño máximo de la miniatura de la foto del empleado
+    TAMANIO_FOTO = (130, 130)
+
+    # Personal + accidentes del legajo en una sola consulta (estadísticas en Python)
+    COLUMNAS_ACCIDENTES = ("id_art", "legajo", "fecha_acc", "fecha_alta", "dx", "ambito",
+                           "objetivo", "n_siniestro", "descripcion")
+    RESUMEN_ACCIDENTES = ConsultaResumen("accidentes", COLUMNAS_ACCIDENTES, "fecha_acc DESC")
+    RESUMEN_INFORME = ConsultaResumen("accidentes", COLUMNAS_ACCIDENTES, "fecha_acc DESC",
+                                      campos_personal=("puesto", "sector"))
+
     def __init__(self, parent_frame=None):
         """
         Inicializar la aplicación
@@ -101,6 +117,9 @@ class AplicacionART:
         # Inicializar otros componentes después de tener un root válido
         self.dialog_manager = DialogManager()
         self.db_pool = DatabasePool()
+        # Gestor de tareas compartido: los callbacks llegan en el hilo de Tk
+        self.thread_manager = get_thread_manager(self.root)
+        self.consultas = CoalescedorConsultas("art", self.root)
         self.is_destroyed = False
         self.accidente_seleccionado_id = None
         self.actualizando_treeview = False
@@ -113,34 +132,9 @@ class AplicacionART:
             self._init_async()
         
     def _setup_logging(self):
-        """Configurar el sistema de logging"""
-        logger = logging.getLogger('AplicacionART')
-        logger.setLevel(logging.DEBUG)
-        
-        # Crear manejador para la consola
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(logging.DEBUG)
-        
-        # Crear formato para los logs
-        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-        console_handler.setFormatter(formatter)
-        
-        # Agregar manejador al logger
-        logger.addHandler(console_handler)
-        
-        # Crear directorio de logs si no existe
-        os.makedirs('logs', exist_ok=True)
-        
-        # Crear manejador para archivo
-        file_handler = logging.FileHandler('logs/aplicacion_art.log')
-        file_handler.setLevel(logging.INFO)
-        file_handler.setFormatter(formatter)
-        
-        # Agregar manejador al logger
-        logger.addHandler(file_handler)
-        
-        return logger
-    
+        """Obtener el logger del módulo (configuración central en utils.log_config)"""
+        return get_logger(__name__, 'aplicacion_art.log')
+
     def setup_window(self):
         """Configuración inicial de la ventana"""
         if self.is_standalone:
@@ -563,6 +557,7 @@ class AplicacionART:
         vsb = ttk.Scrollbar(tree_container, orient="vertical", command=self.tree.yview)
         hsb = ttk.Scrollbar(tree_container, orient="horizontal", command=self.tree.xview)
         self.tree.configure(yscrollcommand=vsb.set, xscrollcommand=hsb.set)
+        self.tabla = VirtualTreeview(self.tree, clave=lambda valores: valores[0])
         
         # Configurar columnas
         columnas = {
@@ -609,36 +604,10 @@ class AplicacionART:
             if os.path.exists(logo_path):
                 self.gif_frames = []
                 self.current_frame = 0
-                gif = Image.open(logo_path)
-                
-                # Calcular el tamaño manteniendo la proporción circular
+                # Frames ya centrados en un cuadrado de 300px con 20px de margen,
+                # decodificados una sola vez por proceso (los adelanta el arranque en caliente)
                 size = 300
-                padding = 20  # Espacio alrededor del círculo
-                circle_size = size - (padding * 2)
-                
-                for frame_index in range(0, gif.n_frames):
-                    gif.seek(frame_index)
-                    frame_image = gif.convert('RGBA')
-                    
-                    # Crear una imagen cuadrada con fondo transparente
-                    square_image = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-                    
-                    # Redimensionar el frame manteniendo la proporción
-                    aspect_ratio = frame_image.width / frame_image.height
-                    if aspect_ratio > 1:
-                        new_width = circle_size
-                        new_height = int(circle_size / aspect_ratio)
-                    else:
-                        new_height = circle_size
-                        new_width = int(circle_size * aspect_ratio)
-                    
-                    frame_image = frame_image.resize((new_width, new_height), Image.LANCZOS)
-                    
-                    # Centrar la imagen en el cuadrado
-                    x = (size - new_width) // 2
-                    y = (size - new_height) // 2
-                    square_image.paste(frame_image, (x, y))
-                    
+                for square_image in frames_logo_gif(cuadrado=size, margen=20, ruta=logo_path):
                     ctk_frame = ctk.CTkImage(
                         light_image=square_image,
                         dark_image=square_image,
@@ -650,11 +619,11 @@ class AplicacionART:
                     self.logo_label.configure(image=self.gif_frames[0])
                     self._animate_gif()
             else:
-                self.logger.error(f"Archivo de logo no encontrado en: {logo_path}")
+                self.logger.error("Archivo de logo no encontrado en: %s", logo_path)
                 self._create_placeholder_logo(self.logo_label)
                     
         except Exception as e:
-            self.logger.error(f"Error cargando logo: {e}")
+            self.logger.error("Error cargando logo: %s", e)
             self._create_placeholder_logo(self.logo_label)
     
     def _animate_gif(self):
@@ -664,6 +633,7 @@ class AplicacionART:
                 self.logo_label.winfo_exists() and 
                 hasattr(self, 'gif_frames') and 
                 self.gif_frames and 
+                not getattr(self, '_suspendido', False) and  # oculto en la caché del menú
                 not self.is_destroyed):
                 
                 # Actualizar el frame actual
@@ -675,7 +645,7 @@ class AplicacionART:
                     self.main_container.after(100, self._animate_gif)
             
         except Exception as e:
-            self.logger.error(f"Error en animación del logo: {e}")
+            self.logger.error("Error en animación del logo: %s", e)
     
     def _create_placeholder_logo(self, parent):
         """Crear logo placeholder cuando no se puede cargar el GIF"""
@@ -719,7 +689,7 @@ class AplicacionART:
             self.create_gui()
             
         except Exception as e:
-            self.logger.error(f"Error en show_in_frame: {str(e)}")
+            self.logger.error("Error en show_in_frame: %s", e)
             raise
     
     def _init_async(self):
@@ -742,7 +712,7 @@ class AplicacionART:
                 self.root.mainloop()
                 
         except Exception as e:
-            self.logger.error(f"Error en inicialización: {str(e)}")
+            self.logger.error("Error en inicialización: %s", e)
             messagebox.showerror("Error", f"Error al inicializar la aplicación: {str(e)}")
     
     def _find_root_window(self, parent):
@@ -774,7 +744,7 @@ class AplicacionART:
                 raise Exception(f"Error al probar la conexión: {str(e)}")
             
         except Exception as e:
-            self.logger.error(f"Error al inicializar la base de datos: {str(e)}")
+            self.logger.error("Error al inicializar la base de datos: %s", e)
             if self.is_standalone:
                 messagebox.showerror("Error de Conexión", 
                                     f"No se pudo conectar a la base de datos: {str(e)}")
@@ -887,85 +857,52 @@ class AplicacionART:
     def buscar_empleado(self, event=None):
         """Buscar empleado por legajo"""
         try:
-            # Evitar múltiples consultas simultáneas
-            if hasattr(self, '_consulta_en_progreso') and self._consulta_en_progreso:
-                return
-                
-            self._consulta_en_progreso = True
-            
             # Obtener legajo
             legajo = self.entry_legajo.get().strip()
             
             # Validar legajo
             if not legajo:
                 self.mostrar_mensaje("Advertencia", "Debe ingresar un número de legajo", "warning")
-                self._consulta_en_progreso = False
                 return
                 
             try:
                 legajo = int(legajo)
             except ValueError:
                 self.mostrar_mensaje("Error", "El legajo debe ser un número", "error")
-                self._consulta_en_progreso = False
                 return
                 
-            # Iniciar thread manager si no existe
-            if not hasattr(self, 'thread_manager') or self.thread_manager is None:
-                self.thread_manager = ThreadManager()
-                
             # Mostrar indicador de carga
             self._mostrar_placeholder_foto()
             
-            # Ejecutar consulta en segundo plano
-            self.thread_manager.submit_task(
-                "consulta_empleado",
-                lambda: self._consultar_empleado_db(legajo),
+            # Ejecutar consulta en segundo plano (una por legajo; las reemplazadas se descartan)
+            self.consultas.solicitar(
+                legajo,
+                lambda solicitud: self._consultar_empleado_db(legajo),
                 self._actualizar_ui_empleado
             )
         except Exception as e:
-            self.logger.error(f"Error al buscar empleado: {str(e)}")
+            self.logger.error("Error al buscar empleado: %s", e)
             self.mostrar_mensaje("Error", f"Error al buscar empleado: {str(e)}", "error")
-            if hasattr(self, '_consulta_en_progreso'):
-                self._consulta_en_progreso = False
 
     def _consultar_empleado_db(self, legajo):
-        """Consultar datos del empleado en la base de datos"""
+        """Consultar datos del empleado y sus accidentes (una sola consulta)"""
         conn = None
         cursor = None
         try:
             conn = self.db_pool.get_connection()
             cursor = conn.cursor()
             
-            # Consultar datos del empleado
-            query = """
-            SELECT apellido_nombre, foto FROM personal WHERE legajo = %s
-            """
-            
-            cursor.execute(query, (legajo,))
-            empleado = cursor.fetchone()
-            
-            if not empleado:
+            # Personal y accidentes juntos (la foto se trae aparte, solo si no está en caché)
+            resumen = self.RESUMEN_ACCIDENTES.leer(cursor, legajo)
+            if not resumen:
                 return None  # Empleado no encontrado
-                
-            apellido_nombre, foto_blob = empleado
-            
-            # Contar accidentes
-            query_count = """
-            SELECT COUNT(*) FROM accidentes WHERE legajo = %s
-            """
             
-            cursor.execute(query_count, (legajo,))
-            total_accidentes = cursor.fetchone()[0]
+            # Tabla y estadísticas salen de las mismas filas
+            self._mostrar_accidentes(resumen.registros)
             
-            # Consultar accidentes
-            self._consultar_accidentes(cursor, legajo)
-            
-            # Actualizar estadísticas
-            self._actualizar_estadisticas(cursor, legajo)
-            
-            return (apellido_nombre, foto_blob, total_accidentes)
+            return (legajo, resumen.apellido_nombre, resumen.foto_version, resumen.total)
         except Exception as e:
-            self.logger.error(f"Error al consultar empleado: {str(e)}")
+            self.logger.error("Error al consultar empleado: %s", e)
             return e  # Devolver la excepción para manejarla en el callback
         finally:
             if cursor:
@@ -976,33 +913,29 @@ class AplicacionART:
     def _actualizar_ui_empleado(self, result):
         """Actualizar UI con los resultados de la consulta de empleado"""
         try:
-            # Liberar la bandera de consulta en progreso
-            if hasattr(self, '_consulta_en_progreso'):
-                self._consulta_en_progreso = False
-                
             if result is None or result is False:
                 self.mostrar_mensaje("Información", "Empleado no encontrado", "info")
                 self._limpiar_formulario()
                 return
                 
             if isinstance(result, Exception):
-                self.logger.error(f"Error en consulta de empleado: {str(result)}")
+                self.logger.error("Error en consulta de empleado: %s", result)
                 self.handle_database_error(result, "consulta de empleado")
                 return
                 
             # Desempaquetar resultados
-            apellido_nombre, foto_blob, total_accidentes = result
+            legajo, apellido_nombre, foto_version, total_accidentes = result
             
             # Actualizar datos en la UI
             def actualizar_ui():
-                self._actualizar_datos_empleado(apellido_nombre, foto_blob, total_accidentes)
+                self._actualizar_datos_empleado(legajo, apellido_nombre, foto_version, total_accidentes)
                 
             self.root.after(0, actualizar_ui)
         except Exception as e:
-            self.logger.error(f"Error al actualizar UI de empleado: {str(e)}")
+            self.logger.error("Error al actualizar UI de empleado: %s", e)
             self.mostrar_mensaje("Error", f"Error al actualizar UI: {str(e)}", "error")
 
-    def _actualizar_datos_empleado(self, apellido_nombre, foto_blob, total_accidentes):
+    def _actualizar_datos_empleado(self, legajo, apellido_nombre, foto_version, total_accidentes):
         """Actualizar datos del empleado en la interfaz"""
         try:
             # Actualizar nombre
@@ -1013,25 +946,24 @@ class AplicacionART:
             if hasattr(self, 'total_accidentes_label'):
                 self.total_accidentes_label.configure(text=f"Total Accidentes: {total_accidentes}")
             
-            # Actualizar foto
-            if foto_blob:
+            # Pedir la foto (de la caché o, si cambió la versión, de la base)
+            self._solicitud_foto = solicitar_foto_empleado(
+                self.root, legajo, self.TAMANIO_FOTO, self._mostrar_foto_empleado,
+                foto_version, getattr(self, '_solicitud_foto', None)
+            )
+                
+        except Exception as e:
+            self.logger.error("Error al actualizar datos del empleado: %s", e)
+            raise
+
+    def _mostrar_foto_empleado(self, foto):
+        """Mostrar la miniatura del empleado (imagen PIL de la caché) o el placeholder"""
+        try:
+            if foto:
                 try:
-                    # Convertir blob a imagen
-                    image_data = BytesIO(foto_blob)
-                    pil_image = Image.open(image_data)
-                    
-                    # Redimensionar manteniendo proporción
-                    width, height = pil_image.size
-                    max_size = 130
-                    
-                    if width > height:
-                        new_width = max_size
-                        new_height = int(height * (max_size / width))
-                    else:
-                        new_height = max_size
-                        new_width = int(width * (max_size / height))
-                    
-                    pil_image = pil_image.resize((new_width, new_height), Image.LANCZOS)
+                    # La miniatura ya viene redimensionada manteniendo proporción
+                    pil_image = foto
+                    new_width, new_height = pil_image.size
                     
                     # Convertir a PhotoImage
                     self.photo_image = ImageTk.PhotoImage(pil_image)
@@ -1052,16 +984,14 @@ class AplicacionART:
                         image=self.photo_image
                     )
                     
-                    self.logger.info(f"Foto actualizada para {apellido_nombre}")
                 except Exception as e:
-                    self.logger.error(f"Error al procesar foto: {str(e)}")
+                    self.logger.error("Error al procesar foto: %s", e)
                     self._mostrar_placeholder_foto()
             else:
                 self._mostrar_placeholder_foto()
                 
         except Exception as e:
-            self.logger.error(f"Error al actualizar datos del empleado: {str(e)}")
-            raise
+            self.logger.error("Error al mostrar la foto del empleado: %s", e)
 
     def _mostrar_placeholder_foto(self):
         """Mostrar imagen placeholder cuando no hay foto disponible"""
@@ -1096,66 +1026,48 @@ class AplicacionART:
             )
             
         except Exception as e:
-            self.logger.error(f"Error al mostrar placeholder de foto: {str(e)}")
+            self.logger.error("Error al mostrar placeholder de foto: %s", e)
 
-    def _consultar_accidentes(self, cursor, legajo):
-        """Consultar accidentes del empleado"""
-        try:
-            query = """
-            SELECT id_art, legajo, fecha_acc, fecha_alta, dx, ambito, objetivo, n_siniestro, descripcion
-            FROM accidentes 
-            WHERE legajo = %s 
-            ORDER BY fecha_acc DESC
-            """
-            
-            cursor.execute(query, (legajo,))
-            accidentes = []
-            
-            columns = [col[0] for col in cursor.description]
-            
-            for row in cursor.fetchall():
-                # Convertir la tupla a un diccionario usando los nombres de columnas
-                accidente = {}
-                for i, value in enumerate(row):
-                    if i < len(columns):
-                        accidente[columns[i]] = value
-                        
-                # Asegurarse de que 'descripcion' exista
-                if 'descripcion' not in accidente:
-                    accidente['descripcion'] = ''
-                    
-                accidentes.append(accidente)
-            
-            def actualizar_treeview():
-                try:
-                    self._update_treeview(accidentes)
-                except Exception as e:
-                    self.logger.error(f"Error al actualizar treeview: {str(e)}")
-                    # No mostrar mensaje aquí para evitar múltiples ventanas
-            
-            self.root.after(0, actualizar_treeview)
-            
-            return accidentes
-        except Exception as e:
-            self.logger.error(f"Error al consultar accidentes: {str(e)}")
-            # No lanzar excepción para evitar interrumpir el flujo principal
-            return []
+    def _mostrar_accidentes(self, accidentes):
+        """Programar en el hilo de Tk la tabla y las estadísticas de los accidentes leídos"""
+        estadisticas = self._estadisticas_accidentes(accidentes)
+        
+        def actualizar_vista():
+            try:
+                self._update_treeview(accidentes)
+                self._actualizar_estadisticas(estadisticas)
+            except Exception as e:
+                self.logger.error("Error al actualizar treeview: %s", e)
+                # No mostrar mensaje aquí para evitar múltiples ventanas
+        
+        self.root.after(0, actualizar_vista)
+
+    def _estadisticas_accidentes(self, accidentes):
+        """
+        Total, último accidente y días de baja a partir de las filas ya leídas
+        (antes eran tres consultas: COUNT, el último y SUM(DATEDIFF(...))).
+        """
+        total_dias = 0
+        for accidente in accidentes:
+            # Sin fecha de alta se cuenta hasta hoy, como IFNULL(fecha_alta, CURDATE())
+            accidente['dias_baja'] = dias_entre(accidente['fecha_acc'], accidente['fecha_alta'])
+            total_dias += accidente['dias_baja']
+        fechas = [a['fecha_acc'] for a in accidentes if a['fecha_acc']]
+        return {
+            'total_accidentes': len(accidentes),
+            'ultimo_accidente': max(fechas, key=como_fecha) if fechas else None,
+            'total_dias': total_dias
+        }
 
     def _update_treeview(self, registros):
         """Actualizar el treeview con los registros obtenidos"""
         try:
-            # Limpiar treeview
-            self._clear_treeview()
-            
-            # Si no hay registros, salir
-            if not registros:
-                return
-                
             # Verificar si el treeview tiene la columna 'descripcion'
             tiene_columna_descripcion = 'descripcion' in self.tree['columns']
             
-            # Insertar nuevos registros
-            for registro in registros:
+            # Formatear registros
+            filas = []
+            for registro in registros or []:
                 # Truncar textos largos para mejor visualización
                 dx_truncado = registro['dx'][:50] + '...' if registro['dx'] and len(registro['dx']) > 50 else registro['dx']
                 objetivo_truncado = registro['objetivo'][:50] + '...' if registro['objetivo'] and len(registro['objetivo']) > 50 else registro['objetivo']
@@ -1195,62 +1107,33 @@ class AplicacionART:
                 if tiene_columna_descripcion:
                     valores.append(descripcion_truncada)
                     
-                # Insertar en el treeview
-                self.tree.insert('', 'end', values=tuple(valores))
+                filas.append(tuple(valores))
+            
+            # Actualizar solo las filas que cambiaron
+            self.tabla.actualizar(filas)
         except Exception as e:
-            self.logger.error(f"Error al actualizar treeview: {str(e)}")
+            self.logger.error("Error al actualizar treeview: %s", e)
             # No mostrar mensaje aquí para evitar múltiples ventanas
 
     def _clear_treeview(self):
         """Limpiar todos los registros del treeview"""
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        self.tabla.limpiar()
 
-    def _actualizar_estadisticas(self, cursor, legajo):
-        """Actualizar estadísticas del empleado"""
+    def _actualizar_estadisticas(self, estadisticas):
+        """Actualizar los labels de estadísticas del empleado (hilo de Tk)"""
         try:
-            # Consultar último accidente
-            query_ultimo = """
-            SELECT fecha_acc, fecha_alta
-            FROM accidentes 
-            WHERE legajo = %s 
-            ORDER BY fecha_acc DESC 
-            LIMIT 1
-            """
-            
-            cursor.execute(query_ultimo, (legajo,))
-            ultimo = cursor.fetchone()
-            
-            # Consultar total de días de baja
-            query_dias = """
-            SELECT SUM(DATEDIFF(IFNULL(fecha_alta, CURDATE()), fecha_acc)) as total_dias
-            FROM accidentes 
-            WHERE legajo = %s
-            """
+            # Verificar si los labels existen antes de actualizarlos
+            if hasattr(self, 'ultimo_accidente_label'):
+                ultimo = estadisticas['ultimo_accidente']
+                if ultimo:
+                    self.ultimo_accidente_label.configure(text=f"Último accidente: {ultimo.strftime('%d-%m-%Y')}")
+                else:
+                    self.ultimo_accidente_label.configure(text="Último accidente: No registrado")
             
-            cursor.execute(query_dias, (legajo,))
-            total_dias_result = cursor.fetchone()
-            
-            def _actualizar_labels():
-                # Verificar si los labels existen antes de actualizarlos
-                if hasattr(self, 'ultimo_accidente_label'):
-                    if ultimo and ultimo[0]:  # Acceder por índice, no por clave
-                        fecha_ultimo = ultimo[0].strftime('%d-%m-%Y') if ultimo[0] else "No registrado"
-                        self.ultimo_accidente_label.configure(text=f"Último accidente: {fecha_ultimo}")
-                    else:
-                        self.ultimo_accidente_label.configure(text="Último accidente: No registrado")
-                
-                if hasattr(self, 'dias_totales_label'):
-                    if total_dias_result and total_dias_result[0] is not None:  # Acceder por índice
-                        total_dias = total_dias_result[0]
-                        self.dias_totales_label.configure(text=f"Días totales de baja: {total_dias}")
-                    else:
-                        self.dias_totales_label.configure(text="Días totales de baja: 0")
-        
-            # Actualizar UI en el hilo principal
-            self.root.after(0, _actualizar_labels)
+            if hasattr(self, 'dias_totales_label'):
+                self.dias_totales_label.configure(text=f"Días totales de baja: {estadisticas['total_dias']}")
         except Exception as e:
-            self.logger.error(f"Error al actualizar estadísticas: {str(e)}")
+            self.logger.error("Error al actualizar estadísticas: %s", e)
             # No lanzar excepción para evitar interrumpir el flujo principal
 
     def on_tree_double_click(self, event):
@@ -1275,7 +1158,7 @@ class AplicacionART:
             
             self.root.after(0, actualizar_campos)
         except Exception as e:
-            self.logger.error(f"Error al cargar datos: {str(e)}")
+            self.logger.error("Error al cargar datos: %s", e)
             self.mostrar_mensaje("Error", f"No se pudieron cargar los datos: {str(e)}", "error")
 
     def _cargar_datos_accidente(self, values):
@@ -1283,7 +1166,7 @@ class AplicacionART:
         try:
             # Verificar que tenemos suficientes valores
             if len(values) < 9:  # Mínimo necesitamos 9 valores (sin descripción)
-                self.logger.error(f"Datos insuficientes: {values}")
+                self.logger.error("Datos insuficientes: %s", values)
                 return
             
             # Asignar valores a los campos
@@ -1299,7 +1182,7 @@ class AplicacionART:
                     try:
                         self.entry_fecha_accidente.set_date(datetime.strptime(fecha_acc, '%d-%m-%Y'))
                     except Exception as e:
-                        self.logger.error(f"Error al establecer fecha de accidente: {str(e)}")
+                        self.logger.error("Error al establecer fecha de accidente: %s", e)
             
             # Fecha de alta
             if hasattr(self, 'entry_fecha_alta'):
@@ -1308,7 +1191,7 @@ class AplicacionART:
                     try:
                         self.entry_fecha_alta.set_date(datetime.strptime(fecha_alta, '%d-%m-%Y'))
                     except Exception as e:
-                        self.logger.error(f"Error al establecer fecha de alta: {str(e)}")
+                        self.logger.error("Error al establecer fecha de alta: %s", e)
             
             # Diagnóstico
             if hasattr(self, 'entry_diagnostico'):
@@ -1335,9 +1218,9 @@ class AplicacionART:
             # Guardar ID seleccionado
             self.accidente_seleccionado_id = values[0]
             
-            self.logger.info(f"Datos cargados correctamente para accidente ID: {values[0]}")
+            self.logger.info("Datos cargados correctamente para accidente ID: %s", values[0])
         except Exception as e:
-            self.logger.error(f"Error al cargar datos: {str(e)}")
+            self.logger.error("Error al cargar datos: %s", e)
             self.mostrar_mensaje("Error", f"Error al cargar datos: {str(e)}", "error")
 
     def limpiar_campos_parcial(self):
@@ -1350,14 +1233,14 @@ class AplicacionART:
                 try:
                     self.entry_fecha_accidente.set_date(None)
                 except Exception as e:
-                    self.logger.warning(f"No se pudo limpiar fecha de accidente: {str(e)}")
+                    self.logger.warning("No se pudo limpiar fecha de accidente: %s", e)
             
             # Limpiar fecha de alta
             if hasattr(self, 'entry_fecha_alta'):
                 try:
                     self.entry_fecha_alta.set_date(None)
                 except Exception as e:
-                    self.logger.warning(f"No se pudo limpiar fecha de alta: {str(e)}")
+                    self.logger.warning("No se pudo limpiar fecha de alta: %s", e)
             
             # Limpiar diagnóstico
             if hasattr(self, 'entry_diagnostico'):
@@ -1380,7 +1263,7 @@ class AplicacionART:
             
             self.logger.info("Campos limpiados correctamente")
         except Exception as e:
-            self.logger.error(f"Error al limpiar campos: {str(e)}")
+            self.logger.error("Error al limpiar campos: %s", e)
 
 
     def _limpiar_formulario(self):
@@ -1425,7 +1308,7 @@ class AplicacionART:
 
     def handle_database_error(self, error, operacion):
         """Manejar errores de base de datos"""
-        self.logger.error(f"Error de base de datos en {operacion}: {str(error)}")
+        self.logger.error("Error de base de datos en %s: %s", operacion, error)
         self.mostrar_mensaje("Error de Base de Datos", 
                              f"Error al {operacion}: {str(error)}", 
                              "error")
@@ -1454,9 +1337,6 @@ class AplicacionART:
             n_siniestro = self.entry_n_siniestro.get().strip()
             
             # Ejecutar inserción en un hilo separado
-            if not hasattr(self, 'thread_manager'):
-                self.thread_manager = ThreadManager()
-            
             # Pasar el tipo de tarea como primer argumento
             self.thread_manager.submit_task(
                 "insertar_accidente",  # Tipo de tarea
@@ -1465,7 +1345,7 @@ class AplicacionART:
             )
             
         except Exception as e:
-            self.logger.error(f"Error al guardar registro: {str(e)}")
+            self.logger.error("Error al guardar registro: %s", e)
             self.mostrar_mensaje("Error", f"Error al guardar registro: {str(e)}", "error")
 
     def _insertar_accidente_db(self, legajo, fecha_acc, fecha_alta, dias_baja, dx, ambito, objetivo, n_siniestro):
@@ -1521,7 +1401,7 @@ class AplicacionART:
                 return result_dict
             return True
         except Exception as e:
-            self.logger.error(f"Error al insertar accidente: {str(e)}")
+            self.logger.error("Error al insertar accidente: %s", e)
             raise
         finally:
             if 'cursor' in locals() and cursor:
@@ -1544,7 +1424,7 @@ class AplicacionART:
                 self.mostrar_mensaje("Error", "Error desconocido al guardar el registro", "error")
                 
         except Exception as e:
-            self.logger.error(f"Error al actualizar UI después de inserción: {str(e)}")
+            self.logger.error("Error al actualizar UI después de inserción: %s", e)
             self.mostrar_mensaje("Error", f"Error al actualizar UI: {str(e)}", "error")
 
     def validar_campos(self):
@@ -1561,7 +1441,7 @@ class AplicacionART:
                 return False
             fecha_acc = self.entry_fecha_accidente.get_date()
         except Exception as e:
-            self.logger.error(f"Error al obtener fecha de accidente: {str(e)}")
+            self.logger.error("Error al obtener fecha de accidente: %s", e)
             self.mostrar_mensaje("Error", "Debe ingresar una fecha de accidente válida", "error")
             return False
         
@@ -1571,7 +1451,7 @@ class AplicacionART:
                 return False
             fecha_alta = self.entry_fecha_alta.get_date()
         except Exception as e:
-            self.logger.error(f"Error al obtener fecha de alta: {str(e)}")
+            self.logger.error("Error al obtener fecha de alta: %s", e)
             self.mostrar_mensaje("Error", "Debe ingresar una fecha de alta válida", "error")
             return False
         
@@ -1607,7 +1487,7 @@ class AplicacionART:
             )
             
         except Exception as e:
-            self.logger.error(f"Error al iniciar modificación: {str(e)}")
+            self.logger.error("Error al iniciar modificación: %s", e)
             self.mostrar_mensaje("Error", f"Error al iniciar modificación: {str(e)}", "error")
 
     def _ejecutar_modificacion(self):
@@ -1641,10 +1521,6 @@ class AplicacionART:
                 objetivo = self.text_descripcion.get('1.0', 'end-1c')
                 
             n_siniestro = self.entry_n_siniestro.get()
-            
-            # Iniciar thread manager si no existe
-            if not hasattr(self, 'thread_manager') or self.thread_manager is None:
-                self.thread_manager = ThreadManager()
                 
             # Ejecutar modificación en segundo plano
             self.thread_manager.submit_task(
@@ -1656,7 +1532,7 @@ class AplicacionART:
                 self._actualizar_ui_modificacion
             )
         except Exception as e:
-            self.logger.error(f"Error al ejecutar modificación: {str(e)}")
+            self.logger.error("Error al ejecutar modificación: %s", e)
             self.mostrar_mensaje("Error", f"Error al modificar registro: {str(e)}", "error")
 
     def _modificar_accidente_db(self, accidente_id, legajo, fecha_acc, fecha_alta, dias_baja, dx, ambito, objetivo, n_siniestro):
@@ -1718,7 +1594,7 @@ class AplicacionART:
             else:
                 return False
         except Exception as e:
-            self.logger.error(f"Error al modificar accidente: {str(e)}")
+            self.logger.error("Error al modificar accidente: %s", e)
             raise
         finally:
             if 'cursor' in locals() and cursor:
@@ -1741,7 +1617,7 @@ class AplicacionART:
                 return
                 
             if isinstance(result, Exception):
-                self.logger.error(f"Error al modificar accidente: {str(result)}")
+                self.logger.error("Error al modificar accidente: %s", result)
                 self.handle_database_error(result, "modificación de accidente")
                 return
                 
@@ -1760,7 +1636,7 @@ class AplicacionART:
             else:
                 self.mostrar_mensaje("Error", "No se pudo modificar el registro", "error")
         except Exception as e:
-            self.logger.error(f"Error al actualizar UI después de modificación: {str(e)}")
+            self.logger.error("Error al actualizar UI después de modificación: %s", e)
             self.mostrar_mensaje("Error", f"Error al actualizar UI: {str(e)}", "error")
 
     def _eliminar_licencia(self):
@@ -1781,9 +1657,6 @@ class AplicacionART:
         """Ejecutar la eliminación del registro"""
         try:
             # Ejecutar eliminación en un hilo separado
-            if not hasattr(self, 'thread_manager'):
-                self.thread_manager = ThreadManager()
-            
             # Usar una función lambda para encapsular la llamada y solo pasar el resultado al callback
             accidente_id = self.accidente_seleccionado_id
             self.thread_manager.submit_task(
@@ -1793,7 +1666,7 @@ class AplicacionART:
             )
             
         except Exception as e:
-            self.logger.error(f"Error al ejecutar eliminación: {str(e)}")
+            self.logger.error("Error al ejecutar eliminación: %s", e)
             self.mostrar_mensaje("Error", f"Error al ejecutar eliminación: {str(e)}", "error")
 
     def _eliminar_accidente_db(self, accidente_id):
@@ -1809,7 +1682,7 @@ class AplicacionART:
             
             return True
         except Exception as e:
-            self.logger.error(f"Error al eliminar accidente: {str(e)}")
+            self.logger.error("Error al eliminar accidente: %s", e)
             raise
         finally:
             if 'cursor' in locals() and cursor:
@@ -1850,7 +1723,7 @@ class AplicacionART:
                 self.mostrar_mensaje("Error", "Error desconocido al eliminar el registro", "error")
                 
         except Exception as e:
-            self.logger.error(f"Error al actualizar UI después de eliminación: {str(e)}")
+            self.logger.error("Error al actualizar UI después de eliminación: %s", e)
             self.mostrar_mensaje("Error", f"Error al actualizar UI: {str(e)}", "error")
 
     def mostrar_menu_contextual(self, event):
@@ -1959,7 +1832,7 @@ class AplicacionART:
     def exportar_a_excel(self):
         """Exportar datos a Excel"""
         # Verificar si hay datos para exportar
-        if not self.tree.get_children():
+        if not len(self.tabla):
             self.mostrar_mensaje("Información", "No hay datos para exportar", "info")
             return
         
@@ -1974,10 +1847,11 @@ class AplicacionART:
             return  # Usuario canceló
         
         # Ejecutar exportación en un hilo separado
-        self.thread_manager.run_in_thread(
-            target=self._exportar_datos_excel,
-            args=(file_path,),
-            callback=self._actualizar_ui_exportacion
+        self.thread_manager.submit_task(
+            "exportar_excel",
+            self._exportar_datos_excel,
+            self._actualizar_ui_exportacion,
+            file_path
         )
 
     def _exportar_datos_excel(self, file_path):
@@ -1990,10 +1864,13 @@ class AplicacionART:
                 "Días Baja", "Diagnóstico", "Ámbito", "Objetivo", "N° Siniestro", "Descripción"
             ]
             
-            for item in self.tree.get_children():
-                values = self.tree.item(item, 'values')
+            # Incluye las filas que todavía no se materializaron en la tabla
+            for values in self.tabla.filas:
                 data.append(list(values))
             
+            # pandas solo se necesita para exportar: se importa aquí y no con el módulo
+            import pandas as pd
+            
             # Crear DataFrame
             df = pd.DataFrame(data, columns=columns)
             
@@ -2034,13 +1911,14 @@ class AplicacionART:
             
             return file_path
         except Exception as e:
-            self.logger.error(f"Error al exportar a Excel: {str(e)}")
+            self.logger.error("Error al exportar a Excel: %s", e)
             raise
 
     def _actualizar_ui_exportacion(self, result):
         """Actualizar UI después de exportación"""
-        if isinstance(result, Exception):
-            self.mostrar_mensaje("Error", f"Error al exportar datos: {str(result)}", "error")
+        if result is None or isinstance(result, Exception):
+            # Si la exportación falla llega None; el detalle queda en el log
+            self.mostrar_mensaje("Error", "Error al exportar datos. Revise el log para más detalles.", "error")
             return
         
         self.mostrar_mensaje("Éxito", f"Datos exportados correctamente a:\n{result}", "info")
@@ -2062,42 +1940,34 @@ class AplicacionART:
         )
 
     def _generar_informe_db(self, legajo):
-        """Generar datos para el informe desde la base de datos"""
+        """Generar datos para el informe desde la base de datos (una sola consulta)"""
         try:
             conn = self.db_pool.get_connection()
-            cursor = conn.cursor(dictionary=True)
-            
-            # Consultar datos del empleado
-            query_empleado = """
-            SELECT p.legajo, p.apellido_nombre, p.foto, p.puesto, p.sector
-            FROM personal p
-            WHERE p.legajo = %s
-            """
-            cursor.execute(query_empleado, (legajo,))
-            empleado = cursor.fetchone()
-            
-            if not empleado:
-                return None, None, 0
-            
-            # Consultar historial de accidentes
-            query_accidentes = """
-            SELECT COUNT(*) as total_accidentes
-            FROM accidentes
-            WHERE legajo = %s
-            """
-            cursor.execute(query_accidentes, (legajo,))
-            result = cursor.fetchone()
-            total_accidentes = result['total_accidentes'] if result else 0
-            
-            # Consultar estadísticas adicionales
-            self._actualizar_estadisticas(cursor, legajo)
-            
-            # Consultar accidentes del empleado
-            self._consultar_accidentes(cursor, legajo)
+            cursor = conn.cursor()
             
-            return empleado['apellido_nombre'], empleado['foto'], total_accidentes
+            # Personal (con puesto y sector) y accidentes juntos; la foto no se usa
+            resumen = self.RESUMEN_INFORME.leer(cursor, legajo)
+            if not resumen:
+                return None
+            
+            accidentes = resumen.registros
+            estadisticas = self._estadisticas_accidentes(accidentes)
+            
+            # Mantener actualizadas la tabla y las estadísticas del módulo
+            self._mostrar_accidentes(accidentes)
+            
+            return {
+                'empleado': {
+                    'legajo': legajo,
+                    'apellido_nombre': resumen.apellido_nombre,
+                    'puesto': resumen.personal.get('puesto') or 'No especificado',
+                    'sector': resumen.personal.get('sector') or 'No especificado'
+                },
+                'estadisticas': estadisticas,
+                'accidentes': accidentes
+            }
         except Exception as e:
-            self.logger.error(f"Error en consulta de empleado: {str(e)}")
+            self.logger.error("Error en consulta de empleado: %s", e)
             raise
         finally:
             if 'cursor' in locals() and cursor:
@@ -2327,7 +2197,7 @@ class AplicacionART:
             descripcion = values[4]
             self.mostrar_mensaje("Descripción Completa", descripcion, "info")
         except Exception as e:
-            self.logger.error(f"Error al mostrar descripción completa: {str(e)}")
+            self.logger.error("Error al mostrar descripción completa: %s", e)
             self.mostrar_mensaje("Error", f"No se pudo mostrar la descripción: {str(e)}", "error")
 
     def limpiar_campos(self):
@@ -2385,7 +2255,7 @@ class AplicacionART:
             
             self.logger.info("Campos limpiados correctamente")
         except Exception as e:
-            self.logger.error(f"Error al limpiar campos: {str(e)}")
+            self.logger.error("Error al limpiar campos: %s", e)
             self.mostrar_mensaje("Error", f"Error al limpiar campos: {str(e)}", "error")
 
     def _toggle_fecha_alta(self):
@@ -2399,7 +2269,7 @@ class AplicacionART:
                 # Si no está en curso, habilitar el campo de fecha de alta
                 self.entry_fecha_alta.configure(state="normal")
         except Exception as e:
-            self.logger.error(f"Error al cambiar estado de fecha de alta: {str(e)}")
+            self.logger.error("Error al cambiar estado de fecha de alta: %s", e)
 
 # Código para ejecutar la aplicación directamente
 if __name__ == "__main__":
@@ -14,8 +14,21 @@ import logging
 from datetime import datetime
 import traceback
 import os
-from logging.handlers import RotatingFileHandler
 from dotenv import load_dotenv
+import sys
+
+# Agregar el directorio raíz al path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from utils.thread_manager import DatabasePool
+from utils.log_config import get_logger
+from utils.request_coalescer import CoalescedorConsultas
+from utils.employee_summary import ConsultaResumen, como_fecha, desde_hace
+from utils.photo_cache import solicitar_foto_empleado
+from utils.virtual_tree import VirtualTreeview
+
+logger = logging.getLogger(__name__)
 
 # Cargar variables de entorno
 load_dotenv()
@@ -43,85 +56,18 @@ class EstiloApp:
     BOTON_LIMPIAR = "#757575"
     BOTON_LIMPIAR_HOVER = "#616161"
 
-class DatabasePool:
-    """Clase para manejar el pool de conexiones a la base de datos"""
-    def __init__(self):
-        self.config = {
-            'host': os.getenv('DB_HOST'),
-            'user': os.getenv('DB_USER'),
-            'password': os.getenv('DB_PASSWORD'),
-            'database': os.getenv('DB_DATABASE')
-        }
-        self.executor = ThreadPoolExecutor(max_workers=3)
-        self.connection_pool = []
-        self._initialize_pool()
-
-    def _initialize_pool(self, pool_size=3):
-        """Inicializar el pool de conexiones"""
-        try:
-            for _ in range(pool_size):
-                connection = mysql.connector.connect(**self.config)
-                self.connection_pool.append(connection)
-        except Exception as e:
-            print(f"Error inicializando pool: {e}")
-
-    def get_connection(self):
-        """Obtener una conexión del pool"""
-        if not self.connection_pool:
-            connection = mysql.connector.connect(**self.config)
-            return connection
-        return self.connection_pool.pop()
-
-    def return_connection(self, connection):
-        """Devolver una conexión al pool"""
-        if connection and connection.is_connected():
-            self.connection_pool.append(connection)
-
-    def execute_query_async(self, query: str, params: tuple = None, callback=None):
-        """Ejecutar consulta de forma asíncrona usando ThreadPoolExecutor"""
-        def _async_query():
-            connection = None
-            cursor = None
-            try:
-                connection = self.get_connection()
-                cursor = connection.cursor(buffered=True)
-                
-                if params:
-                    cursor.execute(query, params)
-                else:
-                    cursor.execute(query)
-                
-                if query.strip().lower().startswith('select'):
-                    result = cursor.fetchall()
-                else:
-                    connection.commit()
-                    result = True
-
-                if callback:
-                    callback(result)
-                
-            except Exception as e:
-                if callback:
-                    callback(None)
-                print(f"Error en consulta: {str(e)}")
-            finally:
-                if cursor:
-                    cursor.close()
-                if connection:
-                    self.return_connection(connection)
-
-        self.executor.submit(_async_query)
+class AplicacionCertificadosMedicos:
+    # Tamaño máximo de la miniatura de la foto del empleado
+    TAMANIO_FOTO = (140, 140)
 
-    def close(self):
-        """Cerrar todas las conexiones y el executor"""
-        for conn in self.connection_pool:
-            try:
-                conn.close()
-            except:
-                pass
-        self.executor.shutdown(wait=True)
+    # Personal + certificados del legajo en una sola consulta (estadísticas en Python)
+    RESUMEN_CERTIFICADOS = ConsultaResumen(
+        "certificados_medicos",
+        ("id", "legajo", "fecha_atencion_medica", "fecha_recepcion_certificado", "diagnostico_causa",
+         "cantidad_dias", "medico_hospital_clinica", "datos_adicionales"),
+        "fecha_recepcion_certificado DESC"
+    )
 
-class AplicacionCertificadosMedicos:
     def __init__(self, parent_frame=None):
         """
         Inicializa la aplicación de certificados médicos.
@@ -130,6 +76,7 @@ class AplicacionCertificadosMedicos:
                          Si es None, se creará una ventana independiente.
         """
         self.is_destroyed = False
+        self.consultas = CoalescedorConsultas("certificados")
         self.mensaje_dialog = None
         self.dialogo_confirmacion = None
         self.certificado_seleccionado_id = None
@@ -155,31 +102,8 @@ class AplicacionCertificadosMedicos:
             self.show_in_frame(parent_frame)
 
     def _setup_logging(self):
-        """Configurar el sistema de logging"""
-        # Crear directorio logs si no existe
-        log_dir = "logs"
-        if not os.path.exists(log_dir):
-            os.makedirs(log_dir)
-        
-        # Configurar el logger
-        self.logger = logging.getLogger(__name__)
-        self.logger.setLevel(logging.INFO)
-        
-        # Verificar si ya tiene handlers para evitar duplicados
-        if not self.logger.handlers:
-            # Configurar formato
-            formatter = logging.Formatter(
-                '%(asctime)s - [%(levelname)s] - %(module)s - Línea %(lineno)d: %(message)s',
-                datefmt='%Y-%m-%d %H:%M:%S'
-            )
-            
-            # Configurar handler para archivo
-            file_handler = logging.FileHandler(
-                os.path.join(log_dir, 'certificados_medicos.log'), 
-                encoding='utf-8'
-            )
-            file_handler.setFormatter(formatter)
-            self.logger.addHandler(file_handler)
+        """Obtener el logger del módulo (configuración central en utils.log_config)"""
+        self.logger = get_logger(__name__, 'certificados_medicos.log')
 
     def setup_window(self):
         """Configuración inicial de la ventana"""
@@ -497,6 +421,7 @@ class AplicacionCertificadosMedicos:
         vsb = ttk.Scrollbar(tree_container, orient="vertical", command=self.tree.yview)
         hsb = ttk.Scrollbar(tree_container, orient="horizontal", command=self.tree.xview)
         self.tree.configure(yscrollcommand=vsb.set, xscrollcommand=hsb.set)
+        self.tabla = VirtualTreeview(self.tree, clave=lambda valores: valores[0])
         
         # Configurar columnas
         columnas = {
@@ -620,51 +545,16 @@ class AplicacionCertificadosMedicos:
                 connection.commit()
                 
                 legajo = self.entry_legajo.get()
-                self.logger.info(f"Certificado médico insertado exitosamente para legajo {legajo}")
+                self.logger.info("Certificado médico insertado exitosamente para legajo %s", legajo)
                 
-                # Consultar estadísticas actualizadas
-                cursor.execute("""
-                    SELECT 
-                        COUNT(cm.id) as total_certificados,
-                        COALESCE(SUM(cm.cantidad_dias), 0) as total_dias,
-                        MAX(cm.fecha_atencion_medica) as ultimo_certificado,
-                        COALESCE(SUM(CASE 
-                            WHEN cm.fecha_atencion_medica >= DATE_SUB(CURDATE(), INTERVAL 12 MONTH)
-                            THEN cm.cantidad_dias 
-                            ELSE 0 
-                        END), 0) as dias_ultimo_anio
-                    FROM certificados_medicos cm
-                    WHERE cm.legajo = %s
-                """, (legajo,))
-                
-                stats = cursor.fetchone()
-                if stats:
-                    total_certificados, total_dias, ultimo_certificado, dias_ultimo_anio = stats
+                # La tabla y las estadísticas se refrescan juntas en consultar_certificados
+                if not self.is_destroyed:
+                    def _actualizar_vista():
+                        self.mostrar_mensaje("Éxito", "Certificado médico registrado correctamente")
+                        self.limpiar_campos_parcial()
+                        self.consultar_certificados(legajo)
                     
-                    if not self.is_destroyed:
-                        def _actualizar_vista():
-                            # Verificar que los widgets existan antes de actualizarlos
-                            if hasattr(self, 'total_certificados_label') and self.total_certificados_label.winfo_exists():
-                                self.total_certificados_label.configure(
-                                    text=f"Total Certificados: {total_certificados}"
-                                )
-                            if hasattr(self, 'total_dias_label') and self.total_dias_label.winfo_exists():
-                                self.total_dias_label.configure(
-                                    text=f"Total de días de reposo: {total_dias} (Último año: {dias_ultimo_anio})"
-                                )
-                            if hasattr(self, 'ultimo_certificado_label') and self.ultimo_certificado_label.winfo_exists():
-                                if ultimo_certificado:
-                                    fecha_formato = ultimo_certificado.strftime('%d-%m-%Y')
-                                    self.ultimo_certificado_label.configure(
-                                        text=f"Último Certificado: {fecha_formato}"
-                                    )
-                            
-                            # Mostrar mensaje y actualizar vista
-                            self.mostrar_mensaje("Éxito", "Certificado médico registrado correctamente")
-                            self.limpiar_campos_parcial()
-                            self.consultar_certificados(legajo)
-                        
-                        self.root.after(0, _actualizar_vista)
+                    self.root.after(0, _actualizar_vista)
                 
             except ValueError as ve:
                 if connection:
@@ -675,7 +565,7 @@ class AplicacionCertificadosMedicos:
             except Exception as e:
                 if connection:
                     connection.rollback()
-                self.logger.error(f"Error al insertar certificado: {str(e)}")
+                self.logger.error("Error al insertar certificado: %s", e)
                 if not self.is_destroyed:
                     error_msg = str(e)  # Capturar el mensaje de error
                     self.root.after(0, lambda msg=error_msg: self.handle_database_error(msg, "insertar_certificado_medico"))
@@ -774,51 +664,16 @@ class AplicacionCertificadosMedicos:
                 connection.commit()
                 
                 legajo = self.entry_legajo.get()
-                self.logger.info(f"Certificado médico {self.certificado_seleccionado_id} modificado exitosamente")
+                self.logger.info("Certificado médico %s modificado exitosamente", self.certificado_seleccionado_id)
                 
-                # Consultar estadísticas actualizadas
-                cursor.execute("""
-                    SELECT 
-                        COUNT(cm.id) as total_certificados,
-                        COALESCE(SUM(cm.cantidad_dias), 0) as total_dias,
-                        MAX(cm.fecha_atencion_medica) as ultimo_certificado,
-                        COALESCE(SUM(CASE 
-                            WHEN cm.fecha_atencion_medica >= DATE_SUB(CURDATE(), INTERVAL 12 MONTH)
-                            THEN cm.cantidad_dias 
-                            ELSE 0 
-                        END), 0) as dias_ultimo_anio
-                    FROM certificados_medicos cm
-                    WHERE cm.legajo = %s
-                """, (legajo,))
-                
-                stats = cursor.fetchone()
-                if stats:
-                    total_certificados, total_dias, ultimo_certificado, dias_ultimo_anio = stats
+                # La tabla y las estadísticas se refrescan juntas en consultar_certificados
+                if not self.is_destroyed:
+                    def _actualizar_vista():
+                        self.mostrar_mensaje("Éxito", "Certificado médico modificado correctamente")
+                        self.limpiar_campos_parcial()
+                        self.consultar_certificados(legajo)
                     
-                    if not self.is_destroyed:
-                        def _actualizar_vista():
-                            # Verificar que los widgets existan antes de actualizarlos
-                            if hasattr(self, 'total_certificados_label') and self.total_certificados_label.winfo_exists():
-                                self.total_certificados_label.configure(
-                                    text=f"Total Certificados: {total_certificados}"
-                                )
-                            if hasattr(self, 'total_dias_label') and self.total_dias_label.winfo_exists():
-                                self.total_dias_label.configure(
-                                    text=f"Total de días de reposo: {total_dias} (Último año: {dias_ultimo_anio})"
-                                )
-                            if hasattr(self, 'ultimo_certificado_label') and self.ultimo_certificado_label.winfo_exists():
-                                if ultimo_certificado:
-                                    fecha_formato = ultimo_certificado.strftime('%d-%m-%Y')
-                                    self.ultimo_certificado_label.configure(
-                                        text=f"Último Certificado: {fecha_formato}"
-                                    )
-                            
-                            # Mostrar mensaje y actualizar vista
-                            self.mostrar_mensaje("Éxito", "Certificado médico modificado correctamente")
-                            self.limpiar_campos_parcial()
-                            self.consultar_certificados(legajo)
-                        
-                        self.root.after(0, _actualizar_vista)
+                    self.root.after(0, _actualizar_vista)
                 
             except ValueError as ve:
                 if connection:
@@ -829,7 +684,7 @@ class AplicacionCertificadosMedicos:
             except Exception as e:
                 if connection:
                     connection.rollback()
-                self.logger.error(f"Error al modificar certificado: {str(e)}")
+                self.logger.error("Error al modificar certificado: %s", e)
                 if not self.is_destroyed:
                     error_msg = str(e)
                     self.root.after(0, lambda msg=error_msg: self.handle_database_error(msg, "modificar_certificado_medico"))
@@ -889,7 +744,7 @@ class AplicacionCertificadosMedicos:
                 connection.commit()
                 
                 legajo = self.entry_legajo.get()
-                self.logger.info(f"Certificado médico {id_cert} eliminado - Empleado: {nombre_empleado} (Legajo: {legajo_cert})")
+                self.logger.info("Certificado médico %s eliminado - Empleado: %s (Legajo: %s)", id_cert, nombre_empleado, legajo_cert)
                 
                 if not self.is_destroyed:
                     def _actualizar_vista():
@@ -909,7 +764,7 @@ class AplicacionCertificadosMedicos:
             except Exception as e:
                 if connection:
                     connection.rollback()
-                self.logger.error(f"Error al eliminar certificado: {str(e)}")
+                self.logger.error("Error al eliminar certificado: %s", e)
                 if not self.is_destroyed:
                     error_msg = str(e)  # Capturar el mensaje de error
                     self.root.after(0, lambda msg=error_msg: self.handle_database_error(msg, "eliminar_certificado_medico"))
@@ -927,7 +782,7 @@ class AplicacionCertificadosMedicos:
         )
 
     def consultar_certificados(self, legajo=None):
-        """Consultar certificados médicos por legajo de manera asíncrona"""
+        """Consultar certificados médicos y estadísticas por legajo (una consulta, asíncrona)"""
         def _consultar():
             connection = None
             cursor = None
@@ -938,32 +793,22 @@ class AplicacionCertificadosMedicos:
 
                 connection = self.db_pool.get_connection()
                 cursor = connection.cursor()
-                cursor.execute("""
-                    SELECT id, legajo, fecha_atencion_medica, fecha_recepcion_certificado, 
-                           diagnostico_causa, cantidad_dias, medico_hospital_clinica, datos_adicionales
-                    FROM certificados_medicos 
-                    WHERE legajo = %s
-                    ORDER BY fecha_recepcion_certificado DESC
-                """, (legajo,))
+                resumen = self.RESUMEN_CERTIFICADOS.leer(cursor, legajo)
+                registros = resumen.registros if resumen else []
+                estadisticas = self._estadisticas_certificados(registros)
+                filas = self._filas_certificados(registros)
                 
-                registros = cursor.fetchall()
-                registros_convertidos = []
-                
-                for registro in registros:
-                    fecha_atencion = registro[2].strftime('%d-%m-%Y')
-                    fecha_recepcion = registro[3].strftime('%d-%m-%Y')
-                    registro_convertido = list(registro)
-                    registro_convertido[2] = fecha_atencion
-                    registro_convertido[3] = fecha_recepcion
-                    registros_convertidos.append(tuple(registro_convertido))
+                def _actualizar_vista():
+                    self._update_treeview(filas)
+                    self._mostrar_estadisticas(estadisticas)
                 
                 if not self.is_destroyed:
-                    self.root.after(0, lambda: self._update_treeview(registros_convertidos))
+                    self.root.after(0, _actualizar_vista)
                 
             except Exception as e:
                 if not self.is_destroyed:
                     error_msg = str(e)
-                    self.logger.error(f"Error en consultar_certificados: {error_msg}")
+                    self.logger.error("Error en consultar_certificados: %s", error_msg)
                     self.root.after(0, lambda msg=error_msg: 
                         self.handle_database_error(msg, "consultar_certificados"))
             finally:
@@ -974,6 +819,16 @@ class AplicacionCertificadosMedicos:
 
         self.db_pool.executor.submit(_consultar)
 
+    def _filas_certificados(self, registros):
+        """Filas para la tabla, con las fechas en formato dd-mm-aaaa"""
+        filas = []
+        for registro in registros:
+            fila = list(registro.values())
+            fila[2] = registro['fecha_atencion_medica'].strftime('%d-%m-%Y')
+            fila[3] = registro['fecha_recepcion_certificado'].strftime('%d-%m-%Y')
+            filas.append(tuple(fila))
+        return filas
+
     def _check_active(self):
         """Verificar si la aplicación sigue activa y puede actualizar la UI"""
         return not self.is_destroyed and hasattr(self, 'root') and self.root.winfo_exists()
@@ -1027,7 +882,7 @@ class AplicacionCertificadosMedicos:
         """Actualizar treeview de forma segura"""
         if not self.is_destroyed and hasattr(self, 'tree'):
             try:
-                self._clear_treeview()
+                filas = []
                 for registro in registros:
                     # Truncar textos largos para mejor visualización
                     valores = list(registro)
@@ -1037,15 +892,15 @@ class AplicacionCertificadosMedicos:
                         valores[6] = valores[6][:50] + '...' if len(valores[6]) > 50 else valores[6]
                     if len(valores) >= 8:  # Datos adicionales
                         valores[7] = valores[7][:50] + '...' if len(valores[7]) > 50 else valores[7]
-                    self.tree.insert("", tk.END, values=tuple(valores))
+                    filas.append(tuple(valores))
+                self.tabla.actualizar(filas)
             except Exception as e:
-                self.logger.error(f"Error actualizando treeview: {str(e)}")
+                self.logger.error("Error actualizando treeview: %s", e)
 
     def _clear_treeview(self):
         """Limpiar todos los registros del treeview de forma segura"""
-        if hasattr(self, 'tree') and self.tree.winfo_exists():
-            for row in self.tree.get_children():
-                self.tree.delete(row)
+        if hasattr(self, 'tabla') and self.tree.winfo_exists():
+            self.tabla.limpiar()
 
     def mostrar_calificacion_completa(self, event):
         """Mostrar ventana emergente con la calificación completa"""
@@ -1234,7 +1089,7 @@ class AplicacionCertificadosMedicos:
     def handle_database_error(self, error, operacion):
         """Manejar errores de base de datos"""
         error_msg = str(error)
-        self.logger.error(f"Error en {operacion}: {error_msg}")
+        self.logger.error("Error en %s: %s", operacion, error_msg)
         self.mostrar_mensaje("Error", f"Error en la operación: {error_msg}")
 
     def _init_async(self):
@@ -1253,7 +1108,7 @@ class AplicacionCertificadosMedicos:
                 try:
                     self.loading_label.destroy()
                 except Exception as e:
-                    self.logger.warning(f"Error al destruir loading_label: {e}")
+                    self.logger.warning("Error al destruir loading_label: %s", e)
                 finally:
                     self.loading_label = None
             
@@ -1264,7 +1119,7 @@ class AplicacionCertificadosMedicos:
             self._init_database()
             
         except Exception as e:
-            self.logger.error(f"Error en inicialización: {str(e)}")
+            self.logger.error("Error en inicialización: %s", e)
             messagebox.showerror("Error", f"Error al inicializar la aplicación: {str(e)}")
 
     def _init_database(self):
@@ -1316,8 +1171,8 @@ class AplicacionCertificadosMedicos:
             
         except Exception as e:
             if hasattr(self, 'logger'):
-                self.logger.error(f"Error en cleanup: {e}")
-            print(f"Error en cleanup: {e}")
+                self.logger.error("Error en cleanup: %s", e)
+            logger.error("Error en cleanup: %s", e)
 
     def run(self):
         """Iniciar la aplicación"""
@@ -1408,7 +1263,7 @@ class AplicacionCertificadosMedicos:
                 self._create_logo_placeholder(logo_container)
                 
         except Exception as e:
-            self.logger.error(f"Error al cargar el logo: {str(e)}")
+            self.logger.error("Error al cargar el logo: %s", e)
             self._create_logo_placeholder(logo_container)
         
         # Frame contenedor para los textos
@@ -1462,7 +1317,7 @@ class AplicacionCertificadosMedicos:
         """Anima el logo frame por frame con manejo de errores"""
         try:
             # Verificar si la animación debe continuar
-            if not self.animation_running:
+            if not self.animation_running or getattr(self, '_suspendido', False):
                 return
                 
             # Verificar si el widget todavía existe
@@ -1489,7 +1344,7 @@ class AplicacionCertificadosMedicos:
             # Detener animación en caso de error
             self.animation_running = False
             if hasattr(self, 'logger'):
-                self.logger.error(f"Error en animación del logo: {e}")
+                self.logger.error("Error en animación del logo: %s", e)
 
     def consultar_empleado(self, event=None):
         """Consultar datos del empleado y sus certificados médicos"""
@@ -1504,7 +1359,7 @@ class AplicacionCertificadosMedicos:
             return
         self._ultimo_legajo_consultado = legajo
 
-        def _consultar():
+        def _consultar(solicitud):
             if self.is_destroyed:
                 return
 
@@ -1514,59 +1369,32 @@ class AplicacionCertificadosMedicos:
                 connection = self.db_pool.get_connection()
                 cursor = connection.cursor()
 
-                # Consulta mejorada para obtener datos del empleado y estadísticas de certificados
-                cursor.execute("""
-                    SELECT 
-                        p.apellido_nombre, 
-                        p.foto,
-                        COUNT(cm.id) as total_certificados,
-                        COALESCE(SUM(cm.cantidad_dias), 0) as total_dias,
-                        MAX(cm.fecha_atencion_medica) as ultimo_certificado,
-                        COALESCE(SUM(CASE 
-                            WHEN cm.fecha_atencion_medica >= DATE_SUB(CURDATE(), INTERVAL 12 MONTH)
-                            THEN cm.cantidad_dias 
-                            ELSE 0 
-                        END), 0) as dias_ultimo_anio
-                    FROM personal p
-                    LEFT JOIN certificados_medicos cm ON p.legajo = cm.legajo
-                    WHERE p.legajo = %s
-                    GROUP BY p.legajo, p.apellido_nombre, p.foto
-                """, (legajo,))
-                
-                resultado = cursor.fetchone()
+                # Datos del empleado y sus certificados en una sola consulta
+                # (de la foto solo se trae su versión; el BLOB se pide aparte si no está en caché)
+                resumen = self.RESUMEN_CERTIFICADOS.leer(cursor, legajo)
 
-                if resultado:
-                    apellido_nombre, foto_blob, total_certificados, total_dias, ultimo_certificado, dias_ultimo_anio = resultado
+                if resumen:
+                    estadisticas = self._estadisticas_certificados(resumen.registros)
+                    filas = self._filas_certificados(resumen.registros)
 
                     def _actualizar_ui():
                         if self.is_destroyed or not self.root.winfo_exists():
                             return
                         
                         # Actualizar información del empleado
-                        self.nombre_completo_label.configure(text=f"{apellido_nombre}")
+                        self.nombre_completo_label.configure(text=f"{resumen.apellido_nombre}")
                         
-                        # Actualizar estadísticas de certificados
-                        self.total_certificados_label.configure(
-                            text=f"Total Certificados: {total_certificados}"
-                        )
-                        self.total_dias_label.configure(
-                            text=f"Total de días de reposo: {total_dias} (Último año: {dias_ultimo_anio})"
-                        )
-                        if ultimo_certificado:
-                            fecha_formato = ultimo_certificado.strftime('%d-%m-%Y')
-                            self.ultimo_certificado_label.configure(
-                                text=f"Último Certificado: {fecha_formato}"
-                            )
-                        else:
-                            self.ultimo_certificado_label.configure(
-                                text="Último Certificado: Sin registros"
-                            )
+                        # Estadísticas y tabla salen de las mismas filas
+                        self._mostrar_estadisticas(estadisticas)
+                        self._update_treeview(filas)
                         
-                        # Mostrar foto y actualizar tabla
-                        self._mostrar_foto(foto_blob)
-                        self.consultar_certificados(legajo)
+                        # Mostrar foto
+                        self._solicitud_foto = solicitar_foto_empleado(
+                            self.root, legajo, self.TAMANIO_FOTO, self._mostrar_foto,
+                            resumen.foto_version, getattr(self, '_solicitud_foto', None)
+                        )
 
-                    self.root.after(0, _actualizar_ui)
+                    self.root.after(0, solicitud.si_vigente(_actualizar_ui))
                 else:
                     def _mostrar_error():
                         if self.is_destroyed or not self.root.winfo_exists():
@@ -1580,23 +1408,24 @@ class AplicacionCertificadosMedicos:
                         self._mostrar_placeholder_foto()
                         self._clear_treeview()
 
-                    self.root.after(0, _mostrar_error)
+                    self.root.after(0, solicitud.si_vigente(_mostrar_error))
 
             except Exception as e:
                 if not self.is_destroyed:
                     error_msg = str(e)
-                    self.logger.error(f"Error en consultar_empleado: {error_msg}")
-                    self.root.after(0, lambda msg=error_msg: self.handle_database_error(msg, "consultar_empleado"))
+                    self.logger.error("Error en consultar_empleado: %s", error_msg)
+                    self.root.after(0, solicitud.si_vigente(lambda msg=error_msg: self.handle_database_error(msg, "consultar_empleado")))
             finally:
                 if cursor:
                     cursor.close()
                 if connection:
                     self.db_pool.return_connection(connection)
 
-        self.db_pool.executor.submit(_consultar)
+        # Una consulta por legajo: los pedidos repetidos se unen y los reemplazados se descartan
+        self.consultas.solicitar(legajo, _consultar)
 
-    def _mostrar_foto(self, foto_blob):
-        """Mostrar la foto del empleado en el canvas."""
+    def _mostrar_foto(self, foto):
+        """Mostrar la foto del empleado (miniatura PIL de la caché) en el canvas."""
         self.photo_canvas.delete("all")
         
         # Obtener dimensiones del canvas
@@ -1605,17 +1434,10 @@ class AplicacionCertificadosMedicos:
         canvas_center_x = canvas_width / 2
         canvas_center_y = canvas_height / 2
         
-        if foto_blob and len(foto_blob) > 0:
+        if foto:
             try:
-                # Convertir blob a imagen
-                image = Image.open(io.BytesIO(foto_blob))
-                
-                # Convertir a RGB si es necesario
-                if image.mode != 'RGB':
-                    image = image.convert('RGB')
-                
-                # Redimensionar manteniendo proporción
-                image.thumbnail((140, 140), Image.Resampling.LANCZOS)  # Tamaño reducido
+                # La miniatura ya viene ajustada a TAMANIO_FOTO
+                image = foto
                 
                 # Convertir a PhotoImage
                 photo = ImageTk.PhotoImage(image)
@@ -1630,7 +1452,7 @@ class AplicacionCertificadosMedicos:
                 self.photo_canvas.image = photo  # Mantener referencia
                 
             except Exception as e:
-                self.logger.error(f"Error al cargar la imagen: {str(e)}")
+                self.logger.error("Error al cargar la imagen: %s", e)
                 self._mostrar_placeholder_foto()
         else:
             self._mostrar_placeholder_foto()
@@ -1702,7 +1524,7 @@ class AplicacionCertificadosMedicos:
                 
         except Exception as e:
             self.mostrar_mensaje("Error", "Error al cargar los datos del certificado")
-            self.logger.error(f"Error en double click: {str(e)}")
+            self.logger.error("Error en double click: %s", e)
 
     def _cargar_datos_certificado(self, datos):
         """Cargar datos del certificado médico en el formulario"""
@@ -1733,7 +1555,7 @@ class AplicacionCertificadosMedicos:
             self.consultar_empleado()
             
         except Exception as e:
-            self.logger.error(f"Error al cargar datos: {str(e)}, datos={datos}")
+            self.logger.error("Error al cargar datos: %s, datos=%s", e, datos)
             self.mostrar_mensaje("Error", f"Error al cargar los datos: {str(e)}")
 
     def mostrar_diagnostico_completo(self, event):
@@ -1906,44 +1728,49 @@ class AplicacionCertificadosMedicos:
                 if valores:
                     self.certificado_seleccionado_id = valores[0]
             except Exception as e:
-                self.logger.error(f"Error al seleccionar item: {str(e)}")
+                self.logger.error("Error al seleccionar item: %s", e)
                 self.certificado_seleccionado_id = None
 
-    def _actualizar_estadisticas(self, cursor, legajo):
-        """Actualizar estadísticas de certificados médicos"""
-        cursor.execute("""
-            SELECT 
-                COUNT(cm.id) as total_certificados,
-                COALESCE(SUM(cm.cantidad_dias), 0) as total_dias,
-                MAX(cm.fecha_atencion_medica) as ultimo_certificado,
-                COALESCE(SUM(CASE 
-                    WHEN cm.fecha_atencion_medica >= DATE_SUB(CURDATE(), INTERVAL 12 MONTH)
-                    THEN cm.cantidad_dias 
-                    ELSE 0 
-                END), 0) as dias_ultimo_anio
-            FROM certificados_medicos cm
-            WHERE cm.legajo = %s
-        """, (legajo,))
-        
-        stats = cursor.fetchone()
-        if stats:
-            total_certificados, total_dias, ultimo_certificado, dias_ultimo_anio = stats
-            
-            if not self.is_destroyed:
-                def _actualizar_labels():
-                    self.total_certificados_label.configure(
-                        text=f"Total Certificados: {total_certificados}"
-                    )
-                    self.total_dias_label.configure(
-                        text=f"Total de días de reposo: {total_dias} (Último año: {dias_ultimo_anio})"
-                    )
-                    if ultimo_certificado:
-                        fecha_formato = ultimo_certificado.strftime('%d-%m-%Y')
-                        self.ultimo_certificado_label.configure(
-                            text=f"Último Certificado: {fecha_formato}"
-                        )
-                
-                self.root.after(0, _actualizar_labels)
+    def _estadisticas_certificados(self, registros):
+        """
+        Total, días de reposo (histórico y últimos 12 meses) y último certificado
+        a partir de las filas ya leídas, sin COUNT/SUM/MAX aparte.
+        """
+        corte = desde_hace(anios=1)
+        total_dias = 0
+        dias_ultimo_anio = 0
+        for registro in registros:
+            dias = int(registro['cantidad_dias'] or 0)
+            total_dias += dias
+            fecha = como_fecha(registro['fecha_atencion_medica'])
+            if fecha and fecha >= corte:
+                dias_ultimo_anio += dias
+        fechas = [como_fecha(r['fecha_atencion_medica']) for r in registros if r['fecha_atencion_medica']]
+        return {
+            'total_certificados': len(registros),
+            'total_dias': total_dias,
+            'dias_ultimo_anio': dias_ultimo_anio,
+            'ultimo_certificado': max(fechas) if fechas else None
+        }
+
+    def _mostrar_estadisticas(self, estadisticas):
+        """Actualizar los labels de estadísticas (hilo de Tk)"""
+        # Verificar que los widgets existan antes de actualizarlos
+        if hasattr(self, 'total_certificados_label') and self.total_certificados_label.winfo_exists():
+            self.total_certificados_label.configure(
+                text=f"Total Certificados: {estadisticas['total_certificados']}"
+            )
+        if hasattr(self, 'total_dias_label') and self.total_dias_label.winfo_exists():
+            self.total_dias_label.configure(
+                text=f"Total de días de reposo: {estadisticas['total_dias']} "
+                     f"(Último año: {estadisticas['dias_ultimo_anio']})"
+            )
+        if hasattr(self, 'ultimo_certificado_label') and self.ultimo_certificado_label.winfo_exists():
+            if estadisticas['ultimo_certificado']:
+                fecha_formato = estadisticas['ultimo_certificado'].strftime('%d-%m-%Y')
+                self.ultimo_certificado_label.configure(text=f"Último Certificado: {fecha_formato}")
+            else:
+                self.ultimo_certificado_label.configure(text="Último Certificado: Sin registros")
 
     def show_in_frame(self, parent_frame):
         """Mostrar el módulo en un frame específico"""
@@ -1961,7 +1788,7 @@ class AplicacionCertificadosMedicos:
                             widget.unbind('<Shift-MouseWheel>')
                 except Exception as e:
                     if hasattr(self, 'logger'):
-                        self.logger.warning(f"Error al limpiar bindings: {e}")
+                        self.logger.warning("Error al limpiar bindings: %s", e)
             
             self.is_destroyed = False
             
@@ -2006,7 +1833,7 @@ class AplicacionCertificadosMedicos:
             
         except Exception as e:
             if hasattr(self, 'logger'):
-                self.logger.error(f"Error en show_in_frame: {str(e)}")
+                self.logger.error("Error en show_in_frame: %s", e)
             raise
 
     def _find_root_window(self, widget):
@@ -2052,7 +1879,7 @@ class AplicacionCertificadosMedicos:
         except Exception as e:
             self.animation_running = False
             if hasattr(self, 'logger'):
-                self.logger.error(f"Error cargando logo animado: {e}")
+                self.logger.error("Error cargando logo animado: %s", e)
             return False
 
 if __name__ == "__main__":
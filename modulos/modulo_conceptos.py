@@ -17,122 +17,50 @@ import mysql.connector
 import threading
 from concurrent.futures import ThreadPoolExecutor
 from CTkTable import CTkTable
-from PIL import Image, ImageTk, ImageSequence, ImageDraw
+from PIL import Image, ImageTk, ImageDraw
 import io
 import logging
 from datetime import datetime, date
 import traceback
-from logging.handlers import RotatingFileHandler
 from dotenv import load_dotenv
 
 # Configurar .env
 ENV_PATH = os.path.join(PROJECT_ROOT, '.env')
-print(f"Ruta absoluta al .env: {ENV_PATH}")
 load_dotenv(ENV_PATH)
 
 # Ahora podemos importar nuestros módulos personalizados
 from utils.interface_manager import EstiloApp, InterfaceManager
+from utils.thread_manager import DatabasePool
+from utils.log_config import get_logger
+from utils.request_coalescer import CoalescedorConsultas
+from utils.employee_summary import ConsultaResumen, como_fecha
+from utils.photo_cache import solicitar_foto_empleado
+from utils.warm_start import frames_logo_gif
+
+logger = logging.getLogger(__name__)
 
 # Verificación de variables de entorno
-print(f"Buscando .env en: {ENV_PATH}")
 if os.path.exists(ENV_PATH):
-    print(".env encontrado")
-    print("Variables de entorno cargadas:")
-    print(f"DB_HOST: {os.getenv('DB_HOST')}")
-    print(f"DB_USER: {os.getenv('DB_USER')}")
-    print(f"DB_DATABASE: {os.getenv('DB_DATABASE')}")
+    logger.debug("Variables de entorno cargadas de %s: DB_HOST=%s, DB_DATABASE=%s",
+                 ENV_PATH, os.getenv('DB_HOST'), os.getenv('DB_DATABASE'))
 else:
-    print(f"❌ ERROR: Archivo .env no encontrado en {ENV_PATH}")
+    logger.error("❌ Archivo .env no encontrado en %s", ENV_PATH)
 
 # Configuración de tema y colores
 ctk.set_appearance_mode("light")
 ctk.set_default_color_theme("blue")
 
-class DatabasePool:
-    """Clase para manejar el pool de conexiones a la base de datos"""
-    def __init__(self):
-        self.config = {
-            'host': os.getenv('DB_HOST'),
-            'user': os.getenv('DB_USER'),
-            'password': os.getenv('DB_PASSWORD'),
-            'database': os.getenv('DB_DATABASE')
-        }
-        # Agregar print para debug
-        print("Configuración DB:", {k: v for k, v in self.config.items() if k != 'password'})
-        
-        self.executor = ThreadPoolExecutor(max_workers=3)
-        self.connection_pool = []
-        self._initialize_pool()
-
-    def _initialize_pool(self, pool_size=3):
-        """Inicializar el pool de conexiones"""
-        try:
-            for _ in range(pool_size):
-                connection = mysql.connector.connect(**self.config)
-                self.connection_pool.append(connection)
-        except Exception as e:
-            print(f"Error inicializando pool: {e}")
-
-    def get_connection(self):
-        """Obtener una conexión del pool"""
-        if not self.connection_pool:
-            connection = mysql.connector.connect(**self.config)
-            return connection
-        return self.connection_pool.pop()
-
-    def return_connection(self, connection):
-        """Devolver una conexión al pool"""
-        if connection and connection.is_connected():
-            self.connection_pool.append(connection)
-
-    def execute_query_async(self, query: str, params: tuple = None, callback=None):
-        """Ejecutar consulta de forma asíncrona usando ThreadPoolExecutor"""
-        def _async_query():
-            connection = None
-            cursor = None
-            try:
-                connection = self.get_connection()
-                cursor = connection.cursor(buffered=True)
-                
-                if params:
-                    cursor.execute(query, params)
-                else:
-                    cursor.execute(query)
-                
-                if query.strip().lower().startswith('select'):
-                    result = cursor.fetchall()
-                else:
-                    connection.commit()
-                    result = True
-
-                if callback:
-                    callback(result)
-                
-            except Exception as e:
-                if callback:
-                    callback(None)
-                print(f"Error en consulta: {str(e)}")
-            finally:
-                if cursor:
-                    cursor.close()
-                if connection:
-                    self.return_connection(connection)
-
-        self.executor.submit(_async_query)
+class AplicacionConceptos:
+    # Tamaño máximo de la miniatura de la foto del empleado
+    TAMANIO_FOTO = (150, 150)
 
-    def close(self):
-        """Cerrar todas las conexiones y el executor"""
-        for conn in self.connection_pool:
-            try:
-                conn.close()
-            except:
-                pass
-        self.executor.shutdown(wait=True)
+    # Personal + conceptos del legajo en una sola consulta (estadísticas en Python)
+    RESUMEN_CONCEPTOS = ConsultaResumen("conceptos", ("id", "legajo", "fecha", "concepto"), "fecha DESC")
 
-class AplicacionConceptos:
     def __init__(self, parent_frame=None):
         # Flags de control
         self.is_destroyed = False
+        self.consultas = CoalescedorConsultas("conceptos")
         self.is_closing = False
         self._showing_message = False
         self.mensaje_dialog = None
@@ -141,8 +69,8 @@ class AplicacionConceptos:
         # Determinar si es standalone o integrado
         self.is_standalone = parent_frame is None
         
-        print(f"Inicializando módulo conceptos. Standalone: {self.is_standalone}")
-        print(f"Parent frame recibido: {parent_frame}")
+        logger.debug("Inicializando módulo conceptos. Standalone: %s", self.is_standalone)
+        logger.debug("Parent frame recibido: %s", parent_frame)
         
         if self.is_standalone:
             self.root = ctk.CTk()
@@ -174,28 +102,8 @@ class AplicacionConceptos:
         self._setup_logging()
 
     def _setup_logging(self):
-        """Configurar el sistema de logging"""
-        log_dir = "logs"
-        if not os.path.exists(log_dir):
-            os.makedirs(log_dir)
-        
-        log_format = logging.Formatter(
-            '%(asctime)s - [%(levelname)s] - %(module)s - Línea %(lineno)d: %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        
-        file_handler = RotatingFileHandler(
-            filename=os.path.join(log_dir, 'errores_conceptos.log'),
-            maxBytes=5 * 1024 * 1024,
-            backupCount=5,
-            encoding='utf-8'
-        )
-        file_handler.setFormatter(log_format)
-        
-        self.logger = logging.getLogger(__name__)
-        self.logger.setLevel(logging.INFO)
-        self.logger.addHandler(file_handler)
-        
+        """Obtener el logger del módulo (configuración central en utils.log_config)"""
+        self.logger = get_logger(__name__, 'errores_conceptos.log')
         self.logger.info("🚀 Módulo de Conceptos iniciado")
 
     def _init_async(self):
@@ -636,7 +544,7 @@ class AplicacionConceptos:
             ).pack(side="left", padx=10)
             
         except Exception as e:
-            self.logger.error(f"Error mostrando diálogo de confirmación: {str(e)}")
+            self.logger.error("Error mostrando diálogo de confirmación: %s", e)
             self.mostrar_mensaje("Error", "No se pudo mostrar el diálogo de confirmación")
 
     def _find_root_window(self, widget):
@@ -747,8 +655,7 @@ class AplicacionConceptos:
                     self.mostrar_mensaje("Éxito", "Calificación eliminada correctamente")
                     self.limpiar_campos(mantener_legajo=True)  # Mantener legajo
                     if legajo:
-                        self.consultar_calificaciones(legajo)
-                        self.consultar_empleado()  # Actualizar estadísticas
+                        self.consultar_calificaciones(legajo)  # Tabla y estadísticas
                 
                 self.root.after(0, _actualizar_vista)
                 
@@ -766,7 +673,7 @@ class AplicacionConceptos:
         )
 
     def consultar_calificaciones(self, legajo=None):
-        """Consultar calificaciones filtradas por legajo"""
+        """Consultar calificaciones y estadísticas filtradas por legajo (una consulta)"""
         if self.is_destroyed or self.is_closing:  # Agregar verificación aquí
             return
 
@@ -782,37 +689,16 @@ class AplicacionConceptos:
                     return  # Salir silenciosamente si no hay conexión
 
                 cursor = connection.cursor()
-                cursor.execute("""
-                    SELECT id, legajo, fecha, concepto
-                    FROM conceptos 
-                    WHERE legajo = %s
-                    ORDER BY fecha DESC
-                """, (legajo,))
-
-                registros = cursor.fetchall()
-                registros_convertidos = []
-
-                for registro in registros:
-                    if self.is_destroyed or self.is_closing:  # Verificar durante el procesamiento
-                        return
-                    try:
-                        fecha_mysql = registro[2]
-                        fecha_ui = datetime.strptime(str(fecha_mysql), '%Y-%m-%d').strftime('%d-%m-%Y')
-                        registro_convertido = list(registro)
-                        registro_convertido[2] = fecha_ui
-                        registros_convertidos.append(tuple(registro_convertido))
-                    except Exception as e:
-                        print(f"Error convirtiendo registro: {str(e)}")
-                        continue
+                resumen = self.RESUMEN_CONCEPTOS.leer(cursor, legajo)
+                registros = resumen.registros if resumen else []
+                estadisticas = self._estadisticas_conceptos(registros)
+                filas = self._filas_conceptos(registros)
 
                 def _update_ui():
                     if self.is_destroyed or self.is_closing:  # Verificar antes de actualizar UI
                         return
-                    self._clear_treeview()
-                    for registro in registros_convertidos:
-                        if self.is_destroyed or self.is_closing:
-                            return
-                        self.tree.insert("", tk.END, values=registro)
+                    self._mostrar_estadisticas(estadisticas)
+                    self._mostrar_calificaciones(filas)
 
                 if not self.is_destroyed and not self.is_closing and hasattr(self, 'root') and self.root.winfo_exists():
                     self.safe_after(0, _update_ui)
@@ -830,6 +716,73 @@ class AplicacionConceptos:
         if not self.is_destroyed and not self.is_closing and self.db_pool:
             self.safe_submit(_consultar)
 
+    def _filas_conceptos(self, registros):
+        """Filas para la tabla, con la fecha en formato dd-mm-aaaa"""
+        filas = []
+        for registro in registros:
+            try:
+                fila = list(registro.values())
+                fila[2] = como_fecha(registro['fecha']).strftime('%d-%m-%Y')
+                filas.append(tuple(fila))
+            except Exception as e:
+                logger.error("Error convirtiendo registro: %s", e)
+        return filas
+
+    def _mostrar_calificaciones(self, filas):
+        """Cargar las filas en el treeview (hilo de Tk)"""
+        self._clear_treeview()
+        for fila in filas:
+            if self.is_destroyed or self.is_closing:
+                return
+            self.tree.insert("", tk.END, values=fila)
+
+    def _estadisticas_conceptos(self, registros):
+        """
+        Concepto más alto, más bajo y promedio a partir de las filas ya leídas
+        (antes eran cuatro subconsultas correlacionadas más AVG). Los conceptos
+        en 0 no cuentan y, a igual concepto, vale el más reciente.
+        """
+        validos = [r for r in registros if r['concepto'] and r['concepto'] > 0]
+        if not validos:
+            return {'maximo': None, 'minimo': None, 'promedio': 0, 'total': 0}
+
+        def _dia(r):
+            return (como_fecha(r['fecha']) or date.min).toordinal()
+        maximo = max(validos, key=lambda r: (r['concepto'], _dia(r)))
+        minimo = min(validos, key=lambda r: (r['concepto'], -_dia(r)))
+        return {
+            'maximo': (maximo['concepto'], como_fecha(maximo['fecha'])),
+            'minimo': (minimo['concepto'], como_fecha(minimo['fecha'])),
+            'promedio': sum(float(r['concepto']) for r in validos) / len(validos),
+            'total': len(validos)
+        }
+
+    def _mostrar_estadisticas(self, estadisticas):
+        """Actualizar los labels de conceptos máximo, mínimo y promedio (hilo de Tk)"""
+        def _texto(extremo):
+            if not extremo or not extremo[1]:
+                return "Sin conceptos válidos"
+            return f"{extremo[0]} ({extremo[1].strftime('%m-%Y')})"
+
+        self.calificacion_alta_label.configure(
+            text=f"⭐ Concepto más alto: {_texto(estadisticas['maximo'])}"
+        )
+        self.calificacion_baja_label.configure(
+            text=f"📉 Concepto más bajo: {_texto(estadisticas['minimo'])}"
+        )
+
+        # Actualizar promedio solo si hay conceptos válidos
+        promedio = estadisticas['promedio']
+        if estadisticas['total'] > 0 and promedio > 0:
+            promedio_texto = self._calcular_concepto_promedio(promedio)
+            self.calificacion_promedio_label.configure(
+                text=f"📊 Concepto Promedio: {promedio_texto} ({promedio:.2f})"
+            )
+        else:
+            self.calificacion_promedio_label.configure(
+                text="📊 Concepto Promedio: Sin conceptos válidos"
+            )
+
     def _check_active(self):
         """Verificar si la aplicación sigue activa y puede actualizar la UI"""
         return not self.is_destroyed and hasattr(self, 'root') and self.root.winfo_exists()
@@ -891,7 +844,7 @@ class AplicacionConceptos:
                 for registro in registros:
                     self.tree.insert("", tk.END, values=registro)
             except Exception as e:
-                print(f"Error actualizando treeview: {str(e)}")
+                logger.error("Error actualizando treeview: %s", e)
 
     def _clear_treeview(self):
         """Limpiar todos los registros del treeview de forma segura"""
@@ -1059,7 +1012,7 @@ class AplicacionConceptos:
             btn_aceptar.focus_set()
 
         except Exception as e:
-            print(f"Error mostrando mensaje: {e}")
+            logger.error("Error mostrando mensaje: %s", e)
         finally:
             self._showing_message = False
 
@@ -1068,7 +1021,7 @@ class AplicacionConceptos:
         if self.is_destroyed or self.is_closing:
             return
             
-        self.logger.error(f"Error en {operacion}: {error_msg}")
+        self.logger.error("Error en %s: %s", operacion, error_msg)
         self.safe_after(0, lambda: self.mostrar_mensaje("Error", f"Error en la operación: {error_msg}"))
 
     def _init_async(self):
@@ -1127,7 +1080,7 @@ class AplicacionConceptos:
         except Exception as e:
             # Silenciar el error de winfo
             if "winfo" not in str(e):
-                print(f"Error durante el cierre: {e}")
+                logger.error("Error durante el cierre: %s", e)
 
     def run(self):
         """Iniciar la aplicación"""
@@ -1163,22 +1116,8 @@ class AplicacionConceptos:
             gif_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 
                                    "resources", "icons_gifs", "logo.gif")
             
-            gif = Image.open(gif_path)
-            frames = []
-            
-            # Calcular el tamaño manteniendo la proporción
-            target_height = 200  # Mismo tamaño que en módulo_prestamos
-            for frame in ImageSequence.Iterator(gif):
-                frame = frame.convert('RGBA')
-                # Obtener dimensiones originales
-                width, height = frame.size
-                # Calcular nueva anchura manteniendo proporción
-                aspect_ratio = width / height
-                target_width = int(target_height * aspect_ratio)
-                
-                # Redimensionar manteniendo proporción
-                frame = frame.resize((target_width, target_height), Image.LANCZOS)
-                frames.append(frame)
+            # Frames decodificados una sola vez por proceso (los adelanta el arranque en caliente)
+            frames = frames_logo_gif(alto=200, ruta=gif_path)
             
             # Crear el label dentro del contenedor del logo
             logo_label = tk.Label(
@@ -1201,7 +1140,7 @@ class AplicacionConceptos:
             update_gif()
 
         except Exception as e:
-            print(f"Error al cargar el logo: {e}")
+            logger.error("Error al cargar el logo: %s", e)
 
         # Títulos
         title_label = ctk.CTkLabel(
@@ -1248,6 +1187,9 @@ class AplicacionConceptos:
         if not hasattr(self, 'animation_running'):
             self.animation_running = True
         
+        if getattr(self, '_suspendido', False):
+            return  # oculto en la caché del menú
+        
         if self.animation_running and hasattr(self, 'logo_label') and self.logo_label.winfo_exists():
             try:
                 self.logo_label.configure(image=self.logo_frames[self.current_frame])
@@ -1255,7 +1197,7 @@ class AplicacionConceptos:
                 if hasattr(self, 'root') and self.root.winfo_exists():
                     self.root.after(100, self._animate_logo)
             except Exception as e:
-                print(f"Error en animación del logo: {e}")
+                logger.error("Error en animación del logo: %s", e)
 
     def consultar_empleado(self, event=None):
         """Consultar datos del empleado cuando se ingresa el legajo."""
@@ -1268,7 +1210,7 @@ class AplicacionConceptos:
 
         self._ultimo_legajo_consultado = legajo
 
-        def _consultar():
+        def _consultar(solicitud):
             if self.is_destroyed:
                 return
 
@@ -1281,44 +1223,13 @@ class AplicacionConceptos:
 
                 cursor = connection.cursor(buffered=True)
 
-                # Consulta modificada para ignorar conceptos con valor 0
-                cursor.execute("""
-                    SELECT 
-                        p.apellido_nombre, 
-                        p.foto,
-                        (SELECT concepto
-                         FROM conceptos 
-                         WHERE legajo = p.legajo AND concepto > 0
-                         ORDER BY concepto DESC, fecha DESC 
-                         LIMIT 1) as max_concepto,
-                        (SELECT DATE_FORMAT(fecha, '%m-%Y')
-                         FROM conceptos 
-                         WHERE legajo = p.legajo AND concepto > 0
-                         ORDER BY concepto DESC, fecha DESC 
-                         LIMIT 1) as max_fecha,
-                        (SELECT concepto
-                         FROM conceptos 
-                         WHERE legajo = p.legajo AND concepto > 0
-                         ORDER BY concepto ASC, fecha DESC 
-                         LIMIT 1) as min_concepto,
-                        (SELECT DATE_FORMAT(fecha, '%m-%Y')
-                         FROM conceptos 
-                         WHERE legajo = p.legajo AND concepto > 0
-                         ORDER BY concepto ASC, fecha DESC 
-                         LIMIT 1) as min_fecha,
-                        COALESCE(AVG(CASE WHEN c.concepto > 0 THEN c.concepto END), 0) as promedio,
-                        COUNT(CASE WHEN c.concepto > 0 THEN 1 END) as total_conceptos_validos
-                    FROM personal p
-                    LEFT JOIN conceptos c ON p.legajo = c.legajo
-                    WHERE p.legajo = %s
-                    GROUP BY p.legajo, p.apellido_nombre, p.foto
-                """, (legajo,))
-                
-                resultado = cursor.fetchone()
+                # Datos del empleado y sus conceptos en una sola consulta
+                # (de la foto solo se trae su versión; el BLOB se pide aparte si no está en caché)
+                resumen = self.RESUMEN_CONCEPTOS.leer(cursor, legajo)
 
-                if resultado:
-                    (apellido_nombre, foto_blob, max_concepto, max_fecha, 
-                     min_concepto, min_fecha, promedio, total_conceptos) = resultado
+                if resumen:
+                    estadisticas = self._estadisticas_conceptos(resumen.registros)
+                    filas = self._filas_conceptos(resumen.registros)
 
                     def _actualizar_ui():
                         if self.is_destroyed or not self.root.winfo_exists():
@@ -1326,62 +1237,41 @@ class AplicacionConceptos:
 
                         # Actualizar nombre y estadísticas
                         self.nombre_completo_label.configure(
-                            text=f"👤 Apellido y Nombre: {apellido_nombre}"
+                            text=f"👤 Apellido y Nombre: {resumen.apellido_nombre}"
                         )
-
-                        # Actualizar conceptos máximo y mínimo
-                        max_text = f"Sin conceptos válidos"
-                        min_text = f"Sin conceptos válidos"
-                        if max_concepto and max_fecha:
-                            max_text = f"{max_concepto} ({max_fecha})"
-                        if min_concepto and min_fecha:
-                            min_text = f"{min_concepto} ({min_fecha})"
-
-                        self.calificacion_alta_label.configure(
-                            text=f"⭐ Concepto más alto: {max_text}"
-                        )
-                        self.calificacion_baja_label.configure(
-                            text=f"📉 Concepto más bajo: {min_text}"
-                        )
-
-                        # Actualizar promedio solo si hay conceptos válidos
-                        if total_conceptos > 0 and promedio > 0:
-                            promedio_texto = self._calcular_concepto_promedio(promedio)
-                            self.calificacion_promedio_label.configure(
-                                text=f"📊 Concepto Promedio: {promedio_texto} ({promedio:.2f})"
-                            )
-                        else:
-                            self.calificacion_promedio_label.configure(
-                                text="📊 Concepto Promedio: Sin conceptos válidos"
-                            )
+                        self._mostrar_estadisticas(estadisticas)
 
                         # Actualizar foto
-                        self._mostrar_foto(foto_blob)
+                        self._solicitud_foto = solicitar_foto_empleado(
+                            self.root, legajo, self.TAMANIO_FOTO, self._mostrar_foto,
+                            resumen.foto_version, getattr(self, '_solicitud_foto', None)
+                        )
 
-                        # Consultar y mostrar calificaciones en el treeview
-                        self.consultar_calificaciones(legajo)
+                        # Mostrar calificaciones en el treeview (ya leídas)
+                        self._mostrar_calificaciones(filas)
 
-                    self.root.after(0, _actualizar_ui)
+                    self.root.after(0, solicitud.si_vigente(_actualizar_ui))
                 else:
                     def _mostrar_error():
                         if not self.is_destroyed:
                             self.mostrar_mensaje("Error", f"El legajo {legajo} no existe en la base de datos.")
                             self.limpiar_campos()
-                    self.root.after(0, _mostrar_error)
+                    self.root.after(0, solicitud.si_vigente(_mostrar_error))
 
             except Exception as e:
                 error_msg = str(e)  # Capturar el mensaje de error
                 if not self.is_destroyed:
                     def _show_error():
                         self.handle_database_error(error_msg, "consultar_empleado")
-                    self.root.after(0, _show_error)
+                    self.root.after(0, solicitud.si_vigente(_show_error))
             finally:
                 if cursor:
                     cursor.close()
                 if connection:
                     self.db_pool.return_connection(connection)
 
-        self.db_pool.executor.submit(_consultar)
+        # Una consulta por legajo: los pedidos repetidos se unen y los reemplazados se descartan
+        self.consultas.solicitar(legajo, _consultar)
 
     def _calcular_concepto_promedio(self, promedio):
         """Calcular la clasificación del concepto según el promedio"""
@@ -1396,21 +1286,14 @@ class AplicacionConceptos:
         else:
             return "Muy Malo"
 
-    def _mostrar_foto(self, foto_blob):
-        """Mostrar la foto del empleado en el canvas."""
+    def _mostrar_foto(self, foto):
+        """Mostrar la foto del empleado (miniatura PIL de la caché) en el canvas."""
         self.photo_canvas.delete("all")
         
-        if foto_blob and len(foto_blob) > 0:
+        if foto:
             try:
-                # Convertir blob a imagen
-                image = Image.open(io.BytesIO(foto_blob))
-                
-                # Convertir a RGB si es necesario
-                if image.mode != 'RGB':
-                    image = image.convert('RGB')
-                
-                # Redimensionar manteniendo proporciones para que quepa en 150x150
-                image.thumbnail((150, 150), Image.Resampling.LANCZOS)
+                # La miniatura ya viene ajustada a TAMANIO_FOTO
+                image = foto
                 
                 # Convertir a PhotoImage
                 photo = ImageTk.PhotoImage(image)
@@ -1424,7 +1307,7 @@ class AplicacionConceptos:
                 self.photo_canvas.image = photo  # Mantener referencia
                 
             except Exception as e:
-                self.logger.error(f"Error al cargar la imagen: {str(e)}")
+                self.logger.error("Error al cargar la imagen: %s", e)
                 self._mostrar_placeholder_foto()
         else:
             self._mostrar_placeholder_foto()
@@ -1491,7 +1374,7 @@ class AplicacionConceptos:
                 
         except Exception as e:
             self.mostrar_mensaje("Error", "Error al cargar los datos de la calificación")
-            self.logger.error(f"Error en double click: {str(e)}")
+            self.logger.error("Error en double click: %s", e)
 
     def _cargar_datos_calificacion(self, datos):
         """Cargar datos de calificación en el formulario"""
@@ -1514,7 +1397,7 @@ class AplicacionConceptos:
             self.consultar_empleado()
             
         except Exception as e:
-            self.logger.error(f"Error al cargar datos: {str(e)}, datos={datos}")
+            self.logger.error("Error al cargar datos: %s, datos=%s", e, datos)
             self.mostrar_mensaje("Error", f"Error al cargar los datos: {str(e)}")
 
     def show_in_frame(self, parent_frame):
@@ -1585,7 +1468,7 @@ class AplicacionConceptos:
             self._init_database()
             
         except Exception as e:
-            self.logger.error(f"Error en show_in_frame: {str(e)}")
+            self.logger.error("Error en show_in_frame: %s", e)
             raise
 
 if __name__ == "__main__":
@@ -13,7 +13,6 @@ import logging
 from datetime import datetime, date
 import traceback
 import os
-from logging.handlers import RotatingFileHandler
 from dotenv import load_dotenv
 import sys
 
@@ -22,8 +21,15 @@ project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.append(project_root)
 
 from utils.thread_manager import DatabasePool
+from utils.log_config import get_logger
+from utils.request_coalescer import CoalescedorConsultas
+from utils.photo_cache import solicitar_foto_empleado
+from utils.employee_summary import expresion_version_foto
+from utils.warm_start import frames_logo_gif
 from utils.interface_manager import EstiloApp, DialogManager
 
+logger = logging.getLogger(__name__)
+
 # Cargar variables de entorno
 load_dotenv()
 
@@ -31,6 +37,9 @@ load_dotenv()
 ctk.set_appearance_mode("light")
 
 class AplicacionFelicitaciones:
+    # Tamaño del canvas de la foto del empleado
+    TAMANIO_FOTO = (200, 200)
+
     def __init__(self, parent_frame=None):
         """
         Inicializar la aplicación
@@ -52,6 +61,8 @@ class AplicacionFelicitaciones:
             self.main_container.grid(row=0, column=0, sticky="nsew")
             
         self.db_pool = DatabasePool()
+        # Consultas por legajo fuera del hilo de Tk (callbacks en el hilo de Tk)
+        self.consultas = CoalescedorConsultas("felicitaciones", self.root)
         self.is_destroyed = False
         self.felicitacion_seleccionada_id = None
         self.actualizando_treeview = False
@@ -104,7 +115,7 @@ class AplicacionFelicitaciones:
             self.create_gui()
             
         except Exception as e:
-            self.logger.error(f"Error en show_in_frame: {str(e)}")
+            self.logger.error("Error en show_in_frame: %s", e)
             raise
 
     def show_window(self):
@@ -121,28 +132,8 @@ class AplicacionFelicitaciones:
             self.on_closing()
 
     def _setup_logging(self):
-        """Configurar el sistema de logging"""
-        log_dir = "logs"
-        if not os.path.exists(log_dir):
-            os.makedirs(log_dir)
-        
-        log_format = logging.Formatter(
-            '%(asctime)s - [%(levelname)s] - %(module)s - Línea %(lineno)d: %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        
-        file_handler = RotatingFileHandler(
-            filename=os.path.join(log_dir, 'errores_felicitaciones.log'),
-            maxBytes=5 * 1024 * 1024,
-            backupCount=5,
-            encoding='utf-8'
-        )
-        file_handler.setFormatter(log_format)
-        
-        self.logger = logging.getLogger(__name__)
-        self.logger.setLevel(logging.INFO)
-        self.logger.addHandler(file_handler)
-        
+        """Obtener el logger del módulo (configuración central en utils.log_config)"""
+        self.logger = get_logger(__name__, 'errores_felicitaciones.log')
         self.logger.info("🚀 Módulo de Felicitaciones iniciado")
 
     def setup_window(self):
@@ -252,6 +243,16 @@ class AplicacionFelicitaciones:
         )
         self.total_felicitaciones_label.pack()
 
+        # Indicador de consulta en curso
+        self.estado_consulta_label = ctk.CTkLabel(
+            data_frame,
+            text="",
+            font=ctk.CTkFont(size=12),
+            anchor="center",
+            width=250
+        )
+        self.estado_consulta_label.pack(pady=(5, 0))
+
         # Panel derecho (botones CRUD)
         self._create_crud_buttons(form_frame)
 
@@ -495,7 +496,7 @@ class AplicacionFelicitaciones:
                 self._animate_gif()
                 
         except Exception as e:
-            self.logger.error(f"Error cargando logo: {e}")
+            self.logger.error("Error cargando logo: %s", e)
 
     def _load_gif_frames(self):
         """Cargar frames del GIF del logo"""
@@ -511,36 +512,10 @@ class AplicacionFelicitaciones:
             if os.path.exists(logo_path):
                 self.gif_frames = []
                 self.current_frame = 0
-                gif = Image.open(logo_path)
-                
-                # Calcular el tamaño manteniendo la proporción circular
+                # Frames ya centrados en un cuadrado de 300px con 20px de margen,
+                # decodificados una sola vez por proceso (los adelanta el arranque en caliente)
                 size = 300
-                padding = 20  # Espacio alrededor del círculo
-                circle_size = size - (padding * 2)
-                
-                for frame_index in range(0, gif.n_frames):
-                    gif.seek(frame_index)
-                    frame_image = gif.convert('RGBA')
-                    
-                    # Crear una imagen cuadrada con fondo transparente
-                    square_image = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-                    
-                    # Redimensionar el frame manteniendo la proporción
-                    aspect_ratio = frame_image.width / frame_image.height
-                    if aspect_ratio > 1:
-                        new_width = circle_size
-                        new_height = int(circle_size / aspect_ratio)
-                    else:
-                        new_height = circle_size
-                        new_width = int(circle_size * aspect_ratio)
-                    
-                    frame_image = frame_image.resize((new_width, new_height), Image.LANCZOS)
-                    
-                    # Centrar la imagen en el cuadrado
-                    x = (size - new_width) // 2
-                    y = (size - new_height) // 2
-                    square_image.paste(frame_image, (x, y))
-                    
+                for square_image in frames_logo_gif(cuadrado=size, margen=20, ruta=logo_path):
                     ctk_frame = ctk.CTkImage(
                         light_image=square_image,
                         dark_image=square_image,
@@ -552,11 +527,11 @@ class AplicacionFelicitaciones:
                     self.logo_label.configure(image=self.gif_frames[0])
                     self._animate_gif()
             else:
-                self.logger.error(f"Archivo de logo no encontrado en: {logo_path}")
+                self.logger.error("Archivo de logo no encontrado en: %s", logo_path)
                 self._create_placeholder_logo(self.logo_label)
                     
         except Exception as e:
-            self.logger.error(f"Error cargando logo: {e}")
+            self.logger.error("Error cargando logo: %s", e)
             self._create_placeholder_logo(self.logo_label)
 
     def _animate_gif(self):
@@ -566,6 +541,7 @@ class AplicacionFelicitaciones:
                 self.logo_label.winfo_exists() and 
                 hasattr(self, 'gif_frames') and 
                 self.gif_frames and 
+                not getattr(self, '_suspendido', False) and  # oculto en la caché del menú
                 not self.is_destroyed):
                 
                 # Actualizar el frame actual
@@ -577,7 +553,7 @@ class AplicacionFelicitaciones:
                     self.main_container.after(100, self._animate_gif)  # 100ms para una animación más suave
             
         except Exception as e:
-            self.logger.error(f"Error en animación del logo: {e}")
+            self.logger.error("Error en animación del logo: %s", e)
 
     def _create_placeholder_logo(self, parent):
         """Crear logo placeholder cuando no se puede cargar el GIF"""
@@ -684,7 +660,7 @@ class AplicacionFelicitaciones:
                             
                             self.mostrar_mensaje("Éxito", "Felicitación registrada correctamente")
                     except Exception as e:
-                        self.logger.error(f"Error actualizando UI: {str(e)}")
+                        self.logger.error("Error actualizando UI: %s", e)
                         self.mostrar_mensaje("Error", "Error actualizando la interfaz")
 
                 if not self.is_destroyed:
@@ -692,7 +668,7 @@ class AplicacionFelicitaciones:
                 
         except Exception as error:
             self.mostrar_mensaje("Error", f"No se pudo insertar: {str(error)}")
-            self.logger.error(f"Error en insertar_felicitacion: {str(error)}")
+            self.logger.error("Error en insertar_felicitacion: %s", error)
 
     def _actualizar_ui_insercion(self, valores):
         """Actualizar la UI después de insertar"""
@@ -718,7 +694,7 @@ class AplicacionFelicitaciones:
             self.limpiar_campos_parcial()
             
         except Exception as error:
-            self.logger.error(f"Error actualizando UI: {str(error)}")
+            self.logger.error("Error actualizando UI: %s", error)
             self.mostrar_mensaje("Error", "Error actualizando la interfaz")
 
     def modificar_felicitacion(self):
@@ -762,7 +738,7 @@ class AplicacionFelicitaciones:
                     
         except Exception as error:
             self.mostrar_mensaje("Error", f"No se pudo modificar: {str(error)}")
-            self.logger.error(f"Error en modificar_felicitacion: {str(error)}")
+            self.logger.error("Error en modificar_felicitacion: %s", error)
 
     def eliminar_felicitacion(self):
         """Eliminar felicitación seleccionada"""
@@ -835,7 +811,7 @@ class AplicacionFelicitaciones:
                             
                 except Exception as error:
                     self.mostrar_mensaje("Error", f"No se pudo eliminar: {str(error)}")
-                    self.logger.error(f"Error en eliminar_felicitacion: {str(error)}")
+                    self.logger.error("Error en eliminar_felicitacion: %s", error)
                     dialog.destroy()
             
             # Botones
@@ -862,46 +838,46 @@ class AplicacionFelicitaciones:
             
         except Exception as error:
             self.mostrar_mensaje("Error", f"No se pudo procesar la eliminación: {str(error)}")
-            self.logger.error(f"Error en eliminar_felicitacion: {str(error)}")
+            self.logger.error("Error en eliminar_felicitacion: %s", error)
 
     def consultar_felicitaciones(self, legajo):
-        """Consultar felicitaciones por legajo"""
-        print(f"\n=== INICIO consultar_felicitaciones para legajo {legajo} ===")
-        
+        """Consultar felicitaciones por legajo en segundo plano y refrescar la tabla"""
         if not legajo:
-            print("No hay legajo, limpiando treeview")
+            self.consultas.invalidar('felicitaciones')
             self._clear_treeview()
             return
 
-        try:
-            with self.db_pool.get_connection() as connection:
-                with connection.cursor() as cursor:
-                    cursor.execute("""
-                        SELECT id, legajo, fecha, objetivo, motivo
-                        FROM felicitaciones 
-                        WHERE legajo = %s
-                        ORDER BY fecha DESC
-                    """, (legajo,))
-                        
-                    registros = cursor.fetchall()
-                    print(f"Registros encontrados en BD: {len(registros)}")
-                    
-                    registros_procesados = []
-                    for registro in registros:
-                        fecha = datetime.strptime(str(registro[2]), '%Y-%m-%d').strftime('%d-%m-%Y')
-                        valores = list(registro)
-                        valores[2] = fecha
-                        registros_procesados.append(tuple(valores))
-
-                    print(f"Registros procesados: {len(registros_procesados)}")
-                    
-                    if not self.is_destroyed:
-                        print("Programando actualización del treeview")
-                        self.root.after(0, lambda: self._update_treeview(registros_procesados))
+        def _consultar(solicitud):
+            try:
+                with self.db_pool.get_connection() as connection:
+                    with connection.cursor() as cursor:
+                        return self._leer_felicitaciones(cursor, legajo)
+            except Exception as e:
+                self.logger.error("Error al consultar felicitaciones: %s", e)
+                return None
 
-        except Exception as e:
-            print(f"ERROR en consulta: {str(e)}")
-            self.logger.error(f"Error al consultar felicitaciones: {str(e)}")
+        def _actualizar(registros):
+            if registros is not None and not self.is_destroyed:
+                self._update_treeview(registros)
+
+        self.consultas.solicitar(legajo, _consultar, _actualizar, ambito='felicitaciones')
+
+    def _leer_felicitaciones(self, cursor, legajo):
+        """Felicitaciones del legajo, con la fecha ya formateada para la tabla"""
+        cursor.execute("""
+            SELECT id, legajo, fecha, objetivo, motivo
+            FROM felicitaciones 
+            WHERE legajo = %s
+            ORDER BY fecha DESC
+        """, (legajo,))
+
+        registros_procesados = []
+        for registro in cursor.fetchall():
+            fecha = datetime.strptime(str(registro[2]), '%Y-%m-%d').strftime('%d-%m-%Y')
+            valores = list(registro)
+            valores[2] = fecha
+            registros_procesados.append(tuple(valores))
+        return registros_procesados
 
     def _create_table(self):
         """Crear tabla de felicitaciones"""
@@ -1049,7 +1025,7 @@ class AplicacionFelicitaciones:
                         if not self.is_destroyed and self.root.winfo_exists():
                             self.root.after(100, self._restaurar_foco)
                 except Exception as e:
-                    print(f"Error al cerrar ventana: {e}")
+                    logger.error("Error al cerrar ventana: %s", e)
             
             # Bindings para cerrar la ventana
             self.dialog_motivo.protocol("WM_DELETE_WINDOW", cerrar_ventana)
@@ -1060,7 +1036,7 @@ class AplicacionFelicitaciones:
             self.dialog_motivo.after(100, self.dialog_motivo.focus_force)
             
         except Exception as e:
-            self.logger.error(f"Error al crear ventana de motivo: {str(e)}")
+            self.logger.error("Error al crear ventana de motivo: %s", e)
             if hasattr(self, 'dialog_motivo'):
                 try:
                     self.dialog_motivo.destroy()
@@ -1123,7 +1099,7 @@ class AplicacionFelicitaciones:
                     self.consultar_empleado()
                     
                 except Exception as e:
-                    self.logger.error(f"Error actualizando campos: {str(e)}")
+                    self.logger.error("Error actualizando campos: %s", e)
                     self.mostrar_mensaje("Error", "Error al cargar los datos")
             
             # Ejecutar actualización en el hilo principal
@@ -1131,7 +1107,7 @@ class AplicacionFelicitaciones:
                 self.root.after(0, actualizar_campos)
             
         except Exception as e:
-            self.logger.error(f"Error en double click: {str(e)}")
+            self.logger.error("Error en double click: %s", e)
             if not self.is_destroyed:
                 self.mostrar_mensaje("Error", "Error al cargar los datos del registro")
 
@@ -1165,7 +1141,7 @@ class AplicacionFelicitaciones:
             self.consultar_empleado()
             
         except Exception as e:
-            self.logger.error(f"Error al cargar datos: {str(e)}")
+            self.logger.error("Error al cargar datos: %s", e)
             if not self.is_destroyed:
                 self.mostrar_mensaje("Error", f"Error al cargar los datos: {str(e)}")
 
@@ -1177,6 +1153,7 @@ class AplicacionFelicitaciones:
                 self.logo_label.winfo_exists() and 
                 hasattr(self, 'gif_frames') and 
                 self.gif_frames and 
+                not getattr(self, '_suspendido', False) and  # oculto en la caché del menú
                 not self.is_destroyed):
                 
                 self.logo_label.configure(image=self.gif_frames[self.current_frame])
@@ -1186,7 +1163,7 @@ class AplicacionFelicitaciones:
                 if self.main_container and self.main_container.winfo_exists():
                     self.main_container.after(100, self._animate_logo)
         except Exception as e:
-            self.logger.error(f"Error en animación del logo: {str(e)}")
+            self.logger.error("Error en animación del logo: %s", e)
             # No reintentar si hay error
 
     def _init_async(self):
@@ -1209,7 +1186,7 @@ class AplicacionFelicitaciones:
                 self.root.mainloop()
                 
         except Exception as e:
-            self.logger.error(f"Error en inicialización: {str(e)}")
+            self.logger.error("Error en inicialización: %s", e)
             messagebox.showerror("Error", f"Error al inicializar la aplicación: {str(e)}")
 
     def _init_database(self):
@@ -1321,34 +1298,33 @@ class AplicacionFelicitaciones:
 
     def _update_treeview(self, registros):
         """Actualizar treeview con registros de manera segura"""
-        print("\n=== INICIO _update_treeview ===")
-        print(f"Registros recibidos: {len(registros)}")
-        print(f"Thread actual: {threading.current_thread().name}")
+        logger.debug("=== INICIO _update_treeview ===")
+        logger.debug("Registros recibidos: %s", len(registros))
+        logger.debug("Thread actual: %s", threading.current_thread().name)
         
         try:
             if threading.current_thread() != threading.main_thread():
-                print("No estamos en el hilo principal, programando actualización...")
+                logger.debug("No estamos en el hilo principal, programando actualización...")
                 if not self.is_destroyed:
                     self.root.after(0, lambda: self._update_treeview(registros))
                 return
 
-            print("Limpiando treeview...")
+            logger.debug("Limpiando treeview...")
             self.tree.delete(*self.tree.get_children())
             
-            print("Insertando registros...")
+            logger.debug("Insertando registros...")
             for registro in registros:
-                print(f"Insertando registro: {registro}")
+                logger.debug("Insertando registro: %s", registro)
                 self.tree.insert("", "end", values=registro)
 
-            print("Actualizando contador...")
+            logger.debug("Actualizando contador...")
             self.total_felicitaciones_label.configure(
                 text=f"Total Felicitaciones: {len(registros)}"
             )
-            print("=== FIN _update_treeview ===\n")
+            logger.debug("=== FIN _update_treeview ===")
 
         except Exception as e:
-            print(f"ERROR en _update_treeview: {str(e)}")
-            self.logger.error(f"Error al actualizar treeview: {str(e)}")
+            self.logger.error("Error al actualizar treeview: %s", e)
 
     def _clear_treeview(self):
         """Limpiar todos los registros del treeview de manera segura"""
@@ -1362,7 +1338,7 @@ class AplicacionFelicitaciones:
                 for item in self.tree.get_children():
                     self.tree.delete(item)
         except Exception as e:
-            self.logger.error(f"Error al limpiar treeview: {e}")
+            self.logger.error("Error al limpiar treeview: %s", e)
 
     def limpiar_campos_parcial(self):
         """Limpiar solo los campos del formulario manteniendo legajo y datos del personal"""
@@ -1379,7 +1355,7 @@ class AplicacionFelicitaciones:
             self.entry_objetivo.focus_set()
             
         except Exception as e:
-            self.logger.error(f"Error en limpiar_campos_parcial: {e}")
+            self.logger.error("Error en limpiar_campos_parcial: %s", e)
 
     def _mostrar_placeholder_foto(self):
         """Mostrar placeholder cuando no hay foto disponible"""
@@ -1416,6 +1392,11 @@ class AplicacionFelicitaciones:
                 self.felicitacion_seleccionada_id = None
                 self._ultimo_legajo_consultado = None
                 
+                # Que una respuesta tardía no vuelva a llenar el formulario
+                self.consultas.invalidar()
+                self.consultas.invalidar('felicitaciones')
+                self._indicar_consulta(None)
+                
                 def actualizar_ui():
                     if self.is_destroyed:
                         return
@@ -1444,7 +1425,7 @@ class AplicacionFelicitaciones:
                     self.root.after(0, actualizar_ui)
                 
         except Exception as e:
-            self.logger.error(f"Error en limpiar_campos: {e}")
+            self.logger.error("Error en limpiar_campos: %s", e)
             if not self.is_destroyed:
                 self.mostrar_mensaje("Error", f"Error al limpiar los campos: {str(e)}")
 
@@ -1473,7 +1454,7 @@ class AplicacionFelicitaciones:
             self.entry_objetivo.focus_set()
             
         except Exception as e:
-            self.logger.error(f"Error en limpiar_campos_modificacion: {e}")
+            self.logger.error("Error en limpiar_campos_modificacion: %s", e)
 
     def validar_campos(self):
         """Validar todos los campos del formulario"""
@@ -1500,100 +1481,132 @@ class AplicacionFelicitaciones:
             return False
 
     def consultar_empleado(self, event=None):
-        """Consultar datos del empleado por legajo"""
+        """
+        Consultar datos del empleado por legajo en segundo plano.
+
+        La consulta (datos, versión de la foto y felicitaciones) corre en el
+        gestor de tareas compartido; mientras tanto se muestra un indicador y
+        el teclado sigue respondiendo. Un legajo nuevo reemplaza al anterior:
+        si la consulta vieja no empezó se cancela y, si ya terminó, su
+        resultado se descarta.
+        """
+        if self.is_destroyed:
+            return
         try:
             # Obtener el legajo del campo de entrada
-            legajo = self.entry_legajo.get()
+            legajo = self.entry_legajo.get().strip()
             if not legajo:
+                self.consultas.invalidar()
+                self._indicar_consulta(None)
                 return
-            
-            with self.lock:
-                with self.db_pool.get_connection() as connection:
-                    with connection.cursor() as cursor:
-                        cursor.execute("""
-                            SELECT apellido_nombre, foto 
-                            FROM personal 
-                            WHERE legajo = %s
-                        """, (legajo,))
-                        
-                        resultado = cursor.fetchone()
-                        if resultado:
-                            # Obtener total de felicitaciones
-                            cursor.execute("""
-                                SELECT COUNT(*) 
-                                FROM felicitaciones 
-                                WHERE legajo = %s
-                            """, (legajo,))
-                            total_felicitaciones = cursor.fetchone()[0]
-                            
-                            # Actualizar UI con los datos
-                            def actualizar_ui():
-                                if not self.is_destroyed and hasattr(self, 'entry_objetivo') and self.entry_objetivo.winfo_exists():
-                                    apellido_nombre, foto_blob = resultado
-                                    self._actualizar_datos_empleado(
-                                        apellido_nombre, foto_blob, total_felicitaciones
-                                    )
-                                    self.consultar_felicitaciones(legajo)
-                                    
-                                    # Mover el foco si se presionó Enter y el widget existe
-                                    if event and event.keysym == 'Return':
-                                        try:
-                                            self.entry_objetivo.focus_set()
-                                        except Exception:
-                                            pass  # Ignorar errores de foco
-                            
-                            if not self.is_destroyed:
-                                self.root.after(0, actualizar_ui)
-                        else:
-                            def mostrar_error():
-                                if not self.is_destroyed and hasattr(self, 'entry_legajo') and self.entry_legajo.winfo_exists():
-                                    self.mostrar_mensaje("Error", "Empleado no encontrado")
-                                    self.entry_legajo.delete(0, tk.END)
-                                    self._clear_treeview()
-                                    self._actualizar_datos_empleado("-", None, 0)
-                                    try:
-                                        self.entry_legajo.focus_set()
-                                    except Exception:
-                                        pass  # Ignorar errores de foco
-                    
+
+            self._indicar_consulta(legajo)
+            self.consultas.solicitar(
+                legajo,
+                lambda solicitud: self._consultar_empleado_db(solicitud, legajo),
+                lambda resultado: self._mostrar_resultado_empleado(resultado, event)
+            )
         except Exception as e:
-            self.logger.error(f"Error en consultar_empleado: {str(e)}")
+            self.logger.error("Error en consultar_empleado: %s", e)
+            self._indicar_consulta(None)
             if not self.is_destroyed:
                 self.mostrar_mensaje("Error", f"Error al consultar empleado: {str(e)}")
 
-    def _actualizar_datos_empleado(self, apellido_nombre, foto_blob, total_felicitaciones):
+    def _consultar_empleado_db(self, solicitud, legajo):
+        """Leer empleado y felicitaciones (hilo de trabajo, sin tocar la interfaz)"""
+        try:
+            with self.db_pool.get_connection() as connection:
+                with connection.cursor() as cursor:
+                    # La foto se trae aparte, solo si su versión no está en caché
+                    cursor.execute(f"""
+                        SELECT apellido_nombre, {expresion_version_foto()}
+                        FROM personal 
+                        WHERE legajo = %s
+                    """, (legajo,))
+                    empleado = cursor.fetchone()
+                    if not empleado:
+                        return {'estado': 'no_encontrado', 'legajo': legajo}
+
+                    # Si ya se pidió otro legajo no vale la pena seguir
+                    if not solicitud.vigente():
+                        return None
+
+                    registros = self._leer_felicitaciones(cursor, legajo)
+            return {'estado': 'ok', 'legajo': legajo, 'empleado': empleado, 'registros': registros}
+        except Exception as e:
+            self.logger.error("Error en consultar_empleado: %s", e)
+            return {'estado': 'error', 'legajo': legajo, 'error': str(e)}
+
+    def _mostrar_resultado_empleado(self, resultado, event=None):
+        """Volcar en la interfaz el resultado de la consulta vigente (hilo de Tk)"""
+        self._indicar_consulta(None)
+        if self.is_destroyed or not resultado:
+            return
+
+        if resultado['estado'] == 'error':
+            self.mostrar_mensaje("Error", f"Error al consultar empleado: {resultado['error']}")
+            return
+
+        if resultado['estado'] == 'no_encontrado':
+            if hasattr(self, 'entry_legajo') and self.entry_legajo.winfo_exists():
+                self.mostrar_mensaje("Error", "Empleado no encontrado")
+                self.entry_legajo.delete(0, tk.END)
+                self._clear_treeview()
+                self._actualizar_datos_empleado("-", None, 0)
+                try:
+                    self.entry_legajo.focus_set()
+                except Exception:
+                    pass  # Ignorar errores de foco
+            return
+
+        if not hasattr(self, 'entry_objetivo') or not self.entry_objetivo.winfo_exists():
+            return
+
+        legajo = resultado['legajo']
+        apellido_nombre, foto_version = resultado['empleado']
+        registros = resultado['registros']
+        self._actualizar_datos_empleado(apellido_nombre, None, len(registros))
+        # La foto se descarga y decodifica en segundo plano (o sale de la caché)
+        self._solicitud_foto = solicitar_foto_empleado(
+            self.root, legajo, self.TAMANIO_FOTO, self._mostrar_foto_empleado,
+            foto_version, getattr(self, '_solicitud_foto', None)
+        )
+        self._update_treeview(registros)
+
+        # Mover el foco si se presionó Enter y el widget existe
+        if event and getattr(event, 'keysym', None) == 'Return':
+            try:
+                self.entry_objetivo.focus_set()
+            except Exception:
+                pass  # Ignorar errores de foco
+
+    def _indicar_consulta(self, legajo):
+        """Mostrar (o con None, ocultar) el indicador de consulta en curso"""
+        if self.is_destroyed or not hasattr(self, 'estado_consulta_label'):
+            return
+        try:
+            texto = f"⏳ Consultando legajo {legajo}..." if legajo else ""
+            self.estado_consulta_label.configure(text=texto)
+        except Exception:
+            pass  # El widget puede haberse destruido al cambiar de módulo
+
+    def _actualizar_datos_empleado(self, apellido_nombre, foto, total_felicitaciones):
         """Actualizar la UI con los datos del empleado"""
         self.nombre_completo_label.configure(text=f"Apellido y Nombre: {apellido_nombre}")
         self.total_felicitaciones_label.configure(text=f"Total Felicitaciones: {total_felicitaciones}")
+        self._mostrar_foto_empleado(foto)
 
-        # Actualizar foto
+    def _mostrar_foto_empleado(self, foto):
+        """Mostrar la miniatura del empleado (imagen PIL de la caché) o el placeholder"""
+        if self.is_destroyed:
+            return
         try:
-            if foto_blob and len(foto_blob) > 0:  # Corregido de 'fando_blob'
-                # Abrir la imagen desde el blob
-                image = Image.open(io.BytesIO(foto_blob))
-                if image.mode != 'RGB':
-                    image = image.convert('RGB')
-                
-                # Obtener dimensiones del canvas
-                canvas_width = self.photo_canvas.winfo_width()
-                canvas_height = self.photo_canvas.winfo_height()
-                
-                # Calcular ratio de aspecto
-                image_ratio = image.width / image.height
-                canvas_ratio = canvas_width / canvas_height
-                
-                # Calcular nuevas dimensiones manteniendo proporción
-                if image_ratio > canvas_ratio:
-                    # Imagen más ancha que el canvas
-                    new_width = canvas_width
-                    new_height = int(canvas_width / image_ratio)
-                else:
-                    # Imagen más alta que el canvas
-                    new_height = canvas_height
-                    new_width = int(canvas_height * image_ratio)
+            if foto:
+                canvas_width, canvas_height = self.TAMANIO_FOTO
                 
-                # Redimensionar la imagen manteniendo la calidad
-                resized_image = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
+                # La miniatura ya viene redimensionada manteniendo proporción
+                resized_image = foto
+                new_width, new_height = foto.size
                 
                 # Si la imagen es más pequeña que el canvas, centrarla
                 if new_width < canvas_width or new_height < canvas_height:
@@ -1619,7 +1632,7 @@ class AplicacionFelicitaciones:
             else:
                 raise ValueError("No hay foto disponible")
         except Exception as e:
-            self.logger.error(f"Error al cargar la imagen: {str(e)}")
+            self.logger.error("Error al cargar la imagen: %s", e)
             self.photo_canvas.delete("all")
             self.photo_canvas.create_oval(
                 50, 50, 150, 150,
@@ -1658,7 +1671,7 @@ class AplicacionFelicitaciones:
     def handle_database_error(self, error, operacion):
         """Manejar errores de base de datos"""
         error_msg = str(error)
-        self.logger.error(f"Error en {operacion}: {error_msg}")
+        self.logger.error("Error en %s: %s", operacion, error_msg)
         self.mostrar_mensaje("Error", f"Error en la operación: {error_msg}")
 
     def on_closing(self):
@@ -1692,8 +1705,8 @@ class AplicacionFelicitaciones:
                 
         except Exception as e:
             if hasattr(self, 'logger'):
-                self.logger.error(f"Error en cleanup: {e}")
-            print(f"Error en cleanup: {e}")
+                self.logger.error("Error en cleanup: %s", e)
+            logger.error("Error en cleanup: %s", e)
 
     def run(self):
         """Iniciar la aplicación con manejo seguro de cierre"""
@@ -1703,7 +1716,7 @@ class AplicacionFelicitaciones:
                 self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
                 self.root.mainloop()
             except Exception as e:
-                print(f"Error en ejecución: {str(e)}")
+                logger.error("Error en ejecución: %s", e)
             finally:
                 self.cleanup()
 
@@ -10,18 +10,24 @@ from datetime import datetime
 import mysql.connector
 import threading
 from concurrent.futures import ThreadPoolExecutor
-from PIL import Image, ImageTk, ImageSequence, ImageDraw
+from PIL import Image, ImageTk, ImageDraw
 import io
 import logging
 from datetime import datetime, date
 import traceback
-from logging.handlers import RotatingFileHandler
 from dotenv import load_dotenv
 from io import BytesIO
 
 # Importaciones de utils
 from utils.thread_manager import ThreadManager, DatabasePool
+from utils.log_config import get_logger
+from utils.request_coalescer import CoalescedorConsultas
+from utils.employee_summary import ConsultaResumen, como_fecha, expresion_version_foto
+from utils.photo_cache import solicitar_foto_empleado
 from utils.interface_manager import EstiloApp
+from utils.warm_start import frames_logo_gif
+
+logger = logging.getLogger(__name__)
 
 # Cargar variables de entorno
 load_dotenv()
@@ -52,36 +58,38 @@ class EstiloApp:
     BOTON_LIMPIAR_HOVER = "#616161"  # Gris más oscuro
 
 class AplicacionLicencias:
+    # Tamaño del recuadro de la foto del empleado
+    TAMANIO_FOTO = (180, 180)
+
+    # Personal + licencias del legajo en una sola consulta (estadísticas en Python)
+    RESUMEN_LICENCIAS = ConsultaResumen(
+        "licencias_sin_goce",
+        ("id", "legajo", "desde_fecha", "hasta_fecha", "cantidad_dias", "motivo", "solicita"),
+        "desde_fecha DESC"
+    )
+
     def __init__(self, parent_frame=None):
         self.is_destroyed = False
         self.is_standalone = parent_frame is None
         self.licencia_seleccionada_id = None
         self._ultimo_legajo_consultado = None
+        self.consultas = CoalescedorConsultas("licencias")
         
-        print("=== INICIANDO APLICACIÓN LICENCIAS ===")
+        logger.debug("=== INICIANDO APLICACIÓN LICENCIAS ===")
         
         # Configurar logging
         self._setup_logging()
         
         # Configuración de base de datos
-        print(f"Variables de entorno: HOST={os.getenv('DB_HOST')}, USER={os.getenv('DB_USER')}, DB={os.getenv('DB_DATABASE')}")
-        
-        self.db_config = {
-            'host': os.getenv('DB_HOST') or 'localhost',
-            'user': os.getenv('DB_USER') or 'root',
-            'password': os.getenv('DB_PASSWORD') or '',
-            'database': os.getenv('DB_DATABASE') or 'antecedentes_laborales'
-        }
-        
-        print(f"Configuración DB: {self.db_config}")
+        logger.debug("Variables de entorno: HOST=%s, DB=%s", os.getenv('DB_HOST'), os.getenv('DB_DATABASE'))
         
         # Inicializar pool de base de datos
         try:
-            print("Intentando inicializar pool de base de datos...")
+            logger.debug("Intentando inicializar pool de base de datos...")
             self.db_pool = DatabasePool()
-            print("Pool de base de datos inicializado correctamente")
+            logger.debug("Pool de base de datos inicializado correctamente")
         except Exception as e:
-            print(f"ERROR al inicializar pool de base de datos: {str(e)}")
+            logger.error("ERROR al inicializar pool de base de datos: %s", e)
         
         if parent_frame is None:
             self.root = ctk.CTk()
@@ -95,33 +103,8 @@ class AplicacionLicencias:
             self.show_in_frame(parent_frame)
 
     def _setup_logging(self):
-        """Configurar el sistema de logging"""
-        # Crear directorio logs si no existe
-        log_dir = "logs"
-        if not os.path.exists(log_dir):
-            os.makedirs(log_dir)
-        
-        # Configurar el formato del log
-        log_format = logging.Formatter(
-            '%(asctime)s - [%(levelname)s] - %(module)s - Línea %(lineno)d: %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        
-        # Configurar el manejador de archivos con rotación
-        file_handler = RotatingFileHandler(
-            filename=os.path.join(log_dir, 'errores_licencias.log'),
-            maxBytes=5 * 1024 * 1024,  # 5MB
-            backupCount=5,
-            encoding='utf-8'
-        )
-        file_handler.setFormatter(log_format)
-        
-        # Configurar el logger
-        self.logger = logging.getLogger(__name__)
-        self.logger.setLevel(logging.INFO)
-        self.logger.addHandler(file_handler)
-        
-        # Mensaje inicial
+        """Obtener el logger del módulo (configuración central en utils.log_config)"""
+        self.logger = get_logger(__name__, 'errores_licencias.log')
         self.logger.info("🚀 Aplicación iniciada")
 
     def _init_async(self):
@@ -195,7 +178,7 @@ class AplicacionLicencias:
             # Limpiar pool de base de datos si existe
             if hasattr(self, 'db_pool'):
                 try:
-                    self.db_pool.executor.shutdown(wait=False)
+                    self.db_pool.close()
                 except Exception:
                     pass
             
@@ -214,7 +197,7 @@ class AplicacionLicencias:
         except Exception as e:
             # Solo registrar el error, no hacer nada más
             if hasattr(self, 'logger'):
-                self.logger.error(f"Error en cleanup: {str(e)}")
+                self.logger.error("Error en cleanup: %s", e)
 
     def iniciar_aplicacion(self):
         """Iniciar la aplicación principal optimizando la carga"""
@@ -619,20 +602,8 @@ class AplicacionLicencias:
             gif_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 
                                    "resources", "icons_gifs", "logo.gif")
             
-            gif = Image.open(gif_path)
-            frames = []
-            
-            # Calcular el tamaño manteniendo la proporción
-            target_height = 200
-            for frame in ImageSequence.Iterator(gif):
-                frame = frame.convert('RGBA')
-                width, height = frame.size
-                aspect_ratio = width / height
-                target_width = int(target_height * aspect_ratio)
-                
-                # Redimensionar manteniendo proporción
-                frame = frame.resize((target_width, target_height), Image.LANCZOS)
-                frames.append(frame)
+            # Frames decodificados una sola vez por proceso (los adelanta el arranque en caliente)
+            frames = frames_logo_gif(alto=200, ruta=gif_path)
             
             # Crear el label dentro del contenedor del logo
             logo_label = tk.Label(
@@ -655,7 +626,7 @@ class AplicacionLicencias:
             update_gif()
 
         except Exception as e:
-            print(f"Error al cargar el logo: {e}")
+            logger.error("Error al cargar el logo: %s", e)
             self._create_logo_placeholder(header_frame)
 
         # Título principal
@@ -705,6 +676,7 @@ class AplicacionLicencias:
                 self.logo_frames and 
                 hasattr(self, 'logo_label') and 
                 self.logo_label.winfo_exists() and 
+                not getattr(self, '_suspendido', False) and  # oculto en la caché del menú
                 not self.is_destroyed):
                 
                 self.logo_label.configure(image=self.logo_frames[self.current_frame])
@@ -712,169 +684,116 @@ class AplicacionLicencias:
                 # Guardar referencia al after_id para poder cancelarlo
                 self.animation_after_id = self.root.after(100, self._animate_logo)
         except Exception as e:
-            self.logger.error(f"Error en animación del logo: {str(e)}")
+            self.logger.error("Error en animación del logo: %s", e)
 
     def consultar_empleado(self, event=None):
         """Consultar información del empleado por legajo"""
-        print(f"=== INICIANDO CONSULTA EMPLEADO (Evento: {event}) ===")
-        
-        # Prevenir consultas múltiples
-        if hasattr(self, '_consulta_en_proceso') and self._consulta_en_proceso:
-            print(">>> CONSULTA YA EN PROCESO, IGNORANDO LLAMADA ADICIONAL")
-            return
-            
-        self._consulta_en_proceso = True
+        logger.debug("=== INICIANDO CONSULTA EMPLEADO (Evento: %s) ===", event)
         
         legajo = self.entry_legajo.get().strip()
-        print(f"Legajo a consultar: '{legajo}'")
+        logger.debug("Legajo a consultar: '%s'", legajo)
         
         if not legajo:
-            print("Legajo vacío, cancelando consulta")
-            self._consulta_en_proceso = False
+            logger.debug("Legajo vacío, cancelando consulta")
             self.mostrar_mensaje("Error", "Debe ingresar un legajo")
             return
         
         # Si es el mismo legajo recientemente consultado, no volver a consultar
         if hasattr(self, '_ultimo_legajo_consultado') and legajo == self._ultimo_legajo_consultado:
-            print(f"Legajo {legajo} ya consultado recientemente, ignorando consulta")
-            self._consulta_en_proceso = False
+            logger.debug("Legajo %s ya consultado recientemente, ignorando consulta", legajo)
             return
             
-        print("Mostrando ventana de carga...")
+        logger.debug("Mostrando ventana de carga...")
         self.mostrar_carga("Consultando empleado...")
         
-        def _consultar():
-            print("Iniciando consulta en segundo plano...")
+        def _consultar(solicitud):
+            logger.debug("Iniciando consulta en segundo plano...")
             try:
-                print("Obteniendo conexión del pool...")
+                logger.debug("Obteniendo conexión del pool...")
                 connection = self.db_pool.get_connection()
                 cursor = connection.cursor(dictionary=True)
-                print("Conexión obtenida correctamente")
+                logger.debug("Conexión obtenida correctamente")
                 
                 try:
-                    # Primero intentemos una consulta más simple
-                    query = """
-                        SELECT legajo, apellido_nombre, foto
-                        FROM personal
-                        WHERE legajo = %s
-                    """
-                    print(f"Ejecutando query: {query.strip()} con legajo {legajo}")
-                    cursor.execute(query, (legajo,))
-                    resultado = cursor.fetchone()
+                    # Personal y licencias en una sola consulta
+                    # (la foto se trae aparte, solo si su versión no está en caché)
+                    resumen = self.RESUMEN_LICENCIAS.leer(cursor, legajo)
                     
-                    if resultado:
-                        print(f"Resultado encontrado: {resultado}")
-                        apellido_nombre = resultado['apellido_nombre']
-                        foto_blob = resultado['foto']
-                        
-                        # Ahora hacemos una segunda consulta para las estadísticas
-                        query_stats = """
-                            SELECT 
-                                COALESCE(COUNT(id), 0) as total_licencias,
-                                MAX(desde_fecha) as ultima_licencia,
-                                COALESCE(SUM(cantidad_dias), 0) as total_dias
-                            FROM licencias_sin_goce
-                            WHERE legajo = %s
-                        """
-                        cursor.execute(query_stats, (legajo,))
-                        stats = cursor.fetchone()
-                        
-                        total_licencias = stats['total_licencias'] if stats else 0
-                        ultima_fecha = stats['ultima_licencia'] if stats else None
-                        total_dias = stats['total_dias'] if stats else 0
+                    if resumen:
+                        logger.debug("Empleado encontrado: %s (%s licencias)", resumen.apellido_nombre, resumen.total)
+                        estadisticas = self._estadisticas_licencias(resumen.registros)
+                        filas = self._filas_licencias(resumen.registros, resumen.apellido_nombre)
                         
                         def _actualizar_ui():
-                            print("Actualizando UI con datos del empleado")
+                            logger.debug("Actualizando UI con datos del empleado")
                             # Actualizar nombre del empleado
-                            self.nombre_completo_label.configure(text=f"👤 Empleado: {apellido_nombre}")
-                            
-                            # Actualizar estadísticas
-                            self.total_licencias_label.configure(text=f"📋 Historial: {total_licencias} licencias registradas")
+                            self.nombre_completo_label.configure(text=f"👤 Empleado: {resumen.apellido_nombre}")
                             
-                            # Actualizar última licencia
-                            if ultima_fecha:
-                                fecha_formateada = ultima_fecha.strftime('%d-%m-%Y')
-                                self.ultima_licencia_label.configure(text=f"⏱️ Última licencia: {fecha_formateada}")
-                            else:
-                                self.ultima_licencia_label.configure(text="⏱️ Última licencia: No registrada")
-                            
-                            # Actualizar total de días
-                            self.dias_totales_label.configure(text=f"📊 Total días de licencia: {total_dias} días")
+                            # Estadísticas y tabla salen de las mismas filas
+                            self._mostrar_estadisticas(estadisticas)
+                            self._update_treeview(filas)
                             
                             # Actualizar foto
-                            self.actualizar_foto(foto_blob)
+                            self._solicitud_foto = solicitar_foto_empleado(
+                                self.root, legajo, self.TAMANIO_FOTO, self.actualizar_foto,
+                                resumen.foto_version, getattr(self, '_solicitud_foto', None)
+                            )
                             
                             # Guardar último legajo consultado
                             self._ultimo_legajo_consultado = legajo
                             
                             # Ocultar ventana de carga
                             self.ocultar_carga()
-                            
-                            # Permitir nuevas consultas
-                            self._consulta_en_proceso = False
-                            print("UI actualizada correctamente")
+                            logger.debug("UI actualizada correctamente")
                         
                         if not self.is_destroyed and hasattr(self, 'root') and self.root.winfo_exists():
-                            print("Enviando actualización de UI al hilo principal")
-                            self.root.after(0, _actualizar_ui)
+                            logger.debug("Enviando actualización de UI al hilo principal")
+                            self.root.after(0, solicitud.si_vigente(_actualizar_ui))
                         else:
-                            print("La ventana ya no existe, cancelando actualización")
-                            self._consulta_en_proceso = False
-                        
-                        # Consultar licencias para el treeview
-                        print("Consultando licencias para el treeview")
-                        self.consultar_licencias(legajo)
+                            logger.debug("La ventana ya no existe, cancelando actualización")
                         
                     else:
-                        print(f"No se encontró empleado con legajo {legajo}")
+                        logger.debug("No se encontró empleado con legajo %s", legajo)
                         def _mostrar_error():
                             self.mostrar_mensaje("Error", f"No se encontró empleado con legajo {legajo}")
                             self.ocultar_carga()
-                            self._consulta_en_proceso = False
                         
                         if not self.is_destroyed and hasattr(self, 'root') and self.root.winfo_exists():
-                            self.root.after(0, _mostrar_error)
+                            self.root.after(0, solicitud.si_vigente(_mostrar_error))
                         else:
-                            print("La ventana ya no existe, cancelando mensaje de error")
-                            self._consulta_en_proceso = False
+                            logger.debug("La ventana ya no existe, cancelando mensaje de error")
                 except Exception as error:
-                    print(f"ERROR en consulta: {str(error)}")
+                    logger.error("ERROR en consulta: %s", error)
                     def _mostrar_error_exception():
                         self.mostrar_mensaje("Error", f"Error al consultar datos: {str(error)}")
                         self.ocultar_carga()
-                        self._consulta_en_proceso = False
                     
                     if not self.is_destroyed and hasattr(self, 'root') and self.root.winfo_exists():
-                        self.root.after(0, _mostrar_error_exception)
-                    else:
-                        self._consulta_en_proceso = False
+                        self.root.after(0, solicitud.si_vigente(_mostrar_error_exception))
                 finally:
-                    print("Cerrando cursor y devolviendo conexión")
+                    logger.debug("Cerrando cursor y devolviendo conexión")
                     cursor.close()
                     self.db_pool.return_connection(connection)
             except Exception as e:
-                print(f"ERROR CRÍTICO al consultar empleado: {str(e)}")
-                self._consulta_en_proceso = False
+                logger.error("ERROR CRÍTICO al consultar empleado: %s", e)
                 if not self.is_destroyed and hasattr(self, 'root') and self.root.winfo_exists():
                     self.root.after(0, lambda: self.mostrar_mensaje("Error", f"Error crítico: {str(e)}"))
                     self.root.after(0, self.ocultar_carga)
 
-        print("Enviando consulta a thread en segundo plano")
-        threading.Thread(target=_consultar, daemon=True).start()
+        # Una consulta por legajo: los pedidos repetidos se unen y los reemplazados se descartan
+        logger.debug("Enviando consulta a thread en segundo plano")
+        self.consultas.solicitar(legajo, _consultar)
 
-    def actualizar_foto(self, foto_blob):
-        """Actualiza la foto del empleado en el canvas"""
+    def actualizar_foto(self, foto):
+        """Actualiza la foto del empleado en el canvas (miniatura PIL de la caché compartida)"""
         try:
             # Limpiar canvas primero (eliminar óvalo y cualquier imagen previa)
             self.photo_canvas.delete("all")
             
-            if foto_blob:
-                # Si hay una foto, procesarla
+            if foto:
+                # Si hay una foto, mostrarla (ya viene redimensionada)
                 try:
-                    # Procesar la imagen
-                    image_bytes = BytesIO(foto_blob)
-                    img = Image.open(image_bytes)
-                    img = img.resize((180, 180), Image.LANCZOS)
+                    img = foto
                     
                     # Convertir a formato compatible con tkinter
                     self.current_photo = ImageTk.PhotoImage(img)
@@ -883,7 +802,7 @@ class AplicacionLicencias:
                     self.photo_canvas.create_image(90, 90, image=self.current_photo, anchor="center")
                     
                 except Exception as e:
-                    self.logger.error(f"Error procesando imagen: {e}")
+                    self.logger.error("Error procesando imagen: %s", e)
                     # Si hay error, mostrar el emoji de usuario
                     self._draw_user_emoji()
             else:
@@ -891,7 +810,7 @@ class AplicacionLicencias:
                 self._draw_user_emoji()
         
         except Exception as e:
-            self.logger.error(f"Error en actualizar_foto: {e}")
+            self.logger.error("Error en actualizar_foto: %s", e)
             # Si hay error, al menos mostrar el emoji de usuario
             self._draw_user_emoji()
 
@@ -1189,8 +1108,8 @@ class AplicacionLicencias:
         except Exception as e:
             # Mostrar mensaje de error
             self.mostrar_mensaje("Error", f"Error al cargar datos: {str(e)}", "error")
-            print(f"Error en on_tree_double_click: {e}")
-            print(f"Valores: {valores}")
+            logger.error("Error en on_tree_double_click: %s", e)
+            logger.debug("Valores: %s", valores)
 
     def eliminar_sancion(self):
         """Este método ya no es necesario, pero se mantiene para compatibilidad temporal.
@@ -1363,7 +1282,7 @@ class AplicacionLicencias:
             self.entry_objetivo.focus_set()
             
         except Exception as e:
-            self.logger.error(f"Error en limpiar_campos_parcial: {e}")
+            self.logger.error("Error en limpiar_campos_parcial: %s", e)
 
     def modificar_licencia(self):
         """Modificar licencia existente"""
@@ -1422,7 +1341,7 @@ class AplicacionLicencias:
 
     def consultar_licencias(self, legajo=None):
         """Consultar licencias según filtros"""
-        print("Iniciando consulta de licencias...")
+        logger.debug("Iniciando consulta de licencias...")
         # Mostrar ventana de carga
         self.mostrar_carga("Consultando licencias...")
         
@@ -1431,41 +1350,35 @@ class AplicacionLicencias:
             cursor = None
             try:
                 # Crear conexión a la base de datos
-                conexion = mysql.connector.connect(**self.db_config)
+                conexion = self.db_pool.get_connection()
                 cursor = conexion.cursor()
                 
-                # Modificamos la consulta para incluir el nombre del empleado
+                estadisticas = None
                 if legajo:
-                    sql = """
-                    SELECT l.id, l.legajo,
-                           DATE_FORMAT(l.desde_fecha, '%d-%m-%Y') as desde_fecha,
-                           DATE_FORMAT(l.hasta_fecha, '%d-%m-%Y') as hasta_fecha,
-                           l.cantidad_dias, l.motivo, l.solicita
-                    FROM licencias_sin_goce l
-                    WHERE l.legajo = %s
-                    ORDER BY l.desde_fecha DESC
-                    """
-                    cursor.execute(sql, (legajo,))
+                    # Licencias y estadísticas del legajo en una sola consulta
+                    resumen = self.RESUMEN_LICENCIAS.leer(cursor, legajo)
+                    registros = resumen.registros if resumen else []
+                    nombre = resumen.apellido_nombre if resumen else ""
+                    resultados = self._filas_licencias(registros, nombre)
+                    estadisticas = self._estadisticas_licencias(registros)
                 else:
                     sql = """
-                    SELECT l.id, l.legajo,
+                    SELECT l.id, l.legajo, p.apellido_nombre,
                            DATE_FORMAT(l.desde_fecha, '%d-%m-%Y') as desde_fecha,
                            DATE_FORMAT(l.hasta_fecha, '%d-%m-%Y') as hasta_fecha,
                            l.cantidad_dias, l.motivo, l.solicita
                     FROM licencias_sin_goce l
+                    LEFT JOIN personal p ON p.legajo = l.legajo
                     ORDER BY l.desde_fecha DESC
                     """
                     cursor.execute(sql)
-                
-                # Obtener resultados
-                resultados = cursor.fetchall()
+                    resultados = cursor.fetchall()
                 
                 # Actualizar UI en el hilo principal
                 def _actualizar_ui():
                     self._update_treeview(resultados)
-                    # No pasar el cursor aquí, será cerrado después
-                    if legajo:
-                        self._actualizar_estadisticas_seguro(legajo)
+                    if estadisticas:
+                        self._mostrar_estadisticas(estadisticas)
                     self.ocultar_carga()
                 
                 self.root.after(0, _actualizar_ui)
@@ -1473,7 +1386,7 @@ class AplicacionLicencias:
             except Exception as error:
                 # Capturar el error para usarlo en una función local
                 error_msg = str(error)  # Guardar el mensaje de error en una variable local
-                self.logger.error(f"Error en consultar_licencias: {error_msg}")
+                self.logger.error("Error en consultar_licencias: %s", error_msg)
                 
                 # Definir una función para mostrar el error
                 def _mostrar_error_ui():
@@ -1493,6 +1406,25 @@ class AplicacionLicencias:
         # Ejecutar en hilo separado
         threading.Thread(target=_consultar, daemon=True).start()
 
+    def _estadisticas_licencias(self, registros):
+        """Total, última licencia y días a partir de las filas ya leídas (antes COUNT/MAX/SUM)"""
+        fechas = [como_fecha(r['desde_fecha']) for r in registros if r['desde_fecha']]
+        return {
+            'total_licencias': len(registros),
+            'ultima_fecha': max(fechas) if fechas else None,
+            'total_dias': sum(int(r['cantidad_dias'] or 0) for r in registros)
+        }
+
+    def _filas_licencias(self, registros, apellido_nombre):
+        """Filas para la tabla: id, legajo, nombre, desde, hasta, días, motivo, solicita"""
+        def _fecha(valor):
+            return como_fecha(valor).strftime('%d-%m-%Y') if valor else ''
+        return [
+            (r['id'], r['legajo'], apellido_nombre, _fecha(r['desde_fecha']), _fecha(r['hasta_fecha']),
+             r['cantidad_dias'], r['motivo'], r['solicita'])
+            for r in registros
+        ]
+
     def validar_campos(self):
         """Validar todos los campos del formulario"""
         try:
@@ -1557,8 +1489,8 @@ class AplicacionLicencias:
                 cursor = connection.cursor()
                 
                 # Consultar datos del empleado
-                cursor.execute("""
-                    SELECT apellido_nombre, foto 
+                cursor.execute(f"""
+                    SELECT apellido_nombre, {expresion_version_foto()}
                     FROM personal 
                     WHERE legajo = %s
                 """, (legajo,))
@@ -1566,7 +1498,7 @@ class AplicacionLicencias:
                 resultado = cursor.fetchone()
                 
                 if resultado:
-                    apellido_nombre, foto_blob = resultado
+                    apellido_nombre, foto_version = resultado
                     
                     # Consultar estadísticas de licencias
                     cursor.execute("""
@@ -1607,7 +1539,7 @@ class AplicacionLicencias:
                             total_licencias, 
                             ultima_fecha, 
                             total_dias, 
-                            foto_blob,
+                            (legajo, foto_version),
                             licencias
                         ))
                 else:
@@ -1619,7 +1551,7 @@ class AplicacionLicencias:
                     
             except Exception as e:
                 error_msg = str(e)
-                self.logger.error(f"Error en búsqueda de empleado: {error_msg}")
+                self.logger.error("Error en búsqueda de empleado: %s", error_msg)
                 if not self.is_destroyed:
                     self.root.after(0, lambda: messagebox.showerror(
                         "Error",
@@ -1668,7 +1600,12 @@ class AplicacionLicencias:
                 text=f"📊 Total días: {dias}"
             )
             
-            self.actualizar_foto(foto)
+            # Pedir la foto (de la caché o, si cambió la versión, de la base)
+            legajo, foto_version = foto
+            self._solicitud_foto = solicitar_foto_empleado(
+                self.root, legajo, self.TAMANIO_FOTO, self.actualizar_foto,
+                foto_version, getattr(self, '_solicitud_foto', None)
+            )
             
             # Actualizar treeview
             for item in self.tree.get_children():
@@ -1678,7 +1615,7 @@ class AplicacionLicencias:
                 self.tree.insert('', 'end', values=licencia)
             
         except Exception as e:
-            self.logger.error(f"Error al actualizar datos del empleado: {str(e)}")
+            self.logger.error("Error al actualizar datos del empleado: %s", e)
 
     def on_tree_select(self, event):
         """Manejar selección en el treeview"""
@@ -1722,7 +1659,7 @@ class AplicacionLicencias:
             self.entry_solicita.insert(0, valores[6])
 
         except Exception as e:
-            print(f"Error en selección: {e}")
+            logger.error("Error en selección: %s", e)
             self.mostrar_mensaje("Error", "Error al cargar los datos seleccionados")
 
     def mostrar_menu_contextual(self, event):
@@ -1995,9 +1932,9 @@ class AplicacionLicencias:
                 # Insertar en el treeview
                 self.tree.insert("", "end", values=valores)
             except Exception as e:
-                self.logger.error(f"Error al actualizar treeview: {str(e)}")
-                print(f"Error en _update_treeview: {e}")
-                print(f"Registro: {registro}")
+                self.logger.error("Error al actualizar treeview: %s", e)
+                logger.error("Error en _update_treeview: %s", e)
+                logger.debug("Registro: %s", registro)
 
     def limpiar_campos(self):
         """Limpiar todos los campos del formulario"""
@@ -2032,7 +1969,7 @@ class AplicacionLicencias:
         """Mostrar mensaje en ventana emergente"""
         try:
             if not hasattr(self, 'root') or not self.root or not self.root.winfo_exists():
-                print(f"Mensaje omitido (ventana cerrada): {titulo} - {mensaje}")
+                logger.warning("Mensaje omitido (ventana cerrada): %s - %s", titulo, mensaje)
                 return  # Evita abrir el mensaje si la aplicación ya está cerrada
             
             # Verificar si ya hay un diálogo abierto con el mismo título y mensaje
@@ -2095,29 +2032,29 @@ class AplicacionLicencias:
             
         except Exception as e:
             # Evitamos recursión al manejar errores en el propio método
-            print(f"Error al mostrar mensaje: {e}")
+            logger.error("Error al mostrar mensaje: %s", e)
             logging.error(f"Error en mostrar_mensaje: {str(e)}")
 
     def mostrar_carga(self, mensaje="Cargando..."):
         """Mostrar indicador de carga"""
-        print(f"=== INICIANDO MOSTRAR_CARGA: {mensaje} ===")
+        logger.debug("=== INICIANDO MOSTRAR_CARGA: %s ===", mensaje)
         
         # Evitar múltiples ventanas de carga
         if hasattr(self, 'is_loading') and self.is_loading:
-            print("Ya hay una ventana de carga activa, ignorando")
+            logger.debug("Ya hay una ventana de carga activa, ignorando")
             return
             
         try:
             self.is_loading = True  # Marcar que hay una carga en proceso
             
             if not hasattr(self, 'root') or not self.root or not self.root.winfo_exists():
-                print("La ventana principal no existe, cancelando mostrar_carga")
+                logger.debug("La ventana principal no existe, cancelando mostrar_carga")
                 self.is_loading = False
                 return
                 
             # Verificar si ya existe una ventana de carga
             if hasattr(self, 'loading_dialog') and self.loading_dialog and self.loading_dialog.winfo_exists():
-                print("Ventana de carga ya existe, actualizando mensaje")
+                logger.debug("Ventana de carga ya existe, actualizando mensaje")
                 # Actualizar mensaje en ventana existente
                 for widget in self.loading_dialog.winfo_children():
                     if isinstance(widget, ctk.CTkLabel):
@@ -2125,7 +2062,7 @@ class AplicacionLicencias:
                         return
                 return
 
-            print("Creando nueva ventana de carga")
+            logger.debug("Creando nueva ventana de carga")
             self.loading_dialog = ctk.CTkToplevel(self.root)
             self.loading_dialog.title("Cargando")
             self.loading_dialog.geometry("200x100")
@@ -2143,31 +2080,31 @@ class AplicacionLicencias:
             
             # Asegurar que la ventana no se quede abierta indefinidamente
             self.root.after(15000, self.ocultar_carga)  # 15 segundos máximo
-            print("Ventana de carga creada correctamente")
+            logger.debug("Ventana de carga creada correctamente")
             
         except Exception as e:
-            print(f"ERROR al mostrar ventana de carga: {str(e)}")
+            logger.error("ERROR al mostrar ventana de carga: %s", e)
             self.is_loading = False
 
     def ocultar_carga(self):
         """Ocultar indicador de carga"""
-        print("=== INICIANDO OCULTAR_CARGA ===")
+        logger.debug("=== INICIANDO OCULTAR_CARGA ===")
         try:
             # Limpiar flag de carga
             self.is_loading = False
             
             if hasattr(self, 'loading_dialog'):
                 if self.loading_dialog and self.loading_dialog.winfo_exists():
-                    print("Destruyendo ventana de carga")
+                    logger.debug("Destruyendo ventana de carga")
                     self.loading_dialog.grab_release()  # Liberar antes de destruir
                     self.loading_dialog.destroy()
                 # Eliminar referencia
                 del self.loading_dialog
-                print("Ventana de carga eliminada")
+                logger.debug("Ventana de carga eliminada")
             else:
-                print("No hay ventana de carga para ocultar")
+                logger.debug("No hay ventana de carga para ocultar")
         except Exception as e:
-            print(f"ERROR al ocultar ventana de carga: {str(e)}")
+            logger.error("ERROR al ocultar ventana de carga: %s", e)
             # Intentar limpiar referencias en caso de error
             if hasattr(self, 'loading_dialog'):
                 del self.loading_dialog
@@ -2177,65 +2114,27 @@ class AplicacionLicencias:
         try:
             self.cleanup()
         except Exception as e:
-            print(f"Error during cleanup: {e}")
+            logger.error("Error during cleanup: %s", e)
 
-    def _actualizar_estadisticas_seguro(self, legajo):
-        """Actualiza estadísticas creando una nueva conexión y cursor"""
-        if not legajo:
-            return
-        
-        conexion = None
-        cursor = None
-        try:
-            # Crear una nueva conexión para estadísticas
-            conexion = mysql.connector.connect(**self.db_config)
-            cursor = conexion.cursor()
-            
-            # Ahora podemos actualizar estadísticas con un cursor nuevo
-            cursor.execute("""
-                SELECT 
-                    COUNT(*) as total_licencias,
-                    SUM(cantidad_dias) as total_dias,
-                    MAX(desde_fecha) as ultima_fecha
-                FROM licencias_sin_goce 
-                WHERE legajo = %s
-            """, (legajo,))
-            
-            resultado = cursor.fetchone()
-            if resultado:
-                total_licencias, total_dias, ultima_fecha = resultado
-                
-                # Actualizar UI en el hilo principal
-                def _actualizar_labels():
-                    # Comprobar si los labels existen antes de actualizar
-                    if hasattr(self, 'total_licencias_label'):
-                        self.total_licencias_label.configure(text=f"📋 Historial: {total_licencias or 0} licencias registradas")
-                    
-                    # Convertir fecha con manejo de errores
-                    fecha_formateada = "No disponible"
-                    if ultima_fecha:
-                        try:
-                            fecha_formateada = ultima_fecha.strftime('%d-%m-%Y')
-                        except Exception as e:
-                            self.logger.error(f"Error al formatear fecha: {str(e)}")
-                    
-                    if hasattr(self, 'ultima_licencia_label'):
-                        self.ultima_licencia_label.configure(text=f"⏱️ Última licencia: {fecha_formateada}")
-                    
-                    if hasattr(self, 'dias_totales_label'):
-                        self.dias_totales_label.configure(text=f"📊 Total días de licencia: {total_dias or 0} días")
-                
-                self.root.after(0, _actualizar_labels)
+    def _mostrar_estadisticas(self, estadisticas):
+        """Actualizar los labels de estadísticas (hilo de Tk)"""
+        # Comprobar si los labels existen antes de actualizar
+        if hasattr(self, 'total_licencias_label'):
+            self.total_licencias_label.configure(
+                text=f"📋 Historial: {estadisticas['total_licencias']} licencias registradas"
+            )
         
-        except Exception as e:
-            self.logger.error(f"Error al actualizar estadísticas: {str(e)}")
+        if hasattr(self, 'ultima_licencia_label'):
+            if estadisticas['ultima_fecha']:
+                fecha_formateada = estadisticas['ultima_fecha'].strftime('%d-%m-%Y')
+                self.ultima_licencia_label.configure(text=f"⏱️ Última licencia: {fecha_formateada}")
+            else:
+                self.ultima_licencia_label.configure(text="⏱️ Última licencia: No registrada")
         
-        finally:
-            # Cerrar recursos
-            if cursor:
-                cursor.close()
-            if conexion and conexion.is_connected():
-                conexion.close()
+        if hasattr(self, 'dias_totales_label'):
+            self.dias_totales_label.configure(
+                text=f"📊 Total días de licencia: {estadisticas['total_dias']} días"
+            )
 
     def show_in_frame(self, parent_frame):
         """Mostrar el módulo en un frame específico"""
@@ -2246,7 +2145,7 @@ class AplicacionLicencias:
                     self.parent_frame.unbind('<MouseWheel>')  # Unbind específico en lugar de unbind_all
                     self.parent_frame.unbind('<Shift-MouseWheel>')
                 except Exception as e:
-                    self.logger.warning(f"Error al limpiar bindings: {e}")
+                    self.logger.warning("Error al limpiar bindings: %s", e)
             
             self.is_destroyed = False
             
@@ -2274,7 +2173,7 @@ class AplicacionLicencias:
             self.create_gui()
         
         except Exception as e:
-            self.logger.error(f"Error en show_in_frame: {str(e)}")
+            self.logger.error("Error en show_in_frame: %s", e)
             raise
 
     def _find_root_window(self, widget):
@@ -2291,7 +2190,7 @@ class AplicacionLicencias:
         try:
             # Verificar si el canvas aún existe y es válido
             if not canvas.winfo_exists():
-                print("Canvas no existe, removiendo binding")
+                logger.debug("Canvas no existe, removiendo binding")
                 if hasattr(self, 'parent_frame'):
                     self.parent_frame.unbind_all('<MouseWheel>')
                     self.parent_frame.unbind_all('<Shift-MouseWheel>')
@@ -2303,7 +2202,7 @@ class AplicacionLicencias:
                 if not scroll_region:
                     return
             except tk.TclError:
-                print("Error accediendo al canvas, removiendo binding")
+                logger.debug("Error accediendo al canvas, removiendo binding")
                 return
 
             # Obtener la posición actual del scroll de forma segura
@@ -2312,7 +2211,7 @@ class AplicacionLicencias:
                 if not current_view:
                     return
             except tk.TclError:
-                print("Error obteniendo yview, removiendo binding")
+                logger.debug("Error obteniendo yview, removiendo binding")
                 return
 
             # Aplicar el scroll con verificaciones
@@ -2325,11 +2224,11 @@ class AplicacionLicencias:
                        (event.delta < 0 and current_view[1] < 1):
                         canvas.yview_scroll(int(-1*(event.delta/120)), "units")
             except tk.TclError as e:
-                print(f"Error durante scroll: {e}")
+                logger.error("Error durante scroll: %s", e)
                 return
 
         except Exception as e:
-            print(f"Error general en _on_mousewheel: {e}")
+            logger.error("Error general en _on_mousewheel: %s", e)
             # Intentar limpiar bindings
             if hasattr(self, 'parent_frame'):
                 try:
@@ -2367,7 +2266,7 @@ class AplicacionLicencias:
                     canvas.configure(scrollregion=canvas.bbox("all"))
                     canvas.itemconfig(canvas_frame, width=canvas.winfo_width())
                 except tk.TclError:
-                    print("Error configurando canvas")
+                    logger.error("Error configurando canvas")
 
         def _bind_mousewheel(event=None):
             if canvas.winfo_exists():
@@ -2375,14 +2274,14 @@ class AplicacionLicencias:
                     container.bind_all("<MouseWheel>", lambda e: self._on_mousewheel(e, canvas))
                     container.bind_all("<Shift-MouseWheel>", lambda e: self._on_mousewheel(e, canvas))
                 except Exception as e:
-                    print(f"Error en binding mousewheel: {e}")
+                    logger.error("Error en binding mousewheel: %s", e)
 
         def _unbind_mousewheel(event=None):
             try:
                 container.unbind_all("<MouseWheel>")
                 container.unbind_all("<Shift-MouseWheel>")
             except Exception as e:
-                print(f"Error unbinding mousewheel: {e}")
+                logger.error("Error unbinding mousewheel: %s", e)
 
         # Configurar bindings con manejo de errores
         try:
@@ -2390,7 +2289,7 @@ class AplicacionLicencias:
             container.bind("<Enter>", _bind_mousewheel)
             container.bind("<Leave>", _unbind_mousewheel)
         except Exception as e:
-            print(f"Error configurando bindings: {e}")
+            logger.error("Error configurando bindings: %s", e)
 
     def limpiar_formulario(self):
         """Limpia todos los campos del formulario"""
@@ -2428,16 +2327,16 @@ class AplicacionLicencias:
                 return
                 
             # Verificar que tengamos la configuración de la base de datos
-            if not hasattr(self, 'db_config') or not self.db_config:
+            if not getattr(self, 'db_pool', None):
                 messagebox.showerror("Error", "No se ha configurado la conexión a la base de datos")
                 return
                 
             # Crear conexión
             try:
-                conexion = mysql.connector.connect(**self.db_config)
+                conexion = self.db_pool.get_connection()
                 cursor = conexion.cursor()
             except mysql.connector.Error as e:
-                self.logger.error(f"Error al conectar con la base de datos: {str(e)}")
+                self.logger.error("Error al conectar con la base de datos: %s", e)
                 messagebox.showerror("Error de conexión", f"No se pudo conectar a la base de datos: {str(e)}")
                 return
             
@@ -2454,7 +2353,7 @@ class AplicacionLicencias:
             self.consultar_licencias()
             
         except Exception as e:
-            self.logger.error(f"Error en eliminar_registro: {str(e)}")
+            self.logger.error("Error en eliminar_registro: %s", e)
             messagebox.showerror("Error", f"Error al eliminar registro: {str(e)}")
             if conexion is not None and conexion.is_connected():
                 conexion.close()
@@ -2495,16 +2394,16 @@ class AplicacionLicencias:
             hasta_fecha_db = hasta_fecha.strftime('%Y-%m-%d')
             
             # Verificar que tengamos la configuración de la base de datos
-            if not hasattr(self, 'db_config') or not self.db_config:
+            if not getattr(self, 'db_pool', None):
                 messagebox.showerror("Error", "No se ha configurado la conexión a la base de datos")
                 return
                 
             # Crear conexión
             try:
-                conexion = mysql.connector.connect(**self.db_config)
+                conexion = self.db_pool.get_connection()
                 cursor = conexion.cursor()
             except mysql.connector.Error as e:
-                self.logger.error(f"Error al conectar con la base de datos: {str(e)}")
+                self.logger.error("Error al conectar con la base de datos: %s", e)
                 messagebox.showerror("Error de conexión", f"No se pudo conectar a la base de datos: {str(e)}")
                 return
             
@@ -2551,7 +2450,7 @@ class AplicacionLicencias:
             self.consultar_licencias()
             
         except Exception as e:
-            self.logger.error(f"Error en guardar_registro: {str(e)}")
+            self.logger.error("Error en guardar_registro: %s", e)
             messagebox.showerror("Error", f"Error al guardar registro: {str(e)}")
             if conexion is not None and conexion.is_connected():
                 conexion.close()
@@ -2610,7 +2509,7 @@ class AplicacionLicencias:
         try:
             # Verificar que los campos existan
             if not hasattr(self, 'entry_fecha_desde') or not hasattr(self, 'entry_fecha_hasta') or not hasattr(self, 'entry_dias'):
-                print("Faltan campos necesarios para calcular días")
+                logger.debug("Faltan campos necesarios para calcular días")
                 return
                 
             fecha_desde_str = self.entry_fecha_desde.get()
@@ -2635,12 +2534,12 @@ class AplicacionLicencias:
             self.entry_dias.delete(0, tk.END)
             self.entry_dias.insert(0, str(diferencia))
             
-            print(f"Días calculados: {diferencia} días entre {fecha_desde_str} y {fecha_hasta_str}")
+            logger.debug("Días calculados: %s días entre %s y %s", diferencia, fecha_desde_str, fecha_hasta_str)
             
         except ValueError as e:
-            print(f"Error al calcular días: {e}")
+            logger.error("Error al calcular días: %s", e)
         except Exception as e:
-            print(f"Error inesperado: {e}")
+            logger.error("Error inesperado: %s", e)
 
 if __name__ == "__main__":
     app = None
@@ -3,7 +3,6 @@ import sys
 # Agregar el directorio raíz al path de Python
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-import tempfile
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from tkcalendar import DateEntry
@@ -15,12 +14,19 @@ from typing import Optional, Tuple, Callable
 from utils.interface_manager import EstiloApp, DialogManager, InterfaceManager
 import threading
 from queue import Queue
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, Future
 import logging
 import traceback
-from logging.handlers import RotatingFileHandler
 from dotenv import load_dotenv
-from utils.thread_manager import ThreadManager
+from utils.thread_manager import DatabasePool, get_thread_manager
+from utils.log_config import get_logger
+from utils.image_utils import decodificar_imagen, limpiar_temporales_heredados
+from utils.photo_cache import get_photo_cache
+from utils.virtual_tree import VirtualTreeview
+from utils.warm_start import get_warm_store, frames_logo_gif
+from utils.db_pool import get_pool
+
+logger = logging.getLogger(__name__)
 
 # Configurar tema claro
 ctk.set_appearance_mode("light")  # Forzar modo claro
@@ -48,70 +54,25 @@ def _fix_dpi_scaling():
         tk.Tk.unblock_update_dimensions_event = _unblock_update_dimensions_event
         
     except Exception as e:
-        print(f"Warning: Could not apply scaling fixes: {e}")
+        logger.warning("Could not apply scaling fixes: %s", e)
 
 #_fix_dpi_scaling()
 
-# Directorio temporal para imágenes
-TEMP_DIR = os.path.join(tempfile.gettempdir(), "personal_images")
-os.makedirs(TEMP_DIR, exist_ok=True)
-
-class DatabaseManager:
+class DatabaseManager(DatabasePool):
     """
-    Gestor de base de datos que maneja conexiones asíncronas con MySQL.
-    Implementa un sistema de cola para evitar bloqueos en la interfaz de usuario.
+    Gestor de base de datos del módulo de personal.
+    Toma las conexiones del pool compartido (utils.db_pool) y mantiene
+    una cola para los resultados asíncronos del módulo.
     
     Atributos:
-        config (dict): Configuración de conexión a MySQL
         queue (Queue): Cola para manejar resultados asíncronos
     """
     def __init__(self):
         """Inicializar el gestor de base de datos"""
-        self.config = {
-            'host': os.getenv('DB_HOST'),
-            'user': os.getenv('DB_USER'),
-            'password': os.getenv('DB_PASSWORD'),
-            'database': os.getenv('DB_DATABASE'),  # Asegurarse de que esta variable existe en .env
-            'port': os.getenv('DB_PORT', '3306')  # Puerto opcional
-        }
+        super().__init__(max_workers=3)
         self.queue = Queue()
-        self.executor = ThreadPoolExecutor(max_workers=3)
-        self.connection_pool = []
-        self._initialize_pool()
         self.dialog_manager = DialogManager()
 
-    def _initialize_pool(self, pool_size=3):
-        """Inicializar pool de conexiones"""
-        try:
-            # Verificar que tenemos la información de la base de datos
-            if not self.config['database']:
-                raise ValueError("No se ha especificado la base de datos en las variables de entorno")
-
-            for _ in range(pool_size):
-                connection = mysql.connector.connect(**self.config)
-                if not connection.is_connected():
-                    raise ConnectionError("No se pudo establecer la conexión con la base de datos")
-                self.connection_pool.append(connection)
-                
-            print(f"Pool de conexiones inicializado con {pool_size} conexiones")
-            print(f"Base de datos seleccionada: {self.config['database']}")
-            
-        except Exception as e:
-            print(f"Error inicializando pool: {e}")
-            raise
-
-    def get_connection(self):
-        """Obtener conexión del pool"""
-        if not self.connection_pool:
-            connection = mysql.connector.connect(**self.config)
-            return connection
-        return self.connection_pool.pop()
-
-    def return_connection(self, connection):
-        """Devolver conexión al pool"""
-        if connection and connection.is_connected():
-            self.connection_pool.append(connection)
-
     def execute_query_async(self, query: str, params: tuple = None, callback=None):
         """Ejecutar consulta de forma asíncrona"""
         def _async_query():
@@ -137,7 +98,7 @@ class DatabaseManager:
                 return result
                 
             except Exception as e:
-                print(f"Error en consulta: {str(e)}")
+                logger.error("Error en consulta: %s", e)
                 if callback:
                     callback(None)
                 return None
@@ -149,21 +110,224 @@ class DatabaseManager:
 
         return _async_query()  # Ejecutar directamente y retornar el resultado
 
-    def close(self):
-        """Cerrar todas las conexiones y el executor"""
-        for conn in self.connection_pool:
-            try:
-                conn.close()
-            except:
-                pass
-        self.executor.shutdown(wait=True)
-
     def check_queue(self):
         """Verificar la cola de resultados"""
         while not self.queue.empty():
             callback, result = self.queue.get()
             callback(result)
 
+class PaginadorPersonal:
+    """
+    Paginación por clave (keyset) de la tabla personal.
+    
+    Cada página se pide con ``WHERE legajo > último_legajo_visto ORDER BY legajo
+    LIMIT n``, por lo que ir a páginas profundas cuesta lo mismo que ir a la
+    primera (OFFSET obliga a MySQL a recorrer y descartar todas las anteriores).
+    Admite un filtro por apellido o legajo, precarga en segundo plano la página
+    siguiente y calcula los totales general y filtrado.
+    
+    Los callbacks se ejecutan en el hilo de Tk (a través de ``widget.after``).
+    """
+    COLUMNAS = """legajo, fecha_alta, apellido_nombre, fecha_nacimiento,
+                   edad, estado_civil, cargas, estudios"""
+
+    def __init__(self, db, widget, page_size=50):
+        self.db = db
+        self.widget = widget
+        self.page_size = page_size
+        self.logger = logging.getLogger(__name__)
+        self._generacion = 0
+        self.reiniciar()
+
+    def reiniciar(self, criterio=None, valor=None):
+        """Volver a la primera página, opcionalmente con un filtro ('Apellido' o 'Legajo')"""
+        self.criterio = criterio if valor else None
+        self.valor = valor if criterio else None
+        self.pagina = 0
+        self.hay_siguiente = False
+        self.total = None
+        self.total_filtrado = None
+        # _inicios[i] es el último legajo de la página i-1 (None para la primera)
+        self._inicios = [None]
+        self._precargas = {}
+        self._generacion += 1
+
+    @classmethod
+    def precargar_primera_pagina(cls, page_size=50):
+        """
+        Arranque en caliente: dejar en el almacén de precargas la primera página
+        sin filtro y el total de legajos, para que el módulo los muestre sin
+        esperar a la base al construirse. No usa Tk.
+        """
+        store = get_warm_store()
+        if store.vigente(('personal', 'primera_pagina', page_size)):
+            return
+        connection = get_pool().get_connection()
+        try:
+            cursor = connection.cursor()
+            cursor.execute(
+                f"SELECT {cls.COLUMNAS} FROM personal ORDER BY legajo LIMIT %s",
+                (page_size + 1,)
+            )
+            filas = cursor.fetchall()
+            cursor.execute("SELECT COUNT(*) FROM personal")
+            total = cursor.fetchone()[0]
+            cursor.close()
+        finally:
+            connection.close()
+        store.guardar(('personal', 'primera_pagina', page_size), filas)
+        store.guardar(('personal', 'total'), total)
+
+    @property
+    def total_paginas(self):
+        """Cantidad de páginas según el total filtrado (None si aún no se contó)"""
+        if self.total_filtrado is None:
+            return None
+        return max(1, -(-self.total_filtrado // self.page_size))
+
+    def _filtro(self):
+        if self.criterio == "Apellido":
+            return "apellido_nombre LIKE %s", [f"%{self.valor}%"]
+        if self.criterio == "Legajo":
+            return "legajo = %s", [self.valor]
+        return None, []
+
+    def _ejecutar(self, query, params):
+        connection = self.db.get_connection()
+        try:
+            cursor = connection.cursor()
+            cursor.execute(query, params)
+            filas = cursor.fetchall()
+            cursor.close()
+            return filas
+        finally:
+            self.db.return_connection(connection)
+
+    def _consultar_pagina(self, filtro, params, inicio):
+        """Traer una página (más una fila para saber si hay siguiente)"""
+        params = list(params)
+        condiciones = [filtro] if filtro else []
+        if inicio is not None:
+            condiciones.append("legajo > %s")
+            params.append(inicio)
+        where = f"WHERE {' AND '.join(condiciones)}" if condiciones else ""
+        query = f"""
+            SELECT {self.COLUMNAS}
+            FROM personal
+            {where}
+            ORDER BY legajo
+            LIMIT %s
+        """
+        params.append(self.page_size + 1)
+        return self._ejecutar(query, params)
+
+    def _en_ui(self, callback):
+        try:
+            self.widget.after(0, callback)
+        except Exception:
+            pass  # El widget ya no existe
+
+    def _pedir(self, inicio):
+        """Devolver el futuro de una página, reutilizando la precarga si existe"""
+        clave = (self.criterio, self.valor, inicio)
+        futuro = self._precargas.pop(clave, None)
+        if futuro is None and inicio is None and self.criterio is None:
+            # Primera página precalculada por el arranque en caliente
+            filas = get_warm_store().tomar(('personal', 'primera_pagina', self.page_size))
+            if filas is not None:
+                futuro = Future()
+                futuro.set_result(filas)
+        if futuro is None or (futuro.done() and futuro.exception() is not None):
+            filtro, params = self._filtro()
+            futuro = self.db.executor.submit(self._consultar_pagina, filtro, params, inicio)
+        return futuro
+
+    def _navegar(self, pagina, callback):
+        self._generacion += 1
+        generacion = self._generacion
+        inicio = self._inicios[pagina]
+
+        def _listo(futuro):
+            try:
+                filas = futuro.result()
+            except Exception as e:
+                self.logger.error("Error obteniendo página de personal: %s", e)
+                filas = None
+            self._en_ui(lambda: self._aplicar(generacion, pagina, filas, callback))
+
+        self._pedir(inicio).add_done_callback(_listo)
+
+    def _aplicar(self, generacion, pagina, filas, callback):
+        """Registrar la página recibida (en el hilo de Tk) y precargar la siguiente"""
+        if generacion != self._generacion:
+            return  # Respuesta de una navegación anterior
+        if filas is None:
+            callback(None)
+            return
+
+        self.hay_siguiente = len(filas) > self.page_size
+        filas = filas[:self.page_size]
+        self.pagina = pagina
+        del self._inicios[pagina + 1:]
+        if filas:
+            self._inicios.append(filas[-1][0])
+        callback(filas)
+
+        if self.hay_siguiente:
+            clave = (self.criterio, self.valor, self._inicios[pagina + 1])
+            if clave not in self._precargas:
+                self._precargas = {clave: self._pedir(clave[2])}
+
+    def recargar(self, callback):
+        """Volver a pedir la página actual (p. ej. tras insertar o modificar)"""
+        self._precargas = {}
+        self._navegar(self.pagina, callback)
+
+    def siguiente(self, callback):
+        """Avanzar una página; devuelve False si no hay más"""
+        if not self.hay_siguiente:
+            return False
+        self._navegar(self.pagina + 1, callback)
+        return True
+
+    def anterior(self, callback):
+        """Retroceder una página; devuelve False si ya está en la primera"""
+        if self.pagina == 0:
+            return False
+        self._navegar(self.pagina - 1, callback)
+        return True
+
+    def contar(self, callback):
+        """Calcular en segundo plano el total de legajos y el total filtrado"""
+        filtro_actual = (self.criterio, self.valor)
+        filtro, params = self._filtro()
+
+        def _contar():
+            total = get_warm_store().tomar(('personal', 'total'))
+            if total is None:
+                total = self._ejecutar("SELECT COUNT(*) FROM personal", [])[0][0]
+            total_filtrado = total
+            if filtro:
+                total_filtrado = self._ejecutar(f"SELECT COUNT(*) FROM personal WHERE {filtro}", params)[0][0]
+            return total, total_filtrado
+
+        def _listo(futuro):
+            try:
+                total, total_filtrado = futuro.result()
+            except Exception as e:
+                self.logger.error("Error contando registros de personal: %s", e)
+                return
+
+            def _aplicar():
+                # Si cambió el filtro mientras se contaba, el total ya no corresponde
+                if (self.criterio, self.valor) == filtro_actual:
+                    self.total = total
+                    self.total_filtrado = total_filtrado
+                    callback()
+            self._en_ui(_aplicar)
+
+        self.db.executor.submit(_contar).add_done_callback(_listo)
+
 class ImageHandler:
     """Manejador de imágenes para la aplicación"""
     def __init__(self, canvas):
@@ -173,10 +337,21 @@ class ImageHandler:
         self.image_path = None
         self.dialog_manager = DialogManager()
 
-    def load_image(self, path: str) -> bool:
+    def load_image(self, source) -> bool:
+        """
+        Cargar una imagen en el canvas.
+        
+        Args:
+            source: ruta de un archivo, bytes (p. ej. el BLOB de la base) o imagen PIL
+        """
         try:
-            # Cargar imagen original
-            image = Image.open(path)
+            # Cargar imagen original (los bytes se decodifican en memoria)
+            if isinstance(source, (bytes, bytearray)):
+                image = decodificar_imagen(source)
+            elif isinstance(source, Image.Image):
+                image = source
+            else:
+                image = Image.open(source)
             
             # Convertir a RGB/RGBA si es necesario
             if image.mode not in ('RGB', 'RGBA'):
@@ -216,14 +391,14 @@ class ImageHandler:
             
             # Actualizar las versiones para mostrar
             self.photo_preview = ImageTk.PhotoImage(self.current_image)
-            self.image_path = path
+            self.image_path = source if isinstance(source, str) else None
             
             # Actualizar display
             self._display_image()
             return True
             
         except Exception as e:
-            print(f"Error loading image: {str(e)}")
+            logger.error("Error loading image: %s", e)
             self.dialog_manager.mostrar_mensaje(
                 None,  # o self.parent si está disponible
                 "Error",
@@ -239,10 +414,8 @@ class ImageHandler:
             self.current_image.thumbnail((150, 150), Image.LANCZOS)
             self.photo_preview = ImageTk.PhotoImage(self.current_image)
             
-            # Guardar la imagen rotada temporalmente
-            temp_rotated = os.path.join(TEMP_DIR, "temp_rotated.png")
-            self.current_image.save(temp_rotated, "PNG")
-            self.image_path = temp_rotated
+            # La imagen rotada vive solo en memoria (get_image_data la serializa)
+            self.image_path = None
             
             self._display_image()
 
@@ -275,7 +448,7 @@ class ImageHandler:
                     anchor=tk.CENTER
                 )
         except Exception as e:
-            print(f"Error displaying image: {str(e)}")
+            logger.error("Error displaying image: %s", e)
 
 class CustomDateEntry(ctk.CTkFrame):
     """Widget personalizado para calendario moderno"""
@@ -351,29 +524,36 @@ class PersonalManagementApp:
     def __init__(self, parent_frame):
         self.parent = parent_frame
         self.page_size = 50
-        self.current_page = 0
         self.db = None
+        self.paginador = None
         
-        print("🚀 Iniciando módulo de personal...")
+        logger.debug("🚀 Iniciando módulo de personal...")
 
         try:
             # Configurar logging
             self._setup_logging()
             
-            # Inicializar ThreadManager antes de la base de datos
-            self.thread_manager = ThreadManager(max_workers=4)
+            # Gestor de tareas compartido de la aplicación (antes de la base de datos)
+            self.thread_manager = get_thread_manager(self.parent)
             
             # Inicializar base de datos
             self.db = DatabaseManager()
+            self.paginador = PaginadorPersonal(self.db, self.parent, self.page_size)
+            
+            # Borrar las fotos temporales que dejaban versiones anteriores
+            self.thread_manager.submit_task(
+                "limpiar_temporales", limpiar_temporales_heredados,
+                priority=self.thread_manager.PRIORITY_LOW
+            )
             
             # Verificar conexión
             def check_connection(result):
                 if result:
-                    print("✓ Conexión a base de datos establecida")
+                    logger.debug("✓ Conexión a base de datos establecida")
                     # Cargar datos iniciales después de confirmar la conexión
-                    self._load_data()
+                    self.parent.after(0, self._load_data)
                 else:
-                    print("❌ Error conectando a la base de datos")
+                    logger.error("❌ Error conectando a la base de datos")
                     raise Exception("No se pudo establecer conexión con la base de datos")
             
             # Resto de la inicialización
@@ -393,8 +573,7 @@ class PersonalManagementApp:
             )
             
         except Exception as e:
-            print(f"❌ Error en inicialización: {str(e)}")
-            self.logger.error(f"Error en inicialización: {str(e)}")
+            self.logger.error("Error en inicialización: %s", e)
             messagebox.showerror("Error", f"Error al inicializar el módulo: {str(e)}")
 
     def _on_record_updated(self, result):
@@ -453,38 +632,13 @@ class PersonalManagementApp:
             
             # Mostrar la ventana
             self.parent.deiconify()
-            print("✨ Ventana mostrada correctamente (maximizada)")
+            logger.debug("✨ Ventana mostrada correctamente (maximizada)")
         except Exception as e:
-            print(f"❌ Error al mostrar ventana: {str(e)}")
+            logger.error("❌ Error al mostrar ventana: %s", e)
 
     def _setup_logging(self):
-        """Configurar el sistema de logging"""
-        # Crear directorio logs si no existe
-        log_dir = "logs"
-        if not os.path.exists(log_dir):
-            os.makedirs(log_dir)
-        
-        # Configurar el formato del log
-        log_format = logging.Formatter(
-            '%(asctime)s - [%(levelname)s] - %(module)s - Línea %(lineno)d: %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        
-        # Configurar el manejador de archivos con rotación
-        file_handler = RotatingFileHandler(
-            filename=os.path.join(log_dir, 'errores_personal.log'),
-            maxBytes=5 * 1024 * 1024,  # 5MB
-            backupCount=5,
-            encoding='utf-8'
-        )
-        file_handler.setFormatter(log_format)
-        
-        # Configurar el logger
-        self.logger = logging.getLogger(__name__)
-        self.logger.setLevel(logging.INFO)
-        self.logger.addHandler(file_handler)
-        
-        # Mensaje inicial
+        """Obtener el logger del módulo (configuración central en utils.log_config)"""
+        self.logger = get_logger(__name__, 'errores_personal.log')
         self.logger.info("🚀 Módulo de Personal iniciado")
 
     def _setup_styles(self):
@@ -585,7 +739,7 @@ class PersonalManagementApp:
                 self._animate_gif()
                 
         except Exception as e:
-            self.logger.error(f"Error cargando logo: {e}")
+            self.logger.error("Error cargando logo: %s", e)
 
         # Titles frame con mejor alineación
         titles_frame = ctk.CTkFrame(header_frame, fg_color='transparent')
@@ -630,36 +784,10 @@ class PersonalManagementApp:
             if os.path.exists(logo_path):
                 self.gif_frames = []
                 self.current_frame = 0
-                gif = Image.open(logo_path)
-                
-                # Calcular el tamaño manteniendo la proporción circular
+                # Frames ya centrados en un cuadrado de 300px con 20px de margen,
+                # decodificados una sola vez por proceso (los adelanta el arranque en caliente)
                 size = 300
-                padding = 20  # Espacio alrededor del círculo
-                circle_size = size - (padding * 2)
-                
-                for frame_index in range(0, gif.n_frames):
-                    gif.seek(frame_index)
-                    frame_image = gif.convert('RGBA')
-                    
-                    # Crear una imagen cuadrada con fondo transparente
-                    square_image = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-                    
-                    # Redimensionar el frame manteniendo la proporción
-                    aspect_ratio = frame_image.width / frame_image.height
-                    if aspect_ratio > 1:
-                        new_width = circle_size
-                        new_height = int(circle_size / aspect_ratio)
-                    else:
-                        new_height = circle_size
-                        new_width = int(circle_size * aspect_ratio)
-                    
-                    frame_image = frame_image.resize((new_width, new_height), Image.LANCZOS)
-                    
-                    # Centrar la imagen en el cuadrado
-                    x = (size - new_width) // 2
-                    y = (size - new_height) // 2
-                    square_image.paste(frame_image, (x, y))
-                    
+                for square_image in frames_logo_gif(cuadrado=size, margen=20, ruta=logo_path):
                     ctk_frame = ctk.CTkImage(
                         light_image=square_image,
                         dark_image=square_image,
@@ -671,11 +799,11 @@ class PersonalManagementApp:
                     self.logo_label.configure(image=self.gif_frames[0])
                     self._animate_gif()
             else:
-                self.logger.error(f"Archivo de logo no encontrado en: {logo_path}")
+                self.logger.error("Archivo de logo no encontrado en: %s", logo_path)
                 self._create_placeholder_logo(self.logo_label)
                     
         except Exception as e:
-            self.logger.error(f"Error cargando logo: {e}")
+            self.logger.error("Error cargando logo: %s", e)
             self._create_placeholder_logo(self.logo_label)
 
     def _animate_gif(self):
@@ -685,7 +813,8 @@ class PersonalManagementApp:
                 self.logo_label.winfo_exists() and 
                 hasattr(self, 'gif_frames') and 
                 self.gif_frames and 
-                not hasattr(self, 'is_destroyed')):  # Cambiado para módulo personal
+                not hasattr(self, 'is_destroyed') and  # Cambiado para módulo personal
+                not getattr(self, '_suspendido', False)):  # oculto en la caché del menú
                 
                 # Actualizar el frame actual
                 self.logo_label.configure(image=self.gif_frames[self.current_frame])
@@ -696,7 +825,7 @@ class PersonalManagementApp:
                     self.main_frame.after(100, self._animate_gif)  # Usar main_frame en lugar de main_container
             
         except Exception as e:
-            print(f"Error en animación del logo: {e}")
+            logger.error("Error en animación del logo: %s", e)
 
     def _create_main_interface(self):
         # Crear las diferentes secciones
@@ -1109,6 +1238,15 @@ class PersonalManagementApp:
                 width=70
             ).pack(side=tk.LEFT, padx=2)
 
+        # Página actual y totales
+        self.page_info_label = ctk.CTkLabel(
+            pagination_frame,
+            text="",
+            font=('Roboto', 12),
+            text_color='black'
+        )
+        self.page_info_label.pack(side=tk.LEFT, padx=10)
+
     def _create_table(self, parent):
         """Crear tabla moderna con estilo personalizado y scrolling suave"""
         # Crear contenedor con dimensiones fijas
@@ -1192,6 +1330,7 @@ class PersonalManagementApp:
         
         # Configurar scrollbar
         scroll_y.configure(command=self.tree.yview)
+        self.tabla = VirtualTreeview(self.tree, clave=lambda valores: valores[0])
 
         # Agregar efecto hover
         def on_enter(event):
@@ -1231,76 +1370,64 @@ class PersonalManagementApp:
         self.tree.bind('<<TreeviewSelect>>', self._on_tree_select)
 
     def _search_records(self):
-        """Buscar registros por criterio seleccionado"""
-        self.current_page = 0
+        """Buscar registros por criterio seleccionado (los resultados se pueden paginar)"""
         criteria = self.search_criteria.get()
         value = self.search_entry.get().strip()
 
         if not value:
-            self._load_data()
-            return
-
-        if (criteria == "Apellido"):
-            query = """
-            SELECT legajo, fecha_alta, apellido_nombre, fecha_nacimiento,
-                   edad, estado_civil, cargas, estudios 
-            FROM personal 
-            WHERE apellido_nombre LIKE %s
-            LIMIT %s OFFSET %s
-            """
-            params = (f"%{value}%", self.page_size, 0)
+            self.paginador.reiniciar()
         else:
-            query = """
-            SELECT legajo, fecha_alta, apellido_nombre, fecha_nacimiento,
-                   edad, estado_civil, cargas, estudios 
-            FROM personal 
-            WHERE legajo = %s
-            LIMIT %s OFFSET %s
-            """
-            params = (value, self.page_size, 0)
-
-        self.db.execute_query_async(query, params, callback=self._update_table)
+            self.paginador.reiniciar(criteria, value)
+        self._load_data()
 
     def _load_data(self):
-        """Cargar datos de forma asíncrona usando ThreadManager"""
+        """Cargar la página actual y los totales de forma asíncrona"""
         try:
-            query = """
-            SELECT legajo, fecha_alta, apellido_nombre, fecha_nacimiento,
-                   edad, estado_civil, cargas, estudios 
-            FROM personal
-            ORDER BY legajo
-            LIMIT %s OFFSET %s
-            """
-            offset = self.current_page * self.page_size
-            
-            def on_data_loaded(result):
-                if result:
-                    self._update_table(result)
-                else:
-                    self.logger.warning("No se encontraron registros")
-            
-            self.thread_manager.submit_task(
-                "load_data",
-                lambda: self.db.execute_query_async(
-                    query, 
-                    (self.page_size, offset),
-                    callback=on_data_loaded
-                )
-            )
+            # Si se vació el campo de búsqueda, volver al listado completo
+            search_entry = getattr(self, 'search_entry', None)
+            if self.paginador.criterio and search_entry and not search_entry.get().strip():
+                self.paginador.reiniciar()
+
+            self.paginador.recargar(self._show_page)
+            self.paginador.contar(self._update_page_info)
             
         except Exception as e:
-            self.logger.error(f"Error cargando datos: {e}")
+            self.logger.error("Error cargando datos: %s", e)
+
+    def _show_page(self, records):
+        """Mostrar la página recibida del paginador"""
+        if records is None:
+            self.logger.warning("No se pudo obtener la página de registros")
+            return
+        if not records:
+            self.logger.warning("No se encontraron registros")
+        self._update_table(records)
+        self._update_page_info()
+
+    def _update_page_info(self):
+        """Actualizar el indicador de página y totales"""
+        label = getattr(self, 'page_info_label', None)
+        if not label or not label.winfo_exists():
+            return
+
+        paginador = self.paginador
+        texto = f"Página {paginador.pagina + 1}"
+        if paginador.total_paginas is not None:
+            texto += f" de {paginador.total_paginas}"
+        if paginador.total is not None:
+            if paginador.criterio:
+                texto += f" · {paginador.total_filtrado} de {paginador.total} legajos"
+            else:
+                texto += f" · {paginador.total} legajos"
+        label.configure(text=texto)
 
     def _load_next_page(self):
         """Cargar siguiente página de registros"""
-        self.current_page += 1
-        self._load_data()
+        self.paginador.siguiente(self._show_page)
 
     def _load_previous_page(self):
         """Cargar página anterior de registros"""
-        if self.current_page > 0:
-            self.current_page -= 1
-            self._load_data()
+        self.paginador.anterior(self._show_page)
 
     def _update_table(self, records):
         """Actualizar la tabla con los resultados de manera segura"""
@@ -1314,15 +1441,9 @@ class PersonalManagementApp:
                 self.parent.after(0, lambda: self._update_table(records))
                 return
 
-            # Limpiar tabla existente
-            for item in self.tree.get_children():
-                self.tree.delete(item)
-
-            if not records:
-                return
-
-            # Insertar nuevos registros
-            for record in records:
+            # Formatear registros y reemplazar el contenido de una vez
+            filas = []
+            for record in records or []:
                 try:
                     fecha_alta = record[1].strftime('%d-%m-%Y') if record[1] else ''
                     fecha_nacimiento = record[3].strftime('%d-%m-%Y') if record[3] else ''
@@ -1337,13 +1458,15 @@ class PersonalManagementApp:
                         record[6] if record[6] is not None else '',
                         record[7] if record[7] is not None else ''
                     )
-                    self.tree.insert("", tk.END, values=formatted_record)
+                    filas.append(formatted_record)
                 except Exception as e:
-                    self.logger.error(f"Error al formatear registro: {e}")
+                    self.logger.error("Error al formatear registro: %s", e)
                     continue
 
+            self.tabla.actualizar(filas)
+
         except Exception as e:
-            self.logger.error(f"Error en actualización de tabla: {e}")
+            self.logger.error("Error en actualización de tabla: %s", e)
 
     def _clear_form(self):
         """Limpiar todos los campos del formulario"""
@@ -1372,8 +1495,7 @@ class PersonalManagementApp:
             if hasattr(self, 'search_criteria') and self.search_criteria:
                 self.search_criteria.set("Apellido")
         except Exception as e:
-            print(f"Error en _clear_form: {str(e)}")
-            self.logger.error(f"Error en _clear_form: {str(e)}")
+            self.logger.error("Error en _clear_form: %s", e)
 
     def _calculate_age(self, birth_date: str) -> int:
         """Calcular edad basada en la fecha de nacimiento"""
@@ -1483,7 +1605,7 @@ class PersonalManagementApp:
             return result["value"]
             
         except Exception as e:
-            print(f"Error showing dialog: {str(e)}")
+            logger.error("Error showing dialog: %s", e)
             return False
 
     def _validate_form(self) -> bool:
@@ -1505,7 +1627,7 @@ class PersonalManagementApp:
                 
             return True
         except Exception as e:
-            self.logger.error(f"Error en validación de formulario: {str(e)}\n{traceback.format_exc()}")
+            self.logger.error("Error en validación de formulario: %s\n%s", e, traceback.format_exc())
             return False
 
     def _get_form_data(self) -> dict:
@@ -1549,12 +1671,15 @@ class PersonalManagementApp:
                     cursor.execute(query, params)
                     connection.commit()
                     
+                    # Descartar miniaturas previas del legajo en los demás módulos
+                    get_photo_cache().invalidar(data['legajo'])
+                    get_warm_store().descartar('personal')
                     self.parent.after(0, lambda: self._handle_insert_complete(True))
                     
                 except Exception as e:
                     connection.rollback()
                     self.parent.after(0, lambda: self._handle_insert_complete(False))
-                    self.logger.error(f"Error en inserción: {str(e)}")
+                    self.logger.error("Error en inserción: %s", e)
                 finally:
                     cursor.close()
                     self.db.return_connection(connection)
@@ -1562,7 +1687,7 @@ class PersonalManagementApp:
             self.thread_manager.submit_task("insert_record", _execute_insert)
 
         except Exception as e:
-            self.logger.error(f"Error preparando inserción: {str(e)}")
+            self.logger.error("Error preparando inserción: %s", e)
             self._show_dialog("Error", f"Error al insertar registro: {str(e)}", "error")
 
     def _handle_insert_complete(self, success: bool):
@@ -1607,12 +1732,15 @@ class PersonalManagementApp:
                     cursor.execute(query, params)
                     connection.commit()
                     
+                    # La foto pudo cambiar: descartar las miniaturas en caché del legajo
+                    get_photo_cache().invalidar(data['legajo'])
+                    get_warm_store().descartar('personal')
                     self.parent.after(0, lambda: self._handle_update_complete(True))
                     
                 except Exception as e:
                     connection.rollback()
                     self.parent.after(0, lambda: self._handle_update_complete(False))
-                    self.logger.error(f"Error en actualización: {str(e)}")
+                    self.logger.error("Error en actualización: %s", e)
                 finally:
                     cursor.close()
                     self.db.return_connection(connection)
@@ -1620,7 +1748,7 @@ class PersonalManagementApp:
             self.thread_manager.submit_task("update_record", _execute_update)
 
         except Exception as e:
-            self.logger.error(f"Error preparando actualización: {str(e)}")
+            self.logger.error("Error preparando actualización: %s", e)
             self._show_dialog("Error", f"Error al actualizar registro: {str(e)}", "error")
 
     def _handle_update_complete(self, success: bool):
@@ -1651,12 +1779,14 @@ class PersonalManagementApp:
                         cursor.execute(query, (legajo,))
                         connection.commit()
                         
+                        get_photo_cache().invalidar(legajo)
+                        get_warm_store().descartar('personal')
                         self.parent.after(0, lambda: self._handle_delete_complete(True))
                         
                     except Exception as e:
                         connection.rollback()
                         self.parent.after(0, lambda: self._handle_delete_complete(False))
-                        self.logger.error(f"Error en eliminación: {str(e)}")
+                        self.logger.error("Error en eliminación: %s", e)
                     finally:
                         cursor.close()
                         self.db.return_connection(connection)
@@ -1664,7 +1794,7 @@ class PersonalManagementApp:
                 self.thread_manager.submit_task("delete_record", _execute_delete)
 
             except Exception as e:
-                self.logger.error(f"Error preparando eliminación: {str(e)}")
+                self.logger.error("Error preparando eliminación: %s", e)
                 self._show_dialog("Error", f"Error al eliminar registro: {str(e)}", "error")
 
     def _handle_delete_complete(self, success: bool):
@@ -1728,24 +1858,19 @@ class PersonalManagementApp:
                 'estudios': values[7]
             }
 
-            # Cargar foto con retardo controlado
-            temp_image_path = os.path.join(TEMP_DIR, f"temp_{values[0]}.png")
+            # Cargar foto con retardo controlado (directamente desde el BLOB, sin archivos temporales)
             query = "SELECT foto FROM personal WHERE legajo = %s"
             
             def on_photo_load(result):
                 if result and result[0][0]:  # Verificar que hay resultado y foto
-                    try:
-                        with open(temp_image_path, 'wb') as file:
-                            file.write(result[0][0])
-                        # Usar retardo para evitar problemas de escalado
-                        self.parent.after(50, lambda: self.image_handler.load_image(temp_image_path))
-                    except Exception as e:
-                        print(f"Error al cargar imagen: {e}")
+                    foto = bytes(result[0][0])
+                    # Usar retardo para evitar problemas de escalado
+                    self.parent.after(50, lambda: self.image_handler.load_image(foto))
 
             self.db.execute_query_async(query, (values[0],), callback=on_photo_load)
 
         except Exception as e:
-            print(f"Error al cargar datos en formulario: {str(e)}")
+            logger.error("Error al cargar datos en formulario: %s", e)
             self._show_dialog("Error", "Error al cargar los datos del registro", "error")
 
     def _select_photo(self):
@@ -1761,13 +1886,17 @@ class PersonalManagementApp:
         try:
             if self.db and not self.parent.winfo_exists():
                 return
+            
+            # Módulo oculto en la caché del menú: el sondeo se retoma al volver a mostrarlo
+            if getattr(self, '_suspendido', False):
+                return
                 
             if self.db:
                 self.db.check_queue()
                 self._check_queue_id = self.parent.after(100, self._check_db_queue)
                 
         except Exception as e:
-            print(f"Error checking queue: {e}")
+            logger.error("Error checking queue: %s", e)
 
     def _on_close(self):
         """Manejar el cierre de la aplicación"""
@@ -1778,14 +1907,13 @@ class PersonalManagementApp:
             if hasattr(self, '_check_queue_id'):
                 self.parent.after_cancel(self._check_queue_id)
             
-            if hasattr(self, 'thread_manager'):
-                self.thread_manager.shutdown()
+            # El gestor de tareas es compartido por la aplicación: no se cierra aquí
             
             if self.db:
                 self.db.close()
                 
         except Exception as e:
-            print(f"Error during cleanup: {e}")
+            logger.error("Error during cleanup: %s", e)
 
     def _register_callbacks(self):
         """Registrar callbacks para los eventos de la aplicación"""
@@ -1798,10 +1926,9 @@ class PersonalManagementApp:
             self.interface_manager.register_callback("record_updated", self._on_record_updated)
             self.interface_manager.register_callback("record_deleted", self._on_record_deleted)
             
-            print("✓ Callbacks registrados correctamente")
+            logger.debug("✓ Callbacks registrados correctamente")
         except Exception as e:
-            print(f"❌ Error registrando callbacks: {e}")
-            self.logger.error(f"Error en registro de callbacks: {e}")
+            self.logger.error("Error en registro de callbacks: %s", e)
 
     def _on_record_inserted(self, result: bool):
         """Callback para cuando se inserta un registro"""
@@ -1812,11 +1939,6 @@ class PersonalManagementApp:
         else:
             self._show_dialog("Error", "No se pudo insertar el registro", "error")
 
-    def __del__(self):
-        """Destructor para limpiar recursos"""
-        if hasattr(self, 'thread_manager'):
-            self.thread_manager.shutdown()
-
 class ModuloPersonal:
     def __init__(self, parent):
         self.parent = parent
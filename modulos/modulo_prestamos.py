@@ -6,14 +6,29 @@ from datetime import datetime
 import mysql.connector
 import threading
 from concurrent.futures import ThreadPoolExecutor
-from PIL import Image, ImageTk, ImageSequence
+from PIL import Image, ImageTk
 import io
 import logging
 from datetime import datetime, date
 import traceback
 import os
-from logging.handlers import RotatingFileHandler
 from dotenv import load_dotenv
+import sys
+
+# Agregar el directorio raíz al path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from utils.thread_manager import DatabasePool
+from utils.photo_cache import solicitar_foto_empleado
+from utils.employee_summary import expresion_version_foto
+from utils.warm_start import frames_logo_gif
+from utils.loan_import import ImportadorPrestamos
+from utils.loan_schedule import plan_cuotas, insertar_cuotas, montos_cuotas, pagar_cuotas
+from utils.schema_maintenance import get_mantenimiento
+from utils.loan_portfolio import leer_cartera, registrar_en_cartera
+
+logger = logging.getLogger(__name__)
 
 # Cargar variables de entorno
 load_dotenv()
@@ -39,11 +54,18 @@ class PrestamosMemento:
         return self._state
 
 class AplicacionPrestamos:
+    # Tamaño máximo de la miniatura de la foto del empleado
+    TAMANIO_FOTO = (200, 250)
+
     def __init__(self, parent_frame=None, root=None):
         self.parent_frame = parent_frame
         self.root = root
         self.standalone = parent_frame is None
         self.state = {}  # Diccionario para almacenar el estado
+        self._generaciones = {}  # canal -> última carga pedida (ejecutar_db_async)
+        self.historial_prestamos = {}  # id_prestamos -> avance y cuotas (cargar_historial_prestamos)
+        self._detalle_pendiente = None  # préstamo pedido mientras se recargaba el historial
+        self.db_pool = DatabasePool()
 
         if self.standalone:
             self.root = ctk.CTk()
@@ -54,7 +76,7 @@ class AplicacionPrestamos:
 
         self.setup_window()
         self.create_gui()
-        self.configurar_actualizacion_automatica()
+        self.db_pool.executor.submit(self.configurar_actualizacion_automatica)
         
         # Crear menú solo si estamos en modo standalone o si root está disponible
         if self.standalone or self.root:
@@ -83,35 +105,35 @@ class AplicacionPrestamos:
 
     def create_gui(self):
         """Crear la interfaz gráfica completa"""
-        print("\n=== Creando GUI de Préstamos ===")
+        logger.debug("=== Creando GUI de Préstamos ===")
         try:
             # Header (row 0)
-            print("1. Creando header...")
+            logger.debug("1. Creando header...")
             self._create_header()
             
             # Main content (row 1)
-            print("2. Creando layout principal...")
+            logger.debug("2. Creando layout principal...")
             self.create_main_layout()
             
             # Asegurar que el contenido principal se expanda
             self.container_frame.grid_rowconfigure(1, weight=1)
             
-            print("3. Creando frame de búsqueda...")
+            logger.debug("3. Creando frame de búsqueda...")
             self.create_search_frame()
             
-            print("4. Creando frame de pagos...")
+            logger.debug("4. Creando frame de pagos...")
             self.create_payments_frame()
             
-            print("5. Creando tabla...")
+            logger.debug("5. Creando tabla...")
             self._create_table()
             
             # Forzar actualización de geometría
             self.container_frame.update_idletasks()
             self.parent_frame.update_idletasks()
             
-            print("=== GUI creada exitosamente ===\n")
+            logger.debug("=== GUI creada exitosamente ===")
         except Exception as e:
-            print(f"❌ Error creando GUI: {str(e)}")
+            logger.error("❌ Error creando GUI: %s", e)
             traceback.print_exc()
 
     def _create_header(self):
@@ -139,9 +161,9 @@ class AplicacionPrestamos:
         # Logo GIF animado - mantenemos la lógica pero ajustamos el tamaño
         try:
             # Debug: Imprimir rutas
-            print("\nDebug de rutas:")
-            print(f"Directorio actual: {os.getcwd()}")
-            print(f"Directorio del módulo: {os.path.dirname(__file__)}")
+            logger.debug("Debug de rutas:")
+            logger.debug("Directorio actual: %s", os.getcwd())
+            logger.debug("Directorio del módulo: %s", os.path.dirname(__file__))
             
             # Intentar diferentes rutas
             possible_paths = [
@@ -155,34 +177,20 @@ class AplicacionPrestamos:
             # Intentar cada ruta posible
             gif_path = None
             for path in possible_paths:
-                print(f"Intentando ruta: {path}")
+                logger.debug("Intentando ruta: %s", path)
                 if os.path.exists(path):
-                    print(f"✓ Encontrado en: {path}")
+                    logger.debug("✓ Encontrado en: %s", path)
                     gif_path = path
                     break
                 else:
-                    print(f"✗ No encontrado en: {path}")
+                    logger.debug("✗ No encontrado en: %s", path)
             
             if gif_path is None:
                 raise FileNotFoundError("No se pudo encontrar logo.gif en ninguna ubicación")
 
             # Cargar y procesar el GIF manteniendo proporción original
-            gif = Image.open(gif_path)
-            frames = []
-            
-            # Calcular el tamaño manteniendo la proporción
-            target_height = 160  # Ajustado de 200 a 90
-            for frame in ImageSequence.Iterator(gif):
-                frame = frame.convert('RGBA')
-                # Obtener dimensiones originales
-                width, height = frame.size
-                # Calcular nueva anchura manteniendo proporción
-                aspect_ratio = width / height
-                target_width = int(target_height * aspect_ratio)
-                
-                # Redimensionar manteniendo proporción
-                frame = frame.resize((target_width, target_height), Image.LANCZOS)
-                frames.append(frame)
+            # Frames decodificados una sola vez por proceso (los adelanta el arranque en caliente)
+            frames = frames_logo_gif(alto=160, ruta=gif_path)
             
             # Crear el label dentro del contenedor del logo
             logo_label = tk.Label(
@@ -206,14 +214,14 @@ class AplicacionPrestamos:
             update_gif()
             
         except Exception as e:
-            print(f"Error detallado al cargar el logo: {str(e)}")
-            print(f"Tipo de error: {type(e)}")
+            logger.error("Error detallado al cargar el logo: %s", e)
+            logger.error("Tipo de error: %s", type(e))
             if isinstance(e, FileNotFoundError):
-                print(f"Directorio actual: {os.getcwd()}")
-                print("Contenido del directorio resources:")
+                logger.debug("Directorio actual: %s", os.getcwd())
+                logger.debug("Contenido del directorio resources:")
                 resources_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "resources")
                 if os.path.exists(resources_dir):
-                    print(os.listdir(resources_dir))
+                    logger.debug("%s", os.listdir(resources_dir))
 
         # Títulos ajustados para mejor disposición
         title_label = ctk.CTkLabel(
@@ -555,64 +563,63 @@ class AplicacionPrestamos:
         self.entry_legajo.focus()
 
     def mostrar_foto_empleado(self, legajo):
-        """Mostrar la foto del empleado en el canvas"""
-        try:
-            db = self.conectar_db()
+        """Mostrar la foto del empleado en el canvas (la foto se descarga aparte, solo si no está en caché)"""
+        def _consultar(db):
             cursor = db.cursor(dictionary=True)
             
-            # Obtener foto y nombre del empleado
-            cursor.execute("""
-                SELECT foto, apellido_nombre
+            # Obtener nombre y versión de la foto del empleado (sin transferir el BLOB)
+            cursor.execute(f"""
+                SELECT {expresion_version_foto()} AS foto_version, apellido_nombre
                 FROM personal 
                 WHERE legajo = %s
             """, (legajo,))
-            
             result = cursor.fetchone()
-            
-            if result and result['foto']:
-                try:
-                    image_data = io.BytesIO(result['foto'])
-                    image = Image.open(image_data)
-                    
-                    # Aumentar el tamaño máximo de la imagen
-                    image.thumbnail((200, 250), Image.Resampling.LANCZOS)  # Aumentado de 150,200 a 200,250
-                    
-                    # Crear un PhotoImage
-                    photo = ImageTk.PhotoImage(image)
-                    
-                    # Obtener dimensiones del canvas
-                    canvas_width = self.photo_canvas.winfo_width()
-                    canvas_height = self.photo_canvas.winfo_height()
-                    
-                    # Calcular posición centrada
-                    x = canvas_width // 2
-                    y = canvas_height // 2
-                    
-                    # Limpiar canvas y mostrar nueva imagen
-                    self.photo_canvas.delete("all")
-                    self.photo_canvas.create_image(
-                        x,  # Centrado horizontalmente
-                        y,  # Centrado verticalmente
-                        image=photo,
-                        anchor="center"
-                    )
-                    self.photo_canvas.image = photo  # Mantener referencia
-                    
-                    # Actualizar etiqueta con nombre
-                    self.photo_label.configure(text=result['apellido_nombre'])
-                    
-                except Exception as e:
-                    print(f"Error procesando imagen: {e}")
-                    self.mostrar_foto_default()
-            else:
+            cursor.close()
+            return result
+
+        def _mostrar(result):
+            if not result:
                 self.mostrar_foto_default()
-                
-        except mysql.connector.Error as err:
-            print(f"Error de base de datos: {err}")
+                return
+            
+            # Actualizar etiqueta con nombre
+            self.photo_label.configure(text=result['apellido_nombre'])
+            
+            # Miniatura desde la caché compartida o, si cambió la versión, desde la base
+            widget = self.root if self.root is not None else self.parent_frame
+            self._solicitud_foto = solicitar_foto_empleado(
+                widget, legajo, self.TAMANIO_FOTO, self._dibujar_foto_empleado,
+                result['foto_version'], getattr(self, '_solicitud_foto', None)
+            )
+
+        def _error(err):
+            logger.error("Error de base de datos: %s", err)
+            self.mostrar_foto_default()
+
+        self.ejecutar_db_async(_consultar, _mostrar, _error, canal='foto')
+
+    def _dibujar_foto_empleado(self, image):
+        """Dibujar la miniatura del empleado (imagen PIL de la caché) en el canvas"""
+        if getattr(self, 'is_destroyed', False):
+            return
+        if image is None:
+            self.mostrar_foto_default()
+            return
+        try:
+            # Crear un PhotoImage (debe hacerse en el hilo de Tk)
+            photo = ImageTk.PhotoImage(image)
+            
+            # Calcular posición centrada
+            x = self.photo_canvas.winfo_width() // 2
+            y = self.photo_canvas.winfo_height() // 2
+            
+            # Limpiar canvas y mostrar nueva imagen
+            self.photo_canvas.delete("all")
+            self.photo_canvas.create_image(x, y, image=photo, anchor="center")
+            self.photo_canvas.image = photo  # Mantener referencia
+        except Exception as e:
+            logger.error("Error procesando imagen: %s", e)
             self.mostrar_foto_default()
-        finally:
-            if 'db' in locals():
-                db.close()
 
     def mostrar_foto_default(self):
         """Mostrar imagen por defecto cuando no hay foto"""
@@ -929,7 +936,8 @@ class AplicacionPrestamos:
 
     # Métodos auxiliares para _create_table
     def get_history_columns(self):
-        return ("id_prestamos", "legajo", "monto_total", "cuotas", "fecha_inicio", "motivo", "estado")
+        return ("id_prestamos", "legajo", "monto_total", "cuotas", "fecha_inicio", "motivo", "estado",
+                "cuotas_pagadas", "cuotas_pendientes", "saldo_pendiente", "proximo_vencimiento")
 
     def get_history_column_config(self):
         return {
@@ -939,7 +947,11 @@ class AplicacionPrestamos:
             "cuotas": {"text": "Cuotas", "width": 100},
             "fecha_inicio": {"text": "Fecha Inicio", "width": 120},
             "motivo": {"text": "Motivo", "width": 200},
-            "estado": {"text": "Estado", "width": 100}
+            "estado": {"text": "Estado", "width": 100},
+            "cuotas_pagadas": {"text": "Pagadas", "width": 90},
+            "cuotas_pendientes": {"text": "Pendientes", "width": 90},
+            "saldo_pendiente": {"text": "Saldo", "width": 120},
+            "proximo_vencimiento": {"text": "Próximo Venc.", "width": 160}
         }
 
     def format_date_for_display(self, fecha):
@@ -956,32 +968,50 @@ class AplicacionPrestamos:
         return fecha.strftime('%Y-%m-%d')
 
     def cargar_historial_prestamos(self, legajo=None):
-        """Cargar datos en el historial de préstamos para un legajo específico"""
-        try:
-            db = self.conectar_db()
+        """
+        Cargar datos en el historial de préstamos para un legajo específico.
+
+        Una sola consulta agrupada trae el avance de todos los préstamos del
+        legajo (cuotas pagadas y pendientes, saldo, próximo vencimiento), que
+        queda en self.historial_prestamos. Las cuotas de un préstamo se leen
+        recién al abrir su detalle (mostrar_historial_pagos).
+        """
+        # Limpiar la tabla
+        self.tree.delete(*self.tree.get_children())
+        self.historial_prestamos = {}
+        
+        if legajo is None:
+            # Si no hay legajo, dejar la tabla vacía (y descartar una carga en curso)
+            self._generaciones['historial'] = self._generaciones.get('historial', 0) + 1
+            return
+
+        def _consultar(db):
             cursor = db.cursor(dictionary=True)
-            
-            # Limpiar la tabla
-            self.tree.delete(*self.tree.get_children())
-            
-            if legajo is None:
-                return  # Si no hay legajo, dejar la tabla vacía
-            
             query = """
-                SELECT id_prestamos, legajo, monto_total, cuotas, fecha_inicio, motivo,
-                       CASE 
-                           WHEN EXISTS (SELECT 1 FROM pagos p WHERE p.id_prestamos = pr.id_prestamos AND p.estado = 'Pendiente')
-                           THEN 'Pendiente'
-                           ELSE 'Pagado'
-                       END as estado
+                SELECT pr.id_prestamos, pr.legajo, pr.monto_total, pr.cuotas, pr.fecha_inicio, pr.motivo,
+                       COUNT(CASE WHEN p.estado = 'Pagado' THEN 1 END) AS cuotas_pagadas,
+                       COUNT(CASE WHEN p.estado = 'Pendiente' THEN 1 END) AS cuotas_pendientes,
+                       COALESCE(SUM(CASE WHEN p.estado = 'Pendiente' THEN p.monto_cuota END), 0) AS saldo_pendiente,
+                       MIN(CASE WHEN p.estado = 'Pendiente' THEN p.fecha_vencimiento END) AS proximo_vencimiento
                 FROM prestamos pr
-                WHERE legajo = %s
+                LEFT JOIN pagos p ON p.id_prestamos = pr.id_prestamos
+                WHERE pr.legajo = %s
+                GROUP BY pr.id_prestamos, pr.legajo, pr.monto_total, pr.cuotas, pr.fecha_inicio, pr.motivo
+                ORDER BY pr.fecha_inicio, pr.id_prestamos
             """
             cursor.execute(query, (legajo,))
-            prestamos = cursor.fetchall()
-            
-            for prestamo in prestamos:
+            # 'pagos' se completa al abrir el detalle del préstamo
+            prestamos = {prestamo['id_prestamos']: dict(prestamo, pagos=None) for prestamo in cursor.fetchall()}
+            cursor.close()
+            return prestamos
+
+        def _mostrar(prestamos):
+            self.tree.delete(*self.tree.get_children())
+            self.historial_prestamos = prestamos
+            for prestamo in prestamos.values():
                 fecha_formateada = self.format_date_for_display(prestamo['fecha_inicio'])
+                proximo = (self.format_date_for_display(prestamo['proximo_vencimiento'])
+                           if prestamo['proximo_vencimiento'] else '-')
                 self.tree.insert("", "end", values=(
                     prestamo['id_prestamos'],
                     prestamo['legajo'],
@@ -989,73 +1019,140 @@ class AplicacionPrestamos:
                     prestamo['cuotas'],
                     fecha_formateada,  # Fecha formateada
                     prestamo['motivo'],
-                    prestamo['estado']
+                    'Pendiente' if prestamo['cuotas_pendientes'] else 'Pagado',
+                    prestamo['cuotas_pagadas'],
+                    prestamo['cuotas_pendientes'],
+                    f"${prestamo['saldo_pendiente']:.2f}",
+                    proximo
                 ))
-                
-        except mysql.connector.Error as err:
+
+            # Detalle pedido mientras se recargaba
+            pendiente, self._detalle_pendiente = self._detalle_pendiente, None
+            if pendiente in prestamos:
+                self._abrir_detalle_prestamo(pendiente)
+
+        def _error(err):
+            self._detalle_pendiente = None
             messagebox.showerror("Error", f"Error de base de datos: {err}")
-        finally:
-            if 'db' in locals():
-                db.close()
+
+        self.ejecutar_db_async(_consultar, _mostrar, _error, canal='historial')
 
     def conectar_db(self):
-        """Establecer conexión a la base de datos usando variables de entorno"""
-        return mysql.connector.connect(
-            host=os.getenv('DB_HOST'),
-            user=os.getenv('DB_USER'),
-            password=os.getenv('DB_PASSWORD'),
-            database=os.getenv('DB_DATABASE')
-        )
+        """Obtener una conexión del pool compartido (close() la devuelve al pool)"""
+        return self.db_pool.get_connection()
+
+    def ejecutar_db_async(self, tarea, on_success=None, on_error=None, canal=None):
+        """
+        Ejecutar tarea(db) en el executor del pool y entregar el resultado en el hilo de Tk.
         
+        La conexión se toma del pool compartido y se devuelve siempre al terminar.
+        Los callbacks on_success(resultado) y on_error(error) se ejecutan con after(),
+        por lo que pueden actualizar widgets directamente. Cualquier excepción
+        de la tarea (de MySQL o no) llega a on_error.
+
+        Args:
+            canal: nombre de la vista que actualiza la tarea (p. ej. 'cuotas').
+                Si mientras tanto se pidió otra carga del mismo canal, el
+                resultado viejo se descarta para no pisar al más nuevo.
+        """
+        generacion = None
+        if canal is not None:
+            generacion = self._generaciones.get(canal, 0) + 1
+            self._generaciones[canal] = generacion
+
+        def _vigente():
+            return canal is None or self._generaciones.get(canal) == generacion
+
+        def _entregar(callback, valor):
+            if _vigente():
+                callback(valor)
+
+        def _run():
+            db = None
+            try:
+                db = self.conectar_db()
+                resultado = tarea(db)
+                if on_success:
+                    self._en_hilo_ui(lambda resultado=resultado: _entregar(on_success, resultado))
+            except Exception as err:
+                if isinstance(err, mysql.connector.Error):
+                    logger.error("Error de base de datos: %s", err)
+                else:
+                    logger.exception("Error en tarea de base de datos: %s", err)
+                if on_error:
+                    self._en_hilo_ui(lambda err=err: _entregar(on_error, err))
+            finally:
+                if db is not None:
+                    db.close()
+
+        return self.db_pool.executor.submit(_run)
+
+    def _en_hilo_ui(self, callback):
+        """Programar un callback en el hilo principal de Tk"""
+        if getattr(self, 'is_destroyed', False):
+            return
+        widget = self.root if self.root is not None else self.parent_frame
+        try:
+            if widget.winfo_exists():
+                widget.after(0, callback)
+        except (RuntimeError, TclError):
+            pass  # La ventana ya fue destruida
+
     def buscar_empleado_ui(self):
         self.lista_empleados.delete(*self.lista_empleados.get_children())
         nombre = self.entry_nombre.get()
         legajo = self.entry_legajo.get()
         
-        try:
-            db = self.conectar_db()
+        if not legajo and not nombre:
+            messagebox.showinfo("Búsqueda", "No se encontraron empleados")
+            return
+
+        def _consultar(db):
             cursor = db.cursor(dictionary=True)
-            
             if legajo:
                 cursor.execute("""
                     SELECT legajo, apellido_nombre
                     FROM personal 
                     WHERE legajo = %s
                 """, (legajo,))
-            elif nombre:
+            else:
                 cursor.execute("""
                     SELECT legajo, apellido_nombre
                     FROM personal 
                     WHERE apellido_nombre LIKE %s
                 """, (f"%{nombre}%",))
-            
             empleados = cursor.fetchall()
-            
+            cursor.close()
+            return empleados
+
+        def _mostrar(empleados):
+            self.lista_empleados.delete(*self.lista_empleados.get_children())
             for emp in empleados:
                 # Dividir apellido_nombre en dos columnas para la visualización
                 nombre_completo = emp['apellido_nombre'].split(',') if ',' in emp['apellido_nombre'] else ['', emp['apellido_nombre']]
                 apellido = nombre_completo[0].strip()
-                nombre = nombre_completo[1].strip() if len(nombre_completo) > 1 else ''
+                nombre_emp = nombre_completo[1].strip() if len(nombre_completo) > 1 else ''
                 
                 self.lista_empleados.insert("", "end", 
-                                          values=(emp['legajo'], nombre, apellido))
-                
-                # Si solo hay un empleado, mostrar su foto
-                if len(empleados) == 1:
-                    self.mostrar_foto_empleado(emp['legajo'])
-                else:
-                    self.mostrar_foto_default()
+                                          values=(emp['legajo'], nombre_emp, apellido))
+
+            # Si solo hay un empleado, mostrar su foto
+            if len(empleados) == 1:
+                self.mostrar_foto_empleado(empleados[0]['legajo'])
+            else:
+                self.mostrar_foto_default()
 
             # Agregar binding al Treeview para mostrar foto al seleccionar
             self.lista_empleados.bind('<<TreeviewSelect>>', self.on_empleado_select)
 
             if not empleados:
                 messagebox.showinfo("Búsqueda", "No se encontraron empleados")
-                
-        except mysql.connector.Error as err:
-            messagebox.showerror("Error", f"Error de base de datos: {err}")
-        finally:
-            db.close()
+
+        self.ejecutar_db_async(
+            _consultar, _mostrar,
+            lambda err: messagebox.showerror("Error", f"Error de base de datos: {err}"),
+            canal='empleados'
+        )
 
     def on_empleado_select(self, event):
         """Manejador de evento para selección en el Treeview"""
@@ -1075,33 +1172,27 @@ class AplicacionPrestamos:
         item = self.lista_empleados.item(seleccionado)
         legajo = item['values'][0]
         
-        # Cargar el historial de préstamos del empleado
+        # Cargar el historial de préstamos del empleado (en paralelo con las cuotas)
         self.cargar_historial_prestamos(legajo)
         
-        # Resto del código para mostrar cuotas
-        try:
-            db = self.conectar_db()
+        def _consultar(db):
             cursor = db.cursor(dictionary=True)
-            
-            # Actualizar primero las cuotas vencidas
-            cursor.execute("""
-                UPDATE pagos
-                SET estado = 'Pagado',
-                    fecha_pago = fecha_vencimiento
-                WHERE estado = 'Pendiente'
-                AND fecha_vencimiento <= CURDATE()
-            """)
-            db.commit()
 
+            # Solo lectura: las cuotas vencidas las marca el barrido diario;
+            # si hoy todavía no corrió, igual no se muestran como pendientes
             query = """
                 SELECT p.id_prestamos, p.numero_cuota, p.monto_cuota, p.fecha_vencimiento, p.estado
                 FROM pagos p
                 JOIN prestamos pr ON p.id_prestamos = pr.id_prestamos
                 WHERE pr.legajo = %s AND p.estado = 'Pendiente'
+                  AND p.fecha_vencimiento > CURDATE()
             """
             cursor.execute(query, (legajo,))
             cuotas = cursor.fetchall()
-            
+            cursor.close()
+            return cuotas
+
+        def _mostrar(cuotas):
             self.lista_cuotas.delete(*self.lista_cuotas.get_children())
             
             for cuota in cuotas:
@@ -1113,11 +1204,12 @@ class AplicacionPrestamos:
                     fecha_formateada,  # Fecha formateada
                     cuota['estado']
                 ))
-                
-        except mysql.connector.Error as err:
-            messagebox.showerror("Error", f"Error de base de datos: {err}")
-        finally:
-            db.close()
+
+        self.ejecutar_db_async(
+            _consultar, _mostrar,
+            lambda err: messagebox.showerror("Error", f"Error de base de datos: {err}"),
+            canal='cuotas'
+        )
 
     def registrar_prestamo_ui(self, legajo, monto_total, cuotas, fecha_inicio, motivo):
         """Registrar préstamo con los datos proporcionados"""
@@ -1126,6 +1218,13 @@ class AplicacionPrestamos:
            messagebox.showerror("Error", "Todos los campos son obligatorios.")
            return
 
+        # Validar monto y cuotas antes de ir a la base (hasta dos decimales)
+        try:
+            montos_cuotas(monto_total, int(cuotas))
+        except ValueError as e:
+            messagebox.showerror("Error", str(e))
+            return
+
         # Mostrar mensaje informativo sobre la acreditación automática
         mensaje = """
         INFORMACIÓN IMPORTANTE:
@@ -1146,15 +1245,14 @@ class AplicacionPrestamos:
         """
         messagebox.showinfo("Acreditación y Pagos Automáticos", mensaje)
 
-        try:
-            db = self.conectar_db()
+        def _registrar(db):
             cursor = db.cursor()
 
             # Validar que el legajo existe
             cursor.execute("SELECT COUNT(*) FROM personal WHERE legajo = %s", (legajo,))
             if cursor.fetchone()[0] == 0:
-               messagebox.showerror("Error", "El legajo no existe.")
-               return
+                cursor.close()
+                return False
 
             # Insertar el préstamo
             fecha_mysql = self.format_date_for_mysql(fecha_inicio)
@@ -1163,24 +1261,33 @@ class AplicacionPrestamos:
                 VALUES (%s, %s, %s, %s, %s)
             """
             cursor.execute(query, (legajo, monto_total, cuotas, fecha_mysql, motivo))
-            db.commit()
 
-            # Obtener el ID del préstamo recién insertado
+            # Generar las cuotas en la misma transacción que el préstamo
             id_prestamo = cursor.lastrowid
-
-            # Llamar al procedimiento almacenado para generar las cuotas
-            cursor.callproc('generar_cuotas', (id_prestamo, float(monto_total), int(cuotas), fecha_inicio))
+            plan = plan_cuotas(id_prestamo, monto_total, cuotas, fecha_mysql)
+            insertar_cuotas(cursor, plan)
+            registrar_en_cartera(
+                cursor,
+                prestamos=[(plan[0][3], sum(cuota[2] for cuota in plan))],
+                cuotas_pendientes=[(cuota[3], cuota[2]) for cuota in plan]
+            )
             db.commit()
+            cursor.close()
+            return True
 
+        def _finalizar(registrado):
+            if not registrado:
+                messagebox.showerror("Error", "El legajo no existe.")
+                return
             messagebox.showinfo("Éxito", "Préstamo registrado y cuotas generadas correctamente.")
             
             # Actualizar la vista de cuotas
             self.mostrar_cuotas()
 
-        except mysql.connector.Error as err:
-            messagebox.showerror("Error", f"Error de base de datos: {err}")
-        finally:
-            db.close()
+        self.ejecutar_db_async(
+            _registrar, _finalizar,
+            lambda err: messagebox.showerror("Error", f"Error de base de datos: {err}")
+        )
 
     def clear_loan_form(self):
         self.entry_legajo_prestamo.delete(0, 'end')
@@ -1201,30 +1308,15 @@ class AplicacionPrestamos:
         item = self.lista_cuotas.item(seleccionado)
         id_prestamo = item['values'][0]  # ID del préstamo
         numero_cuota = item['values'][1]  # Número de cuota
-        fecha_vencimiento = item['values'][3]  # Fecha de vencimiento
 
-        try:
-        # Obtener la fecha de pago
-            fecha_pago = self.fecha_pago.get_date()
-        
-        # Conexión a la base de datos
-            db = self.conectar_db()
-            cursor = db.cursor()
+    # Obtener la fecha de pago
+        fecha_pago = self.fecha_pago.get_date()
 
-        # Actualizar el estado de la cuota específica a 'Pagado'
-            query = """
-                UPDATE pagos 
-                SET estado = 'Pagado', fecha_pago = %s 
-                WHERE id_prestamos = %s 
-                AND numero_cuota = %s 
-                AND estado = 'Pendiente'
-            """
-            cursor.execute(query, (fecha_pago.strftime('%Y-%m-%d'), id_prestamo, numero_cuota))
-        
-        # Necesitamos hacer commit para que los cambios se apliquen
-            db.commit()
+        def _registrar(db):
+            return self._pagar_cuota(db, id_prestamo, numero_cuota, fecha_pago.strftime('%Y-%m-%d'))
 
-            if cursor.rowcount > 0:
+        def _finalizar(actualizadas):
+            if actualizadas > 0:
                 messagebox.showinfo("Éxito", f"Pago de la cuota {numero_cuota} registrado correctamente")
             else:
                 messagebox.showwarning("Advertencia", "No se pudo registrar el pago. La cuota podría estar ya pagada.")
@@ -1232,11 +1324,10 @@ class AplicacionPrestamos:
         # Actualizar la vista de cuotas
             self.mostrar_cuotas()
 
-        except mysql.connector.Error as err:
-            messagebox.showerror("Error", f"Error al registrar el pago: {err}")
-        finally:
-            if 'db' in locals():
-                db.close()
+        self.ejecutar_db_async(
+            _registrar, _finalizar,
+            lambda err: messagebox.showerror("Error", f"Error al registrar el pago: {err}")
+        )
 
     def pagar_todas_cuotas_ui(self):
     # Obtener el empleado seleccionado
@@ -1249,55 +1340,54 @@ class AplicacionPrestamos:
         item = self.lista_empleados.item(seleccionado)
         legajo = item['values'][0]
 
-        try:
-        # Obtener la fecha de pago
-            fecha_pago = self.fecha_pago.get_date()
-        
-        # Conexión a la base de datos
-            db = self.conectar_db()
-            cursor = db.cursor()
+    # Obtener la fecha de pago
+        fecha_pago = self.fecha_pago.get_date()
 
-        # Primero verificamos si hay cuotas pendientes
-            cursor.execute("""
-               SELECT COUNT(*) 
-               FROM pagos p
-               JOIN prestamos pr ON p.id_prestamos = pr.id_prestamos
-               WHERE pr.legajo = %s AND p.estado = 'Pendiente'
-            """, (legajo,))
-        
-            cantidad_pendientes = cursor.fetchone()[0]
-            if cantidad_pendientes == 0:
+        def _pagar(db):
+            return self._pagar_cuotas_pendientes(db, fecha_pago.strftime('%Y-%m-%d'), legajo=legajo)
+
+        def _finalizar(pagado):
+            if not pagado:
                 messagebox.showinfo("Info", "No hay cuotas pendientes para pagar")
                 return
-
-        # Obtener todos los préstamos del empleado con cuotas pendientes
-            cursor.execute("""
-               SELECT DISTINCT p.id_prestamos
-               FROM pagos p
-               JOIN prestamos pr ON p.id_prestamos = pr.id_prestamos
-               WHERE pr.legajo = %s AND p.estado = 'Pendiente'
-            """, (legajo,))
-        
-            prestamos = cursor.fetchall()
-        
-        # Pagar todas las cuotas de cada préstamo
-            for (id_prestamo,) in prestamos:
-                cursor.callproc('pagar_todas_cuotas', 
-                          (id_prestamo, fecha_pago.strftime('%Y-%m-%d')))
-            db.commit()
-
             messagebox.showinfo("Éxito", 
                           f"Se han pagado todas las cuotas pendientes del empleado {legajo}")
         
         # Actualizar la vista de cuotas
             self.mostrar_cuotas()
 
-        except mysql.connector.Error as err:
-            messagebox.showerror("Error", f"Error al pagar las cuotas: {err}")
+        self.ejecutar_db_async(
+            _pagar, _finalizar,
+            lambda err: messagebox.showerror("Error", f"Error al pagar las cuotas: {err}")
+        )
+
+    def _pagar_cuota(self, db, id_prestamo, numero_cuota, fecha_pago):
+        """
+        Pagar una cuota pendiente y descontarla de la cartera en la misma transacción.
+
+        Returns:
+            Cantidad de cuotas pagadas (0 si ya estaba pagada)
+        """
+        return len(self._pagar_cuotas_pendientes(db, fecha_pago, id_prestamo=id_prestamo,
+                                                 numero_cuota=numero_cuota))
+
+    def _pagar_cuotas_pendientes(self, db, fecha_pago, **filtro):
+        """
+        Pagar cuotas pendientes (utils.loan_schedule.pagar_cuotas: por legajo,
+        préstamo o cuota) y descontarlas de la cartera, en una transacción.
+
+        Returns:
+            Lista de las cuotas pagadas (vacía si no había pendientes)
+        """
+        cursor = db.cursor()
+        try:
+            cuotas = pagar_cuotas(cursor, fecha_pago, **filtro)
+            registrar_en_cartera(cursor, cuotas_pagadas=cuotas)
+            db.commit()
         finally:
-            if 'db' in locals():
-                db.close()  
-            
+            cursor.close()
+        return cuotas
+
     def mostrar_menu_empleados(self, event):
         """Mostrar menú contextual de empleados"""
         # Verificar si hay un empleado seleccionado
@@ -1528,130 +1618,80 @@ class AplicacionPrestamos:
 
     def confirmar_pago(self, ventana, id_prestamo, numero_cuota, fecha_pago):
         """Confirmar pago de cuota"""
-        try:
-            # Obtener la fecha de pago
-            fecha_mysql = self.format_date_for_mysql(fecha_pago.get_date())
-            
-            db = self.conectar_db()
-            cursor = db.cursor()
+        # Obtener la fecha de pago
+        fecha_mysql = self.format_date_for_mysql(fecha_pago.get_date())
 
-            # Actualizar el estado de la cuota
-            query = """
-                UPDATE pagos 
-                SET estado = 'Pagado', fecha_pago = %s 
-                WHERE id_prestamos = %s 
-                AND numero_cuota = %s 
-                AND estado = 'Pendiente'
-            """
-            cursor.execute(query, (fecha_mysql, id_prestamo, numero_cuota))
-            db.commit()
+        def _registrar(db):
+            return self._pagar_cuota(db, id_prestamo, numero_cuota, fecha_mysql)
 
-            if cursor.rowcount > 0:
+        def _finalizar(actualizadas):
+            if actualizadas > 0:
                 messagebox.showinfo("Éxito", f"Pago de la cuota {numero_cuota} registrado correctamente")
                 ventana.destroy()
                 self.mostrar_cuotas()  # Actualizar vista de cuotas
             else:
                 messagebox.showwarning("Advertencia", "No se pudo registrar el pago")
 
-        except mysql.connector.Error as err:
-            messagebox.showerror("Error", f"Error al registrar el pago: {err}")
-        finally:
-            if 'db' in locals():
-                db.close()
+        self.ejecutar_db_async(
+            _registrar, _finalizar,
+            lambda err: messagebox.showerror("Error", f"Error al registrar el pago: {err}")
+        )
 
     def confirmar_pago_total(self, ventana, legajo, fecha_pago):
         """Confirmar pago total de cuotas"""
-        try:
-            fecha_mysql = self.format_date_for_mysql(fecha_pago.get_date())
-            db = self.conectar_db()
-            cursor = db.cursor()
+        fecha_mysql = self.format_date_for_mysql(fecha_pago.get_date())
 
-            # Obtener préstamos con cuotas pendientes
-            cursor.execute("""
-               SELECT DISTINCT p.id_prestamos
-               FROM pagos p
-               JOIN prestamos pr ON p.id_prestamos = pr.id_prestamos
-               WHERE pr.legajo = %s AND p.estado = 'Pendiente'
-            """, (legajo,))
-            
-            prestamos = cursor.fetchall()
-            
-            if not prestamos:
+        def _pagar(db):
+            return self._pagar_cuotas_pendientes(db, fecha_mysql, legajo=legajo)
+
+        def _finalizar(pagado):
+            if not pagado:
                 messagebox.showinfo("Info", "No hay cuotas pendientes para pagar")
                 ventana.destroy()
                 return
-
-            # Pagar todas las cuotas
-            for (id_prestamo,) in prestamos:
-                cursor.callproc('pagar_todas_cuotas', 
-                          (id_prestamo, fecha_mysql))
-            db.commit()
-
             messagebox.showinfo("Éxito", 
                           f"Se han pagado todas las cuotas pendientes del empleado {legajo}")
             ventana.destroy()
             self.mostrar_cuotas()  # Actualizar vista de cuotas
 
-        except mysql.connector.Error as err:
-            messagebox.showerror("Error", f"Error al realizar el pago total: {err}")
-        finally:
-            if 'db' in locals():
-                db.close()
+        self.ejecutar_db_async(
+            _pagar, _finalizar,
+            lambda err: messagebox.showerror("Error", f"Error al realizar el pago total: {err}")
+        )
 
     def confirmar_pago_total_prestamo(self, ventana, id_prestamo, fecha_pago):
         """Confirmar pago total de todas las cuotas de un préstamo"""
-        try:
-            fecha_mysql = self.format_date_for_mysql(fecha_pago.get_date())
-            db = self.conectar_db()
-            cursor = db.cursor()
+        fecha_mysql = self.format_date_for_mysql(fecha_pago.get_date())
 
-            # Llamar al procedimiento almacenado
-            cursor.callproc('pagar_todas_cuotas', (id_prestamo, fecha_mysql))
-            db.commit()
+        def _pagar(db):
+            return self._pagar_cuotas_pendientes(db, fecha_mysql, id_prestamo=id_prestamo)
 
+        def _finalizar(pagadas):
+            if not pagadas:
+                messagebox.showinfo("Info", "No hay cuotas pendientes para pagar")
+                ventana.destroy()
+                return
             messagebox.showinfo("Éxito", "Se han pagado todas las cuotas pendientes del préstamo")
             ventana.destroy()
             self.mostrar_cuotas()  # Actualizar vista de cuotas
 
-        except mysql.connector.Error as err:
-            messagebox.showerror("Error", f"Error al realizar el pago total: {err}")
-        finally:
-            if 'db' in locals():
-                db.close()
+        self.ejecutar_db_async(
+            _pagar, _finalizar,
+            lambda err: messagebox.showerror("Error", f"Error al realizar el pago total: {err}")
+        )
 
     def configurar_actualizacion_automatica(self):
-        """Configurar el evento de actualización automática de cuotas"""
+        """
+        Asegurar el barrido diario de cuotas vencidas (utils.schema_maintenance).
+
+        El evento de MySQL se instala una sola vez por base (esquema versionado)
+        y el barrido solo corre si hoy todavía no lo hizo el evento ni otro
+        puesto; abrir el módulo ya no recrea el evento.
+        """
         try:
-            db = self.conectar_db()
-            cursor = db.cursor()
-            
-            # Habilitar el Event Scheduler
-            cursor.execute("SET GLOBAL event_scheduler = ON")
-            
-            # Eliminar el evento si ya existe
-            cursor.execute("DROP EVENT IF EXISTS actualizar_cuotas_automaticamente")
-            
-            # Crear el evento que se ejecutará diariamente
-            evento_sql = """
-                CREATE EVENT actualizar_cuotas_automaticamente
-                ON SCHEDULE EVERY 1 DAY
-                STARTS CURRENT_TIMESTAMP
-                DO
-                BEGIN
-                    UPDATE pagos
-                    SET estado = 'Pagado',
-                        fecha_pago = fecha_vencimiento
-                    WHERE estado = 'Pendiente'
-                    AND fecha_vencimiento <= CURDATE();
-                END
-            """
-            cursor.execute(evento_sql)
-            
-        except mysql.connector.Error as err:
-            print(f"Error al configurar actualización automática: {err}")
-        finally:
-            if 'db' in locals():
-                db.close()
+            get_mantenimiento().barrer_cuotas_vencidas()
+        except (mysql.connector.Error, RuntimeError) as err:
+            logger.error("Error al configurar actualización automática: %s", err)
 
     def create_menu_bar(self):
         """Crear barra de menú"""
@@ -1665,110 +1705,163 @@ class AplicacionPrestamos:
                              command=self.exportar_formato_csv)
         tools_menu.add_command(label="Importar préstamos históricos desde CSV", 
                              command=self.importar_prestamos_csv)
+        tools_menu.add_separator()
+        tools_menu.add_command(label="Cartera de préstamos",
+                             command=self.mostrar_cartera)
+
+    def mostrar_cartera(self):
+        """
+        Mostrar los indicadores de la cartera de préstamos.
+
+        Se leen de la tabla resumen mensual (utils.loan_portfolio), que se
+        actualiza con cada alta y pago, así la ventana abre sin recorrer
+        prestamos ni pagos.
+        """
+        ventana = tk.Toplevel(self.parent_frame)
+        ventana.title("Cartera de Préstamos")
+        ventana.geometry("700x600")
+        ventana.transient(self.parent_frame)
+
+        # Centrar la ventana
+        ventana.geometry(f"+{self.parent_frame.winfo_x() + 50}+{self.parent_frame.winfo_y() + 50}")
+
+        frame = ctk.CTkFrame(ventana)
+        frame.pack(fill="both", expand=True, padx=20, pady=20)
+
+        ctk.CTkLabel(
+            frame,
+            text="Cartera de Préstamos",
+            font=('Roboto', 20, 'bold')
+        ).pack(pady=10)
+
+        # Indicadores (se completan al llegar los datos)
+        indicadores_frame = ctk.CTkFrame(frame)
+        indicadores_frame.pack(fill="x", pady=10)
+        indicadores = {}
+        for fila, (clave, titulo) in enumerate((
+            ('saldo', "Saldo pendiente"),
+            ('mes', "Cuotas que vencen este mes"),
+            ('siguiente', "Cuotas que vencen el mes próximo"),
+        )):
+            ctk.CTkLabel(indicadores_frame, text=f"{titulo}:", font=('Roboto', 12, 'bold')).grid(
+                row=fila, column=0, sticky="w", padx=10, pady=4)
+            indicadores[clave] = ctk.CTkLabel(indicadores_frame, text="Cargando...", font=('Roboto', 12))
+            indicadores[clave].grid(row=fila, column=1, sticky="w", padx=10, pady=4)
+
+        ctk.CTkLabel(
+            frame,
+            text="Préstamos otorgados por mes",
+            font=('Roboto', 14, 'bold')
+        ).pack(pady=(10, 5))
+
+        tree_frame = ctk.CTkFrame(frame)
+        tree_frame.pack(fill="both", expand=True, pady=(0, 10))
+
+        columns = ("Mes", "Préstamos", "Monto")
+        tree = ttk.Treeview(
+            tree_frame,
+            columns=columns,
+            show="headings",
+            style="Custom.Treeview"
+        )
+        for col in columns:
+            tree.heading(col, text=col, anchor="center")
+            tree.column(col, anchor="center", width=150)
+
+        y_scrollbar = self.create_modern_scrollbar(tree_frame, tree, "vertical")
+        tree.grid(row=0, column=0, sticky="nsew")
+        y_scrollbar.grid(row=0, column=1, sticky="ns")
+        tree_frame.grid_columnconfigure(0, weight=1)
+        tree_frame.grid_rowconfigure(0, weight=1)
+
+        ctk.CTkButton(
+            frame,
+            text="Cerrar",
+            command=ventana.destroy,
+            width=100
+        ).pack(pady=10)
+
+        def _mostrar(cartera):
+            if not ventana.winfo_exists():
+                return
+            indicadores['saldo'].configure(text=f"${cartera.saldo_pendiente:,.2f}")
+            indicadores['mes'].configure(
+                text=f"{cartera.cuotas_mes} (${cartera.monto_mes:,.2f})")
+            indicadores['siguiente'].configure(
+                text=f"{cartera.cuotas_mes_siguiente} (${cartera.monto_mes_siguiente:,.2f})")
+            for mes, prestamos, monto in cartera.desembolsos():
+                tree.insert("", "end", values=(mes.strftime('%m/%Y'), prestamos, f"${monto:,.2f}"))
+
+        def _error(err):
+            if ventana.winfo_exists():
+                ventana.destroy()
+            messagebox.showerror("Error", f"Error al leer la cartera de préstamos: {err}")
+
+        self.ejecutar_db_async(leer_cartera, _mostrar, _error)
 
     def importar_prestamos_csv(self):
-        """Importar préstamos históricos desde archivo CSV"""
-        try:
-            from tkinter import filedialog
-            import csv
-            from datetime import datetime
-            
-            # Seleccionar archivo CSV
-            filename = filedialog.askopenfilename(
-                defaultextension='.csv',
-                filetypes=[("CSV files", "*.csv")],
-                title="Seleccionar archivo CSV de préstamos históricos"
+        """
+        Importar préstamos históricos desde archivo CSV.
+
+        La importación corre en segundo plano por lotes (utils.loan_import);
+        se puede hacer antes una simulación que solo valida. Los errores por
+        fila quedan en <archivo>_errores.csv.
+        """
+        from tkinter import filedialog
+
+        # Seleccionar archivo CSV
+        filename = filedialog.askopenfilename(
+            defaultextension='.csv',
+            filetypes=[("CSV files", "*.csv")],
+            title="Seleccionar archivo CSV de préstamos históricos"
+        )
+
+        if not filename:
+            return
+
+        respuesta = messagebox.askyesnocancel(
+            "Importación",
+            "¿Desea hacer primero una simulación?\n\n"
+            "Sí: solo valida el archivo, sin grabar nada.\n"
+            "No: importa los préstamos y genera sus cuotas."
+        )
+        if respuesta is None:
+            return
+        simulacion = respuesta
+
+        def _importar(db):
+            importador = ImportadorPrestamos(
+                db, simulacion=simulacion,
+                progreso=lambda filas: logger.debug("Importación de préstamos: %s filas leídas", filas)
             )
-            
-            if not filename:
+            try:
+                return importador.importar(filename)
+            except (ValueError, OSError, UnicodeDecodeError) as e:
+                # Archivo ilegible o sin las columnas de la plantilla
+                self._en_hilo_ui(lambda e=e: _error(e))
+                return None
+
+        def _finalizar(resultado):
+            if resultado is None:
                 return
-                
-            db = self.conectar_db()
-            cursor = db.cursor()
-            
-            prestamos_procesados = 0
-            errores = []
-            
-            with open(filename, 'r', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                
-                for row in reader:
-                    try:
-                        # Validar que el legajo existe
-                        cursor.execute("SELECT COUNT(*) FROM personal WHERE legajo = %s", 
-                                    (row['legajo'],))
-                        if cursor.fetchone()[0] == 0:
-                            errores.append(f"Legajo {row['legajo']} no existe")
-                            continue
-                        
-                        # Insertar el préstamo
-                        query = """
-                            INSERT INTO prestamos (legajo, monto_total, cuotas, 
-                                                 fecha_inicio, motivo)
-                            VALUES (%s, %s, %s, %s, %s)
-                        """
-                        cursor.execute(query, (
-                            row['legajo'],
-                            float(row['monto_total']),
-                            int(row['cuotas']),
-                            row['fecha_inicio'],
-                            row['motivo']
-                        ))
-                        
-                        id_prestamo = cursor.lastrowid
-                        monto_cuota = float(row['monto_total']) / int(row['cuotas'])
-                        
-                        # Generar y actualizar cuotas
-                        cursor.callproc('generar_cuotas', (
-                            id_prestamo,
-                            float(row['monto_total']),
-                            int(row['cuotas']),
-                            datetime.strptime(row['fecha_inicio'], '%Y-%m-%d')
-                        ))
-                        
-                        # Si el préstamo está pagado, marcar cuotas como pagadas
-                        if row['estado'].lower() == 'pagado':
-                            update_query = """
-                                UPDATE pagos 
-                                SET estado = 'Pagado',
-                                    fecha_pago = CASE
-                                        WHEN fecha_vencimiento <= %s THEN fecha_vencimiento
-                                        ELSE NULL
-                                    END
-                                WHERE id_prestamos = %s
-                                AND fecha_vencimiento <= %s
-                            """
-                            cursor.execute(update_query, (
-                                row['fecha_ultima_cuota'],
-                                id_prestamo,
-                                row['fecha_ultima_cuota']
-                            ))
-                        
-                        db.commit()
-                        prestamos_procesados += 1
-                        
-                    except Exception as e:
-                        errores.append(f"Error en legajo {row['legajo']}: {str(e)}")
-                        db.rollback()
-            
-            # Mostrar resumen
-            mensaje = f"Préstamos procesados: {prestamos_procesados}\n"
-            if errores:
-                mensaje += "\nErrores encontrados:\n" + "\n".join(errores)
-            
-            if prestamos_procesados > 0:
+            mensaje = resultado.resumen()
+            if resultado.errores:
+                reporte = filename.rsplit('.', 1)[0] + '_errores.csv'
+                try:
+                    resultado.guardar_errores(reporte)
+                    mensaje += f"\nDetalle de errores en:\n{reporte}"
+                except OSError as e:
+                    mensaje += f"\nNo se pudo guardar el reporte de errores: {e}"
+
+            if resultado.prestamos > 0:
                 messagebox.showinfo("Importación Completada", mensaje)
             else:
                 messagebox.showwarning("Importación", mensaje)
-                
-        except Exception as e:
-            messagebox.showerror(
-                "Error",
-                f"Error al importar los préstamos: {str(e)}"
-            )
-        finally:
-            if 'db' in locals():
-                db.close()
+
+        def _error(err):
+            messagebox.showerror("Error", f"Error al importar los préstamos: {err}")
+
+        self.ejecutar_db_async(_importar, _finalizar, _error)
 
     def exportar_formato_csv(self):
         """Exportar plantilla CSV para importación de préstamos históricos"""
@@ -1887,7 +1980,7 @@ Ejemplo:
         if hasattr(self, 'container_frame'):
             self.container_frame.update_idletasks()
         
-        self.configurar_actualizacion_automatica()
+        self.db_pool.executor.submit(self.configurar_actualizacion_automatica)
         if hasattr(self, 'standalone') and self.standalone:
             self.create_menu_bar()
 
@@ -1897,227 +1990,251 @@ Ejemplo:
             self.menu_historial.post(event.x_root, event.y_root)
 
     def mostrar_historial_pagos(self):
-        """Mostrar ventana con historial de pagos de un préstamo"""
+        """
+        Mostrar ventana con historial de pagos de un préstamo.
+
+        El avance ya viene con el historial del legajo
+        (cargar_historial_prestamos); las cuotas del préstamo se leen con una
+        consulta la primera vez que se abre su detalle y quedan guardadas.
+        Si el historial se está recargando, el detalle se abre al terminar.
+        """
         # Obtener el ID del préstamo seleccionado
-        seleccionado = self.tree.selection()[0]
-        item = self.tree.item(seleccionado)
-        id_prestamo = item['values'][0]
-        
-        try:
-            db = self.conectar_db()
+        seleccion = self.tree.selection()
+        if not seleccion:
+            messagebox.showinfo("Historial de Pagos", "Seleccione un préstamo")
+            return
+        id_prestamo = self.tree.item(seleccion[0])['values'][0]
+
+        if id_prestamo not in self.historial_prestamos:
+            self._detalle_pendiente = id_prestamo
+            return
+        self._abrir_detalle_prestamo(id_prestamo)
+
+    def _abrir_detalle_prestamo(self, id_prestamo):
+        """Mostrar el detalle con las cuotas guardadas o leerlas antes (un solo préstamo)"""
+        prestamo = self.historial_prestamos[id_prestamo]
+        if prestamo['pagos'] is not None or not (prestamo['cuotas_pagadas'] or prestamo['cuotas_pendientes']):
+            self._ventana_historial_pagos(id_prestamo, prestamo, prestamo['pagos'] or [])
+            return
+
+        def _consultar(db):
             cursor = db.cursor(dictionary=True)
-            
-            # Verificar si existen pagos para este préstamo
-            query = """
-                SELECT COUNT(*) as total_pagos
-                FROM pagos
-                WHERE id_prestamos = %s
-            """
-            cursor.execute(query, (id_prestamo,))
-            result = cursor.fetchone()
-            
-            if result['total_pagos'] == 0:
-                # Si no hay pagos, mostrar ventana modal informativa
-                ventana = tk.Toplevel(self.parent_frame)
-                ventana.title("Sin Historial de Pagos")
-                ventana.geometry("500x500")
-                ventana.transient(self.parent_frame)
-                ventana.grab_set()
-                
-                # Centrar la ventana
-                ventana.geometry(f"+{self.parent_frame.winfo_x() + 100}+{self.parent_frame.winfo_y() + 100}")
-                
-                # Frame principal
-                frame = ctk.CTkFrame(ventana)
-                frame.pack(fill="both", expand=True, padx=20, pady=20)
-                
-                # Ícono de información (emoji)
-                icon_label = ctk.CTkLabel(
-                    frame,
-                    text="ℹ️",
-                    font=('Roboto', 48)
-                )
-                icon_label.pack(pady=(20, 10))
-                
-                # Título
-                ctk.CTkLabel(
-                    frame,
-                    text="Préstamo sin Historial",
-                    font=('Roboto', 20, 'bold')
-                ).pack(pady=(0, 20))
-                
-                # Mensaje informativo
-                mensaje = (
-                    "Este préstamo fue importado desde un archivo CSV\n"
-                    "y no cuenta con un historial detallado de pagos.\n\n"
-                    "Los préstamos importados solo mantienen su información básica\n"
-                    "y estado final, pero no el registro de pagos individuales."
-                )
-                
-                ctk.CTkLabel(
-                    frame,
-                    text=mensaje,
-                    font=('Roboto', 12),
-                    justify="center",
-                    wraplength=400
-                ).pack(pady=20)
-                
-                # Botón cerrar
-                ctk.CTkButton(
-                    frame,
-                    text="Entendido",
-                    command=ventana.destroy,
-                    width=100
-                ).pack(pady=20)
-                
-                return
-                
-            # Si hay pagos, mostrar la ventana normal de historial
-            query = """
-                SELECT 
-                    p.numero_cuota,
-                    p.monto_cuota,
-                    p.fecha_vencimiento,
-                    p.fecha_pago,
-                    p.estado,
+            cursor.execute("""
+                SELECT
+                    numero_cuota,
+                    monto_cuota,
+                    fecha_vencimiento,
+                    fecha_pago,
+                    estado,
                     CASE 
-                        WHEN p.fecha_pago > p.fecha_vencimiento THEN 'Atrasado'
-                        WHEN p.fecha_pago <= p.fecha_vencimiento THEN 'A tiempo'
+                        WHEN fecha_pago > fecha_vencimiento THEN 'Atrasado'
+                        WHEN fecha_pago <= fecha_vencimiento THEN 'A tiempo'
                         ELSE '-'
                     END as tipo_pago
-                FROM pagos p
-                WHERE p.id_prestamos = %s
-                ORDER BY p.numero_cuota
-            """
-            cursor.execute(query, (id_prestamo,))
+                FROM pagos
+                WHERE id_prestamos = %s
+                ORDER BY numero_cuota
+            """, (id_prestamo,))
             pagos = cursor.fetchall()
+            cursor.close()
+            return pagos
+
+        def _mostrar(pagos):
+            # Si mientras tanto se recargó el historial, el préstamo es otro diccionario
+            actual = self.historial_prestamos.get(id_prestamo)
+            if actual is None:
+                return
+            actual['pagos'] = pagos
+            self._ventana_historial_pagos(id_prestamo, actual, pagos)
+
+        self.ejecutar_db_async(
+            _consultar, _mostrar,
+            lambda err: messagebox.showerror("Error", f"Error al leer las cuotas del préstamo: {err}"),
+            canal='detalle'
+        )
 
-            # Crear ventana de historial
+    def _ventana_historial_pagos(self, id_prestamo, prestamo, pagos):
+        """Ventana de cuotas de un préstamo (o aviso si no tiene cuotas registradas)"""
+        if not pagos:
+            # Si no hay pagos, mostrar ventana modal informativa
             ventana = tk.Toplevel(self.parent_frame)
-            ventana.title("Historial de Pagos")
-            ventana.geometry("800x700")
+            ventana.title("Sin Historial de Pagos")
+            ventana.geometry("500x500")
             ventana.transient(self.parent_frame)
             ventana.grab_set()
 
             # Centrar la ventana
-            ventana.geometry(f"+{self.parent_frame.winfo_x() + 50}+{self.parent_frame.winfo_y() + 50}")
+            ventana.geometry(f"+{self.parent_frame.winfo_x() + 100}+{self.parent_frame.winfo_y() + 100}")
 
             # Frame principal
             frame = ctk.CTkFrame(ventana)
             frame.pack(fill="both", expand=True, padx=20, pady=20)
 
+            # Ícono de información (emoji)
+            icon_label = ctk.CTkLabel(
+                frame,
+                text="ℹ️",
+                font=('Roboto', 48)
+            )
+            icon_label.pack(pady=(20, 10))
+
             # Título
             ctk.CTkLabel(
                 frame,
-                text=f"Historial de Pagos - Préstamo #{id_prestamo}",
+                text="Préstamo sin Historial",
                 font=('Roboto', 20, 'bold')
-            ).pack(pady=10)
-
-            # Crear tabla de pagos
-            tree_frame = ctk.CTkFrame(frame)
-            tree_frame.pack(fill="both", expand=True, pady=(10, 20))
-
-            # Treeview para mostrar los pagos
-            columns = ("Cuota", "Monto", "Vencimiento", "Fecha Pago", "Estado", "Tipo")
-            tree = ttk.Treeview(
-                tree_frame,
-                columns=columns,
-                show="headings",
-                style="Custom.Treeview"
+            ).pack(pady=(0, 20))
+
+            # Mensaje informativo
+            mensaje = (
+                "Este préstamo fue importado desde un archivo CSV\n"
+                "y no cuenta con un historial detallado de pagos.\n\n"
+                "Los préstamos importados solo mantienen su información básica\n"
+                "y estado final, pero no el registro de pagos individuales."
             )
 
-            # Configurar columnas
-            for col in columns:
-                tree.heading(col, text=col, anchor="center")
-                tree.column(col, anchor="center", width=120)
-
-            # Insertar datos
-            for pago in pagos:
-                fecha_vencimiento = self.format_date_for_display(pago['fecha_vencimiento'])
-                fecha_pago = self.format_date_for_display(pago['fecha_pago']) if pago['fecha_pago'] else '-'
-                
-                # Determinar color de la fila según el tipo de pago
-                tag = "atrasado" if pago['tipo_pago'] == 'Atrasado' else "normal"
-                
-                tree.insert("", "end", values=(
-                    pago['numero_cuota'],
-                    f"${pago['monto_cuota']:.2f}",
-                    fecha_vencimiento,
-                    fecha_pago,
-                    pago['estado'],
-                    pago['tipo_pago']
-                ), tags=(tag,))
-
-            # Configurar colores para los tags
-            tree.tag_configure("atrasado", foreground="red")
-            tree.tag_configure("normal", foreground="black")
-
-            # Scrollbars (corregido)
-            y_scrollbar = self.create_modern_scrollbar(tree_frame, tree, "vertical")
-            x_scrollbar = self.create_modern_scrollbar(tree_frame, tree, "horizontal")
-
-            # Layout con grid
-            tree.grid(row=0, column=0, sticky="nsew")
-            y_scrollbar.grid(row=0, column=1, sticky="ns")
-            x_scrollbar.grid(row=1, column=0, sticky="ew")
-
-            # Configuración del grid
-            tree_frame.grid_columnconfigure(0, weight=1)
-            tree_frame.grid_rowconfigure(0, weight=1)
-
-            # Binding para mousewheel
-            def handle_scroll(event):
-                if event.state & 4:  # Shift presionado
-                    tree.xview_scroll(int(-1*(event.delta/120)), "units")
-                else:
-                    tree.yview_scroll(int(-1*(event.delta/120)), "units")
-                return "break"
-
-            tree.bind("<MouseWheel>", handle_scroll)
-            tree.bind("<Shift-MouseWheel>", handle_scroll)
-
-            # Resumen de pagos
-            resumen_frame = ctk.CTkFrame(frame)
-            resumen_frame.pack(fill="x", pady=(0, 10))
-
-            # Calcular estadísticas
-            total_cuotas = len(pagos)
-            pagos_atrasados = sum(1 for p in pagos if p['tipo_pago'] == 'Atrasado')
-            pagos_tiempo = sum(1 for p in pagos if p['tipo_pago'] == 'A tiempo')
-            cuotas_pendientes = sum(1 for p in pagos if p['estado'] == 'Pendiente')
-
-            # Mostrar estadísticas
-            stats_text = f"""
-            Total de cuotas: {total_cuotas}
-            Pagos a tiempo: {pagos_tiempo}
-            Pagos atrasados: {pagos_atrasados}
-            Cuotas pendientes: {cuotas_pendientes}
-            """
-
             ctk.CTkLabel(
-                resumen_frame,
-                text=stats_text,
+                frame,
+                text=mensaje,
                 font=('Roboto', 12),
-                justify="left"
-            ).pack(pady=10)
+                justify="center",
+                wraplength=400
+            ).pack(pady=20)
 
             # Botón cerrar
             ctk.CTkButton(
                 frame,
-                text="Cerrar",
+                text="Entendido",
                 command=ventana.destroy,
                 width=100
-            ).pack(pady=10)
+            ).pack(pady=20)
 
-        except mysql.connector.Error as err:
-            messagebox.showerror("Error", f"Error de base de datos: {err}")
-        finally:
-            if 'db' in locals():
-                db.close()
+            return
+
+        # Crear ventana de historial
+        ventana = tk.Toplevel(self.parent_frame)
+        ventana.title("Historial de Pagos")
+        ventana.geometry("800x700")
+        ventana.transient(self.parent_frame)
+        ventana.grab_set()
+
+        # Centrar la ventana
+        ventana.geometry(f"+{self.parent_frame.winfo_x() + 50}+{self.parent_frame.winfo_y() + 50}")
+
+        # Frame principal
+        frame = ctk.CTkFrame(ventana)
+        frame.pack(fill="both", expand=True, padx=20, pady=20)
+
+        # Título
+        ctk.CTkLabel(
+            frame,
+            text=f"Historial de Pagos - Préstamo #{id_prestamo}",
+            font=('Roboto', 20, 'bold')
+        ).pack(pady=10)
+
+        # Crear tabla de pagos
+        tree_frame = ctk.CTkFrame(frame)
+        tree_frame.pack(fill="both", expand=True, pady=(10, 20))
+
+        # Treeview para mostrar los pagos
+        columns = ("Cuota", "Monto", "Vencimiento", "Fecha Pago", "Estado", "Tipo")
+        tree = ttk.Treeview(
+            tree_frame,
+            columns=columns,
+            show="headings",
+            style="Custom.Treeview"
+        )
+
+        # Configurar columnas
+        for col in columns:
+            tree.heading(col, text=col, anchor="center")
+            tree.column(col, anchor="center", width=120)
+
+        # Insertar datos
+        for pago in pagos:
+            fecha_vencimiento = self.format_date_for_display(pago['fecha_vencimiento'])
+            fecha_pago = self.format_date_for_display(pago['fecha_pago']) if pago['fecha_pago'] else '-'
+
+            # Determinar color de la fila según el tipo de pago
+            tag = "atrasado" if pago['tipo_pago'] == 'Atrasado' else "normal"
+
+            tree.insert("", "end", values=(
+                pago['numero_cuota'],
+                f"${pago['monto_cuota']:.2f}",
+                fecha_vencimiento,
+                fecha_pago,
+                pago['estado'],
+                pago['tipo_pago']
+            ), tags=(tag,))
+
+        # Configurar colores para los tags
+        tree.tag_configure("atrasado", foreground="red")
+        tree.tag_configure("normal", foreground="black")
+
+        # Scrollbars (corregido)
+        y_scrollbar = self.create_modern_scrollbar(tree_frame, tree, "vertical")
+        x_scrollbar = self.create_modern_scrollbar(tree_frame, tree, "horizontal")
+
+        # Layout con grid
+        tree.grid(row=0, column=0, sticky="nsew")
+        y_scrollbar.grid(row=0, column=1, sticky="ns")
+        x_scrollbar.grid(row=1, column=0, sticky="ew")
+
+        # Configuración del grid
+        tree_frame.grid_columnconfigure(0, weight=1)
+        tree_frame.grid_rowconfigure(0, weight=1)
+
+        # Binding para mousewheel
+        def handle_scroll(event):
+            if event.state & 4:  # Shift presionado
+                tree.xview_scroll(int(-1*(event.delta/120)), "units")
+            else:
+                tree.yview_scroll(int(-1*(event.delta/120)), "units")
+            return "break"
+
+        tree.bind("<MouseWheel>", handle_scroll)
+        tree.bind("<Shift-MouseWheel>", handle_scroll)
+
+        # Resumen de pagos
+        resumen_frame = ctk.CTkFrame(frame)
+        resumen_frame.pack(fill="x", pady=(0, 10))
+
+        # Calcular estadísticas
+        total_cuotas = len(pagos)
+        pagos_atrasados = sum(1 for p in pagos if p['tipo_pago'] == 'Atrasado')
+        pagos_tiempo = sum(1 for p in pagos if p['tipo_pago'] == 'A tiempo')
+        cuotas_pendientes = sum(1 for p in pagos if p['estado'] == 'Pendiente')
+
+        # Mostrar estadísticas
+        proximo = (self.format_date_for_display(prestamo['proximo_vencimiento'])
+                   if prestamo['proximo_vencimiento'] else '-')
+        stats_text = f"""
+        Total de cuotas: {total_cuotas}
+        Pagos a tiempo: {pagos_tiempo}
+        Pagos atrasados: {pagos_atrasados}
+        Cuotas pendientes: {cuotas_pendientes}
+        Saldo pendiente: ${prestamo['saldo_pendiente']:.2f}
+        Próximo vencimiento: {proximo}
+        """
+
+        ctk.CTkLabel(
+            resumen_frame,
+            text=stats_text,
+            font=('Roboto', 12),
+            justify="left"
+        ).pack(pady=10)
+
+        # Botón cerrar
+        ctk.CTkButton(
+            frame,
+            text="Cerrar",
+            command=ventana.destroy,
+            width=100
+        ).pack(pady=10)
 
     def cleanup(self):
         """Método para limpiar recursos y eventos antes de destruir el módulo"""
-        print("Limpiando recursos del módulo de préstamos...")
+        logger.debug("Limpiando recursos del módulo de préstamos...")
         try:
             # Desconectar TODOS los eventos de mousewheel
             widgets = [self.container_frame, self.parent_frame]
@@ -2137,13 +2254,16 @@ Ejemplo:
                         widget.unbind_all("<MouseWheel>")
                         widget.unbind_all("<Shift-MouseWheel>")
                     except Exception as e:
-                        print(f"Error limpiando eventos: {e}")
+                        logger.error("Error limpiando eventos: %s", e)
                         
             # Marcar el módulo como destruido para evitar actualizaciones
             self.is_destroyed = True
             
+            # Detener el executor del módulo (las conexiones quedan en el pool compartido)
+            self.db_pool.close()
+            
         except Exception as e:
-            print(f"Error en cleanup: {e}")
+            logger.error("Error en cleanup: %s", e)
 
     def _configure_mousewheel(self, canvas, scrollable_frame=None):
         """Configura eventos de rueda de ratón con mejor manejo de errores"""
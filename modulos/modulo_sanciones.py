@@ -10,17 +10,26 @@ from datetime import datetime
 import mysql.connector
 import threading
 from concurrent.futures import ThreadPoolExecutor
-from PIL import Image, ImageTk, ImageSequence
+from PIL import Image, ImageTk
 import io
 import logging
 from datetime import datetime, date
 import traceback
-from logging.handlers import RotatingFileHandler
 from dotenv import load_dotenv
 
 # Importaciones de utils
 from utils.thread_manager import ThreadManager, DatabasePool
+from utils.log_config import get_logger
+from utils.request_coalescer import CoalescedorConsultas
+from utils.employee_summary import ConsultaResumen, como_fecha, desde_hace
+from utils.photo_cache import solicitar_foto_empleado
+from utils.virtual_tree import VirtualTreeview
 from utils.interface_manager import EstiloApp
+from utils.warm_start import frames_logo_gif
+from utils.sanction_types import TIPOS_SANCION, TIPO_SUSPENSION, normalizar_tipo_sancion
+from utils.schema_maintenance import get_mantenimiento
+
+logger = logging.getLogger(__name__)
 
 # Cargar variables de entorno
 load_dotenv()
@@ -51,6 +60,16 @@ class EstiloApp:
     BOTON_LIMPIAR_HOVER = "#616161"  # Gris más oscuro
 
 class AplicacionSanciones:
+    # Tamaño del recuadro de la foto del empleado
+    TAMANIO_FOTO = (210, 210)
+
+    # Personal + sanciones del legajo en una sola consulta (estadísticas en Python)
+    RESUMEN_SANCIONES = ConsultaResumen(
+        "sanciones",
+        ("id", "legajo", "fecha", "objetivo", "motivo", "tipo_sancion", "cantidad_dias", "solicita"),
+        "fecha DESC"
+    )
+
     def __init__(self, parent_frame=None):
         """
         Inicializar la aplicación
@@ -58,6 +77,7 @@ class AplicacionSanciones:
         """
         # Inicializar is_destroyed primero
         self.is_destroyed = False
+        self.consultas = CoalescedorConsultas("sanciones")
         
         # Determinar si es standalone o integrado
         self.is_standalone = parent_frame is None
@@ -95,33 +115,8 @@ class AplicacionSanciones:
             self._init_async()
 
     def _setup_logging(self):
-        """Configurar el sistema de logging"""
-        # Crear directorio logs si no existe
-        log_dir = "logs"
-        if not os.path.exists(log_dir):
-            os.makedirs(log_dir)
-        
-        # Configurar el formato del log
-        log_format = logging.Formatter(
-            '%(asctime)s - [%(levelname)s] - %(module)s - Línea %(lineno)d: %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        
-        # Configurar el manejador de archivos con rotación
-        file_handler = RotatingFileHandler(
-            filename=os.path.join(log_dir, 'errores_sanciones.log'),
-            maxBytes=5 * 1024 * 1024,  # 5MB
-            backupCount=5,
-            encoding='utf-8'
-        )
-        file_handler.setFormatter(log_format)
-        
-        # Configurar el logger
-        self.logger = logging.getLogger(__name__)
-        self.logger.setLevel(logging.INFO)
-        self.logger.addHandler(file_handler)
-        
-        # Mensaje inicial
+        """Obtener el logger del módulo (configuración central en utils.log_config)"""
+        self.logger = get_logger(__name__, 'errores_sanciones.log')
         self.logger.info("🚀 Aplicación iniciada")
 
     def _init_async(self):
@@ -148,11 +143,20 @@ class AplicacionSanciones:
         def _connect():
             try:
                 self.db_pool = DatabasePool()
+                # Tipos guardados antes de normalizar al guardar: migración única por base
+                try:
+                    get_mantenimiento().asegurar_esquema('sanciones')
+                except (mysql.connector.Error, RuntimeError) as e:
+                    self.logger.error("No se pudieron normalizar los tipos de sanción: %s", e)
+                    self.root.after(0, lambda e=e: self.mostrar_mensaje(
+                        "Error", f"No se pudieron normalizar los tipos de sanción guardados: {e}"
+                    ))
+                    return
                 self.root.after(0, lambda: self.mostrar_mensaje(
                     "Éxito", "Conexión establecida correctamente"
                 ))
             except Exception as e:
-                self.root.after(0, lambda: self.mostrar_mensaje(
+                self.root.after(0, lambda e=e: self.mostrar_mensaje(
                     "Error", f"Error al conectar con la base de datos: {str(e)}"
                 ))
         
@@ -203,7 +207,7 @@ class AplicacionSanciones:
             self.is_destroyed = True
             
         except Exception as e:
-            print(f"Error en cleanup: {e}")
+            logger.error("Error en cleanup: %s", e)
 
     def iniciar_aplicacion(self):
         """Iniciar la aplicación principal optimizando la carga"""
@@ -387,22 +391,8 @@ class AplicacionSanciones:
             gif_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 
                                    "resources", "icons_gifs", "logo.gif")
             
-            gif = Image.open(gif_path)
-            frames = []
-            
-            # Calcular el tamaño manteniendo la proporción
-            target_height = 200  # Mismo tamaño que en módulo_prestamos
-            for frame in ImageSequence.Iterator(gif):
-                frame = frame.convert('RGBA')
-                # Obtener dimensiones originales
-                width, height = frame.size
-                # Calcular nueva anchura manteniendo proporción
-                aspect_ratio = width / height
-                target_width = int(target_height * aspect_ratio)
-                
-                # Redimensionar manteniendo proporción
-                frame = frame.resize((target_width, target_height), Image.LANCZOS)
-                frames.append(frame)
+            # Frames decodificados una sola vez por proceso (los adelanta el arranque en caliente)
+            frames = frames_logo_gif(alto=200, ruta=gif_path)
             
             # Crear el label dentro del contenedor del logo
             logo_label = tk.Label(
@@ -425,7 +415,7 @@ class AplicacionSanciones:
             update_gif()
 
         except Exception as e:
-            print(f"Error al cargar el logo: {e}")
+            logger.error("Error al cargar el logo: %s", e)
 
         # Título principal
         title_label = ctk.CTkLabel(
@@ -474,6 +464,7 @@ class AplicacionSanciones:
                 self.logo_frames and 
                 hasattr(self, 'logo_label') and 
                 self.logo_label.winfo_exists() and 
+                not getattr(self, '_suspendido', False) and  # oculto en la caché del menú
                 not self.is_destroyed):
                 
                 self.logo_label.configure(image=self.logo_frames[self.current_frame])
@@ -481,7 +472,7 @@ class AplicacionSanciones:
                 # Guardar referencia al after_id para poder cancelarlo
                 self.animation_after_id = self.root.after(100, self._animate_logo)
         except Exception as e:
-            self.logger.error(f"Error en animación del logo: {str(e)}")
+            self.logger.error("Error en animación del logo: %s", e)
 
     def consultar_empleado(self, event=None):
         """Consultar datos del empleado cuando se ingresa el legajo"""
@@ -491,103 +482,106 @@ class AplicacionSanciones:
 
         legajo = self.entry_legajo.get().strip()
         
-        def _consultar():
+        def _consultar(solicitud):
             connection = self.db_pool.get_connection()
             try:
                 cursor = connection.cursor()
                 
-                # Consultar datos del empleado
-                cursor.execute("""
-                    SELECT apellido_nombre, foto 
-                    FROM personal 
-                    WHERE legajo = %s
-                """, (legajo,))
-                
-                resultado = cursor.fetchone()
-                if resultado:
-                    apellido_nombre, foto_blob = resultado
-                    
-                    # Consultar estadísticas
-                    cursor.execute("""
-                        SELECT 
-                            COUNT(*) as total_sanciones,
-                            COALESCE(
-                                SUM(CASE 
-                                    WHEN LOWER(REPLACE(tipo_sancion, 'ó', 'o')) IN ('suspension', 'suspensión', 'suspencion')
-                                    AND fecha >= DATE_SUB(CURDATE(), INTERVAL 365 DAY)
-                                    THEN cantidad_dias 
-                                    ELSE 0 
-                                END
-                            ), 0) as dias_suspension_recientes,
-                            MAX(fecha) as ultima_fecha
-                        FROM sanciones 
-                        WHERE legajo = %s
-                    """, (legajo,))
-                    
-                    stats = cursor.fetchone()
-                    total_sanciones = stats[0]
-                    dias_suspension_recientes = stats[1]
-                    ultima_fecha = stats[2]
+                # Personal y sanciones juntos (la foto se trae aparte, solo si no está en caché)
+                resumen = self.RESUMEN_SANCIONES.leer(cursor, legajo)
+                if resumen:
+                    estadisticas = self._estadisticas_sanciones(resumen.registros)
+                    filas = self._filas_sanciones(resumen.registros)
                     
                     def _actualizar_ui():
-                        self.nombre_completo_label.configure(text=f"👤 Empleado: {apellido_nombre}")
-                        self.total_sanciones_label.configure(text=f"📋 Historial: {total_sanciones} sanciones registradas")
-                        
-                        # Actualizar última sanción
-                        if ultima_fecha:
-                            fecha_formateada = ultima_fecha.strftime('%d-%m-%Y')
-                            self.ultima_sancion_label.configure(text=f"⏱️ Última sanción: {fecha_formateada}")
-                        else:
-                            self.ultima_sancion_label.configure(text="⏱️ Última sanción: No registrada")
-                        
-                        # Actualizar suspensiones recientes
-                        self.suspensiones_recientes_label.configure(
-                            text=f"⚠️ Suspensiones (365 días): {dias_suspension_recientes} días"
-                        )
+                        self.nombre_completo_label.configure(text=f"👤 Empleado: {resumen.apellido_nombre}")
+                        self._mostrar_estadisticas(estadisticas)
+                        self.tabla.actualizar(filas)
                         
                         # Actualizar foto
-                        self.actualizar_foto(foto_blob)
+                        self._solicitud_foto = solicitar_foto_empleado(
+                            self.root, legajo, self.TAMANIO_FOTO, self.actualizar_foto,
+                            resumen.foto_version, getattr(self, '_solicitud_foto', None)
+                        )
                     
                     if not self.is_destroyed:
-                        self.root.after(0, _actualizar_ui)
-                        
-                    # Consultar sanciones para el treeview
-                    self.consultar_sanciones(legajo)
+                        self.root.after(0, solicitud.si_vigente(_actualizar_ui))
                     
                 else:
                     if not self.is_destroyed:
-                        self.root.after(0, lambda: self.mostrar_mensaje(
+                        self.root.after(0, solicitud.si_vigente(lambda: self.mostrar_mensaje(
                             "Error", "No se encontró el empleado"
-                        ))
+                        )))
             finally:
                 cursor.close()
                 self.db_pool.return_connection(connection)
 
-        self.db_pool.executor.submit(_consultar)
+        # Una consulta por legajo: los pedidos repetidos se unen y los reemplazados se descartan
+        self.consultas.solicitar(legajo, _consultar)
+
+    @staticmethod
+    def _es_suspension(tipo_sancion):
+        """
+        Los tipos se guardan canónicos (al guardar y por la migración
+        sanciones v1), pero se normaliza igual por si la migración no corrió
+        o la fila la escribió otro programa.
+        """
+        return normalizar_tipo_sancion(tipo_sancion) == TIPO_SUSPENSION
+
+    def _estadisticas_sanciones(self, registros):
+        """Total, última fecha y días de suspensión a partir de las filas ya leídas"""
+        corte = desde_hace(365)
+        dias_recientes = 0
+        dias_historicos = 0
+        for registro in registros:
+            if not self._es_suspension(registro['tipo_sancion']):
+                continue
+            dias = int(registro['cantidad_dias'] or 0)
+            dias_historicos += dias
+            if registro['fecha'] and como_fecha(registro['fecha']) >= corte:
+                dias_recientes += dias
+        fechas = [como_fecha(r['fecha']) for r in registros if r['fecha']]
+        return {
+            'total_sanciones': len(registros),
+            'dias_suspension_recientes': dias_recientes,
+            'total_dias_suspension': dias_historicos,
+            'ultima_fecha': max(fechas) if fechas else None
+        }
 
-    def actualizar_foto(self, foto_blob):
-        """Actualizar la foto del empleado"""
+    def _filas_sanciones(self, registros):
+        """Filas para la tabla, con la fecha en formato dd-mm-aaaa"""
+        filas = []
+        for registro in registros:
+            fila = list(registro.values())
+            fila[2] = como_fecha(registro['fecha']).strftime('%d-%m-%Y') if registro['fecha'] else ''
+            filas.append(tuple(fila))
+        return filas
+
+    def _mostrar_estadisticas(self, estadisticas):
+        """Actualizar los labels de estadísticas (hilo de Tk)"""
+        self.total_sanciones_label.configure(
+            text=f"📋 Historial: {estadisticas['total_sanciones']} sanciones registradas"
+        )
+        self.suspensiones_recientes_label.configure(
+            text=f"⚠️ Suspensiones (365 días): {estadisticas['dias_suspension_recientes']} días"
+        )
+        self.suspensiones_historicas_label.configure(
+            text=f"📊 Total histórico suspensiones: {estadisticas['total_dias_suspension']} días"
+        )
+        if estadisticas['ultima_fecha']:
+            fecha_formateada = estadisticas['ultima_fecha'].strftime('%d-%m-%Y')
+            self.ultima_sancion_label.configure(text=f"⏱️ Última sanción: {fecha_formateada}")
+        else:
+            self.ultima_sancion_label.configure(text="⏱️ Última sanción: No registrada")
+
+    def actualizar_foto(self, foto):
+        """Actualizar la foto del empleado (miniatura PIL de la caché compartida)"""
         try:
-            if foto_blob and len(foto_blob) > 0:
-                image = Image.open(io.BytesIO(foto_blob))
-                
-                # Calcular el tamaño manteniendo la proporción
-                target_size = 210  # Tamaño objetivo
-                width, height = image.size
-                aspect_ratio = width / height
-                
-                if aspect_ratio > 1:
-                    new_width = target_size
-                    new_height = int(target_size / aspect_ratio)
-                else:
-                    new_height = target_size
-                    new_width = int(target_size * aspect_ratio)
-                
-                # Convertir y redimensionar la imagen
-                if image.mode != 'RGB':
-                    image = image.convert('RGB')
-                
-                image = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
+            if foto:
+                # La miniatura ya viene redimensionada manteniendo la proporción
+                target_size = self.TAMANIO_FOTO[0]
+                image = foto
+                new_width, new_height = image.size
                 
                 # Crear una imagen cuadrada con fondo blanco
                 square_image = Image.new('RGB', (target_size, target_size), 'white')
@@ -616,7 +610,7 @@ class AplicacionSanciones:
             else:
                 raise ValueError("No hay foto disponible")
         except Exception as e:
-            self.logger.error(f"Error al cargar la imagen: {str(e)}")
+            self.logger.error("Error al cargar la imagen: %s", e)
             self.photo_canvas.delete("all")
             self.photo_canvas.create_oval(
                 10, 10,
@@ -832,6 +826,7 @@ class AplicacionSanciones:
         vsb = ttk.Scrollbar(tree_frame, orient="vertical", command=self.tree.yview)
         hsb = ttk.Scrollbar(tree_frame, orient="horizontal", command=self.tree.xview)
         self.tree.configure(yscrollcommand=vsb.set, xscrollcommand=hsb.set)
+        self.tabla = VirtualTreeview(self.tree, clave=lambda valores: valores[0])
 
         # Grid layout
         self.tree.grid(row=0, column=0, sticky="nsew")
@@ -925,55 +920,12 @@ class AplicacionSanciones:
                 cursor.execute("DELETE FROM sanciones WHERE id = %s", (valores[0],))
                 connection.commit()
                 
-                # Consultar sanciones actualizadas
-                cursor.execute("""
-                    SELECT id, legajo, fecha, objetivo, motivo, tipo_sancion, cantidad_dias, solicita
-                    FROM sanciones 
-                    WHERE legajo = %s
-                    ORDER BY fecha DESC
-                """, (legajo,))
-                
-                registros = cursor.fetchall()
-                
-                # Obtener estadísticas actualizadas
-                cursor.execute("""
-                    SELECT 
-                        COUNT(*) as total_sanciones,
-                        COALESCE(SUM(CASE 
-                            WHEN tipo_sancion = 'Suspensión' 
-                            AND fecha >= DATE_SUB(CURDATE(), INTERVAL 365 DAY)
-                            THEN cantidad_dias 
-                            ELSE 0 
-                        END), 0) as dias_suspension_recientes,
-                        MAX(fecha) as ultima_fecha
-                    FROM sanciones 
-                    WHERE legajo = %s
-                """, (legajo,))
-                
-                stats = cursor.fetchone()
+                # Sanciones y estadísticas actualizadas (una consulta)
+                estadisticas, filas = self._leer_sanciones(cursor, legajo)
                 
                 def _actualizar_ui():
-                    # Limpiar treeview
-                    for item in self.tree.get_children():
-                        self.tree.delete(item)
-                    
-                    # Insertar registros actualizados
-                    for registro in registros:
-                        fecha = datetime.strptime(str(registro[2]), '%Y-%m-%d').strftime('%d-%m-%Y')
-                        valores = list(registro)
-                        valores[2] = fecha
-                        self.tree.insert("", "end", values=valores)
-                    
-                    # Actualizar contadores existentes
-                    self.total_sanciones_label.configure(text=f"📋 Historial: {stats[0] or 0} sanciones registradas")
-                    self.suspensiones_recientes_label.configure(text=f"⚠️ Suspensiones (365 días): {stats[1] or 0} días")
-                    
-                    # Actualizar última sanción si existe
-                    if stats[2]:
-                        fecha_formateada = datetime.strptime(str(stats[2]), '%Y-%m-%d').strftime('%d-%m-%Y')
-                        self.ultima_sancion_label.configure(text=f"⏱️ Última sanción: {fecha_formateada}")
-                    else:
-                        self.ultima_sancion_label.configure(text="⏱️ Última sanción: No registrada")
+                    # Actualizar solo las filas que cambiaron y los contadores
+                    self._mostrar_sanciones(estadisticas, filas)
                     
                     # Mostrar mensaje de éxito
                     self.mostrar_mensaje("Éxito", "Sanción eliminada correctamente")
@@ -1153,13 +1105,12 @@ class AplicacionSanciones:
                 
         except Exception as e:
             self.mostrar_mensaje("Error", "Error al cargar los datos del registro")
-            self.logger.error(f"Error en double click: {str(e)}")
+            self.logger.error("Error en double click: %s", e)
 
     def _cargar_datos_sancion(self, datos):
         """Cargar datos completos de la sanción en el formulario"""
         try:
-            # Debug: imprimir los datos recibidos
-            print("Datos recibidos:", datos)
+            self.logger.debug("Datos recibidos: %s", datos)
             
             # Mapear los datos según el orden de la base de datos
             valores = {
@@ -1197,7 +1148,7 @@ class AplicacionSanciones:
                 
         except Exception as e:
             self.mostrar_mensaje("Error", f"Error al cargar los datos: {str(e)}")
-            self.logger.error(f"Error al cargar datos: {str(e)}, datos={datos}")
+            self.logger.error("Error al cargar datos: %s, datos=%s", e, datos)
 
     def limpiar_campos_parcial(self):
         """Limpiar solo los campos del formulario manteniendo legajo y datos del personal"""
@@ -1222,7 +1173,7 @@ class AplicacionSanciones:
             self.entry_objetivo.focus_set()
             
         except Exception as e:
-            self.logger.error(f"Error en limpiar_campos_parcial: {e}")
+            self.logger.error("Error en limpiar_campos_parcial: %s", e)
 
     def modificar_sancion(self):
         """Modificar sanción seleccionada"""
@@ -1281,7 +1232,7 @@ class AplicacionSanciones:
                     datetime.strptime(self.entry_fecha.get(), "%d-%m-%Y").strftime("%Y-%m-%d"),
                     self.entry_objetivo.get().strip(),
                     self.text_motivo.get("1.0", tk.END).strip(),
-                    self.combo_tipo.get(),  # Cambiado de entry_tipo_sancion a combo_tipo
+                    normalizar_tipo_sancion(self.combo_tipo.get()),
                     int(self.entry_cantidad_dias.get() or 0),  # Cambiado de entry_dias
                     self.entry_solicita.get().strip(),  # Agregado entry_solicita
                     self.sancion_seleccionada_id
@@ -1291,38 +1242,15 @@ class AplicacionSanciones:
                 connection.commit()
                 
                 legajo = self.entry_legajo.get()
-                self.logger.info(f"Sanción {self.sancion_seleccionada_id} modificada exitosamente")
-                
-                # Obtener los datos actualizados para el treeview
-                cursor.execute("""
-                    SELECT id, legajo, fecha, objetivo, motivo, tipo_sancion, cantidad_dias, solicita
-                    FROM sanciones 
-                    WHERE legajo = %s
-                    ORDER BY fecha DESC
-                """, (legajo,))
-                
-                registros = cursor.fetchall()
-                registros_convertidos = []
+                self.logger.info("Sanción %s modificada exitosamente", self.sancion_seleccionada_id)
                 
-                for registro in registros:
-                    fecha_mysql = registro[2]
-                    fecha_ui = datetime.strptime(str(fecha_mysql), '%Y-%m-%d').strftime('%d-%m-%Y')
-                    registro_convertido = list(registro)
-                    registro_convertido[2] = fecha_ui
-                    # Truncar textos largos si es necesario
-                    if len(registro[4]) > 50:  # motivo
-                        registro_convertido[4] = registro[4][:47] + "..."
-                    registros_convertidos.append(tuple(registro_convertido))
-                
-                # Actualizar estadísticas
-                self._actualizar_estadisticas(cursor, legajo)
+                # Sanciones y estadísticas actualizadas (una consulta)
+                estadisticas, filas = self._leer_sanciones(cursor, legajo)
                 
                 if not self.is_destroyed:
                     def _actualizar_vista():
-                        # Primero actualizar el treeview
-                        self._clear_treeview()
-                        for registro in registros_convertidos:
-                            self.tree.insert("", tk.END, values=registro)
+                        # Primero actualizar el treeview y las estadísticas
+                        self._mostrar_sanciones(estadisticas, filas)
                         
                         # Luego mostrar mensaje y limpiar campos
                         self.mostrar_mensaje("Éxito", "Sanción modificada correctamente")
@@ -1344,7 +1272,7 @@ class AplicacionSanciones:
             except Exception as e:
                 if connection:
                     connection.rollback()
-                self.logger.error(f"Error al modificar sanción: {str(e)}")
+                self.logger.error("Error al modificar sanción: %s", e)
                 if not self.is_destroyed:
                     error_msg = str(e)
                     self.root.after(0, lambda msg=error_msg: 
@@ -1426,7 +1354,7 @@ class AplicacionSanciones:
             "objetivo": {"row": 2, "column": 0, "width": 200, "height": 35},
             "fecha": {"row": 3, "column": 0, "width": 200, "height": 35},
             "tipo": {"row": 5, "column": 0, "width": 200, "height": 35, "combo": True, 
-                    "values": ["Suspensión", "Amonestación", "Apercibimiento", "Despido"]},
+                    "values": list(TIPOS_SANCION)},
             "solicita": {"row": 4, "column": 0, "width": 200, "height": 35},  # Movido a la columna izquierda
             # Columna derecha (motivo)
             "motivo": {"row": 1, "column": 1, "width": 400, "height": 200, "rowspan": 5, "textbox": True},
@@ -1595,7 +1523,7 @@ class AplicacionSanciones:
                         fecha_sql,
                         self.entry_objetivo.get().strip(),
                         self.text_motivo.get("1.0", tk.END).strip(),
-                        self.combo_tipo.get(),
+                        normalizar_tipo_sancion(self.combo_tipo.get()),
                         cantidad_dias,  # Usar el valor calculado
                         self.entry_solicita.get().strip()
                     )
@@ -1628,70 +1556,11 @@ class AplicacionSanciones:
                 cursor = connection.cursor()
                 legajo = self.entry_legajo.get()
                 
-                # Actualizar estadísticas
-                cursor.execute("""
-                    SELECT 
-                        COUNT(*) as total_sanciones,
-                        COALESCE(SUM(CASE 
-                            WHEN LOWER(REPLACE(tipo_sancion, 'ó', 'o')) IN ('suspension', 'suspensión', 'suspencion')
-                            AND fecha >= DATE_SUB(CURDATE(), INTERVAL 365 DAY)
-                            THEN cantidad_dias 
-                            ELSE 0 
-                        END), 0) as dias_suspension_recientes,
-                        COALESCE(SUM(CASE 
-                            WHEN LOWER(REPLACE(tipo_sancion, 'ó', 'o')) IN ('suspension', 'suspensión', 'suspencion')
-                            THEN CAST(cantidad_dias AS SIGNED)
-                            ELSE 0 
-                        END), 0) as total_dias_suspension,
-                        MAX(fecha) as ultima_fecha
-                    FROM sanciones 
-                    WHERE legajo = %s
-                """, (legajo,))
-                
-                stats = cursor.fetchone()
-                total_sanciones = stats[0]
-                dias_suspension = stats[1]
-                total_historico = stats[2]
-                ultima_fecha = stats[3]
-                
-                # Actualizar lista de sanciones
-                cursor.execute("""
-                    SELECT id, legajo, fecha, objetivo, motivo, tipo_sancion, cantidad_dias, solicita 
-                    FROM sanciones 
-                    WHERE legajo = %s
-                    ORDER BY fecha DESC
-                """, (legajo,))
-                
-                registros = cursor.fetchall()
-                registros_convertidos = []
-                for registro in registros:
-                    fecha_mysql = registro[2]
-                    fecha_ui = datetime.strptime(str(fecha_mysql), '%Y-%m-%d').strftime('%d-%m-%Y')
-                    registro_convertido = list(registro)
-                    registro_convertido[2] = fecha_ui
-                    registros_convertidos.append(tuple(registro_convertido))
+                # Sanciones y estadísticas actualizadas (una consulta)
+                estadisticas, filas = self._leer_sanciones(cursor, legajo)
                 
                 def _actualizar_ui():
-                    # Actualizar labels estadísticos
-                    self.total_sanciones_label.configure(
-                        text=f"📋 Historial: {total_sanciones} sanciones registradas"
-                    )
-                    self.suspensiones_recientes_label.configure(
-                        text=f"⚠️ Suspensiones (365 días): {dias_suspension} días"
-                    )
-                    self.suspensiones_historicas_label.configure(
-                        text=f"📊 Total histórico suspensiones: {total_historico} días"
-                    )
-                    if ultima_fecha:
-                        fecha_formateada = datetime.strptime(str(ultima_fecha), '%Y-%m-%d').strftime('%d-%m-%Y')
-                        self.ultima_sancion_label.configure(
-                            text=f"⏱️ Última sanción: {fecha_formateada}"
-                        )
-                    
-                    # Actualizar treeview
-                    self._clear_treeview()
-                    for registro in registros_convertidos:
-                        self.tree.insert("", tk.END, values=registro)
+                    self._mostrar_sanciones(estadisticas, filas)
                     
                     # Mostrar mensaje de éxito
                     self.mostrar_mensaje("Éxito", "Sanción insertada correctamente")
@@ -1703,7 +1572,7 @@ class AplicacionSanciones:
                     self.root.after(0, _actualizar_ui)
                 
             except Exception as e:
-                self.logger.error(f"Error al actualizar después de inserción: {str(e)}")
+                self.logger.error("Error al actualizar después de inserción: %s", e)
                 if not self.is_destroyed:
                     self.root.after(0, lambda: self.mostrar_mensaje(
                         "Error", "Error al actualizar los datos"
@@ -1718,7 +1587,6 @@ class AplicacionSanciones:
     def validar_campos(self):
         """Validar todos los campos del formulario"""
         try:
-            # Imprimir valores para depuración
             campos = {
                 'legajo': self.entry_legajo.get(),
                 'fecha': self.entry_fecha.get(),
@@ -1730,7 +1598,7 @@ class AplicacionSanciones:
                 'dias': self.entry_cantidad_dias.get() if self.suspension_var.get() else '0'
             }
             
-            print("Valores de campos:", campos)
+            self.logger.debug("Valores de campos: %s", campos)
 
             # Validar campos obligatorios básicos uno por uno
             if not self.entry_legajo.get():
@@ -1772,125 +1640,29 @@ class AplicacionSanciones:
             return False
 
     def consultar_sanciones(self, legajo=None):
+        """Refrescar tabla y estadísticas del legajo (una consulta, en segundo plano)"""
         def _consultar():
             connection = self.db_pool.get_connection()
             if not connection:
                 return
 
+            cursor = None
             try:
                 cursor = connection.cursor()
-                print(f"📋 Consultando sanciones para legajo: {legajo}")
-                
-                # Consulta de diagnóstico
-                cursor.execute("""
-                    SELECT 
-                        id,
-                        tipo_sancion,
-                        cantidad_dias,
-                        fecha,
-                        LOWER(REPLACE(tipo_sancion, 'ó', 'o')) as tipo_normalizado,
-                        CASE 
-                            WHEN LOWER(REPLACE(tipo_sancion, 'ó', 'o')) IN ('suspension', 'suspensión', 'suspencion')
-                            AND fecha >= DATE_SUB(CURDATE(), INTERVAL 365 DAY)
-                            THEN cantidad_dias 
-                            ELSE 0 
-                        END as dias_computados,
-                        fecha >= DATE_SUB(CURDATE(), INTERVAL 365 DAY) as es_ultimo_anio
-                    FROM sanciones 
-                    WHERE legajo = %s
-                    ORDER BY fecha DESC
-                """, (legajo,))
-                
-                # Imprimir resultados de diagnóstico
-                diagnostico = cursor.fetchall()
-                print("\n=== DIAGNÓSTICO DE SANCIONES ===")
-                for reg in diagnostico:
-                    print(f"""
-                    ID: {reg[0]}
-                    Tipo Original: '{reg[1]}'
-                    Días: {reg[2]}
-                    Fecha: {reg[3]}
-                    Tipo Normalizado: '{reg[4]}'
-                    Días Computados: {reg[5]}
-                    Es último año: {reg[6]}
-                    {'='*40}
-                    """)
-
-                # Continuar con la consulta normal...
-                cursor.execute("""
-                    SELECT 
-                        COUNT(*) as total_sanciones,
-                        COALESCE(SUM(CASE 
-                            WHEN LOWER(REPLACE(tipo_sancion, 'ó', 'o')) IN ('suspension', 'suspensión', 'suspencion')
-                            AND fecha >= DATE_SUB(CURDATE(), INTERVAL 365 DAY)
-                            THEN CAST(cantidad_dias AS SIGNED)  -- Forzar conversión a número
-                            ELSE 0 
-                        END), 0) as dias_suspension_recientes,
-                        COALESCE(SUM(CASE 
-                            WHEN LOWER(REPLACE(tipo_sancion, 'ó', 'o')) IN ('suspension', 'suspensión', 'suspencion')
-                            THEN CAST(cantidad_dias AS SIGNED)
-                            ELSE 0 
-                        END), 0) as total_dias_suspension,
-                        MAX(fecha) as ultima_fecha
-                    FROM sanciones 
-                    WHERE legajo = %s
-                """, (legajo,))
-                
-                stats = cursor.fetchone()
-                total_sanciones = stats[0]
-                dias_suspension = stats[1]
-                total_historico = stats[2]
-                ultima_fecha = stats[3]
-                
-                # Luego obtener los registros para el treeview
-                cursor.execute("""
-                    SELECT id, legajo, fecha, objetivo, motivo, tipo_sancion, cantidad_dias, solicita 
-                    FROM sanciones 
-                    WHERE legajo = %s
-                    ORDER BY fecha DESC
-                """, (legajo,))
-                
-                registros = cursor.fetchall()
-                registros_convertidos = []
-                for registro in registros:
-                    fecha_mysql = registro[2]
-                    fecha_ui = datetime.strptime(str(fecha_mysql), '%Y-%m-%d').strftime('%d-%m-%Y')
-                    registro_convertido = list(registro)
-                    registro_convertido[2] = fecha_ui
-                    registros_convertidos.append(tuple(registro_convertido))
-                
-                def _actualizar_ui():
-                    # Actualizar estadísticas
-                    self.total_sanciones_label.configure(
-                        text=f"📋 Historial: {total_sanciones} sanciones registradas"
-                    )
-                    self.suspensiones_recientes_label.configure(
-                        text=f"⚠️ Suspensiones (365 días): {dias_suspension} días"
-                    )
-                    self.suspensiones_historicas_label.configure(
-                        text=f"📊 Total histórico suspensiones: {total_historico} días"
-                    )
-                    if ultima_fecha:
-                        fecha_formateada = datetime.strptime(str(ultima_fecha), '%Y-%m-%d').strftime('%d-%m-%Y')
-                        self.ultima_sancion_label.configure(
-                            text=f"⏱️ Última sanción: {fecha_formateada}"
-                        )
-                    
-                    # Actualizar treeview
-                    self._clear_treeview()
-                    for registro in registros_convertidos:
-                        self.tree.insert("", tk.END, values=registro)
+                self.logger.debug("Consultando sanciones para legajo: %s", legajo)
+                estadisticas, filas = self._leer_sanciones(cursor, legajo)
                 
                 if not self.is_destroyed:
-                    self.root.after(0, _actualizar_ui)
+                    self.root.after(0, lambda: self._mostrar_sanciones(estadisticas, filas))
                 
             except mysql.connector.Error as err:
-                print(f"❌ Error en consulta SQL: {err}")
+                self.logger.error("Error en consulta SQL: %s", err)
                 self.root.after(0, lambda: self.mostrar_mensaje(
                     "Error", f"No se pudo consultar: {err}", tipo="error"
                 ))
             finally:
-                cursor.close()
+                if cursor:
+                    cursor.close()
                 self.db_pool.return_connection(connection)
 
         if legajo:
@@ -1898,28 +1670,41 @@ class AplicacionSanciones:
         else:
             self._clear_treeview()
 
+    def _leer_sanciones(self, cursor, legajo):
+        """Estadísticas y filas de la tabla del legajo, con un cursor abierto (hilo de trabajo)"""
+        resumen = self.RESUMEN_SANCIONES.leer(cursor, legajo)
+        registros = resumen.registros if resumen else []
+        estadisticas = self._estadisticas_sanciones(registros)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            for registro in registros:
+                self.logger.debug(
+                    f"Sanción {registro['id']}: tipo='{registro['tipo_sancion']}' "
+                    f"días={registro['cantidad_dias']} fecha={registro['fecha']} "
+                    f"suspensión={self._es_suspension(registro['tipo_sancion'])}"
+                )
+            self.logger.debug("Estadísticas de sanciones del legajo %s: %s", legajo, estadisticas)
+        return estadisticas, self._filas_sanciones(registros)
+
+    def _mostrar_sanciones(self, estadisticas, filas):
+        """Actualizar estadísticas y tabla (hilo de Tk)"""
+        self._mostrar_estadisticas(estadisticas)
+        self.tabla.actualizar(filas)
     def _clear_treeview(self):
         """Limpiar todos los registros del treeview"""
-        for row in self.tree.get_children():
-            self.tree.delete(row)
+        self.tabla.limpiar()
 
     def _update_treeview(self, registros):
         """Actualizar treeview con registros"""
-        print("\n📊 Actualizando Treeview:")
-        print(f"Cantidad de registros a mostrar: {len(registros)}")
-        
-        self._clear_treeview()
+        self.logger.debug("Actualizando treeview: %s registros", len(registros))
         
+        filas = []
         for registro in registros:
-            valores = list(registro)
-            print(f"Registro a insertar: {valores}")
-            
-            valores_display = valores.copy()
-            if len(valores[4]) > 50:  # Truncar motivo si es muy largo
-                valores_display[4] = valores[4][:47] + "..."
-            
-            self.tree.insert("", tk.END, values=valores_display)
-        print("✅ Treeview actualizado\n")
+            valores_display = list(registro)
+            if len(valores_display[4]) > 50:  # Truncar motivo si es muy largo
+                valores_display[4] = valores_display[4][:47] + "..."
+            filas.append(valores_display)
+        
+        self.tabla.actualizar(filas)
 
     def limpiar_campos(self):
         """Limpiar todos los campos del formulario"""
@@ -1981,13 +1766,12 @@ class AplicacionSanciones:
             if hasattr(self, 'search_criteria') and self.search_criteria:
                 self.search_criteria.set("Apellido")
         except Exception as e:
-            print(f"Error en _clear_form: {str(e)}")
-            self.logger.error(f"Error en _clear_form: {str(e)}")
+            self.logger.error("Error en _clear_form: %s", e)
 
     def mostrar_mensaje(self, titulo, mensaje, tipo="info"):
         """Mostrar mensaje en ventana emergente"""
         if not self.root.winfo_exists():
-            print(f"Mensaje omitido (ventana cerrada): {titulo} - {mensaje}")
+            logger.warning("Mensaje omitido (ventana cerrada): %s - %s", titulo, mensaje)
             return  # Evita abrir el mensaje si la aplicación ya está cerrada
 
         dialog = ctk.CTkToplevel(self.root)
@@ -2067,38 +1851,7 @@ class AplicacionSanciones:
         try:
             self.cleanup()
         except Exception as e:
-            print(f"Error during cleanup: {e}")
-
-    def _actualizar_estadisticas(self, cursor, legajo):
-        """Actualizar estadísticas de sanciones"""
-        cursor.execute("""
-            SELECT 
-                COUNT(*) as total_sanciones,
-                COALESCE(SUM(CASE 
-                    WHEN LOWER(REPLACE(tipo_sancion, 'ó', 'o')) IN ('suspension', 'suspensión', 'suspencion')
-                    AND fecha >= DATE_SUB(CURDATE(), INTERVAL 365 DAY)
-                    THEN cantidad_dias 
-                    ELSE 0 
-                END), 0) as dias_suspension_recientes
-            FROM sanciones
-            WHERE legajo = %s
-        """, (legajo,))
-        
-        resultado = cursor.fetchone()
-        if resultado:
-            total_sanciones = resultado[0]
-            dias_suspension_recientes = resultado[1]
-            
-            if not self.is_destroyed:
-                def _actualizar_labels():
-                    self.total_sanciones_label.configure(
-                        text=f"📋 Historial: {total_sanciones} sanciones registradas"
-                    )
-                    self.suspensiones_recientes_label.configure(
-                        text=f"⚠️ Suspensiones (365 días): {dias_suspension_recientes} días"
-                    )
-                
-                self.root.after(0, _actualizar_labels)
+            logger.error("Error during cleanup: %s", e)
 
     def show_in_frame(self, parent_frame):
         """Mostrar el módulo en un frame específico"""
@@ -2109,7 +1862,7 @@ class AplicacionSanciones:
                     self.parent_frame.unbind('<MouseWheel>')  # Unbind específico en lugar de unbind_all
                     self.parent_frame.unbind('<Shift-MouseWheel>')
                 except Exception as e:
-                    self.logger.warning(f"Error al limpiar bindings: {e}")
+                    self.logger.warning("Error al limpiar bindings: %s", e)
             
             self.is_destroyed = False
             
@@ -2137,7 +1890,7 @@ class AplicacionSanciones:
             self.create_gui()
             
         except Exception as e:
-            self.logger.error(f"Error en show_in_frame: {str(e)}")
+            self.logger.error("Error en show_in_frame: %s", e)
             raise
 
     def _find_root_window(self, widget):
@@ -2154,7 +1907,7 @@ class AplicacionSanciones:
         try:
             # Verificar si el canvas aún existe y es válido
             if not canvas.winfo_exists():
-                print("Canvas no existe, removiendo binding")
+                logger.debug("Canvas no existe, removiendo binding")
                 if hasattr(self, 'parent_frame'):
                     self.parent_frame.unbind_all('<MouseWheel>')
                     self.parent_frame.unbind_all('<Shift-MouseWheel>')
@@ -2166,7 +1919,7 @@ class AplicacionSanciones:
                 if not scroll_region:
                     return
             except tk.TclError:
-                print("Error accediendo al canvas, removiendo binding")
+                logger.debug("Error accediendo al canvas, removiendo binding")
                 return
 
             # Obtener la posición actual del scroll de forma segura
@@ -2175,7 +1928,7 @@ class AplicacionSanciones:
                 if not current_view:
                     return
             except tk.TclError:
-                print("Error obteniendo yview, removiendo binding")
+                logger.debug("Error obteniendo yview, removiendo binding")
                 return
 
             # Aplicar el scroll con verificaciones
@@ -2188,11 +1941,11 @@ class AplicacionSanciones:
                        (event.delta < 0 and current_view[1] < 1):
                         canvas.yview_scroll(int(-1*(event.delta/120)), "units")
             except tk.TclError as e:
-                print(f"Error durante scroll: {e}")
+                logger.error("Error durante scroll: %s", e)
                 return
 
         except Exception as e:
-            print(f"Error general en _on_mousewheel: {e}")
+            logger.error("Error general en _on_mousewheel: %s", e)
             # Intentar limpiar bindings
             if hasattr(self, 'parent_frame'):
                 try:
@@ -2230,7 +1983,7 @@ class AplicacionSanciones:
                     canvas.configure(scrollregion=canvas.bbox("all"))
                     canvas.itemconfig(canvas_frame, width=canvas.winfo_width())
                 except tk.TclError:
-                    print("Error configurando canvas")
+                    logger.error("Error configurando canvas")
 
         def _bind_mousewheel(event=None):
             if canvas.winfo_exists():
@@ -2238,14 +1991,14 @@ class AplicacionSanciones:
                     container.bind_all("<MouseWheel>", lambda e: self._on_mousewheel(e, canvas))
                     container.bind_all("<Shift-MouseWheel>", lambda e: self._on_mousewheel(e, canvas))
                 except Exception as e:
-                    print(f"Error en binding mousewheel: {e}")
+                    logger.error("Error en binding mousewheel: %s", e)
 
         def _unbind_mousewheel(event=None):
             try:
                 container.unbind_all("<MouseWheel>")
                 container.unbind_all("<Shift-MouseWheel>")
             except Exception as e:
-                print(f"Error unbinding mousewheel: {e}")
+                logger.error("Error unbinding mousewheel: %s", e)
 
         # Configurar bindings con manejo de errores
         try:
@@ -2253,7 +2006,7 @@ class AplicacionSanciones:
             container.bind("<Enter>", _bind_mousewheel)
             container.bind("<Leave>", _unbind_mousewheel)
         except Exception as e:
-            print(f"Error configurando bindings: {e}")
+            logger.error("Error configurando bindings: %s", e)
 
 if __name__ == "__main__":
     app = None
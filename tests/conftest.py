@@ -0,0 +1,75 @@
+import os
+import re
+import sys
+import uuid
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "db: necesita un MySQL con el esquema de la aplicación (RRHH_TEST_DB=1 y las variables DB_*)"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if os.getenv('RRHH_TEST_DB', '').strip().lower() in ('1', 'true', 'si', 'sí', 'yes'):
+        return
+    omitir = pytest.mark.skip(reason="Pruebas con base desactivadas (RRHH_TEST_DB=1 para correrlas)")
+    for item in items:
+        if 'db' in item.keywords:
+            item.add_marker(omitir)
+
+
+# Tablas y procedimientos que se copian de la base de la aplicación
+TABLAS_PRUEBA = ('prestamos', 'pagos')
+PROCEDIMIENTOS_PRUEBA = ('generar_cuotas', 'pagar_todas_cuotas')
+
+
+@pytest.fixture
+def db_prueba():
+    """
+    Conexión a un esquema descartable con la estructura de prestamos y pagos
+    y los procedimientos de la base configurada (DB_*). Como los
+    procedimientos pueden confirmar solos, las pruebas nunca tocan la base
+    real: el esquema se borra al terminar.
+    """
+    mysql_connector = pytest.importorskip('mysql.connector')
+    try:
+        from dotenv import load_dotenv
+        load_dotenv()
+    except ImportError:
+        pass
+
+    origen = os.getenv('DB_DATABASE')
+    esquema = f"rrhh_prueba_{uuid.uuid4().hex[:12]}"
+    db = mysql_connector.connect(
+        host=os.getenv('DB_HOST'),
+        user=os.getenv('DB_USER'),
+        password=os.getenv('DB_PASSWORD'),
+        port=int(os.getenv('DB_PORT', '3306')),
+        database=origen
+    )
+    cursor = db.cursor()
+    try:
+        cursor.execute(f"CREATE DATABASE {esquema}")
+        for tabla in TABLAS_PRUEBA:
+            cursor.execute(f"CREATE TABLE {esquema}.{tabla} LIKE {origen}.{tabla}")
+        definiciones = []
+        for procedimiento in PROCEDIMIENTOS_PRUEBA:
+            cursor.execute(f"SHOW CREATE PROCEDURE {origen}.{procedimiento}")
+            # Sin DEFINER, para no necesitar privilegios sobre otro usuario
+            definiciones.append(re.sub(r"DEFINER\s*=\s*\S+\s+", "", cursor.fetchone()[2], count=1))
+        db.database = esquema
+        for definicion in definiciones:
+            cursor.execute(definicion)
+        cursor.close()
+        yield db
+    finally:
+        cursor = db.cursor()
+        cursor.execute(f"DROP DATABASE IF EXISTS {esquema}")
+        cursor.close()
+        db.close()
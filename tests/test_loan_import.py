@@ -0,0 +1,51 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from utils.loan_import import ErrorFila, normalizar_legajo, validar_fila
+
+
+def _fila(**campos):
+    fila = {
+        'legajo': '7', 'monto_total': '1000', 'cuotas': '3', 'fecha_inicio': '2024-01-31',
+        'fecha_ultima_cuota': '', 'motivo': ' Adelanto ', 'estado': 'Pendiente',
+    }
+    fila.update(campos)
+    return fila
+
+
+@pytest.mark.parametrize("valor", ['7', '007', ' 7 ', '7.0', 7, Decimal('7')])
+def test_normalizar_legajo_como_la_columna(valor):
+    assert normalizar_legajo(valor) == 7
+
+
+@pytest.mark.parametrize("valor", ['7a', '7.5', 'abc', 'NaN'])
+def test_normalizar_legajo_rechaza_no_numericos(valor):
+    with pytest.raises(ErrorFila) as error:
+        normalizar_legajo(valor)
+    assert error.value.campo == 'legajo'
+
+
+def test_validar_fila_legajo_con_ceros_a_la_izquierda():
+    assert validar_fila(_fila(legajo='007'), {7}) == (
+        7, Decimal('1000'), 3, date(2024, 1, 31), None, 'Adelanto', False
+    )
+
+
+def test_validar_fila_legajo_inexistente():
+    with pytest.raises(ErrorFila) as error:
+        validar_fila(_fila(legajo='008'), {7})
+    assert error.value.campo == 'legajo'
+
+
+def test_validar_fila_pagado_necesita_ultima_cuota():
+    with pytest.raises(ErrorFila) as error:
+        validar_fila(_fila(estado='Pagado'), {7})
+    assert error.value.campo == 'fecha_ultima_cuota'
+
+
+def test_validar_fila_rechaza_centavos_de_mas():
+    with pytest.raises(ErrorFila) as error:
+        validar_fila(_fila(monto_total='10.005'), {7})
+    assert error.value.campo == 'monto_total'
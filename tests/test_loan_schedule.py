@@ -0,0 +1,155 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from utils.loan_schedule import (
+    montos_cuotas, plan_cuotas, planes_cuotas, sumar_meses, insertar_cuotas, pagar_cuotas
+)
+
+
+@pytest.mark.parametrize("fecha, meses, esperado", [
+    (date(2025, 1, 15), 1, date(2025, 2, 15)),
+    (date(2025, 1, 31), 1, date(2025, 2, 28)),
+    (date(2024, 1, 31), 1, date(2024, 2, 29)),
+    (date(2024, 2, 29), 12, date(2025, 2, 28)),
+    (date(2024, 2, 29), 48, date(2028, 2, 29)),
+    (date(2025, 1, 31), 2, date(2025, 3, 31)),
+    (date(2025, 3, 31), 1, date(2025, 4, 30)),
+    (date(2025, 11, 30), 2, date(2026, 1, 30)),
+    (date(2025, 12, 31), 0, date(2025, 12, 31)),
+])
+def test_sumar_meses(fecha, meses, esperado):
+    assert sumar_meses(fecha, meses) == esperado
+
+
+def test_sumar_meses_cuenta_desde_la_fecha_original():
+    # 31/01 -> 28/02 -> 31/03, no 28/03
+    vencimientos = [sumar_meses(date(2025, 1, 31), n) for n in range(4)]
+    assert vencimientos == [date(2025, 1, 31), date(2025, 2, 28), date(2025, 3, 31), date(2025, 4, 30)]
+
+
+@pytest.mark.parametrize("total, cuotas, esperado", [
+    ('1000', 3, ['333.34', '333.33', '333.33']),
+    ('1000', 4, ['250.00'] * 4),
+    ('0.05', 3, ['0.02', '0.02', '0.01']),
+    ('100.01', 1, ['100.01']),
+    ('10', 6, ['1.67', '1.67', '1.67', '1.67', '1.66', '1.66']),
+])
+def test_montos_cuotas_reparte_centavos_en_las_primeras(total, cuotas, esperado):
+    assert montos_cuotas(total, cuotas) == [Decimal(m) for m in esperado]
+
+
+@pytest.mark.parametrize("total", ['1000', '999.99', '0.01', '123456.78', Decimal('5000.50'), 1500.25])
+@pytest.mark.parametrize("cuotas", [1, 2, 3, 7, 12, 36])
+def test_montos_cuotas_suman_el_total(total, cuotas):
+    montos = montos_cuotas(total, cuotas)
+    assert len(montos) == cuotas
+    assert sum(montos) == Decimal(str(total))
+    assert max(montos) - min(montos) <= Decimal('0.01')
+
+
+@pytest.mark.parametrize("total, cuotas", [
+    ('1000.005', 3),
+    ('0', 3),
+    ('-10', 2),
+    ('abc', 2),
+    ('1000', 0),
+])
+def test_montos_cuotas_rechaza_montos_invalidos(total, cuotas):
+    with pytest.raises(ValueError):
+        montos_cuotas(total, cuotas)
+
+
+def test_plan_cuotas_vencimientos_y_estado():
+    plan = plan_cuotas(7, '1000', 3, '2024-01-31')
+    assert plan == [
+        (7, 1, Decimal('333.34'), date(2024, 1, 31), 'Pendiente', None),
+        (7, 2, Decimal('333.33'), date(2024, 2, 29), 'Pendiente', None),
+        (7, 3, Decimal('333.33'), date(2024, 3, 31), 'Pendiente', None),
+    ]
+
+
+def test_plan_cuotas_historico_pagado_hasta():
+    plan = plan_cuotas(1, '300', 3, date(2024, 5, 10), pagadas_hasta=date(2024, 6, 10))
+    assert [(f[1], f[4], f[5]) for f in plan] == [
+        (1, 'Pagado', date(2024, 5, 10)),
+        (2, 'Pagado', date(2024, 6, 10)),
+        (3, 'Pendiente', None),
+    ]
+
+
+def test_planes_cuotas_concatena_en_orden():
+    filas = planes_cuotas([(1, '200', 2, date(2025, 1, 1)), (2, '100', 1, date(2025, 3, 1))])
+    assert [(f[0], f[1]) for f in filas] == [(1, 1), (1, 2), (2, 1)]
+
+
+@pytest.mark.db
+@pytest.mark.parametrize("monto, cuotas, fecha_inicio", [
+    ('1000.00', 3, date(2025, 1, 31)),
+    ('1200.00', 12, date(2024, 2, 29)),
+    ('100.00', 7, date(2025, 10, 31)),
+    ('0.05', 3, date(2025, 6, 15)),
+    ('50000.00', 1, date(2025, 12, 31)),
+])
+def test_plan_igual_a_generar_cuotas(db_prueba, monto, cuotas, fecha_inicio):
+    """El plan en Python tiene que dar las mismas cuotas que el procedimiento de la base"""
+    cursor = db_prueba.cursor()
+    cursor.execute(
+        "INSERT INTO prestamos (legajo, monto_total, cuotas, fecha_inicio, motivo) VALUES (%s, %s, %s, %s, %s)",
+        (1, monto, cuotas, fecha_inicio, 'prueba')
+    )
+    id_procedimiento = cursor.lastrowid
+    cursor.callproc('generar_cuotas', (id_procedimiento, float(monto), cuotas, fecha_inicio))
+    cursor.execute(
+        "INSERT INTO prestamos (legajo, monto_total, cuotas, fecha_inicio, motivo) VALUES (%s, %s, %s, %s, %s)",
+        (1, monto, cuotas, fecha_inicio, 'prueba')
+    )
+    id_plan = cursor.lastrowid
+    insertar_cuotas(cursor, plan_cuotas(id_plan, monto, cuotas, fecha_inicio))
+    db_prueba.commit()
+
+    consulta = """
+        SELECT numero_cuota, monto_cuota, fecha_vencimiento, estado, fecha_pago
+        FROM pagos WHERE id_prestamos = %s ORDER BY numero_cuota
+    """
+    cursor.execute(consulta, (id_procedimiento,))
+    procedimiento = cursor.fetchall()
+    cursor.execute(consulta, (id_plan,))
+    plan = cursor.fetchall()
+    cursor.close()
+
+    assert plan == procedimiento
+
+
+@pytest.mark.db
+def test_pagar_cuotas_igual_a_pagar_todas_cuotas(db_prueba):
+    """Pagar todas las cuotas deja estado y fecha de pago como el procedimiento"""
+    cursor = db_prueba.cursor()
+    ids = []
+    for _ in range(2):
+        cursor.execute(
+            "INSERT INTO prestamos (legajo, monto_total, cuotas, fecha_inicio, motivo) VALUES (%s, %s, %s, %s, %s)",
+            (1, '900.00', 3, date(2025, 1, 10), 'prueba')
+        )
+        ids.append(cursor.lastrowid)
+        plan = plan_cuotas(ids[-1], '900.00', 3, date(2025, 1, 10), pagadas_hasta=date(2025, 1, 10))
+        insertar_cuotas(cursor, plan)
+    db_prueba.commit()
+
+    cursor.callproc('pagar_todas_cuotas', (ids[0], date(2025, 2, 20)))
+    pagadas = pagar_cuotas(cursor, date(2025, 2, 20), id_prestamo=ids[1])
+    db_prueba.commit()
+    assert len(pagadas) == 2
+
+    consulta = """
+        SELECT numero_cuota, estado, fecha_pago
+        FROM pagos WHERE id_prestamos = %s ORDER BY numero_cuota
+    """
+    cursor.execute(consulta, (ids[0],))
+    procedimiento = cursor.fetchall()
+    cursor.execute(consulta, (ids[1],))
+    aplicacion = cursor.fetchall()
+    cursor.close()
+
+    assert aplicacion == procedimiento
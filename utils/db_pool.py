@@ -0,0 +1,284 @@
+import os
+import time
+import atexit
+import logging
+import threading
+from collections import deque
+
+import mysql.connector
+from dotenv import load_dotenv
+
+
+class PoolTimeoutError(mysql.connector.errors.PoolError):
+    """
+    No se obtuvo una conexión del pool dentro del tiempo de espera.
+    Hereda de mysql.connector.Error para que los ``except`` existentes la capturen.
+    """
+
+
+def _config_desde_entorno():
+    """Armar la configuración de conexión a partir de las variables de entorno"""
+    return {
+        'host': os.getenv('DB_HOST'),
+        'user': os.getenv('DB_USER'),
+        'password': os.getenv('DB_PASSWORD'),
+        'database': os.getenv('DB_DATABASE'),
+        'port': int(os.getenv('DB_PORT', '3306')),
+        'connect_timeout': int(os.getenv('DB_CONNECT_TIMEOUT', '5'))
+    }
+
+
+class PooledConnection:
+    """
+    Conexión MySQL prestada por el pool compartido.
+
+    Delega todo en la conexión real, pero close() (y la salida de un bloque
+    ``with``) la devuelve al pool en lugar de cerrar el socket. Así el código
+    existente que hace ``conn.close()``, ``with pool.get_connection() as conn``
+    o ``return_connection(conn)`` sigue funcionando sin cambios.
+    """
+    _raw = None
+    _released = True
+
+    def __init__(self, pool, raw):
+        self._pool = pool
+        self._raw = raw
+        self._released = False
+
+    def __getattr__(self, name):
+        return getattr(self._raw, name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.close()
+        return False
+
+    def is_connected(self):
+        """Una conexión ya devuelta al pool se considera desconectada"""
+        if self._released:
+            return False
+        return self._raw.is_connected()
+
+    def close(self):
+        """Devolver la conexión al pool (idempotente)"""
+        if not self._released:
+            self._released = True
+            self._pool._release(self._raw)
+
+    def __del__(self):
+        # Una conexión olvidada no debe consumir un lugar del pool para siempre
+        try:
+            if not self._released:
+                self._released = True
+                self._pool._release(self._raw, discard=True)
+        except Exception:
+            pass
+
+
+class ConnectionPool:
+    """
+    Pool de conexiones MySQL único por proceso y seguro entre hilos.
+
+    - Limita la cantidad de conexiones simultáneas (``max_size``); si no hay
+      lugar, espera hasta ``checkout_timeout`` segundos y luego lanza
+      PoolTimeoutError en vez de abrir conexiones por fuera del pool.
+    - Verifica la salud (ping) de las conexiones que estuvieron ociosas más de
+      ``health_check_after`` segundos antes de entregarlas.
+    - Recicla las conexiones ociosas por más de ``idle_timeout`` segundos.
+    - Expone estadísticas de uso mediante stats().
+    """
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, config=None, max_size=None, checkout_timeout=None,
+                 idle_timeout=None, health_check_after=None):
+        self.config = config or _config_desde_entorno()
+        self.max_size = max_size or int(os.getenv('DB_POOL_SIZE', '6'))
+        self.checkout_timeout = (checkout_timeout if checkout_timeout is not None
+                                 else float(os.getenv('DB_POOL_TIMEOUT', '10')))
+        self.idle_timeout = (idle_timeout if idle_timeout is not None
+                             else float(os.getenv('DB_POOL_IDLE_TIMEOUT', '300')))
+        self.health_check_after = (health_check_after if health_check_after is not None
+                                   else float(os.getenv('DB_POOL_HEALTH_CHECK', '30')))
+        self.logger = logging.getLogger(__name__)
+
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.max_size)
+        self._idle = deque()  # (conexión, momento de devolución); a la derecha las más recientes
+        self._in_use = 0
+        self._stats = {
+            'checkouts': 0,
+            'waits': 0,
+            'timeouts': 0,
+            'wait_time_total': 0.0,
+            'created': 0,
+            'recycled': 0,
+            'health_failures': 0,
+            'discarded': 0
+        }
+
+    @classmethod
+    def get_instance(cls):
+        """Obtener (creando si hace falta) el pool compartido del proceso"""
+        with cls._instance_lock:
+            if cls._instance is None:
+                load_dotenv()
+                cls._instance = cls()
+                atexit.register(cls._instance.close_all)
+            return cls._instance
+
+    @classmethod
+    def reset_instance(cls, **kwargs):
+        """
+        Reemplazar el pool del proceso por uno nuevo (p. ej. en un proceso hijo).
+        Las conexiones del pool anterior no se cierran: pueden pertenecer al proceso padre.
+        """
+        with cls._instance_lock:
+            load_dotenv()
+            cls._instance = cls(**kwargs)
+            atexit.register(cls._instance.close_all)
+            return cls._instance
+
+    def get_connection(self, timeout=None):
+        """Tomar una conexión del pool, esperando si todas están en uso"""
+        timeout = self.checkout_timeout if timeout is None else timeout
+
+        if not self._slots.acquire(blocking=False):
+            inicio = time.monotonic()
+            with self._lock:
+                self._stats['waits'] += 1
+            if not self._slots.acquire(timeout=timeout):
+                with self._lock:
+                    self._stats['timeouts'] += 1
+                raise PoolTimeoutError(
+                    f"No hay conexiones disponibles tras {timeout:.1f}s "
+                    f"({self.max_size} en uso)"
+                )
+            with self._lock:
+                self._stats['wait_time_total'] += time.monotonic() - inicio
+
+        try:
+            raw = self._checkout_raw()
+        except Exception:
+            self._slots.release()
+            raise
+
+        with self._lock:
+            self._stats['checkouts'] += 1
+            self._in_use += 1
+        return PooledConnection(self, raw)
+
+    def _checkout_raw(self):
+        """Obtener una conexión ociosa sana o crear una nueva"""
+        while True:
+            with self._lock:
+                entry = self._idle.pop() if self._idle else None
+            if entry is None:
+                return self._create()
+
+            raw, devuelta = entry
+            ociosa = time.monotonic() - devuelta
+            if ociosa > self.idle_timeout:
+                self._discard(raw, 'recycled')
+                continue
+            if ociosa > self.health_check_after:
+                try:
+                    raw.ping(reconnect=False)
+                except Exception:
+                    self._discard(raw, 'health_failures')
+                    continue
+            return raw
+
+    def _create(self):
+        raw = mysql.connector.connect(**self.config)
+        with self._lock:
+            self._stats['created'] += 1
+        return raw
+
+    def _discard(self, raw, motivo='discarded'):
+        with self._lock:
+            self._stats[motivo] += 1
+        try:
+            raw.close()
+        except Exception:
+            pass
+
+    def _release(self, raw, discard=False):
+        """Recibir una conexión devuelta por un PooledConnection"""
+        try:
+            if not discard:
+                try:
+                    # No dejar transacciones abiertas ni snapshots viejos en el pool
+                    if raw.in_transaction:
+                        raw.rollback()
+                except Exception:
+                    discard = True
+
+            if discard:
+                self._discard(raw)
+            else:
+                with self._lock:
+                    self._idle.append((raw, time.monotonic()))
+            self._reap_idle()
+        finally:
+            with self._lock:
+                self._in_use -= 1
+            self._slots.release()
+
+    def _reap_idle(self):
+        """Cerrar las conexiones ociosas que superaron idle_timeout"""
+        limite = time.monotonic() - self.idle_timeout
+        vencidas = []
+        with self._lock:
+            while self._idle and self._idle[0][1] < limite:
+                vencidas.append(self._idle.popleft()[0])
+        for raw in vencidas:
+            self._discard(raw, 'recycled')
+
+    def warm_up(self, count=2):
+        """
+        Abrir de antemano hasta ``count`` conexiones y dejarlas ociosas, para
+        que las primeras consultas de la interfaz no paguen el handshake.
+        Devuelve la cantidad de conexiones ociosas resultante.
+        """
+        count = min(count, self.max_size)
+        with self._lock:
+            faltan = count - len(self._idle)
+        prestadas = []
+        try:
+            for _ in range(max(0, faltan)):
+                prestadas.append(self.get_connection(timeout=0))
+        except Exception as e:
+            self.logger.warning("Precalentamiento del pool incompleto: %s", e)
+        finally:
+            for conexion in prestadas:
+                conexion.close()
+        with self._lock:
+            return len(self._idle)
+
+    def stats(self):
+        """Devolver una copia de las estadísticas del pool"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['in_use'] = self._in_use
+            stats['idle'] = len(self._idle)
+        stats['max_size'] = self.max_size
+        return stats
+
+    def close_all(self):
+        """Cerrar las conexiones ociosas (las prestadas se cierran al devolverse)"""
+        with self._lock:
+            ociosas = [raw for raw, _ in self._idle]
+            self._idle.clear()
+        for raw in ociosas:
+            try:
+                raw.close()
+            except Exception:
+                pass
+
+
+def get_pool():
+    """Acceso al pool de conexiones compartido del proceso"""
+    return ConnectionPool.get_instance()
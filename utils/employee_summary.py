@@ -0,0 +1,140 @@
+from datetime import date, datetime, timedelta
+
+from utils.schema_maintenance import get_mantenimiento
+
+
+# Versión de la foto mientras no se sabe si existe personal.foto_hash (la
+# crea la migración personal v1 al arrancar): el largo del BLOB cambia con
+# casi cualquier foto nueva y NULL sigue indicando que no hay foto
+VERSION_FOTO_PROVISORIA = "LENGTH(foto)"
+
+
+def como_fecha(valor):
+    """Normalizar DATE/DATETIME de MySQL a date (None se mantiene)"""
+    if isinstance(valor, datetime):
+        return valor.date()
+    return valor
+
+
+def dias_entre(desde, hasta=None):
+    """Días entre dos fechas; sin fecha final se cuenta hasta hoy (como DATEDIFF con CURDATE())"""
+    desde = como_fecha(desde)
+    if desde is None:
+        return 0
+    hasta = como_fecha(hasta) or date.today()
+    return (hasta - desde).days
+
+
+def desde_hace(dias=0, anios=0):
+    """
+    Fecha de corte para ventanas móviles, como DATE_SUB(CURDATE(), INTERVAL n DAY)
+    o INTERVAL 12*n MONTH (el 29 de febrero pasa al 28, igual que en MySQL).
+    """
+    hoy = date.today()
+    if anios:
+        try:
+            hoy = hoy.replace(year=hoy.year - anios)
+        except ValueError:
+            hoy = hoy.replace(year=hoy.year - anios, day=28)
+    return hoy - timedelta(days=dias)
+
+
+class ResumenEmpleado:
+    """Datos de personal de un legajo y los registros de un módulo"""
+    def __init__(self, legajo, apellido_nombre, foto_version, registros, personal=None):
+        self.legajo = legajo
+        self.apellido_nombre = apellido_nombre
+        self.foto_version = foto_version
+        self.registros = registros
+        self.personal = personal or {}
+
+    @property
+    def total(self):
+        return len(self.registros)
+
+
+class ConsultaResumen:
+    """
+    Lectura del resumen de un empleado para un módulo en un solo viaje a la base.
+
+    Trae la fila de personal (nombre y versión de la foto, nunca el BLOB) unida
+    a todos los registros del módulo para ese legajo; las estadísticas (totales,
+    último registro, sumas por período) se calculan en Python sobre esas
+    filas, que de todos modos se necesitan para la tabla. Así una consulta
+    reemplaza a las tres a cinco (COUNT, MAX, SUM, subconsultas) que hacía
+    cada módulo.
+
+    La versión de la foto es personal.foto_hash (columna generada que MySQL
+    mantiene al escribir la foto), así la consulta no lee el BLOB; hasta que
+    el arranque confirma la columna se usa expresion_version_foto().
+    """
+    def __init__(self, tabla, columnas, orden, clave=None, campos_personal=()):
+        """
+        Args:
+            tabla: tabla del módulo (con columna legajo)
+            columnas: columnas de la tabla a traer, en orden
+            orden: ORDER BY sobre las columnas de la tabla (sin alias)
+            clave: columna que indica que la fila unida existe (por defecto la primera)
+            campos_personal: columnas extra de personal (p. ej. puesto, sector)
+        """
+        self.tabla = tabla
+        self.columnas = tuple(columnas)
+        self.clave = clave or self.columnas[0]
+        self.campos_personal = tuple(campos_personal)
+        self.orden = orden
+        self._inicio = 2 + len(self.campos_personal)
+        self._sql = {}  # expresión de la versión de la foto -> consulta
+
+    def sql(self, version_foto='foto_hash'):
+        """Consulta con la expresión de versión de la foto indicada"""
+        if version_foto not in self._sql:
+            extra = ''.join(f', {c}' for c in self.campos_personal)
+            self._sql[version_foto] = f"""
+                SELECT p.apellido_nombre, p.foto_version{''.join(f', p.{c}' for c in self.campos_personal)},
+                       {', '.join(f't.{c}' for c in self.columnas)}
+                FROM (SELECT legajo, apellido_nombre, {version_foto} AS foto_version{extra}
+                      FROM personal WHERE legajo = %s LIMIT 1) p
+                LEFT JOIN {self.tabla} t ON t.legajo = p.legajo
+                ORDER BY {', '.join(f't.{o.strip()}' for o in self.orden.split(','))}
+            """
+        return self._sql[version_foto]
+
+    def leer(self, cursor, legajo):
+        """
+        Ejecutar la consulta con un cursor abierto (tuplas o diccionarios).
+
+        Returns:
+            ResumenEmpleado, o None si el legajo no existe. Los registros son
+            diccionarios por nombre de columna.
+        """
+        cursor.execute(self.sql(expresion_version_foto()), (legajo,))
+        filas = cursor.fetchall()
+        if not filas:
+            return None
+
+        indice_clave = self._inicio + self.columnas.index(self.clave)
+        registros = []
+        for fila in filas:
+            if isinstance(fila, dict):
+                fila = tuple(fila.values())
+            if fila[indice_clave] is None:
+                continue  # Empleado sin registros en el módulo (fila del LEFT JOIN)
+            registros.append(dict(zip(self.columnas, fila[self._inicio:])))
+
+        primera = filas[0]
+        if isinstance(primera, dict):
+            primera = tuple(primera.values())
+        personal = dict(zip(self.campos_personal, primera[2:self._inicio]))
+        return ResumenEmpleado(legajo, primera[0], primera[1], registros, personal)
+
+
+def expresion_version_foto():
+    """
+    Columna a seleccionar como versión de la foto: personal.foto_hash si la
+    migración personal v1 ya se verificó en este proceso, si no la versión
+    provisoria. Las búsquedas nunca disparan la migración (reconstruye la
+    tabla); la corre el arranque del menú principal.
+    """
+    if get_mantenimiento().esquema_listo('personal'):
+        return 'foto_hash'
+    return VERSION_FOTO_PROVISORIA
@@ -0,0 +1,86 @@
+import io
+import os
+import re
+import base64
+import shutil
+import tempfile
+
+from PIL import Image
+
+
+def decodificar_imagen(datos):
+    """
+    Decodificar una imagen desde bytes (p. ej. el BLOB personal.foto) sin tocar el disco.
+    La imagen queda cargada por completo, por lo que el buffer puede liberarse.
+    """
+    with Image.open(io.BytesIO(datos)) as imagen:
+        imagen.load()
+        return imagen.copy()
+
+
+def imagen_a_bytes(imagen, formato='PNG', **opciones):
+    """Serializar una imagen PIL a bytes en memoria"""
+    buffer = io.BytesIO()
+    imagen.save(buffer, format=formato, **opciones)
+    return buffer.getvalue()
+
+
+def imagen_a_data_uri(imagen, formato='JPEG', **opciones):
+    """Convertir una imagen PIL en un data URI (lo acepta WeasyPrint como src de <img>)"""
+    if formato.upper() == 'JPEG' and imagen.mode not in ('RGB', 'L'):
+        imagen = imagen.convert('RGB')
+    datos = base64.b64encode(imagen_a_bytes(imagen, formato, **opciones)).decode('ascii')
+    return f"data:image/{formato.lower()};base64,{datos}"
+
+
+# Carpeta propia de la aplicación dentro del temporal del sistema
+DIRECTORIO_TEMPORAL = os.path.join(tempfile.gettempdir(), "rrhh_temporales")
+
+# Carpeta y nombres que usaban versiones anteriores (modulo_personal)
+CARPETA_HEREDADA = os.path.join(tempfile.gettempdir(), "personal_images")
+PATRON_HEREDADO = re.compile(r"temp_(rotated|\d+)\.png")
+
+
+def _es_del_usuario(ruta):
+    """En sistemas con dueños por usuario, solo se toca lo propio"""
+    if not hasattr(os, "getuid"):
+        return True
+    try:
+        return os.lstat(ruta).st_uid == os.getuid()
+    except OSError:
+        return False
+
+
+def limpiar_temporales_heredados():
+    """
+    Eliminar los temporales de fotos que creó la aplicación: su carpeta
+    propia y, en personal_images, solo los archivos con los nombres que
+    usaba modulo_personal. La carpeta heredada se borra si queda vacía.
+    Los directorios tmp* de tempfile.mkdtemp() no se tocan: no hay forma
+    de saber si son de esta aplicación.
+    """
+    eliminados = 0
+
+    if os.path.isdir(DIRECTORIO_TEMPORAL) and _es_del_usuario(DIRECTORIO_TEMPORAL):
+        shutil.rmtree(DIRECTORIO_TEMPORAL, ignore_errors=True)
+        eliminados += 1
+
+    try:
+        nombres = os.listdir(CARPETA_HEREDADA)
+    except OSError:
+        return eliminados
+    for nombre in nombres:
+        ruta = os.path.join(CARPETA_HEREDADA, nombre)
+        if not PATRON_HEREDADO.fullmatch(nombre) or not os.path.isfile(ruta) or not _es_del_usuario(ruta):
+            continue
+        try:
+            os.remove(ruta)
+            eliminados += 1
+        except OSError:
+            continue
+    try:
+        os.rmdir(CARPETA_HEREDADA)
+    except OSError:
+        pass
+
+    return eliminados
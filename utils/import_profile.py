@@ -0,0 +1,181 @@
+import os
+import sys
+import json
+import time
+import subprocess
+
+from utils.load_telemetry import get_load_telemetry
+from utils.module_registry import MODULOS
+
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RUTA_PERFIL = os.path.join("logs", "perfil_importacion.json")
+
+# Una importación es regresión si tarda más que la anterior por encima de
+# ambos umbrales (relativo y absoluto), para no alertar por ruido de medición
+UMBRAL_REGRESION = 0.20
+UMBRAL_REGRESION_SEGUNDOS = 0.05
+
+
+def _parsear_importtime(salida):
+    """
+    Parsear la salida de ``python -X importtime``.
+
+    Devuelve una lista de (paquete, propio, acumulado, nivel) en segundos, en
+    el orden en que Python terminó de importar cada uno.
+    """
+    entradas = []
+    for linea in salida.splitlines():
+        if not linea.startswith("import time:") or "[us]" in linea:
+            continue
+        try:
+            propio, acumulado, columna = linea.split(":", 1)[1].split("|", 2)
+            propio, acumulado = int(propio), int(acumulado)
+        except ValueError:
+            continue
+        nombre = columna.strip()
+        nivel = (len(columna) - len(columna.lstrip()) - 1) // 2
+        entradas.append((nombre, propio / 1e6, acumulado / 1e6, nivel))
+    return entradas
+
+
+def perfilar_importacion(modulo, python=None, timeout=120):
+    """
+    Medir en un proceso nuevo (arranque en frío) la importación de un módulo.
+
+    Returns:
+        dict con el total acumulado, las dependencias más pesadas de primer
+        nivel y el error si la importación falló
+    """
+    comando = [python or sys.executable, "-X", "importtime", "-c", f"import {modulo}"]
+    entorno = dict(os.environ, PYTHONPATH=os.pathsep.join(
+        filter(None, [BASE_DIR, os.environ.get("PYTHONPATH")])
+    ))
+    resultado = {'modulo': modulo, 'total': None, 'dependencias': [], 'error': None}
+    try:
+        proceso = subprocess.run(
+            comando, cwd=BASE_DIR, env=entorno, capture_output=True,
+            text=True, encoding="utf-8", errors="replace", timeout=timeout
+        )
+    except Exception as e:
+        resultado['error'] = str(e)
+        return resultado
+
+    entradas = _parsear_importtime(proceso.stderr)
+    if proceso.returncode != 0:
+        ultima = proceso.stderr.strip().splitlines()[-1:] or ["sin salida"]
+        resultado['error'] = ultima[0]
+
+    indice = next((i for i in range(len(entradas) - 1, -1, -1) if entradas[i][0] == modulo), None)
+    if indice is None:
+        return resultado
+    resultado['total'] = entradas[indice][2]
+
+    # Dependencias directas: Python imprime los hijos antes que el padre y con
+    # un nivel más de sangría (lo anterior es el arranque del intérprete)
+    nivel_modulo = entradas[indice][3]
+    directas = []
+    for nombre, propio, acumulado, nivel in reversed(entradas[:indice]):
+        if nivel <= nivel_modulo:
+            break
+        if nivel == nivel_modulo + 1:
+            directas.append((nombre, propio, acumulado))
+    directas.sort(key=lambda e: -e[2])
+    resultado['dependencias'] = [
+        {'paquete': n, 'propio': round(p, 4), 'acumulado': round(a, 4)} for n, p, a in directas[:8]
+    ]
+    return resultado
+
+
+def perfil_arranque(modulos=None):
+    """
+    Perfil de importación del arranque: el menú principal solo y cada módulo
+    del registro por separado, cada uno en un proceso nuevo.
+    """
+    if modulos is None:
+        modulos = {"Menú principal": "main_menu"}
+        modulos.update({nombre: ruta for nombre, (ruta, _) in MODULOS.items()})
+
+    perfil = {'fecha': time.strftime("%Y-%m-%d %H:%M:%S"), 'python': sys.version.split()[0], 'modulos': {}}
+    for nombre, ruta in modulos.items():
+        perfil['modulos'][nombre] = perfilar_importacion(ruta)
+    return perfil
+
+
+def _leer_perfil_anterior(ruta):
+    try:
+        with open(ruta, encoding="utf-8") as archivo:
+            return json.load(archivo)
+    except (OSError, ValueError):
+        return None
+
+
+def comparar_perfiles(actual, anterior):
+    """Regresiones de tiempo total respecto del perfil anterior"""
+    regresiones = []
+    if not anterior:
+        return regresiones
+    for nombre, datos in actual['modulos'].items():
+        previo = anterior.get('modulos', {}).get(nombre, {}).get('total')
+        total = datos.get('total')
+        if previo is None or total is None:
+            continue
+        diferencia = total - previo
+        if diferencia > UMBRAL_REGRESION_SEGUNDOS and diferencia > previo * UMBRAL_REGRESION:
+            regresiones.append({'modulo': nombre, 'anterior': previo, 'actual': total})
+    return regresiones
+
+
+def formatear_reporte(perfil, regresiones=()):
+    """Texto legible del perfil, una línea por módulo con sus dependencias más pesadas"""
+    lineas = [f"Perfil de importación ({perfil['fecha']}, Python {perfil['python']})"]
+    for nombre, datos in sorted(perfil['modulos'].items(), key=lambda i: -(i[1]['total'] or 0)):
+        if datos['total'] is None:
+            lineas.append(f"  {nombre}: sin medición ({datos['error']})")
+            continue
+        pesadas = ", ".join(
+            f"{d['paquete']} {d['acumulado']:.3f}s" for d in datos['dependencias'][:4]
+        )
+        lineas.append(f"  {nombre}: {datos['total']:.3f}s" + (f" [{pesadas}]" if pesadas else ""))
+        if datos['error']:
+            lineas.append(f"    ⚠️ {datos['error']}")
+    for regresion in regresiones:
+        lineas.append(
+            f"  ⚠️ Regresión en {regresion['modulo']}: "
+            f"{regresion['anterior']:.3f}s → {regresion['actual']:.3f}s"
+        )
+    return "\n".join(lineas)
+
+
+def diagnostico_arranque(ruta=RUTA_PERFIL):
+    """
+    Medir el perfil de importación, compararlo con el de la corrida anterior
+    y dejar el resultado en logs/carga_modulos.log y en ``ruta`` (JSON).
+    """
+    logger = get_load_telemetry().logger
+    perfil = perfil_arranque()
+    regresiones = comparar_perfiles(perfil, _leer_perfil_anterior(ruta))
+    perfil['regresiones'] = regresiones
+
+    reporte = formatear_reporte(perfil, regresiones)
+    for linea in reporte.splitlines():
+        logger.info(linea)
+    try:
+        os.makedirs(os.path.dirname(ruta), exist_ok=True)
+        with open(ruta, "w", encoding="utf-8") as archivo:
+            json.dump(perfil, archivo, ensure_ascii=False, indent=2)
+    except OSError as e:
+        logger.warning("No se pudo guardar el perfil de importación: %s", e)
+    print(reporte)
+    return perfil
+
+
+def diagnostico_solicitado(argv=None):
+    """El diagnóstico se pide con --perfil-importacion o RRHH_PERFIL_IMPORTACION=1"""
+    argv = sys.argv if argv is None else argv
+    return "--perfil-importacion" in argv or os.getenv("RRHH_PERFIL_IMPORTACION") == "1"
+
+
+if __name__ == "__main__":
+    # python -m utils.import_profile
+    diagnostico_arranque()
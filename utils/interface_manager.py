@@ -25,11 +25,11 @@ class InterfaceManager:
                     if hasattr(self.root, 'winfo_exists') and self.root.winfo_exists():
                         update_func(*args, **kwargs)
                 except Exception as e:
-                    self.logger.error(f"Error updating widget {widget_id}: {e}")
+                    self.logger.error("Error updating widget %s: %s", widget_id, e)
 
             self.root.after(10, safe_update)
         except Exception as e:
-            self.logger.error(f"Error scheduling update: {e}")
+            self.logger.error("Error scheduling update: %s", e)
 
     def register_callback(self, event_type: str, callback: Callable):
         """
@@ -48,7 +48,7 @@ class InterfaceManager:
                 try:
                     self.schedule_update(event_type, callback, *args, **kwargs)
                 except Exception as e:
-                    self.logger.error(f"Error triggering callback: {e}")
+                    self.logger.error("Error triggering callback: %s", e)
 
     def create_loading_overlay(self) -> tuple:
         """
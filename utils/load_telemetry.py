@@ -0,0 +1,143 @@
+import time
+import threading
+from contextlib import contextmanager
+
+from utils.log_config import get_logger
+
+
+ETAPAS = ('importacion', 'construccion', 'primeros_datos', 'primer_pintado')
+NOMBRES_ETAPAS = {
+    'importacion': 'importación',
+    'construccion': 'construcción',
+    'primeros_datos': 'primeros datos',
+    'primer_pintado': 'primer pintado'
+}
+
+
+def _crear_logger():
+    """Logger de tiempos de carga, con su propio archivo rotativo en logs/"""
+    return get_logger("carga_modulos", "carga_modulos.log", max_mb=2, copias=3)
+
+
+class MedicionCarga:
+    """
+    Tiempos de una carga de módulo, medidos desde que el usuario lo pidió.
+    Las etapas se marcan una sola vez; la medición se registra en el log al
+    tener primer pintado y primeros datos, o al llamar a finalizar().
+    """
+    def __init__(self, telemetria, modulo, origen):
+        self.telemetria = telemetria
+        self.modulo = modulo
+        self.origen = origen  # 'nuevo' o 'cache'
+        self.inicio = time.perf_counter()
+        self.etapas = {}
+        self.finalizada = False
+
+    def marcar(self, etapa):
+        """Registrar el tiempo transcurrido hasta la etapa (solo la primera vez)"""
+        with self.telemetria._lock:
+            if self.finalizada or etapa in self.etapas:
+                return
+            self.etapas[etapa] = time.perf_counter() - self.inicio
+            completa = 'primer_pintado' in self.etapas and 'primeros_datos' in self.etapas
+        if completa:
+            self.finalizar()
+
+    def finalizar(self):
+        """Cerrar la medición y escribirla en el log"""
+        with self.telemetria._lock:
+            if self.finalizada:
+                return
+            self.finalizada = True
+            if self.telemetria._activa is self:
+                self.telemetria._activa = None
+            self.telemetria._historial.setdefault(self.modulo, []).append(dict(self.etapas))
+        self.telemetria._registrar(self)
+
+    def resumen(self):
+        partes = [
+            f"{NOMBRES_ETAPAS[etapa]} {self.etapas[etapa]:.3f}s"
+            for etapa in ETAPAS if etapa in self.etapas
+        ]
+        return f"Carga {self.modulo} ({self.origen}): " + (" · ".join(partes) or "sin etapas")
+
+
+class LoadTelemetry:
+    """
+    Telemetría de carga de módulos: importación, construcción, primeros datos
+    (primera consulta a la base terminada) y primer pintado, por módulo.
+    Hay una sola medición activa a la vez, que es la del módulo en pantalla.
+    """
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self):
+        self.logger = _crear_logger()
+        self._lock = threading.Lock()
+        self._importaciones = {}
+        self._activa = None
+        self._historial = {}
+
+    @classmethod
+    def get_instance(cls):
+        """Obtener la telemetría compartida del proceso"""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    @contextmanager
+    def medir_importacion(self, modulo):
+        """Medir el tiempo de importación de un módulo (bloque with)"""
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            duracion = time.perf_counter() - inicio
+            with self._lock:
+                self._importaciones[modulo] = duracion
+                # Los módulos se importan al abrirlos: si es el que se está
+                # cargando, la importación forma parte de esta carga
+                activa = self._activa
+                if activa is not None and activa.modulo == modulo and not activa.finalizada:
+                    activa.etapas.setdefault('importacion', duracion)
+            self.logger.info("Importación %s: %.3fs", modulo, duracion)
+
+    def tiempo_importacion(self, modulo):
+        return self._importaciones.get(modulo)
+
+    def iniciar(self, modulo, origen='nuevo'):
+        """Comenzar la medición de una carga; cierra la anterior si seguía abierta"""
+        with self._lock:
+            anterior = self._activa
+        if anterior is not None:
+            anterior.finalizar()
+        medicion = MedicionCarga(self, modulo, origen)
+        with self._lock:
+            self._activa = medicion
+        return medicion
+
+    def _registrar(self, medicion):
+        self.logger.info(medicion.resumen())
+
+    def resumen(self):
+        """Promedio y máximo de cada etapa por módulo"""
+        with self._lock:
+            historial = {modulo: list(cargas) for modulo, cargas in self._historial.items()}
+        resultado = {}
+        for modulo, cargas in historial.items():
+            resultado[modulo] = {'cargas': len(cargas)}
+            for etapa in ETAPAS:
+                valores = [carga[etapa] for carga in cargas if etapa in carga]
+                if valores:
+                    resultado[modulo][etapa] = {
+                        'promedio': sum(valores) / len(valores),
+                        'maximo': max(valores)
+                    }
+        return resultado
+
+
+def get_load_telemetry():
+    """Acceso a la telemetría de carga compartida del proceso"""
+    return LoadTelemetry.get_instance()
+
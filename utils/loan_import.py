@@ -0,0 +1,281 @@
+import csv
+import logging
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+
+from utils.loan_schedule import plan_cuotas, insertar_cuotas
+from utils.loan_portfolio import registrar_en_cartera
+
+
+COLUMNAS_CSV = ('legajo', 'monto_total', 'cuotas', 'fecha_inicio', 'fecha_ultima_cuota', 'motivo', 'estado')
+COLUMNAS_OBLIGATORIAS = ('legajo', 'monto_total', 'cuotas', 'fecha_inicio', 'estado')
+COLUMNAS_REPORTE = ('linea', 'legajo', 'campo', 'error')
+
+# Los préstamos de un lote van en un solo INSERT de varias filas (executemany).
+# Es un "simple insert" (cantidad de filas conocida): con
+# innodb_autoinc_lock_mode <= 1 InnoDB le reserva ids consecutivos desde
+# LAST_INSERT_ID(). Como eso depende de la configuración del servidor, el
+# rango se verifica contra lo grabado antes de generar las cuotas: si otro
+# puesto se intercaló, el lote se revierte y va al reporte de errores.
+SQL_PRESTAMOS = """
+    INSERT INTO prestamos (legajo, monto_total, cuotas, fecha_inicio, motivo)
+    VALUES (%s, %s, %s, %s, %s)
+"""
+
+SQL_VERIFICAR_IDS = """
+    SELECT id_prestamos, legajo, cuotas, fecha_inicio
+    FROM prestamos
+    WHERE id_prestamos BETWEEN %s AND %s
+    ORDER BY id_prestamos
+"""
+
+
+class ErrorFila(Exception):
+    """Dato inválido en una fila del CSV"""
+    def __init__(self, campo, mensaje):
+        super().__init__(mensaje)
+        self.campo = campo
+
+
+def _fecha(valor, campo):
+    try:
+        return datetime.strptime(valor.strip(), '%Y-%m-%d').date()
+    except ValueError:
+        raise ErrorFila(campo, f"Fecha inválida '{valor}' (formato AAAA-MM-DD)")
+
+
+def normalizar_legajo(valor):
+    """
+    Legajo como entero, igual que lo compara la columna de la base
+    ('007', '7.0' y ' 7 ' son el legajo 7).
+    """
+    try:
+        numero = Decimal(str(valor).strip())
+    except InvalidOperation:
+        raise ErrorFila('legajo', f"Legajo inválido '{valor}'")
+    if not numero.is_finite() or numero != numero.to_integral_value():
+        raise ErrorFila('legajo', f"Legajo inválido '{valor}'")
+    return int(numero)
+
+
+def validar_fila(fila, legajos):
+    """
+    Convertir y validar una fila del CSV.
+
+    Args:
+        fila: diccionario de csv.DictReader
+        legajos: legajos existentes en personal (normalizar_legajo)
+
+    Returns:
+        (legajo, monto_total, cuotas, fecha_inicio, fecha_ultima_cuota, motivo, pagado)
+    """
+    for campo in COLUMNAS_OBLIGATORIAS:
+        if not (fila.get(campo) or '').strip():
+            raise ErrorFila(campo, "Campo obligatorio vacío")
+
+    legajo = normalizar_legajo(fila['legajo'])
+    if legajo not in legajos:
+        raise ErrorFila('legajo', f"Legajo {legajo} no existe")
+
+    try:
+        monto_total = Decimal(fila['monto_total'].strip())
+    except InvalidOperation:
+        raise ErrorFila('monto_total', f"Monto inválido '{fila['monto_total']}'")
+    if not monto_total.is_finite() or monto_total <= 0:
+        raise ErrorFila('monto_total', "El monto debe ser mayor a cero")
+    if monto_total != monto_total.quantize(Decimal('0.01')):
+        raise ErrorFila('monto_total', "El monto no puede tener más de dos decimales")
+
+    try:
+        cuotas = int(fila['cuotas'].strip())
+    except ValueError:
+        raise ErrorFila('cuotas', f"Cantidad de cuotas inválida '{fila['cuotas']}'")
+    if cuotas <= 0:
+        raise ErrorFila('cuotas', "La cantidad de cuotas debe ser mayor a cero")
+
+    fecha_inicio = _fecha(fila['fecha_inicio'], 'fecha_inicio')
+
+    estado = fila['estado'].strip().lower()
+    if estado not in ('pagado', 'pendiente'):
+        raise ErrorFila('estado', f"Estado inválido '{fila['estado']}' (Pagado o Pendiente)")
+    pagado = estado == 'pagado'
+
+    fecha_ultima_cuota = None
+    if (fila.get('fecha_ultima_cuota') or '').strip():
+        fecha_ultima_cuota = _fecha(fila['fecha_ultima_cuota'], 'fecha_ultima_cuota')
+    elif pagado:
+        raise ErrorFila('fecha_ultima_cuota', "Un préstamo pagado necesita la fecha de la última cuota")
+    if fecha_ultima_cuota and fecha_ultima_cuota < fecha_inicio:
+        raise ErrorFila('fecha_ultima_cuota', "La última cuota es anterior a la fecha de inicio")
+
+    motivo = (fila.get('motivo') or '').strip()
+    return legajo, monto_total, cuotas, fecha_inicio, fecha_ultima_cuota, motivo, pagado
+
+
+class ResultadoImportacion:
+    """Totales de una importación y errores por fila (para el reporte)"""
+    def __init__(self, simulacion=False):
+        self.simulacion = simulacion
+        self.filas = 0
+        self.prestamos = 0
+        self.cuotas = 0
+        self.errores = []
+
+    def agregar_error(self, linea, legajo, campo, error):
+        self.errores.append({'linea': linea, 'legajo': legajo, 'campo': campo, 'error': error})
+
+    def guardar_errores(self, ruta):
+        """Reporte de errores en CSV (una fila por error, columnas fijas)"""
+        with open(ruta, 'w', newline='', encoding='utf-8') as archivo:
+            writer = csv.DictWriter(archivo, fieldnames=COLUMNAS_REPORTE)
+            writer.writeheader()
+            writer.writerows(self.errores)
+
+    def resumen(self):
+        if self.simulacion:
+            texto = (f"Simulación (no se grabó nada)\n"
+                     f"Filas leídas: {self.filas}\n"
+                     f"Préstamos válidos: {self.prestamos}\n"
+                     f"Cuotas a generar: {self.cuotas}\n")
+        else:
+            texto = (f"Filas leídas: {self.filas}\n"
+                     f"Préstamos importados: {self.prestamos}\n"
+                     f"Cuotas generadas: {self.cuotas}\n")
+        if self.errores:
+            texto += f"Filas con errores: {len(self.errores)}\n"
+        return texto
+
+
+class ImportadorPrestamos:
+    """
+    Importación masiva de préstamos históricos desde CSV.
+
+    El archivo se lee en streaming y se valida contra los legajos de
+    personal, leídos una sola vez. Por lote, los préstamos y todas sus
+    cuotas (utils.loan_schedule) se insertan con una sentencia cada uno
+    dentro de una transacción.
+    Si un lote falla se revierte completo y sus filas van al reporte de
+    errores; los demás lotes siguen.
+
+    Corre en un hilo de trabajo con una conexión del pool (no en el de Tk).
+    """
+    def __init__(self, db, tamanio_lote=1000, simulacion=False, progreso=None):
+        """
+        Args:
+            db: conexión (se usa y se deja abierta; la cierra quien la pidió)
+            tamanio_lote: filas por transacción
+            simulacion: validar y contar sin grabar nada
+            progreso: progreso(filas_leidas) después de cada lote
+        """
+        self.db = db
+        self.tamanio_lote = tamanio_lote
+        self.simulacion = simulacion
+        self.progreso = progreso
+        self.logger = logging.getLogger(__name__)
+
+    def _leer_legajos(self):
+        cursor = self.db.cursor()
+        try:
+            cursor.execute("SELECT legajo FROM personal")
+            legajos = set()
+            for (legajo,) in cursor.fetchall():
+                try:
+                    legajos.add(normalizar_legajo(legajo))
+                except ErrorFila:
+                    continue  # Un legajo no numérico no puede coincidir con ninguna fila
+            return legajos
+        finally:
+            cursor.close()
+
+    def importar(self, ruta):
+        """
+        Importar el archivo CSV.
+
+        Returns:
+            ResultadoImportacion
+
+        Raises:
+            ValueError: si al archivo le faltan columnas obligatorias
+        """
+        resultado = ResultadoImportacion(self.simulacion)
+        legajos = self._leer_legajos()
+        cursor = self.db.cursor()
+        try:
+            with open(ruta, 'r', encoding='utf-8-sig', newline='') as archivo:
+                reader = csv.DictReader(archivo)
+                faltantes = [c for c in COLUMNAS_OBLIGATORIAS if c not in (reader.fieldnames or ())]
+                if faltantes:
+                    raise ValueError(f"Faltan columnas en el CSV: {', '.join(faltantes)}")
+
+                lote = []
+                for fila in reader:
+                    resultado.filas += 1
+                    try:
+                        registro = validar_fila(fila, legajos)
+                    except ErrorFila as e:
+                        resultado.agregar_error(reader.line_num, fila.get('legajo'), e.campo, str(e))
+                        continue
+                    lote.append((reader.line_num,) + registro)
+                    if len(lote) >= self.tamanio_lote:
+                        self._procesar_lote(cursor, lote, resultado)
+                        lote = []
+                if lote:
+                    self._procesar_lote(cursor, lote, resultado)
+        finally:
+            cursor.close()
+
+        self.logger.info(
+            "Importación de préstamos%s: %s filas, %s préstamos, %s cuotas, %s errores",
+            " (simulación)" if self.simulacion else "", resultado.filas,
+            resultado.prestamos, resultado.cuotas, len(resultado.errores)
+        )
+        return resultado
+
+    def _procesar_lote(self, cursor, lote, resultado):
+        cuotas = sum(registro[3] for registro in lote)
+        if self.simulacion:
+            resultado.prestamos += len(lote)
+            resultado.cuotas += cuotas
+        else:
+            try:
+                self._grabar_lote(cursor, lote)
+                resultado.prestamos += len(lote)
+                resultado.cuotas += cuotas
+            except Exception as e:
+                self.db.rollback()
+                self.logger.error("Lote de %s préstamos revertido: %s", len(lote), e)
+                for registro in lote:
+                    resultado.agregar_error(registro[0], registro[1], '', f"Error de base de datos: {e}")
+        if self.progreso:
+            self.progreso(resultado.filas)
+
+    def _grabar_lote(self, cursor, lote):
+        cursor.executemany(SQL_PRESTAMOS, [
+            (legajo, monto, cuotas, inicio, motivo)
+            for linea, legajo, monto, cuotas, inicio, ultima, motivo, pagado in lote
+        ])
+        cursor.execute("SELECT LAST_INSERT_ID()")
+        primer_id = cursor.fetchone()[0]
+
+        # Cada fila del lote con su id (ver SQL_PRESTAMOS), comprobado contra lo grabado
+        ids = list(range(primer_id, primer_id + len(lote)))
+        cursor.execute(SQL_VERIFICAR_IDS, (ids[0], ids[-1]))
+        grabados = [(i, int(legajo), cuotas, inicio) for i, legajo, cuotas, inicio in cursor.fetchall()]
+        esperados = [(i, registro[1], registro[3], registro[4]) for i, registro in zip(ids, lote)]
+        if grabados != esperados:
+            raise RuntimeError("No se pudieron vincular todos los préstamos del lote con sus cuotas")
+
+        # Las cuotas de todo el lote en un solo INSERT, con el estado
+        # histórico ya resuelto en lugar de generarlas y después marcarlas
+        cuotas = []
+        for id_prestamo, (linea, legajo, monto, n_cuotas, inicio, ultima, motivo, pagado) in zip(ids, lote):
+            cuotas.extend(plan_cuotas(id_prestamo, monto, n_cuotas, inicio, ultima if pagado else None))
+        insertar_cuotas(cursor, cuotas)
+        # Resumen de cartera, en la misma transacción
+        registrar_en_cartera(
+            cursor,
+            prestamos=[(registro[4], registro[2]) for registro in lote],
+            cuotas_pendientes=[(cuota[3], cuota[2]) for cuota in cuotas if cuota[4] == 'Pendiente']
+        )
+        self.db.commit()
+
@@ -0,0 +1,195 @@
+import logging
+from datetime import date
+from decimal import Decimal
+
+
+TABLA_CARTERA = "cartera_mensual"
+TAREA_CARTERA = "cartera_mensual"
+
+# Desde/hasta cuando se reconstruye todo
+PRIMER_MES = date(1900, 1, 1)
+ULTIMO_MES = date(9999, 12, 1)
+
+SQL_CREAR_CARTERA = f"""
+    CREATE TABLE IF NOT EXISTS {TABLA_CARTERA} (
+        mes DATE NOT NULL PRIMARY KEY,
+        prestamos INT NOT NULL DEFAULT 0,
+        monto_prestado DECIMAL(14, 2) NOT NULL DEFAULT 0,
+        cuotas_pendientes INT NOT NULL DEFAULT 0,
+        monto_pendiente DECIMAL(14, 2) NOT NULL DEFAULT 0
+    )
+"""
+
+# Una fila por mes: préstamos otorgados (por fecha de inicio) y cuotas
+# pendientes (por mes de vencimiento). Los rangos usan los índices
+# prestamos(fecha_inicio) y pagos(estado, fecha_vencimiento).
+SQL_BORRAR_MESES = f"DELETE FROM {TABLA_CARTERA} WHERE mes >= %s AND mes < %s"
+
+SQL_CALCULAR_MESES = f"""
+    INSERT INTO {TABLA_CARTERA} (mes, prestamos, monto_prestado, cuotas_pendientes, monto_pendiente)
+    SELECT mes, SUM(prestamos), SUM(monto_prestado), SUM(cuotas_pendientes), SUM(monto_pendiente)
+    FROM (
+        SELECT DATE_SUB(fecha_inicio, INTERVAL DAYOFMONTH(fecha_inicio) - 1 DAY) AS mes,
+               COUNT(*) AS prestamos, SUM(monto_total) AS monto_prestado,
+               0 AS cuotas_pendientes, 0 AS monto_pendiente
+        FROM prestamos
+        WHERE fecha_inicio >= %s AND fecha_inicio < %s
+        GROUP BY mes
+        UNION ALL
+        SELECT DATE_SUB(fecha_vencimiento, INTERVAL DAYOFMONTH(fecha_vencimiento) - 1 DAY) AS mes,
+               0, 0, COUNT(*), SUM(monto_cuota)
+        FROM pagos
+        WHERE estado = 'Pendiente' AND fecha_vencimiento >= %s AND fecha_vencimiento < %s
+        GROUP BY mes
+    ) movimientos
+    GROUP BY mes
+"""
+
+# Suma (o resta) movimientos a un mes; solo bloquea la fila de ese mes
+SQL_SUMAR_MES = f"""
+    INSERT INTO {TABLA_CARTERA} (mes, prestamos, monto_prestado, cuotas_pendientes, monto_pendiente)
+    VALUES (%s, %s, %s, %s, %s)
+    ON DUPLICATE KEY UPDATE
+        prestamos = prestamos + VALUES(prestamos),
+        monto_prestado = monto_prestado + VALUES(monto_prestado),
+        cuotas_pendientes = cuotas_pendientes + VALUES(cuotas_pendientes),
+        monto_pendiente = monto_pendiente + VALUES(monto_pendiente)
+"""
+
+
+def inicio_mes(fecha):
+    return date(fecha.year, fecha.month, 1)
+
+
+def mes_siguiente(fecha):
+    if fecha.month == 12:
+        return date(fecha.year + 1, 1, 1)
+    return date(fecha.year, fecha.month + 1, 1)
+
+
+def refrescar_cartera(cursor, desde, hasta):
+    """
+    Recalcular los meses de la cartera entre dos fechas (inclusive), dentro
+    de la transacción de quien escribió préstamos o pagos de esos meses.
+
+    Returns:
+        Cantidad de meses con movimientos en el rango
+    """
+    if desde is None or hasta is None:
+        return 0
+    desde = inicio_mes(desde)
+    hasta = mes_siguiente(hasta) if hasta < ULTIMO_MES else ULTIMO_MES
+    cursor.execute(SQL_BORRAR_MESES, (desde, hasta))
+    cursor.execute(SQL_CALCULAR_MESES, (desde, hasta, desde, hasta))
+    return cursor.rowcount
+
+
+def registrar_en_cartera(cursor, prestamos=(), cuotas_pendientes=(), cuotas_pagadas=()):
+    """
+    Aplicar a la cartera lo que cambió una escritura, en su misma transacción:
+    solo se tocan las filas de los meses afectados, sin recalcularlos.
+
+    Args:
+        prestamos: (fecha_inicio, monto_total) de préstamos nuevos
+        cuotas_pendientes: (fecha_vencimiento, monto_cuota) de cuotas nuevas pendientes
+        cuotas_pagadas: (fecha_vencimiento, monto_cuota) de cuotas que pasaron a pagadas
+    """
+    meses = {}
+
+    def _sumar(fecha, indice, cantidad, monto):
+        fila = meses.setdefault(inicio_mes(fecha), [0, Decimal(0), 0, Decimal(0)])
+        fila[indice] += cantidad
+        fila[indice + 1] += Decimal(str(monto))
+
+    for fecha, monto in prestamos:
+        _sumar(fecha, 0, 1, monto)
+    for fecha, monto in cuotas_pendientes:
+        _sumar(fecha, 2, 1, monto)
+    for fecha, monto in cuotas_pagadas:
+        _sumar(fecha, 2, -1, -Decimal(str(monto)))
+
+    if meses:
+        cursor.executemany(SQL_SUMAR_MES, [(mes, *fila) for mes, fila in sorted(meses.items())])
+    return len(meses)
+
+
+def reconstruir_cartera(cursor):
+    """Recalcular la cartera completa (instalación o reparación)"""
+    cursor.execute(f"DELETE FROM {TABLA_CARTERA}")
+    cursor.execute(SQL_CALCULAR_MESES, (PRIMER_MES, ULTIMO_MES, PRIMER_MES, ULTIMO_MES))
+    return cursor.rowcount
+
+
+def refrescar_desde_marca(cursor, hoy=None):
+    """
+    Poner al día los meses que cambió el barrido de cuotas vencidas: desde
+    la marca de la cartera hasta el mes actual. Solo la llama el barrido de
+    la aplicación (el evento de MySQL hace lo mismo en SQL), que retrasa la
+    marca hasta el vencimiento más viejo que barre antes de marcar las
+    cuotas, así también se corrigen los meses anteriores a la última
+    actualización.
+    """
+    from utils.schema_maintenance import TABLA_TAREAS, SQL_MARCAR_TAREA
+
+    hoy = hoy or date.today()
+    cursor.execute(f"SELECT ultima_ejecucion FROM {TABLA_TAREAS} WHERE tarea = %s", (TAREA_CARTERA,))
+    fila = cursor.fetchone()
+    desde = fila[0] if fila else PRIMER_MES
+    meses = refrescar_cartera(cursor, min(desde, hoy), hoy)
+    cursor.execute(SQL_MARCAR_TAREA, (TAREA_CARTERA, meses))
+
+
+class ResumenCartera:
+    """
+    Indicadores de la cartera de préstamos.
+
+    No hay indicador de morosidad: el barrido diario da por pagadas las
+    cuotas vencidas (se descuentan del recibo) con fecha de pago igual al
+    vencimiento, así que en pagos no quedan cuotas impagas y una cuota
+    barrida no se distingue de una pagada ese mismo día.
+    """
+    def __init__(self, meses, hoy):
+        self.hoy = hoy
+        self.meses = meses  # mes -> dict con las columnas de cartera_mensual
+        actual, siguiente = inicio_mes(hoy), mes_siguiente(hoy)
+        self.saldo_pendiente = sum(m['monto_pendiente'] for m in meses.values())
+        self.cuotas_mes = meses.get(actual, {}).get('cuotas_pendientes', 0)
+        self.monto_mes = meses.get(actual, {}).get('monto_pendiente', 0)
+        self.cuotas_mes_siguiente = meses.get(siguiente, {}).get('cuotas_pendientes', 0)
+        self.monto_mes_siguiente = meses.get(siguiente, {}).get('monto_pendiente', 0)
+
+    def desembolsos(self, ultimos=24):
+        """(mes, préstamos, monto) de los últimos meses con préstamos otorgados, del más reciente al más viejo"""
+        filas = [
+            (mes, datos['prestamos'], datos['monto_prestado'])
+            for mes, datos in self.meses.items()
+            if datos['prestamos'] and mes <= self.hoy
+        ]
+        filas.sort(reverse=True)
+        return filas[:ultimos]
+
+
+def leer_cartera(db=None):
+    """
+    Leer los indicadores de la cartera desde la tabla resumen (pocas
+    filas por año de historia, sin recorrer prestamos ni pagos).
+
+    Es solo lectura: la tabla la mantienen las altas y pagos (con
+    registrar_en_cartera) y el barrido diario de cuotas vencidas. El
+    esquema lo instala el módulo de préstamos al abrirse.
+    """
+    from utils.db_pool import get_pool
+
+    propia = db is None
+    db = db or get_pool().get_connection()
+    try:
+        cursor = db.cursor(dictionary=True)
+        cursor.execute(f"SELECT mes, prestamos, monto_prestado, cuotas_pendientes, monto_pendiente FROM {TABLA_CARTERA}")
+        meses = {fila['mes']: fila for fila in cursor.fetchall()}
+        cursor.close()
+    finally:
+        if propia:
+            db.close()
+
+    logging.getLogger(__name__).debug("Cartera leída: %s meses", len(meses))
+    return ResumenCartera(meses, date.today())
@@ -0,0 +1,141 @@
+import calendar
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation, ROUND_DOWN
+
+
+CENTAVO = Decimal('0.01')
+
+SQL_INSERTAR_CUOTAS = """
+    INSERT INTO pagos (id_prestamos, numero_cuota, monto_cuota, fecha_vencimiento, estado, fecha_pago)
+    VALUES (%s, %s, %s, %s, %s, %s)
+"""
+
+
+def _como_fecha(valor):
+    if isinstance(valor, datetime):
+        return valor.date()
+    if isinstance(valor, str):
+        return datetime.strptime(valor.strip(), '%Y-%m-%d').date()
+    return valor
+
+
+def sumar_meses(fecha, meses):
+    """
+    Misma fecha ``meses`` meses después, como DATE_ADD(fecha, INTERVAL n MONTH):
+    si el día no existe en el mes destino se usa el último (31/01 + 1 = 28/02).
+    Siempre se cuenta desde la fecha original, así el 31/01 vuelve a ser 31/03.
+    """
+    indice = fecha.month - 1 + meses
+    anio, mes = fecha.year + indice // 12, indice % 12 + 1
+    return date(anio, mes, min(fecha.day, calendar.monthrange(anio, mes)[1]))
+
+
+def montos_cuotas(monto_total, cuotas):
+    """
+    Dividir el total en ``cuotas`` montos con centavos exactos: cada cuota es
+    el cociente truncado al centavo y los centavos que sobran se reparten de
+    a uno en las primeras cuotas, así la suma da siempre el total.
+
+    Raises:
+        ValueError: si el total no es un monto positivo con hasta dos
+            decimales (no se redondea en silencio) o si no hay cuotas
+    """
+    try:
+        total = Decimal(str(monto_total).strip())
+    except InvalidOperation:
+        raise ValueError(f"Monto inválido '{monto_total}'")
+    if not total.is_finite() or total <= 0:
+        raise ValueError("El monto debe ser mayor a cero")
+    if total != total.quantize(CENTAVO):
+        raise ValueError(f"El monto {monto_total} tiene más de dos decimales")
+    if cuotas <= 0:
+        raise ValueError("La cantidad de cuotas debe ser mayor a cero")
+    total = total.quantize(CENTAVO)
+    base = (total / cuotas).quantize(CENTAVO, rounding=ROUND_DOWN)
+    resto = int((total - base * cuotas) / CENTAVO)
+    return [base + CENTAVO if i < resto else base for i in range(cuotas)]
+
+
+def plan_cuotas(id_prestamo, monto_total, cuotas, fecha_inicio, pagadas_hasta=None):
+    """
+    Filas de pagos de un préstamo: la cuota 1 vence en la fecha de inicio y
+    las siguientes el mismo día de cada mes.
+
+    Args:
+        pagadas_hasta: en préstamos históricos, las cuotas que vencen hasta
+            esa fecha quedan pagadas en su vencimiento
+
+    Returns:
+        Lista de (id_prestamos, numero_cuota, monto_cuota, fecha_vencimiento,
+        estado, fecha_pago), en el orden de SQL_INSERTAR_CUOTAS
+    """
+    cuotas = int(cuotas)
+    inicio = _como_fecha(fecha_inicio)
+    pagadas_hasta = _como_fecha(pagadas_hasta)
+    filas = []
+    for numero, monto in enumerate(montos_cuotas(monto_total, cuotas), start=1):
+        vencimiento = sumar_meses(inicio, numero - 1)
+        if pagadas_hasta is not None and vencimiento <= pagadas_hasta:
+            filas.append((id_prestamo, numero, monto, vencimiento, 'Pagado', vencimiento))
+        else:
+            filas.append((id_prestamo, numero, monto, vencimiento, 'Pendiente', None))
+    return filas
+
+
+def planes_cuotas(prestamos):
+    """
+    Filas de pagos de varios préstamos juntos.
+
+    Args:
+        prestamos: iterable de (id_prestamos, monto_total, cuotas,
+            fecha_inicio) o (..., pagadas_hasta)
+    """
+    filas = []
+    for prestamo in prestamos:
+        filas.extend(plan_cuotas(*prestamo))
+    return filas
+
+
+def insertar_cuotas(cursor, filas):
+    """Insertar las filas de uno o varios planes (executemany arma un solo INSERT)"""
+    if filas:
+        cursor.executemany(SQL_INSERTAR_CUOTAS, filas)
+    return len(filas)
+
+
+def pagar_cuotas(cursor, fecha_pago, id_prestamo=None, numero_cuota=None, legajo=None):
+    """
+    Marcar como pagadas las cuotas pendientes de un préstamo (todas o una)
+    o de todos los préstamos de un legajo: estado 'Pagado' y fecha_pago,
+    lo mismo que el procedimiento pagar_todas_cuotas. Es el único camino de
+    pago de la aplicación; la transacción la confirma quien llama.
+
+    Returns:
+        Lista de (fecha_vencimiento, monto_cuota) de las cuotas pagadas,
+        para descontarlas de la cartera (utils.loan_portfolio)
+    """
+    if legajo is not None:
+        condicion, parametros = "pr.legajo = %s", (legajo,)
+    elif numero_cuota is not None:
+        condicion, parametros = "p.id_prestamos = %s AND p.numero_cuota = %s", (id_prestamo, numero_cuota)
+    else:
+        condicion, parametros = "p.id_prestamos = %s", (id_prestamo,)
+
+    # Bloqueadas hasta el commit: las que se leen son las que se pagan
+    cursor.execute(f"""
+        SELECT p.fecha_vencimiento, p.monto_cuota
+        FROM pagos p
+        JOIN prestamos pr ON p.id_prestamos = pr.id_prestamos
+        WHERE {condicion} AND p.estado = 'Pendiente'
+        FOR UPDATE
+    """, parametros)
+    cuotas = cursor.fetchall()
+    if cuotas:
+        cursor.execute(f"""
+            UPDATE pagos p
+            JOIN prestamos pr ON p.id_prestamos = pr.id_prestamos
+            SET p.estado = 'Pagado',
+                p.fecha_pago = %s
+            WHERE {condicion} AND p.estado = 'Pendiente'
+        """, (fecha_pago,) + parametros)
+    return cuotas
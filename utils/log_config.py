@@ -0,0 +1,183 @@
+import os
+import json
+import queue
+import atexit
+import logging
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+
+LOG_DIR = "logs"
+ARCHIVO_GENERAL = "rrhh.log"
+FORMATO = '%(asctime)s - [%(levelname)s] - %(name)s - Línea %(lineno)d: %(message)s'
+FORMATO_FECHA = '%Y-%m-%d %H:%M:%S'
+
+_lock = threading.Lock()
+_estado = {'listener': None, 'despachador': None, 'cola': None, 'formato': None}
+
+
+def _activado(variable):
+    return os.getenv(variable, '').strip().lower() in ('1', 'true', 'si', 'sí', 'yes')
+
+
+class FormatoJSON(logging.Formatter):
+    """Una línea JSON por registro, para procesar los logs con herramientas"""
+    def format(self, record):
+        datos = {
+            'fecha': self.formatTime(record, FORMATO_FECHA),
+            'nivel': record.levelname,
+            'logger': record.name,
+            'linea': record.lineno,
+            'hilo': record.threadName,
+            'mensaje': record.getMessage()
+        }
+        if record.exc_info:
+            datos['excepcion'] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            datos['excepcion'] = record.exc_text
+        return json.dumps(datos, ensure_ascii=False, default=str)
+
+
+class _Despachador(logging.Handler):
+    """
+    Handler que atiende el QueueListener: reparte cada registro entre el
+    archivo general y los archivos de cada módulo (por prefijo del nombre
+    del logger). Los destinos se pueden agregar con el listener andando.
+    """
+    def __init__(self):
+        super().__init__()
+        self._destinos = []  # (prefijo o None, handler)
+        self._lock_destinos = threading.Lock()
+
+    def agregar(self, handler, prefijo=None):
+        with self._lock_destinos:
+            self._destinos = self._destinos + [(prefijo, handler)]
+
+    def tiene(self, nombre_handler):
+        return any(h.get_name() == nombre_handler for _, h in self._destinos)
+
+    def emit(self, record):
+        for prefijo, handler in self._destinos:
+            if prefijo and record.name != prefijo and not record.name.startswith(prefijo + '.'):
+                continue
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+    def close(self):
+        for _, handler in self._destinos:
+            handler.close()
+        super().close()
+
+
+class _ManejadorCola(QueueHandler):
+    """
+    Encola el registro ya resuelto (mensaje con sus argumentos, traza de la
+    excepción) pero sin darle formato final: eso lo hace el hilo del
+    listener con el formato de cada destino.
+    """
+    def prepare(self, record):
+        record = logging.makeLogRecord(record.__dict__)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def _archivo_rotativo(archivo, max_mb=5, copias=5):
+    os.makedirs(LOG_DIR, exist_ok=True)
+    handler = RotatingFileHandler(
+        filename=os.path.join(LOG_DIR, archivo),
+        maxBytes=max_mb * 1024 * 1024,
+        backupCount=copias,
+        encoding='utf-8'
+    )
+    handler.set_name(archivo)
+    handler.setFormatter(_estado['formato'])
+    return handler
+
+
+def configurar_logging(nivel=None, formato_json=None, consola=None):
+    """
+    Configurar el logging de toda la aplicación (una sola vez por proceso).
+
+    Los loggers escriben en una cola y un hilo aparte (QueueListener) hace la
+    escritura a disco, así un log en el hilo de Tk no espera al archivo.
+
+    Args:
+        nivel: nivel mínimo; por defecto RRHH_LOG_LEVEL o INFO
+        formato_json: una línea JSON por registro; por defecto RRHH_LOG_JSON
+        consola: copiar los registros a la consola; por defecto RRHH_LOG_CONSOLA
+    """
+    with _lock:
+        if _estado['listener'] is not None:
+            return
+
+        nivel = nivel or os.getenv('RRHH_LOG_LEVEL', 'INFO')
+        if isinstance(nivel, str):
+            nivel = logging.getLevelName(nivel.strip().upper())
+            if not isinstance(nivel, int):
+                nivel = logging.INFO
+        if formato_json is None:
+            formato_json = _activado('RRHH_LOG_JSON')
+        if consola is None:
+            consola = _activado('RRHH_LOG_CONSOLA')
+
+        _estado['formato'] = (
+            FormatoJSON() if formato_json
+            else logging.Formatter(FORMATO, datefmt=FORMATO_FECHA)
+        )
+
+        despachador = _Despachador()
+        despachador.agregar(_archivo_rotativo(ARCHIVO_GENERAL))
+        if consola:
+            consola_handler = logging.StreamHandler()
+            consola_handler.setFormatter(_estado['formato'])
+            despachador.agregar(consola_handler)
+
+        cola = queue.SimpleQueue()
+        listener = QueueListener(cola, despachador, respect_handler_level=False)
+
+        raiz = logging.getLogger()
+        raiz.setLevel(nivel)
+        _estado['cola'] = _ManejadorCola(cola)
+        raiz.addHandler(_estado['cola'])
+        # Las librerías no necesitan su nivel DEBUG aunque la aplicación sí
+        for ruidoso in ('PIL', 'mysql.connector', 'urllib3'):
+            logging.getLogger(ruidoso).setLevel(max(nivel, logging.INFO))
+
+        listener.start()
+        _estado['listener'] = listener
+        _estado['despachador'] = despachador
+        atexit.register(detener_logging)
+
+
+def get_logger(nombre, archivo=None, max_mb=5, copias=5):
+    """
+    Obtener un logger de la aplicación.
+
+    Args:
+        nombre: nombre del logger (normalmente __name__)
+        archivo: archivo propio en logs/ para este logger, además del
+            general; se agrega una sola vez aunque el módulo se instancie
+            muchas veces
+    """
+    configurar_logging()
+    if archivo:
+        with _lock:
+            despachador = _estado['despachador']
+            if not despachador.tiene(archivo):
+                despachador.agregar(_archivo_rotativo(archivo, max_mb, copias), prefijo=nombre)
+    return logging.getLogger(nombre)
+
+
+def detener_logging():
+    """Vaciar la cola y cerrar los archivos (al salir de la aplicación)"""
+    with _lock:
+        listener = _estado['listener']
+        _estado['listener'] = None
+    if listener is not None:
+        logging.getLogger().removeHandler(_estado['cola'])
+        listener.stop()
+        _estado['despachador'].close()
@@ -0,0 +1,147 @@
+import sys
+import types
+import logging
+import threading
+import tkinter as tk
+from concurrent.futures import Executor
+
+from PIL import Image
+
+from utils.thread_manager import ThreadManager, DatabasePool
+
+
+# Objetos que no se recorren al estimar la memoria de un módulo: widgets
+# (su memoria es de Tk y se libera al destruirlos), código y recursos
+# compartidos del proceso
+_NO_RECORRER = (
+    tk.Misc, tk.Variable, types.ModuleType, type, types.FunctionType,
+    types.MethodType, types.BuiltinFunctionType, logging.Logger,
+    threading.Thread, Executor, ThreadManager, DatabasePool
+)
+_ATOMICOS = (str, bytes, bytearray, int, float, complex, bool, type(None))
+
+
+def estimar_memoria(objeto, limite_objetos=200000):
+    """
+    Bytes aproximados de los datos que retiene un módulo: filas cargadas,
+    cachés, imágenes PIL (ancho x alto x bandas), etc.
+
+    Recorre los atributos de la instancia y los contenedores que cuelgan de
+    ellos sin entrar en los widgets; se detiene tras ``limite_objetos``
+    objetos, por lo que en módulos muy grandes el valor es un piso.
+    """
+    vistos = set()
+    pendientes = [objeto]
+    total = 0
+    while pendientes and len(vistos) < limite_objetos:
+        actual = pendientes.pop()
+        if id(actual) in vistos:
+            continue
+        vistos.add(id(actual))
+
+        if isinstance(actual, Image.Image):
+            total += actual.width * actual.height * len(actual.getbands())
+            continue
+        if actual is not objeto and isinstance(actual, _NO_RECORRER):
+            continue
+
+        try:
+            total += sys.getsizeof(actual)
+        except TypeError:
+            continue
+        if isinstance(actual, _ATOMICOS):
+            continue
+
+        if isinstance(actual, dict):
+            pendientes.extend(actual.keys())
+            pendientes.extend(actual.values())
+        elif isinstance(actual, (list, tuple, set, frozenset)):
+            pendientes.extend(actual)
+        elif hasattr(actual, '__dict__'):
+            try:
+                pendientes.extend(vars(actual).values())
+            except TypeError:
+                pass
+        elif hasattr(actual, '__iter__') and hasattr(actual, '__len__'):
+            # deque, Queue.queue y otros contenedores sin __dict__
+            try:
+                pendientes.extend(list(actual))
+            except Exception:
+                pass
+    return total
+
+
+class CicloVidaModulos:
+    """
+    Suspensión, reanudación y liberación de los módulos del menú.
+
+    Un módulo oculto se suspende: se marca ``_suspendido`` (los bucles de
+    animación del logo y de sondeo lo consultan y dejan de reprogramarse), se
+    cierran los executors de sus gestores de base de datos y de hilos propios
+    (el gestor de tareas compartido de la aplicación sigue en marcha; las
+    conexiones vuelven al pool compartido) y
+    se conservan sus datos para volver a mostrarlo rápido. Al reanudarse los
+    executors se recrean solos con la primera consulta.
+
+    Un módulo puede definir suspend() y resume() para recursos propios:
+    suspend() se llama ya marcado y resume() después de desmarcarlo.
+    """
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+
+    def suspendido(self, instancia):
+        return getattr(instancia, '_suspendido', False)
+
+    def _recursos(self, instancia):
+        try:
+            atributos = list(vars(instancia).values())
+        except TypeError:
+            return []
+        return [
+            valor for valor in atributos
+            if isinstance(valor, DatabasePool)
+            or (isinstance(valor, ThreadManager) and not valor.is_shared)
+        ]
+
+    def suspender(self, instancia):
+        """Detener animaciones y liberar hilos del módulo, conservando sus datos"""
+        if instancia is None or self.suspendido(instancia):
+            return
+        instancia._suspendido = True
+
+        if hasattr(instancia, 'suspend'):
+            try:
+                instancia.suspend()
+            except Exception as e:
+                self.logger.error("Error en suspend() de %s: %s", type(instancia).__name__, e)
+
+        for recurso in self._recursos(instancia):
+            try:
+                if isinstance(recurso, ThreadManager):
+                    recurso.shutdown(wait=False)
+                else:
+                    recurso.close()
+            except Exception as e:
+                self.logger.error("Error liberando %s: %s", type(recurso).__name__, e)
+
+    def reanudar(self, instancia):
+        """Quitar la marca de suspendido antes de volver a mostrar el módulo"""
+        if instancia is None or not self.suspendido(instancia):
+            return
+        instancia._suspendido = False
+        if hasattr(instancia, 'resume'):
+            try:
+                instancia.resume()
+            except Exception as e:
+                self.logger.error("Error en resume() de %s: %s", type(instancia).__name__, e)
+
+    def liberar(self, instancia):
+        """Descartar el módulo: suspenderlo y ejecutar su cleanup()"""
+        if instancia is None:
+            return
+        self.suspender(instancia)
+        if hasattr(instancia, 'cleanup'):
+            try:
+                instancia.cleanup()
+            except Exception as e:
+                self.logger.error("Error en cleanup() de %s: %s", type(instancia).__name__, e)
@@ -0,0 +1,94 @@
+import importlib
+import logging
+import threading
+
+from utils.load_telemetry import get_load_telemetry
+
+
+# Nombre en el menú -> (módulo de Python, atributo que construye la pantalla)
+MODULOS = {
+    "Módulo Personal": ("modulos.modulo_personal", "PersonalManagementApp"),
+    "Módulo Felicitaciones": ("modulos.modulo_felicitaciones", "AplicacionFelicitaciones"),
+    "Módulo Sanciones": ("modulos.modulo_sanciones", "AplicacionSanciones"),
+    "Módulo Conceptos": ("modulos.modulo_conceptos", "AplicacionConceptos"),
+    "Módulo Préstamos": ("modulos.modulo_prestamos", "AplicacionPrestamos"),
+    "Módulo Certificados Médicos": ("modulos.modulo_certificados_medicos", "AplicacionCertificadosMedicos"),
+    "Módulo Licencias": ("modulos.modulo_licencias", "AplicacionLicencias"),
+    "Módulo ART": ("modulos.modulo_art", "AplicacionART"),
+    "Antecedentes Laborales": ("modulos.modulo_antecedentes", "crear_modulo"),
+}
+
+
+class RegistroModulos:
+    """
+    Registro perezoso de los módulos del menú.
+
+    El menú principal no importa ningún módulo al arrancar: cada uno se importa
+    la primera vez que se pide (al abrirlo o al precargarlo), registrando el
+    tiempo de importación en la telemetría de carga. Los módulos no abren
+    conexiones al importarse, así que hasta el primer uso no hay tráfico con
+    MySQL.
+    """
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, modulos=None):
+        self.modulos = dict(modulos or MODULOS)
+        self.telemetria = get_load_telemetry()
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._locks = {}
+        self._importados = {}
+
+    @classmethod
+    def get_instance(cls):
+        """Obtener el registro compartido del proceso"""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    @property
+    def nombres(self):
+        return list(self.modulos)
+
+    def _lock_de(self, nombre):
+        with self._lock:
+            return self._locks.setdefault(nombre, threading.Lock())
+
+    def importar(self, nombre):
+        """Importar (una sola vez) el módulo de Python de una entrada del menú"""
+        modulo = self._importados.get(nombre)
+        if modulo is not None:
+            return modulo
+        if nombre not in self.modulos:
+            raise ValueError(f"Módulo no reconocido: {nombre}")
+
+        # Un lock por entrada: la precarga y la apertura no importan dos veces
+        with self._lock_de(nombre):
+            modulo = self._importados.get(nombre)
+            if modulo is None:
+                ruta, _ = self.modulos[nombre]
+                with self.telemetria.medir_importacion(nombre):
+                    modulo = importlib.import_module(ruta)
+                self._importados[nombre] = modulo
+        return modulo
+
+    def obtener(self, nombre, atributo=None):
+        """
+        Clase (o función) que construye el módulo, importándolo si hace falta.
+
+        Args:
+            nombre: nombre del módulo en el menú
+            atributo: otro atributo del módulo (p. ej. una función de precarga)
+        """
+        modulo = self.importar(nombre)
+        return getattr(modulo, atributo or self.modulos[nombre][1])
+
+    def importado(self, nombre):
+        return nombre in self._importados
+
+
+def get_module_registry():
+    """Acceso al registro de módulos compartido del proceso"""
+    return RegistroModulos.get_instance()
@@ -0,0 +1,242 @@
+import os
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from PIL import Image
+
+from utils.image_utils import decodificar_imagen
+from utils.db_pool import get_pool
+
+
+def ajustar_imagen(imagen, size):
+    """Escalar una imagen (ampliando o reduciendo) para que entre en size manteniendo la proporción"""
+    ancho_max, alto_max = size
+    escala = min(ancho_max / imagen.width, alto_max / imagen.height)
+    nuevo = (max(1, int(imagen.width * escala)), max(1, int(imagen.height * escala)))
+    if imagen.mode != 'RGB':
+        imagen = imagen.convert('RGB')
+    return imagen.resize(nuevo, Image.Resampling.LANCZOS)
+
+
+def cargar_foto_db(legajo):
+    """Traer de la base solo el BLOB de la foto de un legajo"""
+    connection = get_pool().get_connection()
+    try:
+        cursor = connection.cursor()
+        cursor.execute("SELECT foto FROM personal WHERE legajo = %s", (legajo,))
+        fila = cursor.fetchone()
+        cursor.close()
+        return fila[0] if fila else None
+    finally:
+        connection.close()
+
+
+class SolicitudFoto:
+    """Pedido de miniatura en curso; cancelar() evita la descarga y el callback"""
+    def __init__(self):
+        self.cancelada = False
+        self.futuro = None
+
+    def cancelar(self):
+        self.cancelada = True
+        if self.futuro is not None:
+            self.futuro.cancel()
+
+
+class PhotoCache:
+    """
+    Caché de miniaturas de fotos de empleados, única por proceso.
+
+    Las miniaturas se guardan por (legajo, tamaño, versión) con desalojo LRU
+    acotado por bytes, de modo que al pasar de un módulo a otro con el mismo
+    empleado no se vuelva a descargar, decodificar ni redimensionar la foto.
+    La versión es la que informa la base (personal.foto_hash) cuando se
+    conoce; si no, un contador local que cambia con invalidar() (p. ej. cuando
+    el módulo de personal actualiza la foto).
+
+    Las miniaturas son imágenes PIL: el PhotoImage de Tk debe crearse en el
+    hilo de la interfaz.
+    """
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, max_bytes=None, max_workers=2):
+        self.max_bytes = max_bytes or int(float(os.getenv('PHOTO_CACHE_MB', '32')) * 1024 * 1024)
+        self.logger = logging.getLogger(__name__)
+
+        self._lock = threading.Lock()
+        self._items = OrderedDict()  # clave -> (imagen, bytes); al final las más recientes
+        self._bytes = 0
+        self._versiones = {}
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="fotos")
+        self._stats = {
+            'hits': 0,
+            'misses': 0,
+            'evictions': 0,
+            'invalidations': 0
+        }
+
+    @classmethod
+    def get_instance(cls):
+        """Obtener (creando si hace falta) la caché compartida del proceso"""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    def version(self, legajo):
+        """Versión vigente de la foto de un legajo"""
+        with self._lock:
+            return self._versiones.get(str(legajo), 0)
+
+    def _clave(self, legajo, size, version=None):
+        if version is None:
+            version = self.version(legajo)
+        return (str(legajo), tuple(size), version)
+
+    def obtener(self, legajo, size, version=None):
+        """Devolver la miniatura en caché o None (no decodifica)"""
+        clave = self._clave(legajo, size, version)
+        with self._lock:
+            item = self._items.get(clave)
+            if item is None:
+                self._stats['misses'] += 1
+                return None
+            self._items.move_to_end(clave)
+            self._stats['hits'] += 1
+            return item[0]
+
+    def guardar(self, legajo, size, imagen, version=None):
+        """Guardar una miniatura y desalojar las menos usadas si se supera el límite"""
+        clave = self._clave(legajo, size, version)
+        tamanio = imagen.width * imagen.height * len(imagen.getbands())
+        with self._lock:
+            anterior = self._items.pop(clave, None)
+            if anterior:
+                self._bytes -= anterior[1]
+            self._items[clave] = (imagen, tamanio)
+            self._bytes += tamanio
+            while self._bytes > self.max_bytes and len(self._items) > 1:
+                _, (_, liberado) = self._items.popitem(last=False)
+                self._bytes -= liberado
+                self._stats['evictions'] += 1
+
+    def miniatura(self, legajo, size, foto_blob=None, cargar_foto=None, version=None):
+        """
+        Obtener la miniatura de un legajo, decodificándola si no está en caché.
+        Bloquea: llamarla desde un hilo de trabajo, no desde el de Tk.
+
+        Args:
+            legajo: legajo del empleado
+            size: (ancho, alto) máximos de la miniatura
+            foto_blob: bytes de la foto si ya se tienen
+            cargar_foto: función sin argumentos que devuelve los bytes de la
+                foto; solo se llama si la miniatura no está en caché
+            version: versión de la foto informada por la base (opcional)
+
+        Returns:
+            PIL.Image o None si el empleado no tiene foto o no se pudo decodificar
+        """
+        imagen = self.obtener(legajo, size, version)
+        if imagen is not None:
+            return imagen
+
+        if foto_blob is None and cargar_foto is not None:
+            foto_blob = cargar_foto()
+        if not foto_blob:
+            return None
+
+        try:
+            imagen = ajustar_imagen(decodificar_imagen(foto_blob), size)
+        except Exception as e:
+            self.logger.error("No se pudo decodificar la foto del legajo %s: %s", legajo, e)
+            return None
+
+        self.guardar(legajo, size, imagen, version)
+        return imagen
+
+    def solicitar(self, widget, legajo, size, callback, foto_blob=None, cargar_foto=None, version=None):
+        """
+        Entregar la miniatura a callback(imagen) en el hilo de Tk.
+        Si está en caché se entrega de inmediato; si no, se descarga (con
+        cargar_foto) y decodifica en segundo plano.
+
+        Returns:
+            SolicitudFoto: permite cancelar el pedido (p. ej. al cambiar de empleado)
+        """
+        solicitud = SolicitudFoto()
+        imagen = self.obtener(legajo, size, version)
+        if imagen is not None:
+            callback(imagen)
+            return solicitud
+
+        def _entregar(imagen):
+            if not solicitud.cancelada:
+                callback(imagen)
+
+        def _cargar():
+            if solicitud.cancelada:
+                return
+            try:
+                imagen = self.miniatura(legajo, size, foto_blob, cargar_foto, version)
+            except Exception as e:
+                self.logger.error("No se pudo obtener la foto del legajo %s: %s", legajo, e)
+                imagen = None
+            if solicitud.cancelada:
+                return
+            try:
+                widget.after(0, lambda: _entregar(imagen))
+            except Exception:
+                pass  # El widget ya no existe
+
+        solicitud.futuro = self._executor.submit(_cargar)
+        return solicitud
+
+    def invalidar(self, legajo):
+        """Descartar las miniaturas de un legajo (su foto cambió)"""
+        legajo = str(legajo)
+        with self._lock:
+            self._versiones[legajo] = self._versiones.get(legajo, 0) + 1
+            for clave in [clave for clave in self._items if clave[0] == legajo]:
+                self._bytes -= self._items.pop(clave)[1]
+            self._stats['invalidations'] += 1
+
+    def stats(self):
+        """Devolver una copia de las estadísticas de la caché"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['items'] = len(self._items)
+            stats['bytes'] = self._bytes
+        stats['max_bytes'] = self.max_bytes
+        return stats
+
+
+def get_photo_cache():
+    """Acceso a la caché de miniaturas compartida del proceso"""
+    return PhotoCache.get_instance()
+
+
+def solicitar_foto_empleado(widget, legajo, size, callback, foto_version, anterior=None):
+    """
+    Pedir la miniatura de un empleado a partir de la versión obtenida en la
+    consulta de resumen (``personal.foto_hash``, NULL si no tiene foto). El BLOB se
+    descarga solo si la miniatura de esa versión no está en caché.
+
+    Args:
+        anterior: SolicitudFoto previa del mismo panel, que se cancela
+
+    Returns:
+        SolicitudFoto o None si el empleado no tiene foto
+    """
+    if anterior is not None:
+        anterior.cancelar()
+    if not foto_version:
+        callback(None)
+        return None
+    return get_photo_cache().solicitar(
+        widget, legajo, size, callback,
+        cargar_foto=lambda: cargar_foto_db(legajo),
+        version=foto_version
+    )
@@ -0,0 +1,144 @@
+import logging
+import threading
+
+from utils.thread_manager import ThreadManager, get_thread_manager
+
+
+# Resultado de una solicitud reemplazada antes de empezar a ejecutarse
+_DESCARTADA = object()
+
+
+class SolicitudConsulta:
+    """
+    Una consulta de un coalescedor, identificada por su ámbito (p. ej.
+    'empleado'), su clave (el legajo) y su número de generación.
+    """
+    def __init__(self, coalescedor, ambito, clave, generacion, callback=None):
+        self.coalescedor = coalescedor
+        self.ambito = ambito
+        self.clave = clave
+        self.generacion = generacion
+        self.callback = callback
+        self.future = None
+
+    def vigente(self):
+        """Sigue siendo la última solicitud de su ámbito"""
+        return self.coalescedor.generacion(self.ambito) == self.generacion
+
+    def si_vigente(self, funcion):
+        """
+        Envolver una actualización de la interfaz para que no haga nada si,
+        al ejecutarse, ya hay una solicitud más nueva (respuesta tardía).
+        """
+        def _aplicar(*args, **kwargs):
+            if self.vigente():
+                return funcion(*args, **kwargs)
+            self.coalescedor._contar('descartadas')
+        return _aplicar
+
+
+class CoalescedorConsultas:
+    """
+    Coalescencia de las consultas por legajo de un módulo.
+
+    Por ámbito hay como mucho una consulta en curso: pedir de nuevo la misma
+    clave mientras la anterior no terminó (FocusOut seguido de Enter) no
+    vuelve a consultar, y pedir otra clave reemplaza a la anterior, que se
+    cancela si todavía no había empezado (no llega a MySQL). Cada solicitud
+    lleva un número de generación y las respuestas de generaciones viejas se
+    descartan en lugar de pisar la interfaz.
+
+    Las consultas corren en el gestor de tareas compartido; llamar a
+    solicitar() desde el hilo de Tk.
+    """
+    def __init__(self, nombre, widget=None, prioridad=ThreadManager.PRIORITY_HIGH):
+        """
+        Args:
+            nombre: nombre del módulo (para los logs y el tipo de tarea)
+            widget: widget cuyo hilo de Tk recibe los callbacks (si el gestor
+                compartido todavía no estaba asociado a uno)
+            prioridad: prioridad de las consultas en el gestor de tareas
+        """
+        self.nombre = nombre
+        self.prioridad = prioridad
+        self.gestor = get_thread_manager(widget)
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._generaciones = {}
+        self._en_curso = {}
+        self._stats = {'enviadas': 0, 'coalescidas': 0, 'canceladas': 0, 'descartadas': 0}
+
+    def generacion(self, ambito='empleado'):
+        with self._lock:
+            return self._generaciones.get(ambito, 0)
+
+    def _contar(self, estadistica):
+        with self._lock:
+            self._stats[estadistica] += 1
+
+    def solicitar(self, clave, funcion, callback=None, ambito='empleado'):
+        """
+        Consultar ``clave`` en segundo plano.
+
+        Args:
+            clave: lo que identifica la consulta dentro del ámbito (el legajo)
+            funcion: funcion(solicitud) que hace la consulta; puede usar
+                solicitud.vigente() y solicitud.si_vigente() para no publicar
+                resultados viejos
+            callback: recibe el resultado en el hilo de Tk, solo si la
+                solicitud sigue vigente
+            ambito: consultas independientes dentro del mismo módulo
+
+        Returns:
+            SolicitudConsulta (la ya en curso si se coalesció)
+        """
+        with self._lock:
+            anterior = self._en_curso.get(ambito)
+            if (anterior is not None and anterior.clave == clave
+                    and anterior.future is not None and not anterior.future.done()):
+                # Misma clave todavía en curso: el último pedido recibe el resultado
+                anterior.callback = callback
+                self._stats['coalescidas'] += 1
+                return anterior
+
+            generacion = self._generaciones.get(ambito, 0) + 1
+            self._generaciones[ambito] = generacion
+            solicitud = SolicitudConsulta(self, ambito, clave, generacion, callback)
+            self._en_curso[ambito] = solicitud
+            self._stats['enviadas'] += 1
+
+        if anterior is not None and anterior.future is not None and anterior.future.cancel():
+            self._contar('canceladas')
+
+        def _tarea():
+            # Reemplazada mientras esperaba un hilo libre
+            if not solicitud.vigente():
+                return _DESCARTADA
+            return funcion(solicitud)
+
+        def _entregar(resultado):
+            with self._lock:
+                if self._en_curso.get(ambito) is solicitud:
+                    del self._en_curso[ambito]
+            if resultado is _DESCARTADA or not solicitud.vigente():
+                self._contar('descartadas')
+                return
+            if solicitud.callback:
+                solicitud.callback(resultado)
+
+        solicitud.future = self.gestor.submit_task(
+            f"{self.nombre}:{ambito}", _tarea, _entregar, priority=self.prioridad
+        )
+        return solicitud
+
+    def invalidar(self, ambito='empleado'):
+        """Descartar lo que esté en curso (p. ej. al limpiar el formulario)"""
+        with self._lock:
+            self._generaciones[ambito] = self._generaciones.get(ambito, 0) + 1
+            anterior = self._en_curso.pop(ambito, None)
+        if anterior is not None and anterior.future is not None and anterior.future.cancel():
+            self._contar('canceladas')
+
+    def stats(self):
+        with self._lock:
+            return dict(self._stats)
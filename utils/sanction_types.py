@@ -0,0 +1,22 @@
+import unicodedata
+
+
+# Tipos de sanción tal como se guardan en la base
+TIPOS_SANCION = ("Suspensión", "Amonestación", "Apercibimiento", "Despido")
+TIPO_SUSPENSION = "Suspensión"
+
+
+def _clave_tipo(tipo):
+    """Minúsculas y sin acentos, para comparar variantes de un mismo tipo"""
+    tipo = unicodedata.normalize('NFKD', (tipo or '').strip().lower())
+    return ''.join(ch for ch in tipo if not unicodedata.combining(ch))
+
+
+# Variantes conocidas (sin acento, en minúsculas, con faltas) -> tipo canónico
+_TIPOS_POR_CLAVE = {_clave_tipo(t): t for t in TIPOS_SANCION}
+_TIPOS_POR_CLAVE['suspencion'] = TIPO_SUSPENSION
+
+
+def normalizar_tipo_sancion(tipo):
+    """Tipo de sanción canónico; los tipos desconocidos se guardan tal cual (sin espacios extra)"""
+    return _TIPOS_POR_CLAVE.get(_clave_tipo(tipo), (tipo or '').strip())
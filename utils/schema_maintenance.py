@@ -0,0 +1,361 @@
+import logging
+import threading
+from datetime import date
+
+import mysql.connector
+
+from utils.db_pool import get_pool
+from utils import loan_portfolio
+from utils.sanction_types import normalizar_tipo_sancion
+
+
+TABLA_VERSIONES = "esquema_versiones"
+TABLA_TAREAS = "mantenimiento_tareas"
+BLOQUEO_ESQUEMA = "rrhh_esquema"
+
+TAREA_BARRIDO_CUOTAS = "barrido_cuotas_vencidas"
+LOTE_BARRIDO = 1000
+
+SQL_CREAR_VERSIONES = f"""
+    CREATE TABLE IF NOT EXISTS {TABLA_VERSIONES} (
+        componente VARCHAR(50) NOT NULL PRIMARY KEY,
+        version INT NOT NULL,
+        actualizado DATETIME NOT NULL
+    )
+"""
+
+SQL_CREAR_TAREAS = f"""
+    CREATE TABLE IF NOT EXISTS {TABLA_TAREAS} (
+        tarea VARCHAR(50) NOT NULL PRIMARY KEY,
+        ultima_ejecucion DATE NOT NULL,
+        filas INT NOT NULL DEFAULT 0
+    )
+"""
+
+# Cuotas vencidas que el proceso diario da por pagadas (descuento por recibo).
+# Por lotes para no bloquear toda la tabla pagos en una sola transacción; con
+# el índice (estado, fecha_vencimiento) cada lote lee solo las pendientes.
+SQL_BARRIDO_LOTE = f"""
+    UPDATE pagos
+    SET estado = 'Pagado',
+        fecha_pago = fecha_vencimiento
+    WHERE estado = 'Pendiente'
+      AND fecha_vencimiento <= CURDATE()
+    ORDER BY fecha_vencimiento
+    LIMIT {LOTE_BARRIDO}
+"""
+
+SQL_MARCAR_TAREA = f"""
+    INSERT INTO {TABLA_TAREAS} (tarea, ultima_ejecucion, filas)
+    VALUES (%s, CURDATE(), %s)
+    ON DUPLICATE KEY UPDATE ultima_ejecucion = VALUES(ultima_ejecucion), filas = VALUES(filas)
+"""
+
+# Retrasar la marca de una tarea hasta una fecha (nunca adelantarla): el
+# barrido la usa para avisarle a la cartera desde qué mes cambiaron cuotas
+SQL_RETRASAR_TAREA = f"""
+    INSERT INTO {TABLA_TAREAS} (tarea, ultima_ejecucion, filas)
+    VALUES (%s, %s, 0)
+    ON DUPLICATE KEY UPDATE ultima_ejecucion = LEAST(ultima_ejecucion, VALUES(ultima_ejecucion))
+"""
+
+SQL_PRIMER_VENCIMIENTO_A_BARRER = """
+    SELECT MIN(fecha_vencimiento)
+    FROM pagos
+    WHERE estado = 'Pendiente' AND fecha_vencimiento <= CURDATE()
+"""
+
+SQL_EVENTO_BARRIDO = f"""
+    CREATE EVENT IF NOT EXISTS {TAREA_BARRIDO_CUOTAS}
+    ON SCHEDULE EVERY 1 DAY
+    STARTS CURRENT_DATE + INTERVAL 1 DAY + INTERVAL 1 HOUR
+    DO
+    BEGIN
+        DECLARE lote INT DEFAULT 1;
+        DECLARE total INT DEFAULT 0;
+        DECLARE desde DATE;
+        DECLARE marca_desde DATE;
+        DECLARE marca_hasta DATE;
+        -- La cartera se recalcula desde el mes de la cuota más vieja que se barre
+        {SQL_PRIMER_VENCIMIENTO_A_BARRER.strip()} INTO desde;
+        IF desde IS NOT NULL THEN
+            INSERT INTO {TABLA_TAREAS} (tarea, ultima_ejecucion, filas)
+            VALUES ('{loan_portfolio.TAREA_CARTERA}', desde, 0)
+            ON DUPLICATE KEY UPDATE ultima_ejecucion = LEAST(ultima_ejecucion, VALUES(ultima_ejecucion));
+        END IF;
+        WHILE lote > 0 DO
+            {SQL_BARRIDO_LOTE.strip()};
+            SET lote = ROW_COUNT();
+            SET total = total + lote;
+        END WHILE;
+        -- Cartera al día desde la marca hasta el mes actual (como refrescar_desde_marca)
+        SELECT MIN(ultima_ejecucion) INTO marca_desde
+        FROM {TABLA_TAREAS} WHERE tarea = '{loan_portfolio.TAREA_CARTERA}';
+        SET marca_desde = LEAST(IFNULL(marca_desde, '{loan_portfolio.PRIMER_MES}'), CURDATE());
+        SET marca_desde = DATE_SUB(marca_desde, INTERVAL DAYOFMONTH(marca_desde) - 1 DAY);
+        SET marca_hasta = LAST_DAY(CURDATE()) + INTERVAL 1 DAY;
+        {(loan_portfolio.SQL_BORRAR_MESES % ('marca_desde', 'marca_hasta')).strip()};
+        {(loan_portfolio.SQL_CALCULAR_MESES % ('marca_desde', 'marca_hasta', 'marca_desde', 'marca_hasta')).strip()};
+        INSERT INTO {TABLA_TAREAS} (tarea, ultima_ejecucion, filas)
+        VALUES ('{loan_portfolio.TAREA_CARTERA}', CURDATE(), ROW_COUNT())
+        ON DUPLICATE KEY UPDATE ultima_ejecucion = VALUES(ultima_ejecucion), filas = VALUES(filas);
+        -- El barrido se marca al final: si queda marcado, la cartera también quedó al día
+        INSERT INTO {TABLA_TAREAS} (tarea, ultima_ejecucion, filas)
+        VALUES ('{TAREA_BARRIDO_CUOTAS}', CURDATE(), total)
+        ON DUPLICATE KEY UPDATE ultima_ejecucion = VALUES(ultima_ejecucion), filas = VALUES(filas);
+    END
+"""
+
+
+def _crear_indice(cursor, tabla, nombre, columnas):
+    """CREATE INDEX solo si no existe (MySQL no tiene IF NOT EXISTS para índices)"""
+    cursor.execute(
+        "SELECT COUNT(*) FROM information_schema.statistics "
+        "WHERE table_schema = DATABASE() AND table_name = %s AND index_name = %s",
+        (tabla, nombre)
+    )
+    if cursor.fetchone()[0] == 0:
+        cursor.execute(f"CREATE INDEX {nombre} ON {tabla} ({columnas})")
+
+
+def _prestamos_v1(cursor):
+    """Índice del barrido y evento diario único (reemplaza al que se recreaba al abrir el módulo)"""
+    _crear_indice(cursor, 'pagos', 'idx_pagos_estado_vencimiento', 'estado, fecha_vencimiento')
+    cursor.execute("DROP EVENT IF EXISTS actualizar_cuotas_automaticamente")
+    cursor.execute(SQL_EVENTO_BARRIDO)
+    try:
+        cursor.execute("SET GLOBAL event_scheduler = ON")
+    except mysql.connector.Error as e:
+        # Sin privilegio SUPER: el barrido igual se pone al día desde la aplicación
+        logging.getLogger(__name__).warning("No se pudo activar el event_scheduler: %s", e)
+
+
+def _prestamos_v2(cursor):
+    """Resumen mensual de la cartera (utils.loan_portfolio), armado desde cero una vez"""
+    _crear_indice(cursor, 'prestamos', 'idx_prestamos_fecha_inicio', 'fecha_inicio')
+    cursor.execute(loan_portfolio.SQL_CREAR_CARTERA)
+    meses = loan_portfolio.reconstruir_cartera(cursor)
+    cursor.execute(SQL_MARCAR_TAREA, (loan_portfolio.TAREA_CARTERA, meses))
+
+
+def _prestamos_v3(cursor):
+    """
+    El barrido (evento y aplicación) avisa a la cartera desde qué mes barrió;
+    la versión anterior solo recalculaba desde la última ejecución, así que
+    se rearma la cartera completa una vez para corregir los meses viejos.
+    """
+    cursor.execute(f"DROP EVENT IF EXISTS {TAREA_BARRIDO_CUOTAS}")
+    cursor.execute(SQL_EVENTO_BARRIDO)
+    meses = loan_portfolio.reconstruir_cartera(cursor)
+    cursor.execute(SQL_MARCAR_TAREA, (loan_portfolio.TAREA_CARTERA, meses))
+
+
+def _prestamos_v4(cursor):
+    """
+    El evento también pone al día la cartera después de barrer (antes lo
+    hacía cada lectura del tablero); se recrea y se recalcula lo que haya
+    quedado pendiente desde la marca.
+    """
+    cursor.execute(f"DROP EVENT IF EXISTS {TAREA_BARRIDO_CUOTAS}")
+    cursor.execute(SQL_EVENTO_BARRIDO)
+    loan_portfolio.refrescar_desde_marca(cursor)
+
+
+def _personal_v1(cursor):
+    """
+    Versión de la foto guardada (personal.foto_hash): las búsquedas de
+    legajo la leen en lugar de calcular MD5(foto), que obligaba al servidor a
+    leer el BLOB completo en cada consulta. Es una columna generada, así que
+    MySQL la recalcula sola en cada INSERT o UPDATE de la foto.
+    """
+    cursor.execute(
+        "SELECT COUNT(*) FROM information_schema.columns "
+        "WHERE table_schema = DATABASE() AND table_name = 'personal' AND column_name = 'foto_hash'"
+    )
+    if cursor.fetchone()[0] == 0:
+        cursor.execute(
+            "ALTER TABLE personal "
+            "ADD COLUMN foto_hash CHAR(32) GENERATED ALWAYS AS (MD5(foto)) STORED"
+        )
+
+
+def _sanciones_v1(cursor):
+    """
+    Tipos de sanción canónicos ('suspension', 'SUSPENSIÓN', 'suspencion' ->
+    'Suspensión'); desde acá se guardan siempre normalizados.
+
+    Los valores se comparan en binario: con la collation de la columna
+    (sin distinguir mayúsculas ni acentos) DISTINCT junta las variantes con
+    la canónica y el UPDATE no vería las que hay que reescribir.
+    """
+    columna = "CONVERT(tipo_sancion USING utf8mb4) COLLATE utf8mb4_bin"
+    cursor.execute(f"SELECT DISTINCT {columna} FROM sanciones WHERE tipo_sancion IS NOT NULL")
+    for (tipo,) in cursor.fetchall():
+        if isinstance(tipo, (bytes, bytearray)):
+            tipo = tipo.decode('utf-8')
+        canonico = normalizar_tipo_sancion(tipo)
+        if canonico != tipo:
+            cursor.execute(
+                f"UPDATE sanciones SET tipo_sancion = %s WHERE {columna} = %s",
+                (canonico, tipo)
+            )
+            logging.getLogger(__name__).info(
+                "Tipo de sanción '%s' normalizado a '%s' (%s registros)", tipo, canonico, cursor.rowcount
+            )
+
+
+# Migraciones por componente: (versión, función(cursor)). Cada una se aplica
+# una sola vez por base y se registra en esquema_versiones; para cambiar el
+# esquema se agrega una versión nueva, nunca se modifica una ya publicada.
+MIGRACIONES = {
+    'prestamos': [
+        (1, _prestamos_v1),
+        (2, _prestamos_v2),
+        (3, _prestamos_v3),
+        (4, _prestamos_v4),
+    ],
+    'personal': [
+        (1, _personal_v1),
+    ],
+    'sanciones': [
+        (1, _sanciones_v1),
+    ],
+}
+
+
+class MantenimientoEsquema:
+    """
+    Instalación del esquema auxiliar y tareas de mantenimiento, única por proceso.
+
+    asegurar_esquema() compara la versión registrada en la base con la de
+    MIGRACIONES y aplica solo las que faltan, con un GET_LOCK para que dos
+    puestos que abren a la vez no migren en paralelo. Después de la primera
+    verificación, las llamadas siguientes del proceso no tocan la base.
+
+    Las tareas diarias (barrido de cuotas vencidas) guardan la fecha de la
+    última ejecución en mantenimiento_tareas: las corre el evento de MySQL y,
+    si el event_scheduler está apagado, la aplicación la primera vez en el
+    día que se necesita.
+    """
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._componentes_listos = set()
+        self._tareas_al_dia = {}  # tarea -> fecha de la última ejecución conocida
+
+    @classmethod
+    def get_instance(cls):
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    def asegurar_esquema(self, componente):
+        """Aplicar las migraciones pendientes del componente (una vez por proceso)"""
+        with self._lock:
+            if componente in self._componentes_listos:
+                return
+            db = get_pool().get_connection()
+            try:
+                cursor = db.cursor()
+                cursor.execute("SELECT GET_LOCK(%s, 30)", (BLOQUEO_ESQUEMA,))
+                if cursor.fetchone()[0] != 1:
+                    raise RuntimeError("No se obtuvo el bloqueo para actualizar el esquema")
+                try:
+                    self._migrar(db, cursor, componente)
+                finally:
+                    cursor.execute("SELECT RELEASE_LOCK(%s)", (BLOQUEO_ESQUEMA,))
+                    cursor.fetchone()
+                    cursor.close()
+            finally:
+                db.close()
+            self._componentes_listos.add(componente)
+
+    def esquema_listo(self, componente):
+        """Si el componente ya se verificó en este proceso (no toca la base)"""
+        return componente in self._componentes_listos
+
+    def _migrar(self, db, cursor, componente):
+        cursor.execute(SQL_CREAR_VERSIONES)
+        cursor.execute(SQL_CREAR_TAREAS)
+        cursor.execute(f"SELECT version FROM {TABLA_VERSIONES} WHERE componente = %s", (componente,))
+        fila = cursor.fetchone()
+        actual = fila[0] if fila else 0
+        for version, migracion in MIGRACIONES.get(componente, ()):
+            if version <= actual:
+                continue
+            self.logger.info("Aplicando migración %s v%s", componente, version)
+            migracion(cursor)
+            cursor.execute(
+                f"INSERT INTO {TABLA_VERSIONES} (componente, version, actualizado) VALUES (%s, %s, NOW()) "
+                "ON DUPLICATE KEY UPDATE version = VALUES(version), actualizado = VALUES(actualizado)",
+                (componente, version)
+            )
+            # Los DDL confirman solos; el registro de la versión se confirma acá
+            db.commit()
+
+    def barrer_cuotas_vencidas(self):
+        """
+        Poner al día el barrido de cuotas vencidas si hoy todavía no corrió
+        (ni el evento ni otro puesto).
+
+        Returns:
+            Cantidad de cuotas marcadas como pagadas (0 si ya estaba al día)
+        """
+        self.asegurar_esquema('prestamos')
+        hoy = date.today()
+        if self._tareas_al_dia.get(TAREA_BARRIDO_CUOTAS) == hoy:
+            return 0
+
+        db = get_pool().get_connection()
+        try:
+            cursor = db.cursor()
+            cursor.execute(
+                f"SELECT ultima_ejecucion FROM {TABLA_TAREAS} WHERE tarea = %s",
+                (TAREA_BARRIDO_CUOTAS,)
+            )
+            fila = cursor.fetchone()
+            if fila and fila[0] >= hoy:
+                # Lo barrió el evento (o otro puesto), que marca el barrido
+                # después de poner al día la cartera
+                self._tareas_al_dia[TAREA_BARRIDO_CUOTAS] = hoy
+                cursor.close()
+                return 0
+
+            # Antes de barrer, la marca de la cartera retrocede hasta el mes de
+            # la cuota más vieja que se va a marcar (pueden ser préstamos
+            # importados o cargados con fecha atrasada)
+            cursor.execute(SQL_PRIMER_VENCIMIENTO_A_BARRER)
+            desde = cursor.fetchone()[0]
+            if desde is not None:
+                cursor.execute(SQL_RETRASAR_TAREA, (loan_portfolio.TAREA_CARTERA, desde))
+                db.commit()
+
+            total = 0
+            while True:
+                cursor.execute(SQL_BARRIDO_LOTE)
+                filas = cursor.rowcount
+                db.commit()
+                total += filas
+                if filas < LOTE_BARRIDO:
+                    break
+            # Las cuotas barridas dejan de ser saldo pendiente en sus meses;
+            # el barrido se marca recién con la cartera al día
+            loan_portfolio.refrescar_desde_marca(cursor, hoy)
+            cursor.execute(SQL_MARCAR_TAREA, (TAREA_BARRIDO_CUOTAS, total))
+            db.commit()
+            cursor.close()
+        finally:
+            db.close()
+
+        self._tareas_al_dia[TAREA_BARRIDO_CUOTAS] = hoy
+        self.logger.info("Barrido de cuotas vencidas: %s cuotas marcadas como pagadas", total)
+        return total
+
+
+def get_mantenimiento():
+    """Obtener el mantenimiento de esquema compartido del proceso"""
+    return MantenimientoEsquema.get_instance()
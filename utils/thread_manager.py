@@ -1,153 +1,325 @@
 import threading
-from queue import Queue, Empty
-from concurrent.futures import ThreadPoolExecutor
+import itertools
+from collections import deque
+from queue import PriorityQueue
+from concurrent.futures import ThreadPoolExecutor, Future
 import logging
-import time
-import mysql.connector
 import os
-import queue
-from logging.handlers import RotatingFileHandler
-from dotenv import load_dotenv
-from mysql.connector import pooling
+from utils.db_pool import get_pool
 
 class ThreadManager:
     """
-    Gestor de hilos para la aplicación.
-    Maneja la ejecución asíncrona de tareas y la comunicación entre hilos.
+    Planificador de tareas en segundo plano de la aplicación.
+
+    Las tareas esperan en una cola de prioridad (menor valor = antes) y los
+    hilos trabajadores se bloquean en ella hasta que llega trabajo, sin
+    sondear. Los callbacks se entregan en el hilo de Tk mediante un único
+    bombeo con after(): el primer resultado lo programa y el bombeo entrega
+    todos los que se acumularon. Sin un widget asociado (attach) los
+    callbacks corren en el hilo trabajador.
+
+    La aplicación comparte una sola instancia (get_thread_manager()). Cada
+    tarea devuelve un Future que se puede cancelar mientras espera, y
+    cancel(task_type) cancela las de un tipo y descarta el resultado de las
+    que ya están en curso.
     """
+    PRIORITY_HIGH = 0
+    PRIORITY_NORMAL = 5
+    PRIORITY_LOW = 10
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
     def __init__(self, max_workers=4):
-        self.executor = ThreadPoolExecutor(max_workers=max_workers)
-        self.task_queue = Queue()
-        self.result_queue = Queue()
-        self.running = True
+        self.max_workers = max_workers
+        self.running = False
         self.logger = logging.getLogger(__name__)
-        
-        # Iniciar worker thread
-        self.worker_thread = threading.Thread(target=self._process_queue, daemon=True)
-        self.worker_thread.start()
+        self._tasks = PriorityQueue()
+        self._sequence = itertools.count()
+        self._workers = []
+        self._lock = threading.Lock()
+        self._pending = {}        # task_type -> futures pendientes o en curso
+        self._discarded = set()   # futures en curso cuyo resultado ya no interesa
+        self._results = deque()   # callbacks esperando al bombeo de Tk
+        self._pump_scheduled = False
+        self._tk_widget = None
+
+    @classmethod
+    def get_instance(cls):
+        """Obtener el gestor compartido de la aplicación"""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls(max_workers=int(os.getenv('THREAD_MANAGER_WORKERS', '6')))
+            return cls._instance
 
-    def submit_task(self, task_type: str, func, callback=None, *args, **kwargs):
+    @property
+    def is_shared(self):
+        """El gestor compartido no se cierra desde los módulos"""
+        return self is ThreadManager._instance
+
+    @property
+    def attached(self):
+        return self._tk_widget is not None
+
+    def attach(self, widget):
+        """
+        Entregar los callbacks en el hilo de Tk del widget (normalmente la
+        ventana raíz). Llamar desde el hilo de Tk.
+        """
+        with self._lock:
+            self._tk_widget = widget
+
+    def _start(self):
+        """Iniciar los hilos trabajadores (también al volver a usarlo tras shutdown)"""
+        with self._lock:
+            if self.running:
+                return
+            self.running = True
+            self._workers = [
+                threading.Thread(target=self._worker, name=f"tareas-{i}", daemon=True)
+                for i in range(self.max_workers)
+            ]
+        for worker in self._workers:
+            worker.start()
+
+    def submit_task(self, task_type: str, func, callback=None, *args, priority=PRIORITY_NORMAL, **kwargs):
         """
         Envía una tarea al gestor de hilos con callback
+
+        Args:
+            task_type: nombre de la tarea (para logs y cancel())
+            func: función a ejecutar en segundo plano con *args y **kwargs
+            callback: recibe el resultado (None si falló) en el hilo de Tk
+            priority: PRIORITY_HIGH, PRIORITY_NORMAL o PRIORITY_LOW
         """
         try:
-            def wrapped_task():
-                try:
-                    result = func(*args, **kwargs)
-                    if callback:
-                        self.result_queue.put((task_type, result, callback))
-                    return result
-                except Exception as e:
-                    self.logger.error(f"Error executing task {task_type}: {e}")
-                    if callback:
-                        self.result_queue.put((task_type, None, callback))
-                    return None
-
-            future = self.executor.submit(wrapped_task)
-            self.task_queue.put((task_type, future))
+            # Sin trabajadores (recién creado o tras shutdown): se inician con la primera tarea
+            if not self.running:
+                self._start()
+            
+            future = Future()
+            with self._lock:
+                self._pending.setdefault(task_type, set()).add(future)
+            self._tasks.put((priority, next(self._sequence), task_type, future, func, args, kwargs, callback))
             return future
         except Exception as e:
-            self.logger.error(f"Error submitting task: {e}")
+            self.logger.error("Error submitting task: %s", e)
 
-    def get_results(self):
-        """
-        Obtiene resultados de tareas completadas
-        """
-        results = []
-        while not self.result_queue.empty():
-            results.append(self.result_queue.get())
-        return results
+    def cancel(self, task_type):
+        """Cancelar las tareas de un tipo; devuelve cuántas había"""
+        with self._lock:
+            futures = list(self._pending.get(task_type, ()))
+        for future in futures:
+            if not future.cancel():
+                # Ya está corriendo: termina, pero su callback no se entrega
+                with self._lock:
+                    self._discarded.add(future)
+        return len(futures)
+
+    def _forget(self, task_type, future):
+        with self._lock:
+            pending = self._pending.get(task_type)
+            if pending is not None:
+                pending.discard(future)
+                if not pending:
+                    del self._pending[task_type]
+            discarded = future in self._discarded
+            self._discarded.discard(future)
+        return discarded
+
+    def _worker(self):
+        """Tomar tareas de la cola (bloqueándose mientras está vacía) hasta recibir la señal de cierre"""
+        while True:
+            _, _, task_type, future, func, args, kwargs, callback = self._tasks.get()
+            if future is None:
+                break
+            if not future.set_running_or_notify_cancel():
+                self._forget(task_type, future)
+                continue
 
-    def _process_queue(self):
-        """
-        Procesa la cola de tareas en segundo plano
-        """
-        while self.running:
             try:
-                if not self.result_queue.empty():
-                    task_type, result, callback = self.result_queue.get_nowait()
-                    if callback:
-                        callback(result)
-                else:
-                    time.sleep(0.1)
-            except Exception:
+                result = func(*args, **kwargs)
+                future.set_result(result)
+            except Exception as e:
+                self.logger.error("Error executing task %s: %s", task_type, e)
+                result = None
+                future.set_exception(e)
+
+            if self._forget(task_type, future) or not callback:
                 continue
+            self._deliver(task_type, callback, result)
+
+    def _deliver(self, task_type, callback, result):
+        widget = self._tk_widget
+        if widget is None:
+            self._run_callback(task_type, callback, result)
+            return
+
+        with self._lock:
+            self._results.append((task_type, callback, result))
+            if self._pump_scheduled:
+                return
+            self._pump_scheduled = True
+        try:
+            widget.after(0, self._pump)
+        except Exception:
+            # Tk cerrado o sin mainloop: entregar aquí para no perder resultados
+            self._pump()
+
+    def _pump(self):
+        """Entregar en el hilo de Tk todos los callbacks acumulados"""
+        while True:
+            with self._lock:
+                if not self._results:
+                    self._pump_scheduled = False
+                    return
+                task_type, callback, result = self._results.popleft()
+            self._run_callback(task_type, callback, result)
 
-    def shutdown(self):
+    def _run_callback(self, task_type, callback, result):
+        try:
+            callback(result)
+        except Exception as e:
+            self.logger.error("Error in callback of task %s: %s", task_type, e)
+
+    def shutdown(self, wait=True):
         """
-        Cierra el gestor de hilos de manera ordenada
+        Cierra el gestor de hilos de manera ordenada: las tareas ya encoladas
+        se completan y luego cada trabajador recibe la señal de cierre
         """
-        self.running = False
-        if self.worker_thread.is_alive():
-            self.worker_thread.join(timeout=1.0)
-        self.executor.shutdown(wait=True)
+        with self._lock:
+            if not self.running:
+                return
+            self.running = False
+            workers = self._workers
+            self._workers = []
+        for _ in workers:
+            self._tasks.put((float('inf'), next(self._sequence), None, None, None, None, None, None))
+        if wait:
+            for worker in workers:
+                if worker is not threading.current_thread():
+                    worker.join(timeout=1.0)
+
+
+def get_thread_manager(widget=None):
+    """
+    Acceso al gestor de tareas compartido de la aplicación. Con widget (desde
+    el hilo de Tk), los callbacks se entregan en ese hilo si el gestor todavía
+    no estaba asociado a otro.
+    """
+    manager = ThreadManager.get_instance()
+    if widget is not None and not manager.attached:
+        manager.attach(widget)
+    return manager
 
 class DatabasePool:
-    _instance = None
-    _lock = threading.Lock()
+    """
+    Acceso de un módulo al pool de conexiones compartido.
 
-    def __new__(cls):
-        with cls._lock:
-            if cls._instance is None:
-                cls._instance = super(DatabasePool, cls).__new__(cls)
-            return cls._instance
+    Las conexiones provienen de utils.db_pool.ConnectionPool, único por
+    proceso, que limita las sesiones abiertas contra MySQL. Cada instancia
+    conserva su propio executor para las consultas en segundo plano, de modo
+    que close() en un módulo no afecta a los demás. El executor se crea al
+    primer uso y close() lo libera; si el módulo vuelve a consultar (p. ej. al
+    reanudarse) se crea otro.
+
+    Quien necesite saber cuándo termina una consulta (la telemetría de carga
+    del menú) puede registrar un aviso con avisar_al_devolver().
+    """
+    _aviso_devolucion = None
+
+    def __init__(self, max_workers=3):
+        """Inicializar el acceso al pool de conexiones"""
+        self.max_workers = max_workers
+        self._executor = None
+        self._executor_lock = threading.Lock()
+        self.logger = logging.getLogger(__name__)
+
+    @property
+    def executor(self):
+        """Executor del módulo (se crea recién cuando hace falta)"""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+            return self._executor
 
-    def __init__(self):
-        """Inicializar el pool de conexiones"""
-        if not hasattr(self, 'initialized'):
-            self.pool = mysql.connector.pooling.MySQLConnectionPool(
-                pool_name="mypool",
-                pool_size=10,  # Aumentado el tamaño del pool
-                host=os.getenv('DB_HOST'),
-                user=os.getenv('DB_USER'),
-                password=os.getenv('DB_PASSWORD'),
-                database=os.getenv('DB_DATABASE'),
-                pool_reset_session=True,
-                autocommit=True,
-                use_pure=True,
-                connect_timeout=3  # Reducido el timeout
-            )
-            self.executor = ThreadPoolExecutor(max_workers=5)  # Aumentado workers
-            self._lock = threading.Lock()
-            self._active_connections = set()
-            self.initialized = True
-
-    def get_connection(self):
-        """Obtener una conexión del pool"""
+    @property
+    def pool(self):
+        """Pool compartido vigente del proceso"""
+        return get_pool()
+
+    def get_connection(self, timeout=None):
+        """Obtener una conexión del pool compartido"""
         try:
-            connection = self.pool.get_connection()
-            if not connection.is_connected():
-                connection.reconnect()
-            with self._lock:
-                self._active_connections.add(connection)
-            return connection
+            return self.pool.get_connection(timeout=timeout)
         except Exception as e:
-            print(f"Error obteniendo conexión: {e}")
+            self.logger.error("Error obteniendo conexión: %s", e)
             raise
 
     def return_connection(self, connection):
         """Devolver una conexión al pool"""
         try:
-            with self._lock:
-                if connection in self._active_connections:
-                    self._active_connections.remove(connection)
-            connection.close()
+            if connection:
+                connection.close()
         except Exception:
             pass
+        aviso = DatabasePool._aviso_devolucion
+        if aviso is not None:
+            aviso()
+
+    @classmethod
+    def avisar_al_devolver(cls, callback):
+        """
+        Registrar callback() para después de cada devolución de conexión
+        (None lo quita). Hay un solo aviso por proceso: registrar otro
+        reemplaza al anterior. Corre en el hilo que devolvió la conexión.
+        """
+        cls._aviso_devolucion = callback
+
+    def execute_query_async(self, query: str, params: tuple = None, callback=None):
+        """Ejecutar consulta de forma asíncrona usando el executor del módulo"""
+        def _async_query():
+            connection = None
+            cursor = None
+            try:
+                connection = self.get_connection()
+                cursor = connection.cursor(buffered=True)
+                if params:
+                    cursor.execute(query, params)
+                else:
+                    cursor.execute(query)
+
+                if query.strip().lower().startswith('select'):
+                    result = cursor.fetchall()
+                else:
+                    connection.commit()
+                    result = True
+
+                if callback:
+                    callback(result)
+                return result
+            except Exception as e:
+                self.logger.error("Error en consulta: %s", e)
+                if callback:
+                    callback(None)
+                return None
+            finally:
+                if cursor:
+                    cursor.close()
+                self.return_connection(connection)
+
+        return self.executor.submit(_async_query)
+
+    def stats(self):
+        """Estadísticas del pool compartido (esperas, préstamos, timeouts...)"""
+        return self.pool.stats()
 
     def close(self):
-        """Cerrar todas las conexiones activas y el executor"""
+        """Detener el executor del módulo; las conexiones siguen en el pool compartido"""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
         try:
-            if hasattr(self, 'executor'):
-                self.executor.shutdown(wait=False)
-            
-            with self._lock:
-                for conn in list(self._active_connections):
-                    try:
-                        conn.close()
-                    except Exception:
-                        pass
-                self._active_connections.clear()
-                
+            if executor is not None:
+                executor.shutdown(wait=False)
         except Exception as e:
-            print(f"Error al cerrar el pool de conexiones: {str(e)}")
+            self.logger.error("Error al cerrar el executor: %s", e)
@@ -0,0 +1,197 @@
+import logging
+
+
+class VirtualTreeview:
+    """
+    Relleno virtualizado de un ttk.Treeview existente.
+
+    Las filas se guardan en memoria y en el Treeview solo se materializan las
+    visibles más un margen; el resto se agrega por lotes cuando el usuario se
+    acerca al final (rueda, barra de desplazamiento o teclado). Así una lista
+    de miles de filas se muestra al instante y el hilo de Tk no queda ocupado
+    insertando filas que nadie ve.
+
+    Las filas materializadas son ítems normales del Treeview, por lo que
+    selection(), item() e identify_row() siguen funcionando igual. Para cargar
+    datos hay que usar reemplazar()/actualizar()/limpiar() en lugar de
+    insertar o borrar directamente en el Treeview.
+
+    Crear la instancia después de configurar yscrollcommand: el desplazamiento
+    se intercepta para saber cuándo materializar más filas y luego se reenvía
+    a la barra original.
+    """
+    def __init__(self, tree, clave=None, tags=None, margen=50, lote=200):
+        """
+        Args:
+            tree: ttk.Treeview a administrar
+            clave: función valores -> identificador único de la fila, usado
+                como iid; si es None se usa la posición (actualizar() compara
+                entonces fila a fila)
+            tags: función (indice, valores) -> tupla de tags (p. ej. filas alternas)
+            margen: filas extra a materializar además de las visibles
+            lote: filas a agregar cada vez que se llega al final
+        """
+        self.tree = tree
+        self.clave = clave
+        self.tags = tags
+        self.margen = margen
+        self.lote = lote
+        self.logger = logging.getLogger(__name__)
+
+        self._filas = []          # [(iid, valores, tags)] en orden de visualización
+        self._materializadas = 0  # las primeras N de _filas están en el Treeview
+        self._pendiente = None
+
+        self._scroll_destino = self.tree.cget('yscrollcommand')
+        self.tree.configure(yscrollcommand=self._on_scroll)
+        self.tree.bind('<End>', lambda e: self.materializar_todo(), add='+')
+
+    @property
+    def filas(self):
+        """Valores de todas las filas, materializadas o no"""
+        return [valores for _, valores, _ in self._filas]
+
+    def __len__(self):
+        return len(self._filas)
+
+    def _preparar(self, filas, iids=None):
+        preparadas = []
+        for indice, valores in enumerate(filas):
+            valores = tuple(valores)
+            if iids is not None:
+                iid = str(iids[indice])
+            elif self.clave is not None:
+                iid = str(self.clave(valores))
+            else:
+                iid = str(indice)
+            tags = tuple(self.tags(indice, valores)) if self.tags else ()
+            preparadas.append((iid, valores, tags))
+
+        if len({iid for iid, _, _ in preparadas}) != len(preparadas):
+            # Claves repetidas: se identifica por posición para no perder filas
+            self.logger.warning("Claves de fila repetidas; se usa la posición como identificador")
+            preparadas = [(str(i), valores, tags) for i, (_, valores, tags) in enumerate(preparadas)]
+        return preparadas
+
+    def _filas_iniciales(self):
+        """Filas visibles estimadas según el alto del Treeview, más el margen"""
+        try:
+            visibles = int(self.tree.cget('height'))
+            alto = self.tree.winfo_height()
+            if alto > 1:
+                visibles = max(visibles, alto // 20)  # 20 px: alto de fila por defecto de ttk
+        except Exception:
+            visibles = 20
+        return visibles + self.margen
+
+    def _cancelar_pendiente(self):
+        if self._pendiente is not None:
+            try:
+                self.tree.after_cancel(self._pendiente)
+            except Exception:
+                pass
+            self._pendiente = None
+
+    def _insertar(self, desde, hasta):
+        hasta = min(hasta, len(self._filas))
+        for iid, valores, tags in self._filas[desde:hasta]:
+            self.tree.insert('', 'end', iid=iid, values=valores, tags=tags)
+        self._materializadas = max(self._materializadas, hasta)
+
+    def limpiar(self):
+        """Quitar todas las filas"""
+        self._cancelar_pendiente()
+        self._filas = []
+        self._materializadas = 0
+        hijos = self.tree.get_children()
+        if hijos:
+            self.tree.delete(*hijos)
+
+    def reemplazar(self, filas, iids=None):
+        """
+        Reemplazar todo el contenido en una sola operación.
+
+        Args:
+            filas: secuencia de tuplas de valores, ya formateadas
+            iids: identificadores opcionales, paralelos a filas
+        """
+        self.limpiar()
+        self._filas = self._preparar(filas, iids)
+        self._insertar(0, min(len(self._filas), self._filas_iniciales()))
+
+    def actualizar(self, filas, iids=None):
+        """
+        Reemplazar el contenido tocando solo las filas que cambiaron.
+
+        Las filas que siguen presentes conservan su ítem (y con él la
+        selección); solo se modifican las de valores distintos, se borran las
+        que ya no están y se insertan las nuevas.
+        """
+        self._cancelar_pendiente()
+        anteriores = {iid: (valores, tags) for iid, valores, tags in self._filas[:self._materializadas]}
+        nuevas = self._preparar(filas, iids)
+        claves_nuevas = {iid for iid, _, _ in nuevas}
+
+        a_materializar = min(len(nuevas), max(self._materializadas, self._filas_iniciales()))
+
+        # Borrar las que desaparecen o quedan fuera de la parte materializada
+        visibles_nuevas = {iid for iid, _, _ in nuevas[:a_materializar]}
+        sobrantes = {iid for iid in anteriores if iid not in claves_nuevas or iid not in visibles_nuevas}
+        if sobrantes:
+            self.tree.delete(*sobrantes)
+        orden_actual = self.tree.get_children()
+
+        # Las filas 0..indice-1 ya están ubicadas; el resto del Treeview
+        # conserva el orden de orden_actual, salvo las ya movidas (colocadas)
+        colocadas = set()
+        cursor = 0
+        for indice, (iid, valores, tags) in enumerate(nuevas[:a_materializar]):
+            while cursor < len(orden_actual) and orden_actual[cursor] in colocadas:
+                cursor += 1
+            colocadas.add(iid)
+            anterior = anteriores.get(iid) if iid not in sobrantes else None
+            if anterior is None:
+                self.tree.insert('', indice, iid=iid, values=valores, tags=tags)
+                continue
+            if anterior != (valores, tags):
+                self.tree.item(iid, values=valores, tags=tags)
+            if cursor < len(orden_actual) and orden_actual[cursor] == iid:
+                cursor += 1
+            else:
+                self.tree.move(iid, '', indice)
+
+        self._filas = nuevas
+        self._materializadas = a_materializar
+
+    def materializar_todo(self):
+        """Agregar al Treeview todas las filas pendientes"""
+        self._cancelar_pendiente()
+        if self._materializadas < len(self._filas):
+            self._insertar(self._materializadas, len(self._filas))
+
+    def mostrar(self, iid):
+        """Materializar (si hace falta) y desplazar hasta la fila indicada"""
+        iid = str(iid)
+        for indice, (clave, _, _) in enumerate(self._filas):
+            if clave == iid:
+                if indice >= self._materializadas:
+                    self._insertar(self._materializadas, indice + self.lote)
+                self.tree.see(iid)
+                return True
+        return False
+
+    def _materializar_lote(self):
+        self._pendiente = None
+        if self._materializadas < len(self._filas):
+            self._insertar(self._materializadas, min(len(self._filas), self._materializadas + self.lote))
+
+    def _on_scroll(self, primero, ultimo):
+        """yscrollcommand: reenviar a la barra y materializar al acercarse al final"""
+        if self._scroll_destino:
+            try:
+                self.tree.tk.call(*self.tree.tk.splitlist(self._scroll_destino), primero, ultimo)
+            except Exception:
+                pass
+        if (float(ultimo) > 0.9 and self._materializadas < len(self._filas)
+                and self._pendiente is None):
+            self._pendiente = self.tree.after_idle(self._materializar_lote)
@@ -0,0 +1,206 @@
+import os
+import json
+import time
+import getpass
+import logging
+import threading
+
+from PIL import Image, ImageSequence
+
+
+RUTA_LOGO_GIF = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    'resources',
+    'icons_gifs',
+    'logo.gif'
+)
+
+_frames_cache = {}
+_frames_lock = threading.Lock()
+
+
+def _decodificar_frames(ruta, alto=None, cuadrado=None, margen=20):
+    frames = []
+    with Image.open(ruta) as gif:
+        for frame in ImageSequence.Iterator(gif):
+            frame = frame.convert('RGBA')
+            aspect_ratio = frame.width / frame.height
+
+            if cuadrado:
+                # Centrar en un cuadrado transparente dejando un margen alrededor
+                lado = cuadrado - (margen * 2)
+                if aspect_ratio > 1:
+                    nuevo = (lado, int(lado / aspect_ratio))
+                else:
+                    nuevo = (int(lado * aspect_ratio), lado)
+                frame = frame.resize(nuevo, Image.LANCZOS)
+                fondo = Image.new('RGBA', (cuadrado, cuadrado), (0, 0, 0, 0))
+                fondo.paste(frame, ((cuadrado - nuevo[0]) // 2, (cuadrado - nuevo[1]) // 2))
+                frame = fondo
+            elif alto:
+                frame = frame.resize((int(alto * aspect_ratio), alto), Image.LANCZOS)
+
+            frames.append(frame)
+    return tuple(frames)
+
+
+def frames_logo_gif(alto=None, cuadrado=None, margen=20, ruta=RUTA_LOGO_GIF):
+    """
+    Frames del GIF del logo ya decodificados y redimensionados (imágenes PIL RGBA).
+
+    Se decodifican una sola vez por proceso y tamaño, sin Tk, por lo que el
+    arranque en caliente puede prepararlos en segundo plano; cada módulo solo
+    crea sus CTkImage/PhotoImage en el hilo de la interfaz.
+
+    Args:
+        alto: redimensionar a esta altura manteniendo la proporción
+        cuadrado: lado del cuadrado transparente donde se centra el logo
+        margen: espacio alrededor del logo dentro del cuadrado
+    """
+    ruta = os.path.abspath(ruta)
+    clave = (ruta, os.path.getmtime(ruta), alto, cuadrado, margen)
+    with _frames_lock:
+        frames = _frames_cache.get(clave)
+    if frames is None:
+        frames = _decodificar_frames(ruta, alto, cuadrado, margen)
+        with _frames_lock:
+            _frames_cache[clave] = frames
+    return frames
+
+
+class AlmacenPrecarga:
+    """
+    Resultados precalculados por el arranque en caliente, a la espera de que
+    el módulo correspondiente los tome al construirse. Cada valor se entrega
+    una sola vez y vence a los ``ttl`` segundos para no mostrar datos viejos.
+    """
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, ttl=None):
+        self.ttl = ttl or float(os.getenv('WARM_START_TTL', '120'))
+        self._lock = threading.Lock()
+        self._valores = {}
+        self._stats = {'guardados': 0, 'entregados': 0, 'vencidos': 0, 'faltantes': 0}
+
+    @classmethod
+    def get_instance(cls):
+        """Obtener el almacén compartido del proceso"""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    def guardar(self, clave, valor):
+        with self._lock:
+            self._valores[clave] = (valor, time.monotonic())
+            self._stats['guardados'] += 1
+
+    def vigente(self, clave):
+        """Indicar si hay un valor sin vencer para la clave (no lo consume)"""
+        with self._lock:
+            item = self._valores.get(clave)
+            return item is not None and time.monotonic() - item[1] <= self.ttl
+
+    def tomar(self, clave):
+        """Entregar y quitar el valor precargado, o None si no hay o venció"""
+        with self._lock:
+            item = self._valores.pop(clave, None)
+            if item is None:
+                self._stats['faltantes'] += 1
+                return None
+            if time.monotonic() - item[1] > self.ttl:
+                self._stats['vencidos'] += 1
+                return None
+            self._stats['entregados'] += 1
+            return item[0]
+
+    def descartar(self, prefijo=None):
+        """Quitar los valores (todos o los de claves que empiezan con prefijo)"""
+        with self._lock:
+            for clave in [c for c in self._valores if prefijo is None or c[0] == prefijo]:
+                del self._valores[clave]
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+            stats['pendientes'] = len(self._valores)
+        return stats
+
+
+def get_warm_store():
+    """Acceso al almacén de precargas compartido del proceso"""
+    return AlmacenPrecarga.get_instance()
+
+
+class HistorialUso:
+    """
+    Historial de uso de módulos de un operador (usuario del sistema), guardado
+    en ~/.rrhh/uso_modulos_<usuario>.json. Registra cuántas veces abre cada
+    módulo y qué módulo abre a continuación de cada uno, para decidir qué
+    conviene precargar.
+    """
+    def __init__(self, usuario=None, ruta=None):
+        self.usuario = usuario or getpass.getuser()
+        self.ruta = ruta or os.path.join(
+            os.path.expanduser('~'), '.rrhh', f'uso_modulos_{self.usuario}.json'
+        )
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._ultimo = None
+        self._usos = {}
+        self._transiciones = {}
+        self._leer()
+
+    def _leer(self):
+        try:
+            with open(self.ruta, encoding='utf-8') as archivo:
+                datos = json.load(archivo)
+            self._usos = datos.get('usos', {})
+            self._transiciones = datos.get('transiciones', {})
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            self.logger.warning("No se pudo leer el historial de uso: %s", e)
+
+    def _escribir(self):
+        with self._lock:
+            datos = {'usos': dict(self._usos), 'transiciones': {
+                origen: dict(destinos) for origen, destinos in self._transiciones.items()
+            }}
+        try:
+            os.makedirs(os.path.dirname(self.ruta), exist_ok=True)
+            temporal = self.ruta + '.tmp'
+            with open(temporal, 'w', encoding='utf-8') as archivo:
+                json.dump(datos, archivo, ensure_ascii=False, indent=2)
+            os.replace(temporal, self.ruta)
+        except Exception as e:
+            self.logger.warning("No se pudo guardar el historial de uso: %s", e)
+
+    def registrar(self, modulo):
+        """Registrar la apertura de un módulo (y la transición desde el anterior)"""
+        with self._lock:
+            self._usos[modulo] = self._usos.get(modulo, 0) + 1
+            if self._ultimo and self._ultimo != modulo:
+                destinos = self._transiciones.setdefault(self._ultimo, {})
+                destinos[modulo] = destinos.get(modulo, 0) + 1
+            self._ultimo = modulo
+        self._escribir()
+
+    def prioridades(self, candidatos, limite=3):
+        """Módulos más usados, en orden; sin historial respeta el orden de candidatos"""
+        with self._lock:
+            usos = dict(self._usos)
+        orden = sorted(candidatos, key=lambda m: -usos.get(m, 0))
+        return orden[:limite]
+
+    def siguientes(self, modulo, candidatos, limite=2):
+        """Módulos que el operador suele abrir después de ``modulo``"""
+        with self._lock:
+            destinos = dict(self._transiciones.get(modulo, {}))
+            usos = dict(self._usos)
+        orden = sorted(
+            (m for m in candidatos if m != modulo),
+            key=lambda m: (-destinos.get(m, 0), -usos.get(m, 0))
+        )
+        return orden[:limite]